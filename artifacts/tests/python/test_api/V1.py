@@ -0,0 +1,565 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Iterable,
+                    Iterator, Optional, TypeVar, Union)
+from uuid import UUID
+
+from httpx import Response
+
+from ._encoder import JsonEncoder
+from ._operation import _Operation
+from ._shared import (HttpRequestHandler, HttpRequestHandlerAsync,
+                      HttpRequestIterHandler, HttpRequestIterHandlerAsync,
+                      _json_encoder_options)
+
+T = TypeVar("T")
+
+class V1:
+    """A client for version V1."""
+    
+    _catalogs: CatalogsClient
+    _data: DataClient
+    _jobs: JobsClient
+    _artifacts: ArtifactsClient
+    _items: ItemsClient
+
+
+
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        """
+        Initializes a new instance of V1
+        
+            Args:
+                invoke: The handler to execute HTTP requests.
+                invoke_iter: The handler to execute HTTP requests which return a JSON array.
+        """
+
+        self._catalogs = CatalogsClient(invoke, invoke_iter)
+        self._data = DataClient(invoke, invoke_iter)
+        self._jobs = JobsClient(invoke, invoke_iter)
+        self._artifacts = ArtifactsClient(invoke, invoke_iter)
+        self._items = ItemsClient(invoke, invoke_iter)
+
+
+
+    @property
+    def catalogs(self) -> CatalogsClient:
+        """Gets the CatalogsClient."""
+        return self._catalogs
+
+    @property
+    def data(self) -> DataClient:
+        """Gets the DataClient."""
+        return self._data
+
+    @property
+    def jobs(self) -> JobsClient:
+        """Gets the JobsClient."""
+        return self._jobs
+
+    @property
+    def artifacts(self) -> ArtifactsClient:
+        """Gets the ArtifactsClient."""
+        return self._artifacts
+
+    @property
+    def items(self) -> ItemsClient:
+        """Gets the ItemsClient."""
+        return self._items
+
+
+
+
+class CatalogsClient:
+    """Provides methods to interact with catalogs."""
+
+    ___invoke: HttpRequestHandler
+    ___invoke_iter: HttpRequestIterHandler
+    
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def search_catalog_items(self, resource_paths: list[str]) -> dict[str, CatalogItem]:
+        """
+        search_catalog_items.
+        """
+
+        return self.___invoke(_operations["catalogs.search_catalog_items"], (), (), resource_paths)
+
+
+class DataClient:
+    """Provides methods to interact with data."""
+
+    ___invoke: HttpRequestHandler
+    ___invoke_iter: HttpRequestIterHandler
+    
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def get_stream(self, resource_path: str, begin: datetime, end: datetime) -> Response:
+        """
+        get_stream.
+        """
+
+        return self.___invoke(_operations["data.get_stream"], (), (resource_path, begin, end), None)
+
+
+class JobsClient:
+    """Provides methods to interact with jobs."""
+
+    ___invoke: HttpRequestHandler
+    ___invoke_iter: HttpRequestIterHandler
+    
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def export(self, parameters: ExportParameters) -> Job:
+        """
+        export.
+        """
+
+        return self.___invoke(_operations["jobs.export"], (), (), parameters)
+
+    def get_job_status(self, job_id: UUID) -> JobStatus:
+        """
+        get_job_status.
+        """
+
+        return self.___invoke(_operations["jobs.get_job_status"], (job_id,), (), None)
+
+    def cancel_job(self, job_id: UUID) -> Response:
+        """
+        cancel_job.
+        """
+
+        return self.___invoke(_operations["jobs.cancel_job"], (job_id,), (), None)
+
+
+class ArtifactsClient:
+    """Provides methods to interact with artifacts."""
+
+    ___invoke: HttpRequestHandler
+    ___invoke_iter: HttpRequestIterHandler
+    
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def download(self, artifact_id: str) -> Response:
+        """
+        download.
+        """
+
+        return self.___invoke(_operations["artifacts.download"], (artifact_id,), (), None)
+
+class ItemsClient:
+    """Provides methods to interact with items."""
+
+    ___invoke: HttpRequestHandler
+    ___invoke_iter: HttpRequestIterHandler
+    
+    def __init__(self, invoke: HttpRequestHandler, invoke_iter: HttpRequestIterHandler):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def get_items(self, limit: Optional[int] = None) -> list[Item]:
+        """
+        Gets items.
+
+        Args:
+            limit: The limit.
+        """
+
+        return self.___invoke(_operations["items.get_items"], (), (limit,), None)
+
+    def get_items_iter(self, limit: Optional[int] = None) -> Iterator[Item]:
+        """
+        Gets items. The items are decoded one by one while the response is being received.
+
+        Args:
+            limit: The limit.
+        """
+
+        return self.___invoke_iter(_operations["items.get_items_iter"], (), (limit,), None)
+
+    def get_item(self, id: str) -> Item:
+        """
+        Gets an item.
+
+        Args:
+            id: The id.
+        """
+
+        return self.___invoke(_operations["items.get_item"], (id,), (), None)
+
+    def put_item(self, item: Item) -> Item:
+        """
+        Puts an item.
+
+        Args:
+        """
+
+        return self.___invoke(_operations["items.put_item"], (), (), item)
+
+    def delete_item(self, id: str) -> None:
+        """
+        Deletes an item.
+
+        Args:
+            id: The id.
+        """
+
+        return self.___invoke(_operations["items.delete_item"], (id,), (), None)
+
+
+
+class V1Async:
+    """A client for version V1."""
+    
+    _catalogs: CatalogsAsyncClient
+    _data: DataAsyncClient
+    _jobs: JobsAsyncClient
+    _artifacts: ArtifactsAsyncClient
+    _items: ItemsAsyncClient
+
+
+
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        """
+        Initializes a new instance of V1Async
+        
+            Args:
+                invoke: The handler to execute HTTP requests.
+                invoke_iter: The handler to execute HTTP requests which return a JSON array.
+        """
+
+        self._catalogs = CatalogsAsyncClient(invoke, invoke_iter)
+        self._data = DataAsyncClient(invoke, invoke_iter)
+        self._jobs = JobsAsyncClient(invoke, invoke_iter)
+        self._artifacts = ArtifactsAsyncClient(invoke, invoke_iter)
+        self._items = ItemsAsyncClient(invoke, invoke_iter)
+
+
+
+    @property
+    def catalogs(self) -> CatalogsAsyncClient:
+        """Gets the CatalogsAsyncClient."""
+        return self._catalogs
+
+    @property
+    def data(self) -> DataAsyncClient:
+        """Gets the DataAsyncClient."""
+        return self._data
+
+    @property
+    def jobs(self) -> JobsAsyncClient:
+        """Gets the JobsAsyncClient."""
+        return self._jobs
+
+    @property
+    def artifacts(self) -> ArtifactsAsyncClient:
+        """Gets the ArtifactsAsyncClient."""
+        return self._artifacts
+
+    @property
+    def items(self) -> ItemsAsyncClient:
+        """Gets the ItemsAsyncClient."""
+        return self._items
+
+
+
+
+class CatalogsAsyncClient:
+    """Provides methods to interact with catalogs."""
+
+    ___invoke: HttpRequestHandlerAsync
+    ___invoke_iter: HttpRequestIterHandlerAsync
+    
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def search_catalog_items(self, resource_paths: list[str]) -> Awaitable[dict[str, CatalogItem]]:
+        """
+        search_catalog_items.
+        """
+
+        return self.___invoke(_operations["catalogs.search_catalog_items"], (), (), resource_paths)
+
+
+class DataAsyncClient:
+    """Provides methods to interact with data."""
+
+    ___invoke: HttpRequestHandlerAsync
+    ___invoke_iter: HttpRequestIterHandlerAsync
+    
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def get_stream(self, resource_path: str, begin: datetime, end: datetime) -> Awaitable[Response]:
+        """
+        get_stream.
+        """
+
+        return self.___invoke(_operations["data.get_stream"], (), (resource_path, begin, end), None)
+
+
+class JobsAsyncClient:
+    """Provides methods to interact with jobs."""
+
+    ___invoke: HttpRequestHandlerAsync
+    ___invoke_iter: HttpRequestIterHandlerAsync
+    
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def export(self, parameters: ExportParameters) -> Awaitable[Job]:
+        """
+        export.
+        """
+
+        return self.___invoke(_operations["jobs.export"], (), (), parameters)
+
+    def get_job_status(self, job_id: UUID) -> Awaitable[JobStatus]:
+        """
+        get_job_status.
+        """
+
+        return self.___invoke(_operations["jobs.get_job_status"], (job_id,), (), None)
+
+    def cancel_job(self, job_id: UUID) -> Awaitable[Response]:
+        """
+        cancel_job.
+        """
+
+        return self.___invoke(_operations["jobs.cancel_job"], (job_id,), (), None)
+
+
+class ArtifactsAsyncClient:
+    """Provides methods to interact with artifacts."""
+
+    ___invoke: HttpRequestHandlerAsync
+    ___invoke_iter: HttpRequestIterHandlerAsync
+    
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def download(self, artifact_id: str) -> Awaitable[Response]:
+        """
+        download.
+        """
+
+        return self.___invoke(_operations["artifacts.download"], (artifact_id,), (), None)
+
+class ItemsAsyncClient:
+    """Provides methods to interact with items."""
+
+    ___invoke: HttpRequestHandlerAsync
+    ___invoke_iter: HttpRequestIterHandlerAsync
+    
+    def __init__(self, invoke: HttpRequestHandlerAsync, invoke_iter: HttpRequestIterHandlerAsync):
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+    def get_items(self, limit: Optional[int] = None) -> Awaitable[list[Item]]:
+        """
+        Gets items.
+
+        Args:
+            limit: The limit.
+        """
+
+        return self.___invoke(_operations["items.get_items"], (), (limit,), None)
+
+    def get_items_iter(self, limit: Optional[int] = None) -> AsyncIterator[Item]:
+        """
+        Gets items. The items are decoded one by one while the response is being received.
+
+        Args:
+            limit: The limit.
+        """
+
+        return self.___invoke_iter(_operations["items.get_items_iter"], (), (limit,), None)
+
+    def get_item(self, id: str) -> Awaitable[Item]:
+        """
+        Gets an item.
+
+        Args:
+            id: The id.
+        """
+
+        return self.___invoke(_operations["items.get_item"], (id,), (), None)
+
+    def put_item(self, item: Item) -> Awaitable[Item]:
+        """
+        Puts an item.
+
+        Args:
+        """
+
+        return self.___invoke(_operations["items.put_item"], (), (), item)
+
+    def delete_item(self, id: str) -> Awaitable[None]:
+        """
+        Deletes an item.
+
+        Args:
+            id: The id.
+        """
+
+        return self.___invoke(_operations["items.delete_item"], (id,), (), None)
+
+
+
+class TaskStatus(Enum):
+    """Task status."""
+
+    CREATED = "CREATED"
+    """Created"""
+
+    WAITING_FOR_ACTIVATION = "WAITING_FOR_ACTIVATION"
+    """WaitingForActivation"""
+
+    RUNNING = "RUNNING"
+    """Running"""
+
+    RAN_TO_COMPLETION = "RAN_TO_COMPLETION"
+    """RanToCompletion"""
+
+    CANCELED = "CANCELED"
+    """Canceled"""
+
+    FAULTED = "FAULTED"
+    """Faulted"""
+
+
+@dataclass(frozen=True)
+class Representation:
+    """A representation."""
+
+    sample_period: timedelta
+    """The sample period."""
+
+
+@dataclass(frozen=True)
+class Resource:
+    """A resource."""
+
+    id: str
+    """The id."""
+
+    properties: Optional[dict[str, object]]
+    """The properties."""
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    """A catalog item."""
+
+    catalog: object
+    """The catalog."""
+
+    resource: Resource
+    """The resource."""
+
+    representation: Representation
+    """The representation."""
+
+
+@dataclass(frozen=True)
+class ExportParameters:
+    """Export parameters."""
+
+    begin: datetime
+    """Begin."""
+
+    end: datetime
+    """End."""
+
+    file_period: timedelta
+    """File period."""
+
+    type: Optional[str]
+    """Type."""
+
+    resource_paths: list[str]
+    """Resource paths."""
+
+    configuration: Optional[dict[str, object]]
+    """Configuration."""
+
+
+@dataclass(frozen=True)
+class Job:
+    """A job."""
+
+    id: UUID
+    """The id."""
+
+
+@dataclass(frozen=True)
+class JobStatus:
+    """A job status."""
+
+    start: datetime
+    """Start."""
+
+    status: TaskStatus
+    """Status."""
+
+    progress: float
+    """Progress."""
+
+    exception_message: Optional[str]
+    """Exception message."""
+
+    result: Optional[object]
+    """Result."""
+
+
+@dataclass(frozen=True)
+class Item:
+    """
+    An item.
+
+    Args:
+        id: The id.
+        name: The name.
+        value: The value.
+    """
+
+    id: str
+    """The id."""
+
+    name: str
+    """The name."""
+
+    value: float
+    """The value."""
+
+
+# the operation table of the generated methods
+_operations: dict[str, _Operation[Any]] = {
+    "catalogs.search_catalog_items": _Operation("catalogs.search_catalog_items", "POST", "/api/v1/catalogs/search-items", (), (), "application/json", "application/json", dict[str, CatalogItem]),
+    "data.get_stream": _Operation("data.get_stream", "GET", "/api/v1/data", (), (("resourcePath", False), ("begin", False), ("end", False)), "application/octet-stream", None, Response),
+    "jobs.export": _Operation("jobs.export", "POST", "/api/v1/jobs/export", (), (), "application/json", "application/json", Job),
+    "jobs.get_job_status": _Operation("jobs.get_job_status", "GET", "/api/v1/jobs/{jobId}/status", ("jobId",), (), "application/json", None, JobStatus),
+    "jobs.cancel_job": _Operation("jobs.cancel_job", "DELETE", "/api/v1/jobs/{jobId}", ("jobId",), (), "application/octet-stream", None, Response),
+    "artifacts.download": _Operation("artifacts.download", "GET", "/api/v1/artifacts/{artifactId}", ("artifactId",), (), "application/octet-stream", None, Response),
+    "items.get_items": _Operation("items.get_items", "GET", "/api/v1/items", (), (("limit", True),), "application/json", None, list[Item]),
+    "items.get_items_iter": _Operation("items.get_items_iter", "GET", "/api/v1/items", (), (("limit", True),), "application/json", None, Item),
+    "items.get_item": _Operation("items.get_item", "GET", "/api/v1/items/{id}", ("id",), (), "application/json", None, Item),
+    "items.put_item": _Operation("items.put_item", "PUT", "/api/v1/items", (), (), "application/json", "application/json", Item),
+    "items.delete_item": _Operation("items.delete_item", "DELETE", "/api/v1/items/{id}", ("id",), (), None, None, type(None)),
+}
+
@@ -0,0 +1,2 @@
+from ._client import *
+from ._shared import *
@@ -0,0 +1,3071 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import importlib
+import json
+import random
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                as_completed, wait)
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from datetime import timedelta
+from io import BytesIO
+from tempfile import TemporaryFile
+from typing import IO, Callable
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Generic, Iterable, Iterator, Optional, Type, TypeVar,
+                    Union, cast)
+from uuid import UUID
+from zipfile import ZipFile, ZipInfo
+
+from httpx import (AsyncBaseTransport, AsyncClient, AsyncHTTPTransport,
+                   BaseTransport, ByteStream, Client, HTTPTransport, Limits,
+                   Request, Response, Timeout, TransportError)
+from httpx._utils import get_environment_proxies
+
+from ._cache import DataCache
+from ._encoder import JsonArrayReader, JsonEncoder, JsonEncoderOptions
+from ._http_cache import (DiskHttpCache, HttpCache, HttpCacheEntry,
+                          MemoryHttpCache)
+from ._instrumentation import (HistogramCollector, RequestMetrics,
+                               RequestObserver, _Measurement)
+from ._limiter import ConcurrencyLimiter
+from ._operation import _Operation
+from ._shared import TestException, _json_encoder_options
+from .V1 import V1, V1Async
+from .V1 import CatalogItem, ExportParameters, Job, JobStatus, TaskStatus
+
+
+T = TypeVar("T")
+
+def _validate_raw_mode(raw_mode: Optional[str]) -> None:
+    if raw_mode is not None and raw_mode != "snake_case" and raw_mode != "untouched":
+        raise Exception(f"The raw mode {raw_mode} is not supported.")
+
+# the request headers which select the response, i.e. responses are not shared between users or configurations
+_CACHE_KEY_HEADER_NAMES = ("accept", "accept-language", "authorization", "cookie", "Nexus-Configuration")
+
+def _get_cache_key(request: Request) -> str:
+    """Returns the cache key of a request, a digest of the method, the URL and the request headers which select the response. Credentials never appear in the key."""
+
+    key = hashlib.sha256(f"{request.method} {request.url}".encode("utf-8"))
+
+    for name in _CACHE_KEY_HEADER_NAMES:
+
+        value = request.headers.get(name)
+
+        if value is not None:
+            key.update(f"\n{name}: {value}".encode("utf-8"))
+
+    return key.hexdigest()
+
+def _get_retry_after(response: Response) -> Optional[float]:
+    """Returns the number of seconds of the Retry-After header, which contains either seconds or an HTTP date."""
+
+    value = response.headers.get("Retry-After")
+
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+
+    except (TypeError, ValueError):
+        return None
+
+class _DisposableConfiguration:
+    ___client : TestClient
+
+    def __init__(self, client: TestClient):
+        self.___client = client
+
+    # "disposable" methods
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.___client.clear_configuration()
+
+class TestClient:
+    """A client for the Test system."""
+    
+    ___configuration_header_key: str = "Nexus-Configuration"
+    ___authorization_header_key: str = "Authorization"
+
+    ___token: Optional[str]
+    ___http_client: Client
+    ___json_encoder_options: JsonEncoderOptions
+    ___lazy_json_encoder_options: JsonEncoderOptions
+    ___raw_json_encoder_options: JsonEncoderOptions
+    ___lazy_decode: ContextVar[bool]
+    ___raw_mode: ContextVar[Optional[str]]
+    ___stream_responses: ContextVar[bool]
+    ___request_headers: ContextVar[Optional[dict[str, str]]]
+    ___observed_responses: ContextVar[Optional[list[Response]]]
+    ___bypass_http_cache: ContextVar[bool]
+    ___http_cache: Optional[HttpCache]
+    ___coalesce_requests: bool
+    ___retry_policy: Optional[RetryPolicy]
+    ___concurrency_limiter: Optional[ConcurrencyLimiter]
+    ___request_observers: list[RequestObserver]
+    ___retry_budget: _RetryBudget
+    ___latency_tracker: _LatencyTracker
+    ___in_flight_requests: dict[Any, Future]
+    ___in_flight_requests_lock: threading.Lock
+    ___hedging_executor: Optional[ThreadPoolExecutor]
+
+    _v1: V1
+
+
+    @classmethod
+    def create(
+        cls,
+        base_url: str,
+        json_backend: str = "stdlib",
+        lazy_decode: bool = False,
+        raw_mode: Optional[str] = None,
+        http_cache: Optional[HttpCache] = None,
+        coalesce_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        request_observers: Optional[list[RequestObserver]] = None,
+        transport_options: Optional[TransportOptions] = None,
+        connection_pool: Optional[SharedConnectionPool] = None) -> TestClient:
+        """
+        Initializes a new instance of the TestClient
+        
+            Args:
+                base_url: The base URL to use.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
+                transport_options: The HTTP/2, connection pool and timeout options.
+                connection_pool: An optional connection pool which is shared with other clients. The transport options of the pool apply, except for the timeouts.
+        """
+
+        # the default transport of httpx uses the proxies of the environment
+        if transport_options is None and connection_pool is None:
+            http_client = Client(base_url=base_url, timeout=60.0)
+
+        else:
+
+            transport_options = transport_options or TransportOptions()
+
+            if connection_pool is None:
+                transport = transport_options._create_transport()
+                mounts = transport_options._create_mounts()
+
+            else:
+                transport = connection_pool._get_transport()
+                mounts = connection_pool._get_mounts()
+
+            http_client = Client(base_url=base_url, timeout=transport_options._get_timeout(), transport=transport, mounts=mounts)
+
+        return TestClient(http_client, json_backend, lazy_decode, raw_mode, http_cache, coalesce_requests, retry_policy, concurrency_limiter, request_observers)
+
+    def __init__(self, http_client: Client, json_backend: str = "stdlib", lazy_decode: bool = False, raw_mode: Optional[str] = None, http_cache: Optional[HttpCache] = None, coalesce_requests: bool = False, retry_policy: Optional[RetryPolicy] = None, concurrency_limiter: Optional[ConcurrencyLimiter] = None, request_observers: Optional[list[RequestObserver]] = None):
+        """
+        Initializes a new instance of the TestClient
+        
+            Args:
+                http_client: The HTTP client to use. Use the create() method to configure the transport and the connection pool.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
+        """
+
+        if http_client.base_url is None:
+            raise Exception("The base url of the HTTP client must be set.")
+
+        _validate_raw_mode(raw_mode)
+
+        self.___http_client = http_client
+
+        self.___json_encoder_options = _json_encoder_options \
+            if json_backend == _json_encoder_options.json_backend \
+            else replace(_json_encoder_options, json_backend=json_backend)
+
+        self.___lazy_json_encoder_options = replace(self.___json_encoder_options, lazy_decode=True)
+        self.___raw_json_encoder_options = replace(self.___json_encoder_options, raw_decode=True)
+        self.___lazy_decode = ContextVar("lazy_decode", default=lazy_decode)
+        self.___raw_mode = ContextVar("raw_mode", default=raw_mode)
+        self.___stream_responses = ContextVar("stream_responses", default=False)
+        self.___request_headers = ContextVar("request_headers", default=None)
+        self.___observed_responses = ContextVar("observed_responses", default=None)
+        self.___bypass_http_cache = ContextVar("bypass_http_cache", default=False)
+        self.___http_cache = http_cache
+        self.___coalesce_requests = coalesce_requests
+        self.___in_flight_requests = {}
+        self.___in_flight_requests_lock = threading.Lock()
+        self.___hedging_executor = None
+        self.___retry_policy = retry_policy
+
+        self.___retry_budget = _RetryBudget(1, 1) \
+            if retry_policy is None \
+            else _RetryBudget(retry_policy.budget_ratio, retry_policy.budget_burst)
+
+        self.___latency_tracker = _LatencyTracker()
+        self.___concurrency_limiter = concurrency_limiter
+        self.___request_observers = list(request_observers or [])
+        self.___token = None
+
+        self._v1 = V1(self._invoke, self._invoke_iter)
+
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Gets a value which indicates if the user is authenticated."""
+        return self.___token is not None
+
+    @property
+    def v1(self) -> V1:
+        """Gets the client for version V1."""
+        return self._v1
+
+
+
+    def sign_in(self, access_token: str):
+        """Signs in the user.
+
+        Args:
+            access_token: The access token.
+        """
+
+        authorization_header_value = f"Bearer {access_token}"
+
+        if self.___authorization_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___authorization_header_key]
+
+        self.___http_client.headers[self.___authorization_header_key] = authorization_header_value
+        self.___token = access_token
+
+    def batch(self, max_concurrency: int = 16) -> Batch:
+        """Creates a batch which executes many operations concurrently, e.g. batch.submit(client.v1.items.get_item, id), and returns their results as they complete.
+
+        Args:
+            max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+        return Batch(max_concurrency)
+
+    @contextmanager
+    def lazy_decode(self, enabled: bool = True) -> Iterator[None]:
+        """Enables or disables lazy decoding for requests within the with block. Lazily decoded models keep the JSON data and decode each field on first access.
+
+        Args:
+            enabled: Enable or disable lazy decoding.
+        """
+
+        token = self.___lazy_decode.set(enabled)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(token)
+
+    @contextmanager
+    def raw(self, mode: Optional[str] = "snake_case") -> Iterator[None]:
+        """Returns the parsed JSON instead of models for requests within the with block. This skips the construction of the models. Use typing.cast with the generated TypedDicts for static typing.
+
+        Args:
+            mode: "snake_case" to convert the property names (like the model fields), "untouched" to return the JSON as is or None to disable the raw mode.
+        """
+
+        _validate_raw_mode(mode)
+        token = self.___raw_mode.set(mode)
+
+        try:
+            yield
+
+        finally:
+            self.___raw_mode.reset(token)
+
+    def attach_configuration(self, configuration: Any) -> Any:
+        """Attaches configuration data to subsequent API requests.
+        
+        Args:
+            configuration: The configuration data.
+        """
+
+        encoded_json = base64.b64encode(json.dumps(configuration).encode("utf-8")).decode("utf-8")
+
+        if self.___configuration_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___configuration_header_key]
+
+        self.___http_client.headers[self.___configuration_header_key] = encoded_json
+
+        return _DisposableConfiguration(self)
+
+    def clear_configuration(self) -> None:
+        """Clears configuration data for all subsequent API requests."""
+
+        if self.___configuration_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___configuration_header_key]
+
+    def _invoke(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> T:
+
+        typeOfT = operation.return_type
+        method = operation.method
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request)
+
+            # identical concurrent GET requests share one response
+            if self.___coalesce_requests and method == "GET" and typeOfT is not Response and typeOfT is not type(None):
+                return_value = self._invoke_coalesced(cast(Type[T], typeOfT), request, operation.url_template, measurement)
+
+            else:
+                return_value = self._process_request(typeOfT, request, operation.url_template, measurement)
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
+
+        return return_value
+
+    def _invoke_coalesced(self, typeOfT: Type[T], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        key = (_get_cache_key(request), self._get_decoding_mode(typeOfT))
+        with self.___in_flight_requests_lock:
+
+            future = self.___in_flight_requests.get(key)
+            is_leader = future is None
+
+            if future is None:
+                future = Future()
+                self.___in_flight_requests[key] = future
+
+        # wait for the thread which sends the request
+        if not is_leader:
+            return future.result()
+
+        try:
+            return_value = self._process_request(typeOfT, request, url_template, measurement)
+
+        except BaseException as exception:
+
+            with self.___in_flight_requests_lock:
+                del self.___in_flight_requests[key]
+
+            future.set_exception(exception)
+            raise
+
+        with self.___in_flight_requests_lock:
+            del self.___in_flight_requests[key]
+
+        future.set_result(return_value)
+
+        return return_value
+
+    def _process_request(self, typeOfT: Optional[Type[T]], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        method = request.method
+
+        # use the cached response if available
+        http_cache = self.___http_cache
+        cache_key: Optional[str] = None
+        cache_entry: Optional[HttpCacheEntry] = None
+
+        if http_cache is not None and method == "GET" and typeOfT is not Response and typeOfT is not type(None) and not self.___bypass_http_cache.get():
+
+            cache_key = _get_cache_key(request)
+            cache_entry = http_cache._lookup(cache_key)
+
+            if cache_entry is not None:
+
+                if cache_entry.is_fresh():
+                    return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
+
+                if cache_entry.etag is not None:
+                    request.headers["If-None-Match"] = cache_entry.etag
+
+                if cache_entry.last_modified is not None:
+                    request.headers["If-Modified-Since"] = cache_entry.last_modified
+
+        # send request
+        stream = typeOfT is Response and self.___stream_responses.get()
+
+        if measurement is not None:
+            measurement.sending()
+
+        response = self._send(request, url_template, stream)
+
+        if measurement is not None:
+
+            measurement.received(response)
+
+            if not stream:
+                measurement.add_response_size(len(response.content))
+
+        observed_responses = self.___observed_responses.get()
+
+        if observed_responses is not None:
+            observed_responses.append(response)
+
+        # the cached response is still valid
+        if http_cache is not None and cache_key is not None and cache_entry is not None and response.status_code == 304:
+            response.close()
+            http_cache._revalidate(cache_key, cache_entry, response.headers)
+
+            return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
+
+        # process response
+        if not response.is_success:
+
+            if stream:
+                response.read()
+
+            raise self._create_exception(response)
+
+        try:
+
+            if typeOfT is type(None):
+                return cast(T, type(None))
+
+            elif typeOfT is Response:
+                return cast(T, response)
+
+            else:
+
+                return_value = self._decode(cast(Type[T], typeOfT), response.content, measurement)
+
+                if http_cache is not None and cache_key is not None:
+
+                    cache_entry = http_cache._store(cache_key, response.headers, response.content)
+
+                    if cache_entry is not None:
+                        cache_entry.decoded[self._get_decoding_mode(typeOfT)] = return_value
+
+                return return_value
+
+        finally:
+            if typeOfT is not Response:
+                response.close()
+
+    def _decode(self, typeOfT: Type[T], content: bytes, measurement: Optional[_Measurement]) -> T:
+
+        if measurement is not None:
+            measurement.mark()
+
+        jsonObject = JsonEncoder.parse(content, self.___json_encoder_options)
+
+        if measurement is not None:
+            measurement.parsed()
+
+        options = self._get_decoder_options()
+
+        # raw mode with untouched property names
+        if options is None:
+            return_value = jsonObject
+
+        # use the generated deserializer if available
+        elif options is self.___json_encoder_options and hasattr(typeOfT, "_from_json"):
+            return_value = getattr(typeOfT, "_from_json")(jsonObject)
+
+        else:
+            return_value = JsonEncoder.decode(typeOfT, jsonObject, options)
+
+        if measurement is not None:
+            measurement.decoded()
+
+        if return_value is None:
+            raise TestException("T01", "Response data could not be deserialized.")
+
+        return return_value
+
+    # the decoded objects are reused as long as the response is cached
+    def _decode_cache_entry(self, typeOfT: Type[T], cache_entry: HttpCacheEntry, measurement: Optional[_Measurement]) -> T:
+
+        decoding_mode = self._get_decoding_mode(typeOfT)
+        return_value = cache_entry.decoded.get(decoding_mode)
+
+        if return_value is None:
+            return_value = self._decode(typeOfT, cache_entry.content, measurement)
+            cache_entry.decoded[decoding_mode] = return_value
+
+        return return_value
+
+    def _get_decoding_mode(self, typeOfT: Any) -> tuple[Any, Optional[str], bool]:
+        return (typeOfT, self.___raw_mode.get(), self.___lazy_decode.get())
+    
+    def _invoke_iter(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> Iterator[T]:
+
+        typeOfT = operation.return_type
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, operation.method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(operation.method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request)
+                measurement.sending()
+
+            # send request
+            response = self._send(request, operation.url_template, True)
+
+            if measurement is not None:
+                measurement.received(response)
+
+            try:
+
+                # process response
+                if not response.is_success:
+                    response.read()
+                    raise self._create_exception(response)
+
+                # decode the array items while the response body is being received
+                options = self._get_decoder_options()
+
+                decode = JsonEncoder.get_decoder(typeOfT, options) \
+                    if options is not None \
+                    else lambda item: item
+
+                if measurement is not None:
+                    decode = measurement.measure_decode(decode)
+
+                reader = JsonArrayReader()
+
+                for chunk in response.iter_bytes():
+
+                    if measurement is not None:
+                        measurement.add_response_size(len(chunk))
+                        measurement.mark()
+
+                    items = reader.feed(chunk)
+
+                    if measurement is not None:
+                        measurement.parsed()
+
+                    for item in items:
+                        yield decode(item)
+
+                for item in reader.close():
+                    yield decode(item)
+
+            finally:
+                response.close()
+
+        # the consumer has stopped the iteration early
+        except GeneratorExit:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(None))
+
+            raise
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
+
+    def _notify_observers(self, metrics: RequestMetrics) -> None:
+        for observer in self.___request_observers:
+            observer(metrics)
+
+    # retries and hedges idempotent requests according to the retry policy
+    def _send(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        retry_policy = self.___retry_policy
+
+        if retry_policy is None or request.method not in retry_policy.methods or not _is_replayable(request):
+            return self._send_timed(request, url_template, stream)
+
+        self.___retry_budget.deposit()
+        backoff = _Backoff(retry_policy.initial_delay, retry_policy.max_delay)
+        retries = 0
+
+        while True:
+
+            # a sent request is not sent again
+            attempt = request \
+                if retries == 0 \
+                else _copy_request(request)
+
+            try:
+                response = self._send_hedged(attempt, url_template, stream, retry_policy)
+
+            except TransportError:
+
+                if retries >= retry_policy.max_retries or not self.___retry_budget.withdraw():
+                    raise
+
+                retry_after = None
+
+            else:
+
+                if response.status_code not in retry_policy.retry_status_codes or \
+                   retries >= retry_policy.max_retries or \
+                   not self.___retry_budget.withdraw():
+
+                    return response
+
+                retry_after = _get_retry_after(response)
+                response.close()
+
+            retries += 1
+            time.sleep(backoff.next(retry_after))
+
+    def _send_hedged(self, request: Request, url_template: str, stream: bool, retry_policy: RetryPolicy) -> Response:
+
+        threshold = None \
+            if retry_policy.hedge_percentile is None \
+            else self.___latency_tracker.get_percentile(retry_policy.hedge_percentile, retry_policy.hedge_min_samples)
+
+        if threshold is None:
+            return self._send_timed(request, url_template, stream)
+
+        # the first request is sent on the calling thread and only the hedged request on the pool, so that waiting
+        # for a pool thread neither delays the first request nor adds to the threshold
+        first_completed = threading.Event()
+        deadline = time.perf_counter() + threshold
+        second = self._get_hedging_executor().submit(self._send_hedge, _copy_request(request), url_template, stream, deadline, first_completed)
+
+        try:
+            response = self._send_timed(request, url_template, stream)
+
+        except BaseException as exception:
+
+            first_completed.set()
+            second.cancel()
+
+            # the hedged request may still succeed
+            if isinstance(exception, TransportError) and not second.cancelled() and second.exception() is None:
+
+                hedged_response = second.result()
+
+                if hedged_response is not None:
+                    return hedged_response
+
+            raise
+
+        first_completed.set()
+        second.cancel()
+        hedged_response = _get_response(second)
+
+        # the hedged request has completed first
+        if hedged_response is not None:
+            response.close()
+            return hedged_response
+
+        second.add_done_callback(_close_response)
+
+        return response
+
+    def _send_hedge(self, request: Request, url_template: str, stream: bool, deadline: float, first_completed: threading.Event) -> Optional[Response]:
+
+        # the hedged request is only sent if the first request is still running at the deadline
+        if first_completed.wait(max(0.0, deadline - time.perf_counter())) or not self.___retry_budget.withdraw():
+            return None
+
+        return self._send_timed(request, url_template, stream)
+
+    def _send_timed(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        limiter = self.___concurrency_limiter
+
+        if limiter is not None:
+            limiter._acquire()
+
+        # the limiter compares the time to first byte of each operation and server with its own baseline, because the
+        # time to download the body depends on its size and not only on the load of the server
+        limiter_key = (request.url.host, request.method, url_template)
+        start = time.perf_counter()
+
+        try:
+
+            response = self.___http_client.send(request, stream=True)
+            time_to_first_byte = time.perf_counter() - start
+
+            if not stream:
+
+                try:
+                    response.read()
+
+                except BaseException:
+                    response.close()
+                    raise
+
+        except BaseException as exception:
+
+            # cancelled requests (e.g. hedged requests) say nothing about the load of the server
+            if limiter is not None:
+                limiter._release(time.perf_counter() - start if isinstance(exception, TransportError) else None, None, limiter_key)
+
+            raise
+
+        self.___latency_tracker.add(time.perf_counter() - start)
+
+        if limiter is not None:
+            limiter._release(time_to_first_byte, response.status_code, limiter_key)
+
+        return response
+
+    def _get_hedging_executor(self) -> ThreadPoolExecutor:
+
+        with self.___in_flight_requests_lock:
+
+            if self.___hedging_executor is None:
+                self.___hedging_executor = ThreadPoolExecutor(thread_name_prefix="hedging")
+
+            return self.___hedging_executor
+
+    # the body of responses of type Response is not read in advance within the with block
+    @contextmanager
+    def _stream_responses(self) -> Iterator[None]:
+
+        token = self.___stream_responses.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___stream_responses.reset(token)
+
+    # the requests within the with block neither use nor fill the HTTP cache
+    @contextmanager
+    def _bypass_http_cache(self) -> Iterator[None]:
+
+        token = self.___bypass_http_cache.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___bypass_http_cache.reset(token)
+
+    # the requests within the with block return models, independent of the raw mode and lazy decoding
+    @contextmanager
+    def _decode_models(self) -> Iterator[None]:
+
+        raw_mode_token = self.___raw_mode.set(None)
+        lazy_decode_token = self.___lazy_decode.set(False)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(lazy_decode_token)
+            self.___raw_mode.reset(raw_mode_token)
+
+    # the headers are added to the requests within the with block
+    @contextmanager
+    def _request_headers(self, headers: Optional[dict[str, str]]) -> Iterator[None]:
+
+        token = self.___request_headers.set(headers)
+
+        try:
+            yield
+
+        finally:
+            self.___request_headers.reset(token)
+
+    # the responses of the requests within the with block are collected
+    @contextmanager
+    def _observe_responses(self) -> Iterator[list[Response]]:
+
+        responses: list[Response] = []
+        token = self.___observed_responses.set(responses)
+
+        try:
+            yield responses
+
+        finally:
+            self.___observed_responses.reset(token)
+
+    # returns None in raw mode with untouched property names
+    def _get_decoder_options(self) -> Optional[JsonEncoderOptions]:
+
+        raw_mode = self.___raw_mode.get()
+
+        if raw_mode == "untouched":
+            return None
+
+        elif raw_mode == "snake_case":
+            return self.___raw_json_encoder_options
+
+        elif self.___lazy_decode.get():
+            return self.___lazy_json_encoder_options
+
+        else:
+            return self.___json_encoder_options
+
+    def _create_exception(self, response: Response) -> TestException:
+
+        message = response.text
+        status_code = f"T00.{response.status_code}"
+
+        if not message:
+            return TestException(status_code, f"The HTTP request failed with status code {response.status_code}.")
+
+        else:
+            return TestException(status_code, f"The HTTP request failed with status code {response.status_code}. The response message is: {message}")
+
+    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+
+        if content_type_value == "application/json":
+            content = JsonEncoder.encode_to_bytes(content, self.___json_encoder_options)
+       
+        request_message = self.___http_client.build_request(method, relative_url, content = content)
+
+        if content_type_value is not None:
+            request_message.headers["Content-Type"] = content_type_value
+
+        if accept_header_value is not None:
+            request_message.headers["Accept"] = accept_header_value
+
+        request_headers = self.___request_headers.get()
+
+        if request_headers is not None:
+            request_message.headers.update(request_headers)
+
+        return request_message
+
+    # "disposable" methods
+    def __enter__(self) -> TestClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if (self.___http_client is not None):
+            self.___http_client.close()
+
+        if self.___hedging_executor is not None:
+            self.___hedging_executor.shutdown(wait=False)
+
+    def load(
+        self,
+        begin: datetime, 
+        end: datetime, 
+        resource_paths: Iterable[str],
+        on_progress: Optional[Callable[[float], None]],
+        max_concurrency: int = 4,
+        max_chunk_size: int = 16 * 1024 * 1024,
+        values_type: str = "array",
+        cache: Optional[DataCache] = None) -> dict[str, DataResponse]:
+        """This high-level methods simplifies loading multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            resource_paths: The resource paths.
+            onProgress: A callback which accepts the current progress.
+            max_concurrency: The maximum number of data requests which are executed concurrently.
+            max_chunk_size: The maximum number of bytes per data request. Longer time ranges are split into multiple requests.
+            values_type: The type of the returned values: "array" (array.array), "memoryview" or "numpy" (numpy.ndarray, requires the numpy package). The data is written directly into the values without intermediate copies.
+            cache: An optional data cache. Only the time intervals which are not cached yet are loaded and then added to the cache. The data is cached per base URL, so the cache can be shared by clients of different servers.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        if values_type not in _values_types:
+            raise Exception(f"The values type {values_type} is not supported.")
+
+        with self._decode_models():
+            catalog_item_map = self.v1.catalogs.search_catalog_items(list(resource_paths))
+        base_url = str(self.___http_client.base_url)
+
+        # preallocate the buffers and split the time range into chunks which are written directly into the buffers
+        buffers: dict[str, Any] = {}
+        chunks: list[tuple[str, datetime, datetime, memoryview]] = []
+        missing: list[tuple[str, timedelta, datetime, memoryview]] = []
+
+        for (resource_path, catalog_item) in catalog_item_map.items():
+
+            sample_period = catalog_item.representation.sample_period
+            sample_count, _ = _split_time_range(begin, end, sample_period, max_chunk_size)
+            buffer, byte_buffer = _allocate_values(sample_count, values_type)
+
+            # only the gaps in the cache are loaded
+            if cache is None:
+                intervals = [(begin, end)]
+
+            else:
+                intervals = cache.read(resource_path, sample_period, begin, byte_buffer, base_url)
+
+            for (interval_begin, interval_end) in intervals:
+
+                interval_offset = (interval_begin - begin) // sample_period * 8
+                _, time_range_chunks = _split_time_range(interval_begin, interval_end, sample_period, max_chunk_size)
+
+                for (chunk_begin, chunk_end, offset, length) in time_range_chunks:
+                    offset += interval_offset
+                    chunks.append((resource_path, chunk_begin, chunk_end, byte_buffer[offset:offset + length]))
+
+                interval_length = (interval_end - interval_begin) // sample_period * 8
+                missing.append((resource_path, sample_period, interval_begin, byte_buffer[interval_offset:interval_offset + interval_length]))
+
+            buffers[resource_path] = buffer
+
+        total_length = sum(len(chunk[3]) for chunk in chunks)
+        progress: float = 0
+
+        def report_progress(length: int):
+
+            nonlocal progress
+
+            progress = progress + (length / total_length if total_length > 0 else 1.0 / len(chunks))
+
+            if on_progress is not None:
+                on_progress(progress)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+            futures = {executor.submit(self._load_chunk, *chunk): len(chunk[3]) for chunk in chunks}
+
+            try:
+
+                # progress is reported on the calling thread
+                for future in as_completed(futures):
+                    future.result()
+                    report_progress(futures[future])
+
+            except BaseException:
+
+                for future in futures:
+                    future.cancel()
+
+                raise
+
+        # the progress is complete even if nothing has been loaded, e.g. because all data is cached
+        if not chunks and on_progress is not None:
+            on_progress(1)
+
+        if cache is not None:
+            for (resource_path, sample_period, interval_begin, interval_buffer) in missing:
+                cache.write(resource_path, sample_period, interval_begin, interval_buffer, base_url)
+
+        return {resource_path: _create_data_response(catalog_item, buffers[resource_path]) for (resource_path, catalog_item) in catalog_item_map.items()}
+
+    def _load_chunk(self, resource_path: str, begin: datetime, end: datetime, buffer: memoryview) -> None:
+
+        with self._stream_responses():
+            response = self.v1.data.get_stream(resource_path, begin, end)
+
+        try:
+
+            offset = 0
+
+            for data in response.iter_bytes():
+
+                next_offset = offset + len(data)
+
+                if next_offset > len(buffer):
+                    raise Exception("The data length is invalid.")
+
+                buffer[offset:next_offset] = data
+                offset = next_offset
+
+            if offset != len(buffer):
+                raise Exception("The data length is invalid.")
+
+        finally:
+            response.close()
+
+    def export(
+        self,
+        begin: datetime, 
+        end: datetime, 
+        file_period: timedelta,
+        file_format: Optional[str],
+        resource_paths: Iterable[str],
+        configuration: dict[str, object],
+        target_folder: str,
+        on_progress: Optional[Callable[[float, str], None]],
+        max_retries: int = 3,
+        max_concurrency: int = 4,
+        max_jobs: int = 1) -> None:
+        """This high-level methods simplifies exporting multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            filePeriod: The file period. Use timedelta(0) to get a single file.
+            fileFormat: The target file format. If null, data will be read (and possibly cached) but not returned. This is useful for data pre-aggregation.
+            resource_paths: The resource paths to export.
+            configuration: The configuration.
+            targetFolder: The target folder for the files to extract.
+            onProgress: A callback which accepts the current progress and the progress message.
+            max_retries: The maximum number of attempts to resume an interrupted download without receiving new data.
+            max_concurrency: The maximum number of files which are extracted concurrently.
+            max_jobs: The maximum number of export jobs. With a non-zero file period, the time range is split at file boundaries (multiples of the file period since 0001-01-01 UTC) into up to max_jobs jobs. These are created and processed concurrently.
+        """
+
+        if max_jobs < 1:
+            raise Exception("The maximum number of jobs must be at least 1.")
+
+        resource_paths = list(resource_paths)
+        time_ranges = _split_export_time_range(begin, end, file_period, max_jobs)
+        progress = _ExportProgress(len(time_ranges), on_progress)
+
+        # Start jobs
+        export_parameters = [
+            ExportParameters(
+                job_begin,
+                job_end,
+                file_period,
+                file_format,
+                resource_paths,
+                configuration
+            ) for (job_begin, job_end) in time_ranges
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(export_parameters)) as executor:
+            jobs = list(executor.map(self._create_export_job, export_parameters))
+
+        # Wait for jobs to finish
+        job_statuses = self.wait_for_jobs(
+            [job.id for job in jobs],
+            lambda index, value: progress.report(index, value, "export"))
+
+        progress.complete("export")
+
+        artifact_ids: list[str] = []
+
+        for job_status in job_statuses:
+
+            if (job_status.result is None or \
+                type(job_status.result) != str):
+
+                raise Exception("The job result is invalid.")
+
+            artifact_ids.append(cast(str, job_status.result))
+
+        if file_format is None:
+            return
+
+        # Download and extract zip files
+        with ThreadPoolExecutor(max_workers=len(artifact_ids)) as executor:
+
+            futures = [
+                executor.submit(self._download_and_extract, artifact_id, target_folder, max_retries, max_concurrency, progress, index)
+                for (index, artifact_id) in enumerate(artifact_ids)]
+
+            for future in futures:
+                future.result()
+
+        progress.complete("download")
+        progress.complete("extract")
+
+    def _create_export_job(self, parameters: ExportParameters) -> Job:
+
+        with self._decode_models():
+            return self.v1.jobs.export(parameters)
+
+    def wait_for_jobs(
+        self,
+        job_ids: Iterable[UUID],
+        on_progress: Optional[Callable[[int, float], None]] = None,
+        initial_delay: float = 0.1,
+        max_delay: float = 10.0) -> list[JobStatus]:
+        """Waits until all jobs have run to completion. The job status is polled with exponentially increasing delays. A Retry-After header of the server takes precedence.
+
+        Args:
+            job_ids: The job identifiers.
+            on_progress: A callback which accepts the index of the job and its current progress.
+            initial_delay: The delay in seconds before the first status request.
+            max_delay: The maximum delay in seconds between two status requests.
+        """
+
+        job_ids = list(job_ids)
+        job_statuses: list[Optional[JobStatus]] = [None] * len(job_ids)
+        polling_delay = _Backoff(initial_delay, max_delay)
+        retry_after: Optional[float] = None
+
+        while True:
+            time.sleep(polling_delay.next(retry_after))
+
+            pending = [index for (index, job_status) in enumerate(job_statuses) if job_status is None]
+
+            # the status of all pending jobs is requested together
+            results = [self._get_job_status(job_ids[index]) for index in pending]
+
+            retry_after = max((result[1] for result in results if result[1] is not None), default=None)
+
+            for (index, (job_status, _)) in zip(pending, results):
+
+                if (job_status.status == TaskStatus.CANCELED):
+                    raise Exception("The job has been cancelled.")
+
+                elif (job_status.status == TaskStatus.FAULTED):
+                    raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
+
+                elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+                    job_statuses[index] = job_status
+
+                if on_progress is not None:
+                    on_progress(index, 1 if job_status.status == TaskStatus.RAN_TO_COMPLETION else job_status.progress)
+
+            if all(job_status is not None for job_status in job_statuses):
+                return cast(list[JobStatus], job_statuses)
+
+    # returns the job status and the value of the Retry-After header
+    def _get_job_status(self, job_id: UUID) -> tuple[JobStatus, Optional[float]]:
+
+        # the job status changes while polling, so a cached status (e.g. due to the ttl of the cache) must not be used
+        with self._decode_models(), self._bypass_http_cache(), self._observe_responses() as responses:
+            job_status = self.v1.jobs.get_job_status(job_id)
+
+        return (job_status, _get_retry_after(responses[-1]) if responses else None)
+
+    def _download_and_extract(self, artifact_id: str, target_folder: str, max_retries: int, max_concurrency: int, progress: _ExportProgress, index: int) -> None:
+
+        # Download zip file
+        target_stream = self._download_artifact(artifact_id, lambda value: progress.report(index, value, "download"), max_retries)
+
+        try:
+
+            progress.report(index, 1, "download")
+
+            # Extract file
+            _extract_zip_file(target_stream, target_folder, max_concurrency, lambda value: progress.report(index, value, "extract"))
+
+            progress.report(index, 1, "extract")
+
+        finally:
+            target_stream.close()
+
+    # downloads the artifact into memory or into a temporary file (see _create_artifact_stream)
+    def _download_artifact(self, artifact_id: str, on_progress: Callable[[float], None], max_retries: int) -> IO[bytes]:
+
+        target_stream: Optional[IO[bytes]] = None
+        length: Optional[int] = None
+        consumed = 0
+        retries = 0
+
+        try:
+
+            while True:
+
+                # the raw bytes are counted because the Range and Content-Length headers refer to them, content
+                # encodings are refused so that the raw bytes are the bytes of the zip file
+                headers = { "Accept-Encoding": "identity" }
+
+                # continue where the previous attempt has stopped
+                if consumed > 0:
+                    headers["Range"] = f"bytes={consumed}-"
+
+                try:
+
+                    with self._stream_responses(), self._request_headers(headers):
+                        response = self.v1.artifacts.download(artifact_id)
+
+                    try:
+
+                        # the server does not support range requests, start over
+                        if consumed > 0 and not _is_partial_content(response, consumed):
+                            consumed = 0
+
+                        if consumed == 0:
+
+                            try:
+                                length = int(response.headers["Content-Length"])
+                            except:
+                                length = None
+
+                            if target_stream is not None:
+                                target_stream.close()
+
+                            target_stream = _create_artifact_stream(length)
+
+                        for data in response.iter_raw():
+
+                            target_stream.write(data)
+                            consumed += len(data)
+                            retries = 0
+
+                            if length is not None and consumed < length:
+                                on_progress(consumed / length)
+
+                    finally:
+                        response.close()
+
+                    if length is None or consumed >= length:
+                        break
+
+                    raise TransportError("The download has ended prematurely.")
+
+                except TransportError:
+
+                    retries += 1
+
+                    if retries > max_retries:
+                        raise
+
+        except BaseException:
+
+            if target_stream is not None:
+                target_stream.close()
+
+            raise
+
+        # the stream has been created for the first response
+        result = cast(IO[bytes], target_stream)
+        result.seek(0)
+
+        return result
+
+class _DisposableAsyncConfiguration:
+    ___client : TestAsyncClient
+
+    def __init__(self, client: TestAsyncClient):
+        self.___client = client
+
+    # "disposable" methods
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.___client.clear_configuration()
+
+class TestAsyncClient:
+    """A client for the Test system."""
+    
+    ___configuration_header_key: str = "Nexus-Configuration"
+    ___authorization_header_key: str = "Authorization"
+
+    ___token: Optional[str]
+    ___http_client: AsyncClient
+    ___json_encoder_options: JsonEncoderOptions
+    ___lazy_json_encoder_options: JsonEncoderOptions
+    ___raw_json_encoder_options: JsonEncoderOptions
+    ___lazy_decode: ContextVar[bool]
+    ___raw_mode: ContextVar[Optional[str]]
+    ___stream_responses: ContextVar[bool]
+    ___request_headers: ContextVar[Optional[dict[str, str]]]
+    ___observed_responses: ContextVar[Optional[list[Response]]]
+    ___bypass_http_cache: ContextVar[bool]
+    ___http_cache: Optional[HttpCache]
+    ___coalesce_requests: bool
+    ___retry_policy: Optional[RetryPolicy]
+    ___concurrency_limiter: Optional[ConcurrencyLimiter]
+    ___request_observers: list[RequestObserver]
+    ___retry_budget: _RetryBudget
+    ___latency_tracker: _LatencyTracker
+    ___in_flight_requests: dict[Any, asyncio.Future]
+
+    _v1: V1Async
+
+
+    @classmethod
+    def create(
+        cls,
+        base_url: str,
+        json_backend: str = "stdlib",
+        lazy_decode: bool = False,
+        raw_mode: Optional[str] = None,
+        http_cache: Optional[HttpCache] = None,
+        coalesce_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        request_observers: Optional[list[RequestObserver]] = None,
+        transport_options: Optional[TransportOptions] = None,
+        connection_pool: Optional[SharedConnectionPool] = None) -> TestAsyncClient:
+        """
+        Initializes a new instance of the TestAsyncClient
+        
+            Args:
+                base_url: The base URL to use.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
+                transport_options: The HTTP/2, connection pool and timeout options.
+                connection_pool: An optional connection pool which is shared with other clients. The transport options of the pool apply, except for the timeouts.
+        """
+
+        # the default transport of httpx uses the proxies of the environment
+        if transport_options is None and connection_pool is None:
+            http_client = AsyncClient(base_url=base_url, timeout=60.0)
+
+        else:
+
+            transport_options = transport_options or TransportOptions()
+
+            if connection_pool is None:
+                transport = transport_options._create_async_transport()
+                mounts = transport_options._create_async_mounts()
+
+            else:
+                transport = connection_pool._get_async_transport()
+                mounts = connection_pool._get_async_mounts()
+
+            http_client = AsyncClient(base_url=base_url, timeout=transport_options._get_timeout(), transport=transport, mounts=mounts)
+
+        return TestAsyncClient(http_client, json_backend, lazy_decode, raw_mode, http_cache, coalesce_requests, retry_policy, concurrency_limiter, request_observers)
+
+    def __init__(self, http_client: AsyncClient, json_backend: str = "stdlib", lazy_decode: bool = False, raw_mode: Optional[str] = None, http_cache: Optional[HttpCache] = None, coalesce_requests: bool = False, retry_policy: Optional[RetryPolicy] = None, concurrency_limiter: Optional[ConcurrencyLimiter] = None, request_observers: Optional[list[RequestObserver]] = None):
+        """
+        Initializes a new instance of the TestAsyncClient
+        
+            Args:
+                http_client: The HTTP client to use. Use the create() method to configure the transport and the connection pool.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
+        """
+
+        if http_client.base_url is None:
+            raise Exception("The base url of the HTTP client must be set.")
+
+        _validate_raw_mode(raw_mode)
+
+        self.___http_client = http_client
+
+        self.___json_encoder_options = _json_encoder_options \
+            if json_backend == _json_encoder_options.json_backend \
+            else replace(_json_encoder_options, json_backend=json_backend)
+
+        self.___lazy_json_encoder_options = replace(self.___json_encoder_options, lazy_decode=True)
+        self.___raw_json_encoder_options = replace(self.___json_encoder_options, raw_decode=True)
+        self.___lazy_decode = ContextVar("lazy_decode", default=lazy_decode)
+        self.___raw_mode = ContextVar("raw_mode", default=raw_mode)
+        self.___stream_responses = ContextVar("stream_responses", default=False)
+        self.___request_headers = ContextVar("request_headers", default=None)
+        self.___observed_responses = ContextVar("observed_responses", default=None)
+        self.___bypass_http_cache = ContextVar("bypass_http_cache", default=False)
+        self.___http_cache = http_cache
+        self.___coalesce_requests = coalesce_requests
+        self.___in_flight_requests = {}
+        self.___retry_policy = retry_policy
+
+        self.___retry_budget = _RetryBudget(1, 1) \
+            if retry_policy is None \
+            else _RetryBudget(retry_policy.budget_ratio, retry_policy.budget_burst)
+
+        self.___latency_tracker = _LatencyTracker()
+        self.___concurrency_limiter = concurrency_limiter
+        self.___request_observers = list(request_observers or [])
+        self.___token = None
+
+        self._v1 = V1Async(self._invoke, self._invoke_iter)
+
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Gets a value which indicates if the user is authenticated."""
+        return self.___token is not None
+
+    @property
+    def v1(self) -> V1Async:
+        """Gets the client for version V1."""
+        return self._v1
+
+
+
+    def sign_in(self, access_token: str):
+        """Signs in the user.
+
+        Args:
+            access_token: The access token.
+        """
+
+        authorization_header_value = f"Bearer {access_token}"
+
+        if self.___authorization_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___authorization_header_key]
+
+        self.___http_client.headers[self.___authorization_header_key] = authorization_header_value
+        self.___token = access_token
+
+    def batch(self, max_concurrency: int = 16) -> AsyncBatch:
+        """Creates a batch which executes many operations concurrently, e.g. batch.submit(client.v1.items.get_item, id), and returns their results as they complete.
+
+        Args:
+            max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+        return AsyncBatch(max_concurrency)
+
+    @contextmanager
+    def lazy_decode(self, enabled: bool = True) -> Iterator[None]:
+        """Enables or disables lazy decoding for requests within the with block. Lazily decoded models keep the JSON data and decode each field on first access.
+
+        Args:
+            enabled: Enable or disable lazy decoding.
+        """
+
+        token = self.___lazy_decode.set(enabled)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(token)
+
+    @contextmanager
+    def raw(self, mode: Optional[str] = "snake_case") -> Iterator[None]:
+        """Returns the parsed JSON instead of models for requests within the with block. This skips the construction of the models. Use typing.cast with the generated TypedDicts for static typing.
+
+        Args:
+            mode: "snake_case" to convert the property names (like the model fields), "untouched" to return the JSON as is or None to disable the raw mode.
+        """
+
+        _validate_raw_mode(mode)
+        token = self.___raw_mode.set(mode)
+
+        try:
+            yield
+
+        finally:
+            self.___raw_mode.reset(token)
+
+    def attach_configuration(self, configuration: Any) -> Any:
+        """Attaches configuration data to subsequent API requests.
+        
+        Args:
+            configuration: The configuration data.
+        """
+
+        encoded_json = base64.b64encode(json.dumps(configuration).encode("utf-8")).decode("utf-8")
+
+        if self.___configuration_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___configuration_header_key]
+
+        self.___http_client.headers[self.___configuration_header_key] = encoded_json
+
+        return _DisposableAsyncConfiguration(self)
+
+    def clear_configuration(self) -> None:
+        """Clears configuration data for all subsequent API requests."""
+
+        if self.___configuration_header_key in self.___http_client.headers:
+            del self.___http_client.headers[self.___configuration_header_key]
+
+    async def _invoke(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> T:
+
+        typeOfT = operation.return_type
+        method = operation.method
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request, is_async=True)
+
+            # identical concurrent GET requests share one response
+            if self.___coalesce_requests and method == "GET" and typeOfT is not Response and typeOfT is not type(None):
+                return_value = await self._invoke_coalesced(cast(Type[T], typeOfT), request, operation.url_template, measurement)
+
+            else:
+                return_value = await self._process_request(typeOfT, request, operation.url_template, measurement)
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
+
+        return return_value
+
+    async def _invoke_coalesced(self, typeOfT: Type[T], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        key = (_get_cache_key(request), self._get_decoding_mode(typeOfT))
+        task = self.___in_flight_requests.get(key)
+
+        if task is None:
+
+            # the request is not cancelled when a single caller is cancelled
+            task = asyncio.ensure_future(self._process_request(typeOfT, request, url_template, measurement))
+            task.add_done_callback(lambda _: self.___in_flight_requests.pop(key, None))
+            self.___in_flight_requests[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _process_request(self, typeOfT: Optional[Type[T]], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        method = request.method
+
+        # use the cached response if available
+        http_cache = self.___http_cache
+        cache_key: Optional[str] = None
+        cache_entry: Optional[HttpCacheEntry] = None
+
+        if http_cache is not None and method == "GET" and typeOfT is not Response and typeOfT is not type(None) and not self.___bypass_http_cache.get():
+
+            cache_key = _get_cache_key(request)
+            cache_entry = http_cache._lookup(cache_key)
+
+            if cache_entry is not None:
+
+                if cache_entry.is_fresh():
+                    return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
+
+                if cache_entry.etag is not None:
+                    request.headers["If-None-Match"] = cache_entry.etag
+
+                if cache_entry.last_modified is not None:
+                    request.headers["If-Modified-Since"] = cache_entry.last_modified
+
+        # send request
+        stream = typeOfT is Response and self.___stream_responses.get()
+
+        if measurement is not None:
+            measurement.sending()
+
+        response = await self._send(request, url_template, stream)
+
+        if measurement is not None:
+
+            measurement.received(response)
+
+            if not stream:
+                measurement.add_response_size(len(response.content))
+
+        observed_responses = self.___observed_responses.get()
+
+        if observed_responses is not None:
+            observed_responses.append(response)
+
+        # the cached response is still valid
+        if http_cache is not None and cache_key is not None and cache_entry is not None and response.status_code == 304:
+            await response.aclose()
+            http_cache._revalidate(cache_key, cache_entry, response.headers)
+
+            return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
+
+        # process response
+        if not response.is_success:
+
+            if stream:
+                await response.aread()
+
+            raise self._create_exception(response)
+
+        try:
+
+            if typeOfT is type(None):
+                return cast(T, type(None))
+
+            elif typeOfT is Response:
+                return cast(T, response)
+
+            else:
+
+                return_value = self._decode(cast(Type[T], typeOfT), response.content, measurement)
+
+                if http_cache is not None and cache_key is not None:
+
+                    cache_entry = http_cache._store(cache_key, response.headers, response.content)
+
+                    if cache_entry is not None:
+                        cache_entry.decoded[self._get_decoding_mode(typeOfT)] = return_value
+
+                return return_value
+
+        finally:
+            if typeOfT is not Response:
+                await response.aclose()
+
+    def _decode(self, typeOfT: Type[T], content: bytes, measurement: Optional[_Measurement]) -> T:
+
+        if measurement is not None:
+            measurement.mark()
+
+        jsonObject = JsonEncoder.parse(content, self.___json_encoder_options)
+
+        if measurement is not None:
+            measurement.parsed()
+
+        options = self._get_decoder_options()
+
+        # raw mode with untouched property names
+        if options is None:
+            return_value = jsonObject
+
+        # use the generated deserializer if available
+        elif options is self.___json_encoder_options and hasattr(typeOfT, "_from_json"):
+            return_value = getattr(typeOfT, "_from_json")(jsonObject)
+
+        else:
+            return_value = JsonEncoder.decode(typeOfT, jsonObject, options)
+
+        if measurement is not None:
+            measurement.decoded()
+
+        if return_value is None:
+            raise TestException("T01", "Response data could not be deserialized.")
+
+        return return_value
+
+    # the decoded objects are reused as long as the response is cached
+    def _decode_cache_entry(self, typeOfT: Type[T], cache_entry: HttpCacheEntry, measurement: Optional[_Measurement]) -> T:
+
+        decoding_mode = self._get_decoding_mode(typeOfT)
+        return_value = cache_entry.decoded.get(decoding_mode)
+
+        if return_value is None:
+            return_value = self._decode(typeOfT, cache_entry.content, measurement)
+            cache_entry.decoded[decoding_mode] = return_value
+
+        return return_value
+
+    def _get_decoding_mode(self, typeOfT: Any) -> tuple[Any, Optional[str], bool]:
+        return (typeOfT, self.___raw_mode.get(), self.___lazy_decode.get())
+    
+    async def _invoke_iter(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> AsyncIterator[T]:
+
+        typeOfT = operation.return_type
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, operation.method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(operation.method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request, is_async=True)
+                measurement.sending()
+
+            # send request
+            response = await self._send(request, operation.url_template, True)
+
+            if measurement is not None:
+                measurement.received(response)
+
+            try:
+
+                # process response
+                if not response.is_success:
+                    await response.aread()
+                    raise self._create_exception(response)
+
+                # decode the array items while the response body is being received
+                options = self._get_decoder_options()
+
+                decode = JsonEncoder.get_decoder(typeOfT, options) \
+                    if options is not None \
+                    else lambda item: item
+
+                if measurement is not None:
+                    decode = measurement.measure_decode(decode)
+
+                reader = JsonArrayReader()
+
+                async for chunk in response.aiter_bytes():
+
+                    if measurement is not None:
+                        measurement.add_response_size(len(chunk))
+                        measurement.mark()
+
+                    items = reader.feed(chunk)
+
+                    if measurement is not None:
+                        measurement.parsed()
+
+                    for item in items:
+                        yield decode(item)
+
+                for item in reader.close():
+                    yield decode(item)
+
+            finally:
+                await response.aclose()
+
+        # the consumer has stopped the iteration early
+        except GeneratorExit:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(None))
+
+            raise
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
+
+    def _notify_observers(self, metrics: RequestMetrics) -> None:
+        for observer in self.___request_observers:
+            observer(metrics)
+
+    # retries and hedges idempotent requests according to the retry policy
+    async def _send(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        retry_policy = self.___retry_policy
+
+        if retry_policy is None or request.method not in retry_policy.methods or not _is_replayable(request):
+            return await self._send_timed(request, url_template, stream)
+
+        self.___retry_budget.deposit()
+        backoff = _Backoff(retry_policy.initial_delay, retry_policy.max_delay)
+        retries = 0
+
+        while True:
+
+            # a sent request is not sent again
+            attempt = request \
+                if retries == 0 \
+                else _copy_request(request)
+
+            try:
+                response = await self._send_hedged(attempt, url_template, stream, retry_policy)
+
+            except TransportError:
+
+                if retries >= retry_policy.max_retries or not self.___retry_budget.withdraw():
+                    raise
+
+                retry_after = None
+
+            else:
+
+                if response.status_code not in retry_policy.retry_status_codes or \
+                   retries >= retry_policy.max_retries or \
+                   not self.___retry_budget.withdraw():
+
+                    return response
+
+                retry_after = _get_retry_after(response)
+                await response.aclose()
+
+            retries += 1
+            await asyncio.sleep(backoff.next(retry_after))
+
+    async def _send_hedged(self, request: Request, url_template: str, stream: bool, retry_policy: RetryPolicy) -> Response:
+
+        threshold = None \
+            if retry_policy.hedge_percentile is None \
+            else self.___latency_tracker.get_percentile(retry_policy.hedge_percentile, retry_policy.hedge_min_samples)
+
+        if threshold is None:
+            return await self._send_timed(request, url_template, stream)
+
+        first = asyncio.ensure_future(self._send_timed(request, url_template, stream))
+        pending: set[asyncio.Future[Response]] = { first }
+        done: set[asyncio.Future[Response]] = set()
+
+        # the requests are also cancelled if the caller is cancelled
+        try:
+
+            done, pending = await asyncio.wait(pending, timeout=threshold)
+
+            # the first response wins, the other request is cancelled
+            if not done and self.___retry_budget.withdraw():
+                pending.add(asyncio.ensure_future(self._send_timed(_copy_request(request), url_template, stream)))
+
+            while True:
+
+                winner = next((task for task in done if task.exception() is None), None)
+
+                if winner is not None:
+                    done.remove(winner)
+                    return winner.result()
+
+                # all requests have failed
+                if not pending:
+                    return done.pop().result()
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        finally:
+
+            for task in pending:
+                task.cancel()
+
+            # wait for the cancelled requests to give back their connections and limiter slots and close the responses
+            # of the requests which have completed anyway
+            for result in await asyncio.gather(*pending, *done, return_exceptions=True):
+                if isinstance(result, Response):
+                    await result.aclose()
+
+    async def _send_timed(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        limiter = self.___concurrency_limiter
+
+        if limiter is not None:
+            await limiter._acquire_async()
+
+        # the limiter compares the time to first byte of each operation and server with its own baseline, because the
+        # time to download the body depends on its size and not only on the load of the server
+        limiter_key = (request.url.host, request.method, url_template)
+        start = time.perf_counter()
+
+        try:
+
+            response = await self.___http_client.send(request, stream=True)
+            time_to_first_byte = time.perf_counter() - start
+
+            if not stream:
+
+                try:
+                    await response.aread()
+
+                except BaseException:
+                    await response.aclose()
+                    raise
+
+        except BaseException as exception:
+
+            # cancelled requests (e.g. hedged requests) say nothing about the load of the server
+            if limiter is not None:
+                limiter._release(time.perf_counter() - start if isinstance(exception, TransportError) else None, None, limiter_key)
+
+            raise
+
+        self.___latency_tracker.add(time.perf_counter() - start)
+
+        if limiter is not None:
+            limiter._release(time_to_first_byte, response.status_code, limiter_key)
+
+        return response
+
+    # the body of responses of type Response is not read in advance within the with block
+    @contextmanager
+    def _stream_responses(self) -> Iterator[None]:
+
+        token = self.___stream_responses.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___stream_responses.reset(token)
+
+    # the requests within the with block neither use nor fill the HTTP cache
+    @contextmanager
+    def _bypass_http_cache(self) -> Iterator[None]:
+
+        token = self.___bypass_http_cache.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___bypass_http_cache.reset(token)
+
+    # the requests within the with block return models, independent of the raw mode and lazy decoding
+    @contextmanager
+    def _decode_models(self) -> Iterator[None]:
+
+        raw_mode_token = self.___raw_mode.set(None)
+        lazy_decode_token = self.___lazy_decode.set(False)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(lazy_decode_token)
+            self.___raw_mode.reset(raw_mode_token)
+
+    # the headers are added to the requests within the with block
+    @contextmanager
+    def _request_headers(self, headers: Optional[dict[str, str]]) -> Iterator[None]:
+
+        token = self.___request_headers.set(headers)
+
+        try:
+            yield
+
+        finally:
+            self.___request_headers.reset(token)
+
+    # the responses of the requests within the with block are collected
+    @contextmanager
+    def _observe_responses(self) -> Iterator[list[Response]]:
+
+        responses: list[Response] = []
+        token = self.___observed_responses.set(responses)
+
+        try:
+            yield responses
+
+        finally:
+            self.___observed_responses.reset(token)
+
+    # returns None in raw mode with untouched property names
+    def _get_decoder_options(self) -> Optional[JsonEncoderOptions]:
+
+        raw_mode = self.___raw_mode.get()
+
+        if raw_mode == "untouched":
+            return None
+
+        elif raw_mode == "snake_case":
+            return self.___raw_json_encoder_options
+
+        elif self.___lazy_decode.get():
+            return self.___lazy_json_encoder_options
+
+        else:
+            return self.___json_encoder_options
+
+    def _create_exception(self, response: Response) -> TestException:
+
+        message = response.text
+        status_code = f"T00.{response.status_code}"
+
+        if not message:
+            return TestException(status_code, f"The HTTP request failed with status code {response.status_code}.")
+
+        else:
+            return TestException(status_code, f"The HTTP request failed with status code {response.status_code}. The response message is: {message}")
+
+    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+
+        if content_type_value == "application/json":
+            content = JsonEncoder.encode_to_bytes(content, self.___json_encoder_options)
+       
+        request_message = self.___http_client.build_request(method, relative_url, content = content)
+
+        if content_type_value is not None:
+            request_message.headers["Content-Type"] = content_type_value
+
+        if accept_header_value is not None:
+            request_message.headers["Accept"] = accept_header_value
+
+        request_headers = self.___request_headers.get()
+
+        if request_headers is not None:
+            request_message.headers.update(request_headers)
+
+        return request_message
+
+    # "disposable" methods
+    async def __aenter__(self) -> TestAsyncClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        if (self.___http_client is not None):
+            await self.___http_client.aclose()
+
+    async def load(
+        self,
+        begin: datetime, 
+        end: datetime, 
+        resource_paths: Iterable[str],
+        on_progress: Optional[Callable[[float], None]],
+        max_concurrency: int = 4,
+        max_chunk_size: int = 16 * 1024 * 1024,
+        values_type: str = "array",
+        cache: Optional[DataCache] = None) -> dict[str, DataResponse]:
+        """This high-level methods simplifies loading multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            resource_paths: The resource paths.
+            onProgress: A callback which accepts the current progress.
+            max_concurrency: The maximum number of data requests which are executed concurrently.
+            max_chunk_size: The maximum number of bytes per data request. Longer time ranges are split into multiple requests.
+            values_type: The type of the returned values: "array" (array.array), "memoryview" or "numpy" (numpy.ndarray, requires the numpy package). The data is written directly into the values without intermediate copies.
+            cache: An optional data cache. Only the time intervals which are not cached yet are loaded and then added to the cache. The data is cached per base URL, so the cache can be shared by clients of different servers.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        if values_type not in _values_types:
+            raise Exception(f"The values type {values_type} is not supported.")
+
+        with self._decode_models():
+            catalog_item_map = await self.v1.catalogs.search_catalog_items(list(resource_paths))
+        base_url = str(self.___http_client.base_url)
+
+        # preallocate the buffers and split the time range into chunks which are written directly into the buffers
+        buffers: dict[str, Any] = {}
+        chunks: list[tuple[str, datetime, datetime, memoryview]] = []
+        missing: list[tuple[str, timedelta, datetime, memoryview]] = []
+
+        for (resource_path, catalog_item) in catalog_item_map.items():
+
+            sample_period = catalog_item.representation.sample_period
+            sample_count, _ = _split_time_range(begin, end, sample_period, max_chunk_size)
+            buffer, byte_buffer = _allocate_values(sample_count, values_type)
+
+            # only the gaps in the cache are loaded
+            if cache is None:
+                intervals = [(begin, end)]
+
+            else:
+                intervals = cache.read(resource_path, sample_period, begin, byte_buffer, base_url)
+
+            for (interval_begin, interval_end) in intervals:
+
+                interval_offset = (interval_begin - begin) // sample_period * 8
+                _, time_range_chunks = _split_time_range(interval_begin, interval_end, sample_period, max_chunk_size)
+
+                for (chunk_begin, chunk_end, offset, length) in time_range_chunks:
+                    offset += interval_offset
+                    chunks.append((resource_path, chunk_begin, chunk_end, byte_buffer[offset:offset + length]))
+
+                interval_length = (interval_end - interval_begin) // sample_period * 8
+                missing.append((resource_path, sample_period, interval_begin, byte_buffer[interval_offset:interval_offset + interval_length]))
+
+            buffers[resource_path] = buffer
+
+        total_length = sum(len(chunk[3]) for chunk in chunks)
+        progress: float = 0
+
+        def report_progress(length: int):
+
+            nonlocal progress
+
+            progress = progress + (length / total_length if total_length > 0 else 1.0 / len(chunks))
+
+            if on_progress is not None:
+                on_progress(progress)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load_chunk(resource_path: str, chunk_begin: datetime, chunk_end: datetime, chunk_buffer: memoryview) -> None:
+
+            async with semaphore:
+                await self._load_chunk(resource_path, chunk_begin, chunk_end, chunk_buffer)
+
+            report_progress(len(chunk_buffer))
+
+        tasks = [asyncio.ensure_future(load_chunk(*chunk)) for chunk in chunks]
+
+        try:
+            await asyncio.gather(*tasks)
+
+        except BaseException:
+
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+        # the progress is complete even if nothing has been loaded, e.g. because all data is cached
+        if not chunks and on_progress is not None:
+            on_progress(1)
+
+        if cache is not None:
+            for (resource_path, sample_period, interval_begin, interval_buffer) in missing:
+                cache.write(resource_path, sample_period, interval_begin, interval_buffer, base_url)
+
+        return {resource_path: _create_data_response(catalog_item, buffers[resource_path]) for (resource_path, catalog_item) in catalog_item_map.items()}
+
+    async def _load_chunk(self, resource_path: str, begin: datetime, end: datetime, buffer: memoryview) -> None:
+
+        with self._stream_responses():
+            response = await self.v1.data.get_stream(resource_path, begin, end)
+
+        try:
+
+            offset = 0
+
+            async for data in response.aiter_bytes():
+
+                next_offset = offset + len(data)
+
+                if next_offset > len(buffer):
+                    raise Exception("The data length is invalid.")
+
+                buffer[offset:next_offset] = data
+                offset = next_offset
+
+            if offset != len(buffer):
+                raise Exception("The data length is invalid.")
+
+        finally:
+            await response.aclose()
+
+    async def export(
+        self,
+        begin: datetime, 
+        end: datetime, 
+        file_period: timedelta,
+        file_format: Optional[str],
+        resource_paths: Iterable[str],
+        configuration: dict[str, object],
+        target_folder: str,
+        on_progress: Optional[Callable[[float, str], None]],
+        max_retries: int = 3,
+        max_concurrency: int = 4,
+        max_jobs: int = 1) -> None:
+        """This high-level methods simplifies exporting multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            filePeriod: The file period. Use timedelta(0) to get a single file.
+            fileFormat: The target file format. If null, data will be read (and possibly cached) but not returned. This is useful for data pre-aggregation.
+            resource_paths: The resource paths to export.
+            configuration: The configuration.
+            targetFolder: The target folder for the files to extract.
+            onProgress: A callback which accepts the current progress and the progress message.
+            max_retries: The maximum number of attempts to resume an interrupted download without receiving new data.
+            max_concurrency: The maximum number of files which are extracted concurrently.
+            max_jobs: The maximum number of export jobs. With a non-zero file period, the time range is split at file boundaries (multiples of the file period since 0001-01-01 UTC) into up to max_jobs jobs. These are created and processed concurrently.
+        """
+
+        if max_jobs < 1:
+            raise Exception("The maximum number of jobs must be at least 1.")
+
+        resource_paths = list(resource_paths)
+        time_ranges = _split_export_time_range(begin, end, file_period, max_jobs)
+        progress = _ExportProgress(len(time_ranges), on_progress)
+
+        # Start jobs
+        export_parameters = [
+            ExportParameters(
+                job_begin,
+                job_end,
+                file_period,
+                file_format,
+                resource_paths,
+                configuration
+            ) for (job_begin, job_end) in time_ranges
+        ]
+
+        jobs = await asyncio.gather(*(self._create_export_job(parameters) for parameters in export_parameters))
+
+        # Wait for jobs to finish
+        job_statuses = await self.wait_for_jobs(
+            [job.id for job in jobs],
+            lambda index, value: progress.report(index, value, "export"))
+
+        progress.complete("export")
+
+        artifact_ids: list[str] = []
+
+        for job_status in job_statuses:
+
+            if (job_status.result is None or \
+                type(job_status.result) != str):
+
+                raise Exception("The job result is invalid.")
+
+            artifact_ids.append(cast(str, job_status.result))
+
+        if file_format is None:
+            return
+
+        # Download and extract zip files
+        await asyncio.gather(*(
+            self._download_and_extract(artifact_id, target_folder, max_retries, max_concurrency, progress, index)
+            for (index, artifact_id) in enumerate(artifact_ids)))
+
+        progress.complete("download")
+        progress.complete("extract")
+
+    async def _create_export_job(self, parameters: ExportParameters) -> Job:
+
+        with self._decode_models():
+            return await self.v1.jobs.export(parameters)
+
+    async def wait_for_jobs(
+        self,
+        job_ids: Iterable[UUID],
+        on_progress: Optional[Callable[[int, float], None]] = None,
+        initial_delay: float = 0.1,
+        max_delay: float = 10.0) -> list[JobStatus]:
+        """Waits until all jobs have run to completion. The job status is polled with exponentially increasing delays. A Retry-After header of the server takes precedence.
+
+        Args:
+            job_ids: The job identifiers.
+            on_progress: A callback which accepts the index of the job and its current progress.
+            initial_delay: The delay in seconds before the first status request.
+            max_delay: The maximum delay in seconds between two status requests.
+        """
+
+        job_ids = list(job_ids)
+        job_statuses: list[Optional[JobStatus]] = [None] * len(job_ids)
+        polling_delay = _Backoff(initial_delay, max_delay)
+        retry_after: Optional[float] = None
+
+        while True:
+            await asyncio.sleep(polling_delay.next(retry_after))
+
+            pending = [index for (index, job_status) in enumerate(job_statuses) if job_status is None]
+
+            # the status of all pending jobs is requested together
+            results = await asyncio.gather(*(self._get_job_status(job_ids[index]) for index in pending))
+
+            retry_after = max((result[1] for result in results if result[1] is not None), default=None)
+
+            for (index, (job_status, _)) in zip(pending, results):
+
+                if (job_status.status == TaskStatus.CANCELED):
+                    raise Exception("The job has been cancelled.")
+
+                elif (job_status.status == TaskStatus.FAULTED):
+                    raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
+
+                elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+                    job_statuses[index] = job_status
+
+                if on_progress is not None:
+                    on_progress(index, 1 if job_status.status == TaskStatus.RAN_TO_COMPLETION else job_status.progress)
+
+            if all(job_status is not None for job_status in job_statuses):
+                return cast(list[JobStatus], job_statuses)
+
+    # returns the job status and the value of the Retry-After header
+    async def _get_job_status(self, job_id: UUID) -> tuple[JobStatus, Optional[float]]:
+
+        # the job status changes while polling, so a cached status (e.g. due to the ttl of the cache) must not be used
+        with self._decode_models(), self._bypass_http_cache(), self._observe_responses() as responses:
+            job_status = await self.v1.jobs.get_job_status(job_id)
+
+        return (job_status, _get_retry_after(responses[-1]) if responses else None)
+
+    async def _download_and_extract(self, artifact_id: str, target_folder: str, max_retries: int, max_concurrency: int, progress: _ExportProgress, index: int) -> None:
+
+        # Download zip file
+        target_stream = await self._download_artifact(artifact_id, lambda value: progress.report(index, value, "download"), max_retries)
+
+        try:
+
+            progress.report(index, 1, "download")
+
+            # Extract file
+            await asyncio.get_running_loop().run_in_executor(
+                None, _extract_zip_file, target_stream, target_folder, max_concurrency, lambda value: progress.report(index, value, "extract"))
+
+            progress.report(index, 1, "extract")
+
+        finally:
+            target_stream.close()
+
+    # downloads the artifact into memory or into a temporary file (see _create_artifact_stream)
+    async def _download_artifact(self, artifact_id: str, on_progress: Callable[[float], None], max_retries: int) -> IO[bytes]:
+
+        target_stream: Optional[IO[bytes]] = None
+        length: Optional[int] = None
+        consumed = 0
+        retries = 0
+
+        try:
+
+            while True:
+
+                # the raw bytes are counted because the Range and Content-Length headers refer to them, content
+                # encodings are refused so that the raw bytes are the bytes of the zip file
+                headers = { "Accept-Encoding": "identity" }
+
+                # continue where the previous attempt has stopped
+                if consumed > 0:
+                    headers["Range"] = f"bytes={consumed}-"
+
+                try:
+
+                    with self._stream_responses(), self._request_headers(headers):
+                        response = await self.v1.artifacts.download(artifact_id)
+
+                    try:
+
+                        # the server does not support range requests, start over
+                        if consumed > 0 and not _is_partial_content(response, consumed):
+                            consumed = 0
+
+                        if consumed == 0:
+
+                            try:
+                                length = int(response.headers["Content-Length"])
+                            except:
+                                length = None
+
+                            if target_stream is not None:
+                                target_stream.close()
+
+                            target_stream = _create_artifact_stream(length)
+
+                        async for data in response.aiter_raw():
+
+                            # file writes would block the event loop
+                            if isinstance(target_stream, BytesIO):
+                                target_stream.write(data)
+
+                            else:
+                                await asyncio.to_thread(target_stream.write, data)
+                            consumed += len(data)
+                            retries = 0
+
+                            if length is not None and consumed < length:
+                                on_progress(consumed / length)
+
+                    finally:
+                        await response.aclose()
+
+                    if length is None or consumed >= length:
+                        break
+
+                    raise TransportError("The download has ended prematurely.")
+
+                except TransportError:
+
+                    retries += 1
+
+                    if retries > max_retries:
+                        raise
+
+        except BaseException:
+
+            if target_stream is not None:
+                target_stream.close()
+
+            raise
+
+        # the stream has been created for the first response
+        result = cast(IO[bytes], target_stream)
+        result.seek(0)
+
+        return result
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """
+    The result of an operation of a batch.
+
+    Args:
+        index: The index of the operation in the order of submission.
+        value: The return value of the operation or None if it has failed.
+        exception: The exception of the operation or None if it has succeeded.
+    """
+
+    index: int
+    """The index of the operation in the order of submission."""
+
+    value: Optional[T]
+    """The return value of the operation or None if it has failed."""
+
+    exception: Optional[BaseException]
+    """The exception of the operation or None if it has succeeded."""
+
+class Batch:
+    """Executes many operations concurrently on a thread pool and returns their results as they complete."""
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initializes a new instance of the Batch.
+
+            Args:
+                max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        self._max_concurrency = max_concurrency
+        self._operations: deque[Callable[[], Any]] = deque()
+        self._count = 0
+
+    def submit(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> int:
+        """Adds an operation, e.g. a method of a sub-client, and returns its index. The operation is executed within results().
+
+            Args:
+                operation: The operation.
+                args: The positional arguments of the operation.
+                kwargs: The keyword arguments of the operation.
+        """
+
+        # settings like lazy_decode() apply as they were at submission time
+        context = copy_context()
+
+        self._operations.append(lambda: context.run(operation, *args, **kwargs))
+        self._count += 1
+
+        return self._count - 1
+
+    def results(self) -> Iterator[BatchResult[Any]]:
+        """Executes the operations and yields their results in order of completion. Failed operations do not stop the batch."""
+
+        pending: dict[Future, int] = {}
+        index = self._count - len(self._operations)
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+
+            try:
+
+                while self._operations or pending:
+
+                    # only max_concurrency operations are in flight
+                    while self._operations and len(pending) < self._max_concurrency:
+                        pending[executor.submit(self._operations.popleft())] = index
+                        index += 1
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield _create_batch_result(pending.pop(future), future)
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
+class AsyncBatch:
+    """Executes many operations concurrently on the event loop and returns their results as they complete."""
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initializes a new instance of the AsyncBatch.
+
+            Args:
+                max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        self._max_concurrency = max_concurrency
+        self._operations: deque[Callable[[], asyncio.Future]] = deque()
+        self._count = 0
+
+    def submit(self, operation: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> int:
+        """Adds an operation, e.g. a method of a sub-client, and returns its index. The operation is executed within results().
+
+            Args:
+                operation: The operation.
+                args: The positional arguments of the operation.
+                kwargs: The keyword arguments of the operation.
+        """
+
+        # settings like lazy_decode() apply as they were at submission time
+        context = copy_context()
+
+        self._operations.append(lambda: context.run(asyncio.ensure_future, operation(*args, **kwargs)))
+        self._count += 1
+
+        return self._count - 1
+
+    async def results(self) -> AsyncIterator[BatchResult[Any]]:
+        """Executes the operations and yields their results in order of completion. Failed operations do not stop the batch."""
+
+        pending: dict[asyncio.Future, int] = {}
+        index = self._count - len(self._operations)
+
+        try:
+
+            while self._operations or pending:
+
+                # only max_concurrency operations are in flight
+                while self._operations and len(pending) < self._max_concurrency:
+                    pending[self._operations.popleft()()] = index
+                    index += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    yield _create_batch_result(pending.pop(future), future)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+def _create_batch_result(index: int, future: Any) -> BatchResult[Any]:
+
+    exception = future.exception()
+
+    return BatchResult(index, None, exception) \
+        if exception is not None \
+        else BatchResult(index, future.result(), None)
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retries and hedging of idempotent requests.
+
+    Args:
+        max_retries: The maximum number of retries per request.
+        initial_delay: The delay in seconds before the first retry. The delay doubles with every retry.
+        max_delay: The maximum delay in seconds between two retries.
+        retry_status_codes: The status codes which cause a retry. A Retry-After header takes precedence over the computed delay.
+        methods: The HTTP methods which are retried and hedged. Requests with streamed content are sent only once.
+        budget_ratio: The number of retries and hedged requests per request, averaged over time.
+        budget_burst: The number of retries and hedged requests which are available at once.
+        hedge_percentile: The latency percentile (e.g. 0.95) after which a duplicate request is sent and the first response wins. None disables hedging. Sync clients send the first request on the calling thread and use the duplicate if it has completed earlier or the first request has failed.
+        hedge_min_samples: The number of measured latencies before hedged requests are sent.
+    """
+
+    max_retries: int = 3
+    """The maximum number of retries per request."""
+
+    initial_delay: float = 0.1
+    """The delay in seconds before the first retry. The delay doubles with every retry."""
+
+    max_delay: float = 10.0
+    """The maximum delay in seconds between two retries."""
+
+    retry_status_codes: frozenset[int] = frozenset({ 429, 500, 502, 503, 504 })
+    """The status codes which cause a retry. A Retry-After header takes precedence over the computed delay."""
+
+    methods: frozenset[str] = frozenset({ "GET", "PUT", "DELETE" })
+    """The HTTP methods which are retried and hedged. Requests with streamed content are sent only once."""
+
+    budget_ratio: float = 0.1
+    """The number of retries and hedged requests per request, averaged over time."""
+
+    budget_burst: float = 10
+    """The number of retries and hedged requests which are available at once."""
+
+    hedge_percentile: Optional[float] = None
+    """The latency percentile (e.g. 0.95) after which a duplicate request is sent and the first response wins. None disables hedging. Sync clients send the first request on the calling thread and use the duplicate if it has completed earlier or the first request has failed."""
+
+    hedge_min_samples: int = 20
+    """The number of measured latencies before hedged requests are sent."""
+
+class _Backoff:
+    """Returns exponentially increasing delays with jitter, limited to a maximum delay."""
+
+    def __init__(self, initial_delay: float, max_delay: float):
+        self._delay = initial_delay
+        self._max_delay = max_delay
+
+    def next(self, retry_after: Optional[float] = None) -> float:
+
+        # the jitter spreads the requests of clients which have started at the same time
+        delay = random.uniform(self._delay / 2, self._delay)
+        self._delay = min(self._delay * 2, self._max_delay)
+
+        return delay if retry_after is None else retry_after
+
+class _RetryBudget:
+    """A token bucket which limits retries and hedged requests to a fraction of all requests to avoid retry storms."""
+
+    def __init__(self, ratio: float, burst: float):
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._burst)
+
+    def withdraw(self) -> bool:
+
+        with self._lock:
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+
+            return True
+
+class _LatencyTracker:
+    """Keeps the most recent latencies to estimate latency percentiles."""
+
+    def __init__(self, capacity: int = 256):
+        self._latencies: deque[float] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def get_percentile(self, percentile: float, min_samples: int) -> Optional[float]:
+
+        with self._lock:
+
+            if len(self._latencies) < max(1, min_samples):
+                return None
+
+            latencies = sorted(self._latencies)
+
+        return latencies[min(len(latencies) - 1, int(percentile * len(latencies)))]
+
+# bodies of iterators or files can only be sent once
+def _is_replayable(request: Request) -> bool:
+    return isinstance(request.stream, ByteStream)
+
+def _copy_request(request: Request) -> Request:
+    return Request(request.method, request.url, headers=request.headers, content=request.content, extensions=request.extensions)
+
+def _get_response(future: Future[Optional[Response]]) -> Optional[Response]:
+    return future.result() \
+        if future.done() and not future.cancelled() and future.exception() is None \
+        else None
+
+def _close_response(future: Future[Optional[Response]]) -> None:
+
+    response = _get_response(future)
+
+    if response is not None:
+        response.close()
+
+@dataclass(frozen=True)
+class TransportOptions:
+    """
+    Options of the HTTP transport and the connection pool.
+
+    Args:
+        http2: Enable HTTP/2. Requires the h2 package (pip install httpx[http2]).
+        max_connections: The maximum number of connections.
+        max_keepalive_connections: The maximum number of idle connections which are kept alive.
+        keepalive_expiry: The time in seconds after which idle connections are closed.
+        connect_timeout: The timeout in seconds for establishing a connection.
+        read_timeout: The timeout in seconds for receiving a chunk of data.
+        write_timeout: The timeout in seconds for sending a chunk of data.
+        pool_timeout: The timeout in seconds for acquiring a connection from the pool.
+    """
+
+    http2: bool = False
+    """Enable HTTP/2. Requires the h2 package (pip install httpx[http2])."""
+
+    max_connections: Optional[int] = 100
+    """The maximum number of connections."""
+
+    max_keepalive_connections: Optional[int] = 20
+    """The maximum number of idle connections which are kept alive."""
+
+    keepalive_expiry: Optional[float] = 5.0
+    """The time in seconds after which idle connections are closed."""
+
+    connect_timeout: Optional[float] = 60.0
+    """The timeout in seconds for establishing a connection."""
+
+    read_timeout: Optional[float] = 60.0
+    """The timeout in seconds for receiving a chunk of data."""
+
+    write_timeout: Optional[float] = 60.0
+    """The timeout in seconds for sending a chunk of data."""
+
+    pool_timeout: Optional[float] = 60.0
+    """The timeout in seconds for acquiring a connection from the pool."""
+
+    def _get_timeout(self) -> Timeout:
+        return Timeout(connect=self.connect_timeout, read=self.read_timeout, write=self.write_timeout, pool=self.pool_timeout)
+
+    def _get_limits(self) -> Limits:
+        return Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_keepalive_connections, keepalive_expiry=self.keepalive_expiry)
+
+    def _create_transport(self, proxy: Optional[str] = None) -> HTTPTransport:
+        self._validate()
+        return HTTPTransport(http2=self.http2, limits=self._get_limits(), proxy=proxy)
+
+    def _create_async_transport(self, proxy: Optional[str] = None) -> AsyncHTTPTransport:
+        self._validate()
+        return AsyncHTTPTransport(http2=self.http2, limits=self._get_limits(), proxy=proxy)
+
+    # httpx ignores the proxies of the environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY, NO_PROXY) if a transport is
+    # passed, so they are mounted explicitly
+    def _create_mounts(self) -> dict[str, Optional[BaseTransport]]:
+        return {
+            pattern: None if proxy is None else self._create_transport(proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def _create_async_mounts(self) -> dict[str, Optional[AsyncBaseTransport]]:
+        return {
+            pattern: None if proxy is None else self._create_async_transport(proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def _validate(self) -> None:
+
+        # h2 is an optional dependency
+        if self.http2:
+
+            try:
+                importlib.import_module("h2")
+
+            except ImportError:
+                raise Exception("HTTP/2 requires the h2 package (pip install httpx[http2]).")
+
+class SharedConnectionPool:
+    """A connection pool which is shared between multiple clients, e.g. for different APIs on the same server. Closing a client does not close the pool."""
+
+    def __init__(self, options: Optional[TransportOptions] = None):
+        """
+        Initializes a new instance of the SharedConnectionPool.
+
+            Args:
+                options: The transport options. The timeouts are configured per client.
+        """
+
+        self._options = options or TransportOptions()
+        self._transport: Optional[HTTPTransport] = None
+        self._async_transport: Optional[AsyncHTTPTransport] = None
+
+        # proxy URL -> transport
+        self._proxy_transports: dict[str, HTTPTransport] = {}
+        self._async_proxy_transports: dict[str, AsyncHTTPTransport] = {}
+
+    def close(self) -> None:
+        """Closes the connections of the sync clients."""
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        for transport in self._proxy_transports.values():
+            transport.close()
+
+        self._proxy_transports.clear()
+
+    async def aclose(self) -> None:
+        """Closes the connections of the async clients."""
+
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+            self._async_transport = None
+
+        for transport in self._async_proxy_transports.values():
+            await transport.aclose()
+
+        self._async_proxy_transports.clear()
+
+    def _get_transport(self) -> BaseTransport:
+
+        if self._transport is None:
+            self._transport = self._options._create_transport()
+
+        return _SharedTransport(self._transport)
+
+    def _get_async_transport(self) -> AsyncBaseTransport:
+
+        if self._async_transport is None:
+            self._async_transport = self._options._create_async_transport()
+
+        return _SharedAsyncTransport(self._async_transport)
+
+    # see TransportOptions._create_mounts
+    def _get_mounts(self) -> dict[str, Optional[BaseTransport]]:
+
+        mounts: dict[str, Optional[BaseTransport]] = {}
+
+        for pattern, proxy in get_environment_proxies().items():
+
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+
+            if proxy not in self._proxy_transports:
+                self._proxy_transports[proxy] = self._options._create_transport(proxy)
+
+            mounts[pattern] = _SharedTransport(self._proxy_transports[proxy])
+
+        return mounts
+
+    def _get_async_mounts(self) -> dict[str, Optional[AsyncBaseTransport]]:
+
+        mounts: dict[str, Optional[AsyncBaseTransport]] = {}
+
+        for pattern, proxy in get_environment_proxies().items():
+
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+
+            if proxy not in self._async_proxy_transports:
+                self._async_proxy_transports[proxy] = self._options._create_async_transport(proxy)
+
+            mounts[pattern] = _SharedAsyncTransport(self._async_proxy_transports[proxy])
+
+        return mounts
+
+class _SharedTransport(BaseTransport):
+
+    def __init__(self, transport: BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self._transport.handle_request(request)
+
+    # the connections are closed by the pool
+    def close(self) -> None:
+        pass
+
+class _SharedAsyncTransport(AsyncBaseTransport):
+
+    def __init__(self, transport: AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
+
+    # the connections are closed by the pool
+    async def aclose(self) -> None:
+        pass
+
+@dataclass(frozen=True)
+class DataResponse:
+    """
+    Result of a data request with a certain resource path.
+
+    Args:
+        catalog_item: The catalog item.
+        name: The resource name.
+        unit: The optional resource unit.
+        description: The optional resource description.
+        sample_period: The sample period.
+        values: The data.
+    """
+
+    catalog_item: CatalogItem
+    """The catalog item."""
+
+    name: Optional[str]
+    """The resource name."""
+
+    unit: Optional[str]
+    """The optional resource unit."""
+
+    description: Optional[str]
+    """The optional resource description."""
+
+    sample_period: timedelta
+    """The sample period."""
+
+    values: Union[array[float], memoryview, Any]
+    """The data. The type depends on the values_type argument of load(): array.array (default), memoryview or numpy.ndarray."""
+
+def _create_data_response(catalog_item: CatalogItem, values: Any) -> DataResponse:
+
+    resource = catalog_item.resource
+
+    unit = cast(str, resource.properties["unit"]) \
+        if resource.properties is not None and "unit" in resource.properties and type(resource.properties["unit"]) == str \
+        else None
+
+    description = cast(str, resource.properties["description"]) \
+        if resource.properties is not None and "description" in resource.properties and type(resource.properties["description"]) == str \
+        else None
+
+    sample_period = catalog_item.representation.sample_period
+
+    return DataResponse(
+        catalog_item=catalog_item,
+        name=resource.id,
+        unit=unit,
+        description=description,
+        sample_period=sample_period,
+        values=values
+    )
+
+_values_types = ("array", "memoryview", "numpy")
+
+def _allocate_values(sample_count: int, values_type: str) -> tuple[Any, memoryview]:
+    """Returns the values and a writable byte view of them."""
+
+    if values_type == "memoryview":
+        buffer = bytearray(sample_count * 8)
+        return (memoryview(buffer).cast("d"), memoryview(buffer))
+
+    elif values_type == "numpy":
+
+        # numpy is an optional dependency
+        try:
+            numpy = importlib.import_module("numpy")
+
+        except ImportError:
+            raise Exception("The values type numpy requires the numpy package.")
+
+        # all bytes are overwritten by the data
+        values = numpy.empty(sample_count, dtype=numpy.float64)
+        return (values, memoryview(values).cast("B"))
+
+    else:
+        values = array("d", [0.0]) * sample_count
+        return (values, memoryview(values).cast("B"))
+
+def _split_time_range(begin: datetime, end: datetime, sample_period: timedelta, max_chunk_size: int) -> tuple[int, list[tuple[datetime, datetime, int, int]]]:
+    """Returns the number of samples and the chunks (begin, end, byte offset, byte length) of the time range."""
+
+    if (end - begin) % sample_period != timedelta(0):
+        raise Exception("The time range must be a multiple of the sample period.")
+
+    sample_count = (end - begin) // sample_period
+    chunk_sample_count = max(1, max_chunk_size // 8)
+    chunks: list[tuple[datetime, datetime, int, int]] = []
+
+    for chunk_offset in range(0, sample_count, chunk_sample_count):
+        chunk_length = min(chunk_sample_count, sample_count - chunk_offset)
+
+        chunks.append((
+            begin + chunk_offset * sample_period,
+            begin + (chunk_offset + chunk_length) * sample_period,
+            chunk_offset * 8,
+            chunk_length * 8))
+
+    # an empty time range is still requested
+    if not chunks:
+        chunks.append((begin, end, 0, 0))
+
+    return (sample_count, chunks)
+
+def _split_export_time_range(begin: datetime, end: datetime, file_period: timedelta, max_jobs: int) -> list[tuple[datetime, datetime]]:
+    """Splits the time range at file boundaries into up to max_jobs time ranges. Like in Nexus, the file boundaries are multiples of the file period since 0001-01-01 (UTC)."""
+
+    if max_jobs == 1 or file_period <= timedelta(0) or end <= begin:
+        return [(begin, end)]
+
+    epoch = datetime(1, 1, 1) \
+        if begin.tzinfo is None \
+        else datetime(1, 1, 1, tzinfo=timezone.utc)
+
+    # the files which overlap the time range
+    first_file = (begin - epoch) // file_period
+    last_file = -((epoch - end) // file_period)
+
+    files_per_job = -(-(last_file - first_file) // max_jobs)
+    time_ranges: list[tuple[datetime, datetime]] = []
+    job_begin = begin
+    job_last_file = first_file
+
+    while job_begin < end:
+        job_last_file += files_per_job
+        job_end = min(epoch + job_last_file * file_period, end)
+        time_ranges.append((job_begin, job_end))
+        job_begin = job_end
+
+    return time_ranges
+
+class _ExportProgress:
+    """Aggregates the progress of multiple export jobs per progress message."""
+
+    def __init__(self, job_count: int, on_progress: Optional[Callable[[float, str], None]]):
+        self._job_count = job_count
+        self._on_progress = on_progress
+        self._progress: dict[str, list[float]] = {}
+
+        # downloads and extractions report their progress from different threads
+        self._lock = threading.Lock()
+
+    def report(self, index: int, progress: float, message: str) -> None:
+
+        if self._on_progress is None:
+            return
+
+        with self._lock:
+
+            job_progress = self._progress.setdefault(message, [0.0] * self._job_count)
+            job_progress[index] = progress
+            total_progress = sum(job_progress) / self._job_count
+
+            if total_progress < 1:
+                self._on_progress(total_progress, message)
+
+    def complete(self, message: str) -> None:
+
+        if self._on_progress is None:
+            return
+
+        with self._lock:
+            self._on_progress(1, message)
+
+# artifacts up to this size are downloaded into memory instead of into a temporary file
+_MAX_IN_MEMORY_ARTIFACT_SIZE = 64 * 1024 * 1024
+
+def _create_artifact_stream(length: Optional[int]) -> IO[bytes]:
+    """Returns an in-memory stream for small artifacts and a temporary file for large artifacts or artifacts of unknown size."""
+
+    if length is not None and length <= _MAX_IN_MEMORY_ARTIFACT_SIZE:
+        return BytesIO()
+
+    return TemporaryFile()
+
+def _is_partial_content(response: Response, offset: int) -> bool:
+    """Checks if the response contains the requested range starting at the offset."""
+
+    return response.status_code == 206 and \
+        response.headers.get("Content-Range", "").startswith(f"bytes {offset}-")
+
+def _extract_zip_file(file: IO[bytes], target_folder: str, max_concurrency: int, on_progress: Optional[Callable[[float], None]]) -> None:
+    """Extracts the zip file into the target folder. The members are decompressed concurrently."""
+
+    with ZipFile(file, "r") as zip_file:
+
+        members = zip_file.infolist()
+        total_size = sum(member.file_size for member in members)
+        extracted_size = 0
+
+        # the zip file synchronizes the reads from the underlying file
+        def extract(member: ZipInfo) -> int:
+
+            try:
+                zip_file.extract(member, target_folder)
+
+            # another thread has created the parent folder in the meantime
+            except FileExistsError:
+                zip_file.extract(member, target_folder)
+
+            return member.file_size
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+
+            # progress is reported on the calling thread
+            for size in executor.map(extract, members):
+
+                extracted_size += size
+
+                if on_progress is not None and total_size > 0 and extracted_size < total_size:
+                    on_progress(extracted_size / total_size)
@@ -0,0 +1,266 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Hashable, Optional
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of concurrent requests of all clients it is attached to. The limit adapts to the upstream API:
+    it grows additively while responses are fast and it shrinks multiplicatively on overload responses (429, 503),
+    on transport errors and when the time to first byte exceeds a multiple of the baseline of the operation (AIMD).
+    The baseline of each operation is its lowest recent time to first byte, so fast and slow operations can share a
+    limiter. Optionally, the rate of outgoing requests is limited by a token bucket.
+
+    The limiter is thread-safe and can be shared between sync and async clients.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        baseline_decay: float = 0.01,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None
+    ):
+        """
+        Initializes a new instance of the ConcurrencyLimiter.
+
+        Args:
+            initial_limit: The initial number of concurrent requests.
+            min_limit: The lower bound of the number of concurrent requests.
+            max_limit: The upper bound of the number of concurrent requests.
+            backoff_ratio: The factor by which the limit is reduced on overload.
+            latency_tolerance: The multiple of the baseline latency of an operation above which a response is considered an overload.
+            baseline_decay: The fraction by which the baseline latency of an operation approaches a higher latency with every response, so that the baseline follows lasting changes of the upstream API.
+            rate: The maximum number of requests per second or None for no rate limit.
+            burst: The number of requests which may be sent at once despite the rate limit. Defaults to the initial limit.
+        """
+
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise Exception("The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+
+        if not 0 < backoff_ratio < 1:
+            raise Exception("The backoff ratio must be between 0 and 1.")
+
+        if not 0 <= baseline_decay <= 1:
+            raise Exception("The baseline decay must be between 0 and 1.")
+
+        if rate is not None and rate <= 0:
+            raise Exception("The rate must be greater than 0.")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._baseline_decay = baseline_decay
+        self._rate = rate
+        self._burst = float(initial_limit if burst is None else burst)
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: deque[Callable[[], None]] = deque()
+        self._baselines: dict[Hashable, float] = {}
+        self._last_decrease = 0.0
+
+        self._started = time.monotonic()
+        self._requests = 0
+        self._successes = 0
+        self._overloads = 0
+        self._queueing_time = 0.0
+        self._acquisitions = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests which are currently being sent."""
+        return self._in_flight
+
+    @property
+    def requests(self) -> int:
+        """The number of completed requests."""
+        return self._requests
+
+    @property
+    def overloads(self) -> int:
+        """The number of requests which have failed with an overload response or a transport error."""
+        return self._overloads
+
+    @property
+    def goodput(self) -> float:
+        """The number of successful requests per second since the creation of the limiter or since the last call to reset_statistics()."""
+        return self._successes / max(time.monotonic() - self._started, 1e-9)
+
+    @property
+    def mean_queueing_time(self) -> float:
+        """The mean time in seconds requests have waited for the rate limit and a free slot."""
+        return self._queueing_time / max(self._acquisitions, 1)
+
+    def reset_statistics(self) -> None:
+        """Resets the request counters, the goodput and the mean queueing time."""
+
+        with self._lock:
+            self._started = time.monotonic()
+            self._requests = 0
+            self._successes = 0
+            self._overloads = 0
+            self._queueing_time = 0.0
+            self._acquisitions = 0
+
+    def _acquire(self) -> None:
+        """Blocks until the request may be sent."""
+
+        start = time.monotonic()
+        delay = self._reserve_token()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        event = threading.Event()
+
+        if not self._try_enter(event.set):
+            event.wait()
+
+        self._add_queueing_time(time.monotonic() - start)
+
+    async def _acquire_async(self) -> None:
+        """Waits until the request may be sent."""
+
+        start = time.monotonic()
+        delay = self._reserve_token()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        def grant() -> None:
+
+            # the slot of a cancelled waiter is passed on
+            if future.cancelled():
+                self._release(None, None)
+
+            else:
+                future.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(grant)
+
+        if not self._try_enter(wake):
+
+            try:
+                await future
+
+            except asyncio.CancelledError:
+
+                with self._lock:
+
+                    if wake in self._waiters:
+                        self._waiters.remove(wake)
+                        raise
+
+                # the slot has been granted in the meantime
+                if future.done() and not future.cancelled():
+                    self._release(None, None)
+
+                raise
+
+        self._add_queueing_time(time.monotonic() - start)
+
+    def _release(self, latency: Optional[float], status_code: Optional[int], key: Hashable = None) -> None:
+        """
+        Frees the slot of a request and adapts the limit.
+
+        Args:
+            latency: The time in seconds until the response headers have been received or None if the request has been cancelled.
+            status_code: The status code of the response or None if the request has failed.
+            key: The operation (e.g. server, method and URL template) whose baseline latency applies.
+        """
+
+        with self._lock:
+
+            self._in_flight -= 1
+
+            if latency is not None:
+
+                self._requests += 1
+                now = time.monotonic()
+                overloaded = status_code is None or status_code == 429 or status_code == 503
+                baseline = self._baselines.get(key, latency)
+
+                if overloaded:
+                    self._overloads += 1
+
+                else:
+
+                    if status_code is not None and status_code < 500:
+                        self._successes += 1
+
+                    # the baseline drops to lower latencies at once and rises to higher latencies slowly
+                    self._baselines[key] = latency \
+                        if latency < baseline \
+                        else baseline + self._baseline_decay * (latency - baseline)
+
+                if overloaded or latency > self._latency_tolerance * baseline:
+
+                    # decrease at most once per round trip, because the responses of a round trip share the same cause
+                    if now - self._last_decrease > latency:
+                        self._limit = max(self._limit * self._backoff_ratio, self._min_limit)
+                        self._last_decrease = now
+
+                # increase by one per round trip, but only if the limit is actually used
+                elif self._in_flight + 1 >= self._limit / 2:
+                    self._limit = min(self._limit + 1 / self._limit, self._max_limit)
+
+            self._wake_waiters()
+
+    def _try_enter(self, wake: Callable[[], None]) -> bool:
+
+        with self._lock:
+
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+
+            self._waiters.append(wake)
+
+            return False
+
+    def _wake_waiters(self) -> None:
+
+        while self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            self._waiters.popleft()()
+
+    def _reserve_token(self) -> float:
+        """Takes a token from the bucket and returns the time in seconds until the token becomes available."""
+
+        if self._rate is None:
+            return 0
+
+        with self._lock:
+
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._refilled) * self._rate, self._burst)
+            self._refilled = now
+
+            # the token may be borrowed from the future
+            self._tokens -= 1
+
+            return max(-self._tokens / self._rate, 0)
+
+    def _add_queueing_time(self, queueing_time: float) -> None:
+        with self._lock:
+            self._queueing_time += queueing_time
+            self._acquisitions += 1
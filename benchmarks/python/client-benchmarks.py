@@ -0,0 +1,269 @@
+"""
+Drives a client which is generated from the checked-in spec benchmarks/python/specs/benchmark-api.json against an
+in-process stub transport (httpx.MockTransport) and reports the encode/decode throughput, the per-request overhead and
+the peak memory for small to very large payloads. No network access is required.
+
+The client is generated into artifacts/benchmarks/python/benchmark_api by the following command, which is run
+automatically if the client is missing or older than the spec or the templates:
+
+    dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- benchmark-client
+
+The results are compared with the baseline benchmarks/python/baselines/client-benchmarks.json (if it exists) and the
+script fails if a metric has regressed by more than the threshold. Baselines depend on the machine, so save them on the
+machine where the comparison is run.
+
+Usage: python benchmarks/python/client-benchmarks.py [--save-baseline] [--threshold 0.1] [--client-path PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import httpx
+
+ROOT = Path(__file__).parents[2]
+SPEC_PATH = ROOT / "benchmarks/python/specs/benchmark-api.json"
+TEMPLATES_PATH = ROOT / "src/Apollo3zehn.OpenApiClientGenerator/Templates"
+CLIENT_PATH = ROOT / "artifacts/benchmarks/python"
+BASELINE_PATH = ROOT / "benchmarks/python/baselines/client-benchmarks.json"
+
+PAYLOAD_SIZES = {
+    "small": 1,
+    "medium": 100,
+    "large": 5_000,
+    "very_large": 50_000
+}
+
+REQUEST_COUNT = 1000
+REPEAT = 3
+
+@dataclass(frozen=True)
+class Metric:
+    value: float
+    unit: str
+    higher_is_better: bool
+
+def _ensure_client(client_path: Path) -> None:
+
+    client_file_path = client_path / "benchmark_api" / "_client.py"
+    sources = [SPEC_PATH, *TEMPLATES_PATH.glob("Python*.py")]
+
+    if client_file_path.exists() and all(source.stat().st_mtime <= client_file_path.stat().st_mtime for source in sources):
+        return
+
+    if client_path != CLIENT_PATH or shutil.which("dotnet") is None:
+        sys.exit(f"The benchmark client in {client_path} is missing or outdated. Generate it with: dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- benchmark-client")
+
+    print("generate the benchmark client")
+
+    subprocess.run(
+        ["dotnet", "run", "--project", str(ROOT / "tests/Apollo3zehn.OpenApiClientGenerator.PythonClients"), "--", "benchmark-client"],
+        check=True,
+        stdout=subprocess.DEVNULL)
+
+def _measure_time(action: Callable[[], Any]) -> float:
+    """Returns the best time per call in seconds."""
+
+    timer = timeit.Timer(action)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+def _measure_peak_memory(action: Callable[[], Any]) -> int:
+
+    tracemalloc.start()
+
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+def run(client_path: Path) -> dict[str, Metric]:
+
+    sys.path.insert(0, str(client_path))
+
+    from benchmark_api import BenchmarkAsyncClient, BenchmarkClient
+    from benchmark_api._encoder import JsonEncoder
+    from benchmark_api._shared import _json_encoder_options
+    from benchmark_api.V1 import Item, ItemDetailsType, ItemKind
+
+    def create_item(i: int, children: Optional[list[Any]]) -> Any:
+
+        return Item(
+            id=UUID(int=i),
+            name=f"item_{i}",
+            count=i,
+            value=i * 1.5,
+            kind=ItemKind.FIRST_KIND if i % 2 == 0 else ItemKind.SECOND_KIND,
+            created=datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+            period=timedelta(seconds=1),
+            tags=["a", "b"],
+            children=children,
+            properties={ "index": i },
+            details=ItemDetailsType(description=None)
+        )
+
+    items = {
+        size: [create_item(i, [create_item(i, None)]) for i in range(count)]
+        for size, count in PAYLOAD_SIZES.items()
+    }
+
+    payloads = {
+        count: JsonEncoder.encode_to_bytes(items[size], _json_encoder_options)
+        for size, count in PAYLOAD_SIZES.items()
+    }
+
+    single_payload = JsonEncoder.encode_to_bytes(items["small"][0], _json_encoder_options)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+
+        if request.method == "DELETE":
+            return httpx.Response(200)
+
+        if request.url.path == "/api/v1/items":
+
+            if request.method == "PUT":
+                return httpx.Response(200, content=request.content, headers={ "Content-Type": "application/json" })
+
+            return httpx.Response(200, content=payloads[int(request.url.params["limit"])], headers={ "Content-Type": "application/json" })
+
+        return httpx.Response(200, content=single_payload, headers={ "Content-Type": "application/json" })
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = BenchmarkClient(httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(handler)))
+    async_client = BenchmarkAsyncClient(httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(async_handler)))
+
+    metrics: dict[str, Metric] = {}
+
+    def throughput(size: int, action: Callable[[], Any]) -> Metric:
+        return Metric(size / _measure_time(action) / 1e6, "MB/s", True)
+
+    for size, count in PAYLOAD_SIZES.items():
+
+        payload = payloads[count]
+        print(f"{size}: {count} items, {len(payload) / 1e6:.3f} MB")
+
+        metrics[f"encode/{size}"] = throughput(
+            len(payload), lambda: JsonEncoder.encode_to_bytes(items[size], _json_encoder_options))
+
+        metrics[f"decode/{size}"] = throughput(
+            len(payload), lambda: JsonEncoder.decode(list[Item], JsonEncoder.parse(payload, _json_encoder_options), _json_encoder_options))
+
+        metrics[f"client/{size}"] = throughput(
+            len(payload), lambda: client.v1.items.get_items(limit=count))
+
+        metrics[f"client_iter/{size}"] = throughput(
+            len(payload), lambda: sum(1 for _ in client.v1.items.get_items_iter(limit=count)))
+
+        metrics[f"peak_memory/{size}"] = Metric(
+            _measure_peak_memory(lambda: client.v1.items.get_items(limit=count)) / 1e6, "MB", False)
+
+    # the per-request overhead of the client and of httpx without response body
+    metrics["overhead/sync"] = Metric(
+        _measure_time(lambda: client.v1.items.delete_item("1")) * 1e6, "us", False)
+
+    metrics["overhead/sync_put"] = Metric(
+        _measure_time(lambda: client.v1.items.put_item(items["small"][0])) * 1e6, "us", False)
+
+    async def delete_items():
+        for _ in range(REQUEST_COUNT):
+            await async_client.v1.items.delete_item("1")
+
+    loop = asyncio.new_event_loop()
+
+    metrics["overhead/async"] = Metric(
+        _measure_time(lambda: loop.run_until_complete(delete_items())) / REQUEST_COUNT * 1e6, "us", False)
+
+    loop.run_until_complete(async_client.__aexit__(None, None, None))
+    loop.close()
+    client.__exit__(None, None, None)
+
+    return metrics
+
+def compare(metrics: dict[str, Metric], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Prints the results and returns the names of the metrics which have regressed by more than the threshold."""
+
+    regressions: list[str] = []
+
+    print(f"{'metric':<24}{'value':>14}  {'unit':<6}{'baseline':>14}{'change':>10}")
+
+    for name, metric in metrics.items():
+
+        baseline_metric = baseline.get(name)
+
+        if baseline_metric is None:
+            print(f"{name:<24}{metric.value:14.3f}  {metric.unit:<6}")
+            continue
+
+        baseline_value = baseline_metric["value"]
+        change = metric.value / baseline_value - 1
+
+        # positive changes are improvements
+        improvement = change if metric.higher_is_better else -change
+        is_regression = improvement < -threshold
+
+        if is_regression:
+            regressions.append(name)
+
+        print(f"{name:<24}{metric.value:14.3f}  {metric.unit:<6}{baseline_value:14.3f}{improvement:+10.1%}{'  REGRESSION' if is_regression else ''}")
+
+    return regressions
+
+def main(save_baseline: bool, threshold: float, client_path: Path):
+
+    _ensure_client(client_path)
+    metrics = run(client_path)
+
+    baseline: dict[str, Any] = {}
+
+    if BASELINE_PATH.exists():
+
+        baseline_document = json.loads(BASELINE_PATH.read_text())
+        baseline = baseline_document["metrics"]
+
+        print(f"baseline: Python {baseline_document['python']} on {baseline_document['platform']}")
+
+    regressions = compare(metrics, baseline, threshold)
+
+    if save_baseline:
+
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+        baseline_document = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "metrics": { name: metric.__dict__ for name, metric in metrics.items() }
+        }
+
+        BASELINE_PATH.write_text(json.dumps(baseline_document, indent=2) + "\n")
+        print(f"saved the baseline to {BASELINE_PATH}")
+
+    elif regressions:
+        sys.exit(f"{len(regressions)} metrics have regressed by more than {threshold:.0%}: {', '.join(regressions)}")
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the relative change which counts as regression")
+    parser.add_argument("--client-path", type=Path, default=CLIENT_PATH, help="the folder which contains the generated benchmark_api package")
+    args = parser.parse_args()
+
+    main(args.save_baseline, args.threshold, args.client_path)
@@ -0,0 +1,149 @@
+"""
+Compares the compiled decode plans of JsonEncoder.decode with the previous reflective implementation.
+
+Usage: python benchmarks/python/decode-benchmarks.py [item_count]
+"""
+
+import dataclasses
+import json
+import sys
+import timeit
+import typing
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar, Optional, Type, TypeVar, Union, cast
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import JsonEncoder, JsonEncoderOptions, to_snake_case
+
+T = TypeVar("T")
+
+class Kind(Enum):
+    A = "A"
+    B = "B"
+
+@dataclass(frozen=True)
+class Leaf:
+    id: UUID
+    kind: Kind
+    value: float
+    timestamp: datetime
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    count: int
+    period: timedelta
+    leaves: list[Leaf]
+    properties: Optional[dict[str, Any]]
+
+@dataclass(frozen=True)
+class Catalog:
+    nodes: list[Node]
+
+def _create_payload(item_count: int) -> Any:
+
+    timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+
+    nodes = [
+        {
+            "name": f"node_{i}",
+            "count": i,
+            "period": "00:00:01",
+            "leaves": [
+                {
+                    "id": str(uuid4()),
+                    "kind": "A" if j % 2 == 0 else "B",
+                    "value": j * 1.5,
+                    "timestamp": timestamp
+                } for j in range(10)
+            ],
+            "properties": { "unit": "m/s", "description": "Speed." }
+        } for i in range(item_count)
+    ]
+
+    return json.loads(json.dumps({ "nodes": nodes }))
+
+# the previous, fully reflective implementation of JsonEncoder._decode
+def _reflective_decode(typeCls: Type[T], data: Any, options: JsonEncoderOptions) -> T:
+
+    if data is None:
+        return cast(T, None)
+
+    if typeCls == Any:
+        return data
+
+    origin = typing.get_origin(typeCls)
+    args = typing.get_args(typeCls)
+
+    if origin is not None:
+
+        if origin is Union and type(None) in args:
+            return _reflective_decode(args[0], data, options)
+
+        elif issubclass(cast(type, origin), list):
+            return cast(T, [_reflective_decode(args[0], value, options) for value in data])
+
+        elif issubclass(cast(type, origin), dict):
+            return cast(T, {_reflective_decode(args[0], key, options): _reflective_decode(args[1], value, options) for key, value in data.items()})
+
+        else:
+            raise Exception(f"Type {str(origin)} cannot be decoded.")
+
+    elif dataclasses.is_dataclass(typeCls):
+
+        parameters = {}
+        type_hints = typing.get_type_hints(typeCls)
+
+        for key, value in data.items():
+
+            key = options.property_name_decoder(key)
+            parameter_type = cast(Type, type_hints.get(key))
+
+            if (parameter_type is not None):
+                parameters[key] = _reflective_decode(parameter_type, value, options)
+
+        for key, value in type_hints.items():
+            if not key in parameters and not typing.get_origin(value) == ClassVar:
+
+                if (value == int):
+                    parameters[key] = 0
+
+                elif (value == float):
+                    parameters[key] = 0.0
+
+                else:
+                    parameters[key] = None
+
+        return cast(T, typeCls(**parameters))
+
+    for base in typeCls.__mro__[:-1]:
+        decoder = options.decoders.get(base)
+
+        if decoder is not None:
+            return decoder(typeCls, data)
+
+    return data
+
+def main(item_count: int):
+
+    options = JsonEncoderOptions(property_name_decoder=to_snake_case)
+    payload = _create_payload(item_count)
+
+    assert JsonEncoder.decode(Catalog, payload, options) == _reflective_decode(Catalog, payload, options)
+
+    reflective = min(timeit.repeat(lambda: _reflective_decode(Catalog, payload, options), number=1, repeat=5))
+    compiled = min(timeit.repeat(lambda: JsonEncoder.decode(Catalog, payload, options), number=1, repeat=5))
+    model_count = item_count * 11 + 1
+
+    print(f"decode {model_count} models ({item_count} nodes with 10 leaves each)")
+    print(f"  reflective: {reflective * 1000:8.1f} ms ({model_count / reflective:10.0f} models/s)")
+    print(f"  compiled:   {compiled * 1000:8.1f} ms ({model_count / compiled:10.0f} models/s)")
+    print(f"  speedup:    {reflective / compiled:8.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
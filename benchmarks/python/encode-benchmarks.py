@@ -0,0 +1,95 @@
+"""
+Compares the default JsonEncoder.encode_to_bytes, which builds an intermediate tree first and serializes it with
+json.dumps, with the single pass writer (JsonEncoderOptions.single_pass_writer).
+
+Usage: python benchmarks/python/encode-benchmarks.py [item_count]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import JsonEncoder, JsonEncoderOptions, to_camel_case
+
+class Kind(Enum):
+    A = "A"
+    B = "B"
+
+@dataclass(frozen=True)
+class Leaf:
+    id: UUID
+    kind: Kind
+    value: float
+    timestamp: datetime
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    count: int
+    period: timedelta
+    leaves: list[Leaf]
+    properties: Optional[dict[str, Any]]
+
+@dataclass(frozen=True)
+class Catalog:
+    nodes: list[Node]
+
+def _create_value(item_count: int) -> Catalog:
+
+    timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    return Catalog(nodes=[
+        Node(
+            name=f"node_{i}",
+            count=i,
+            period=timedelta(seconds=1),
+            leaves=[Leaf(id=uuid4(), kind=Kind.A if j % 2 == 0 else Kind.B, value=j * 1.5, timestamp=timestamp) for j in range(10)],
+            properties={ "unit": "m/s", "description": "Speed." }
+        ) for i in range(item_count)
+    ])
+
+def _measure_peak_memory(action: Callable[[], Any]) -> int:
+
+    tracemalloc.start()
+
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+def main(item_count: int):
+
+    options = JsonEncoderOptions(property_name_encoder=to_camel_case)
+    single_pass_options = JsonEncoderOptions(property_name_encoder=to_camel_case, single_pass_writer=True)
+    value = _create_value(item_count)
+
+    tree = lambda: JsonEncoder.encode_to_bytes(value, options)
+    single_pass = lambda: JsonEncoder.encode_to_bytes(value, single_pass_options)
+
+    assert tree() == single_pass()
+
+    tree_time = min(timeit.repeat(tree, number=1, repeat=5))
+    single_pass_time = min(timeit.repeat(single_pass, number=1, repeat=5))
+    tree_memory = _measure_peak_memory(tree)
+    single_pass_memory = _measure_peak_memory(single_pass)
+    size = len(single_pass())
+
+    print(f"encode {item_count * 11 + 1} models into {size / 1e6:.1f} MB of JSON")
+    print(f"  tree + json.dumps: {tree_time * 1000:8.1f} ms ({size / tree_time / 1e6:6.1f} MB/s), peak memory {tree_memory / 1e6:7.1f} MB")
+    print(f"  single pass:       {single_pass_time * 1000:8.1f} ms ({size / single_pass_time / 1e6:6.1f} MB/s), peak memory {single_pass_memory / 1e6:7.1f} MB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
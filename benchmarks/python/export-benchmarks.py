@@ -0,0 +1,179 @@
+"""
+Compares the previous export() artifact handling (download, then ZipFile.extractall) with the resumable download and
+the concurrent extraction of the members. The artifact is served by a local stub server which supports range requests
+and optionally drops the connection.
+
+The functions below mirror the code emitted by PythonClientTemplate.py and PythonClientTemplate_Main.py.
+
+Usage: python benchmarks/python/export-benchmarks.py [file_count]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tempfile import NamedTemporaryFile
+from typing import IO, Optional
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
+import httpx
+
+FILE_SIZE = 1024 * 1024
+
+class _ArtifactHandler(BaseHTTPRequestHandler):
+
+    artifact: bytes = b""
+    drop_count: int = 0
+
+    def do_GET(self):
+
+        start = 0
+        range_header = self.headers.get("Range")
+
+        if range_header is not None:
+            start = int(range_header[len("bytes="):-1])
+
+        data = _ArtifactHandler.artifact[start:]
+
+        self.send_response(200 if range_header is None else 206)
+        self.send_header("Content-Length", str(len(data)))
+
+        if range_header is not None:
+            self.send_header("Content-Range", f"bytes {start}-{len(_ArtifactHandler.artifact) - 1}/{len(_ArtifactHandler.artifact)}")
+
+        self.end_headers()
+
+        # drop the connection after half of the data
+        if _ArtifactHandler.drop_count > 0:
+            _ArtifactHandler.drop_count -= 1
+            self.wfile.write(data[:len(data) // 2])
+            self.close_connection = True
+
+        else:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+def _create_artifact(file_count: int) -> bytes:
+
+    buffer = io.BytesIO()
+
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as zip_file:
+        for i in range(file_count):
+            zip_file.writestr(f"data/file_{i}.csv", ("\n".join(f"{i},{j},{j * 1.5}" for j in range(FILE_SIZE // 16))).encode("utf-8"))
+
+    return buffer.getvalue()
+
+def _download(client: httpx.Client, url: str, target_stream: IO[bytes], max_retries: int) -> None:
+
+    length: Optional[int] = None
+    consumed = 0
+    retries = 0
+
+    while True:
+
+        headers = None \
+            if consumed == 0 \
+            else { "Range": f"bytes={consumed}-" }
+
+        try:
+
+            with client.stream("GET", url, headers=headers) as response:
+
+                if consumed > 0 and not (response.status_code == 206 and response.headers.get("Content-Range", "").startswith(f"bytes {consumed}-")):
+                    target_stream.seek(0)
+                    target_stream.truncate()
+                    consumed = 0
+
+                if consumed == 0:
+                    length = int(response.headers["Content-Length"])
+
+                for data in response.iter_bytes():
+                    target_stream.write(data)
+                    consumed += len(data)
+                    retries = 0
+
+            if length is None or consumed >= length:
+                break
+
+            raise httpx.TransportError("The download has ended prematurely.")
+
+        except httpx.TransportError:
+
+            retries += 1
+
+            if retries > max_retries:
+                raise
+
+    target_stream.flush()
+
+def _extract_zip_file(file: IO[bytes], target_folder: str, max_concurrency: int) -> None:
+
+    with ZipFile(file, "r") as zip_file:
+
+        def extract(member: ZipInfo) -> int:
+
+            try:
+                zip_file.extract(member, target_folder)
+
+            except FileExistsError:
+                zip_file.extract(member, target_folder)
+
+            return member.file_size
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            for _ in executor.map(extract, zip_file.infolist()):
+                pass
+
+def main(file_count: int):
+
+    _ArtifactHandler.artifact = _create_artifact(file_count)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ArtifactHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/artifact"
+
+    def previous() -> None:
+
+        with tempfile.TemporaryDirectory() as target_folder, NamedTemporaryFile() as target_stream:
+
+            with httpx.stream("GET", url) as response:
+                for data in response.iter_bytes():
+                    target_stream.write(data)
+
+            with ZipFile(target_stream, "r") as zip_file:
+                zip_file.extractall(target_folder)
+
+    def current(max_concurrency: int, drop_count: int) -> None:
+
+        _ArtifactHandler.drop_count = drop_count
+
+        with tempfile.TemporaryDirectory() as target_folder, NamedTemporaryFile() as target_stream, httpx.Client() as client:
+            _download(client, url, target_stream, max_retries=3)
+            _extract_zip_file(target_stream, target_folder, max_concurrency)
+
+    size = len(_ArtifactHandler.artifact)
+    extracted_size = file_count * FILE_SIZE
+
+    print(f"export an artifact with {file_count} files ({size / 1e6:.1f} MB compressed, {extracted_size / 1e6:.1f} MB extracted)")
+
+    previous_time = min(timeit.repeat(previous, number=1, repeat=3))
+    print(f"  previous:                        {previous_time * 1000:8.1f} ms ({extracted_size / previous_time / 1e6:7.1f} MB/s)")
+
+    for max_concurrency in [1, os.cpu_count() or 1]:
+        current_time = min(timeit.repeat(lambda: current(max_concurrency, 0), number=1, repeat=3))
+        print(f"  current, {max_concurrency:2} threads:             {current_time * 1000:8.1f} ms ({extracted_size / current_time / 1e6:7.1f} MB/s)")
+
+    # the previous implementation has to start over after each dropped connection
+    current_time = min(timeit.repeat(lambda: current(os.cpu_count() or 1, 2), number=1, repeat=3))
+    print(f"  current, 2 dropped connections: {current_time * 1000:8.1f} ms ({extracted_size / current_time / 1e6:7.1f} MB/s)")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 32)
@@ -0,0 +1,139 @@
+"""
+Compares the import time of a large generated client with a single module per version and with lazily imported
+sub-client and model modules (Python_LazyModules). The clients are generated from the checked-in spec
+benchmarks/python/specs/benchmark-api.json, enlarged to 100 sub-clients and 300 models, into
+artifacts/benchmarks/python/import_api and artifacts/benchmarks/python/import_api_lazy by the following command,
+which is run automatically if the clients are missing or outdated:
+
+    dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- import-benchmark-clients
+
+Each measurement runs in a fresh interpreter: the import time is the cumulative time of the package as reported by
+python -X importtime (with warm bytecode caches, excluding the interpreter startup) and the first call time includes
+the import, the creation of the client and the first call of one operation.
+
+Usage: python benchmarks/python/import-benchmarks.py [--repeat 10] [--client-path PATH]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).parents[2]
+SPEC_PATH = ROOT / "benchmarks/python/specs/benchmark-api.json"
+TEMPLATES_PATH = ROOT / "src/Apollo3zehn.OpenApiClientGenerator/Templates"
+CLIENT_PATH = ROOT / "artifacts/benchmarks/python"
+
+PACKAGE_NAMES = {
+    "flat": "import_api",
+    "lazy": "import_api_lazy"
+}
+
+FIRST_CALL_SCRIPT = """
+import time
+start = time.perf_counter()
+
+import httpx
+import {package_name}
+
+def handler(request):
+    return httpx.Response(200)
+
+client = {package_name}.BenchmarkClient(httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(handler)))
+client.v1.group0items.delete_item("1")
+
+print(time.perf_counter() - start)
+"""
+
+def _ensure_clients(client_path: Path) -> None:
+
+    client_file_paths = [client_path / package_name / "_client.py" for package_name in PACKAGE_NAMES.values()]
+    sources = [SPEC_PATH, *TEMPLATES_PATH.glob("Python*.py")]
+
+    if all(
+        client_file_path.exists() and all(source.stat().st_mtime <= client_file_path.stat().st_mtime for source in sources)
+        for client_file_path in client_file_paths
+    ):
+        return
+
+    if client_path != CLIENT_PATH or shutil.which("dotnet") is None:
+        sys.exit(f"The benchmark clients in {client_path} are missing or outdated. Generate them with: dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- import-benchmark-clients")
+
+    print("generate the benchmark clients")
+
+    subprocess.run(
+        ["dotnet", "run", "--project", str(ROOT / "tests/Apollo3zehn.OpenApiClientGenerator.PythonClients"), "--", "import-benchmark-clients"],
+        check=True,
+        stdout=subprocess.DEVNULL)
+
+def _run_python(client_path: Path, arguments: list[str]) -> subprocess.CompletedProcess[str]:
+
+    environment = { **os.environ, "PYTHONPATH": str(client_path) }
+
+    return subprocess.run(
+        [sys.executable, *arguments],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True)
+
+def _measure_import_time(client_path: Path, package_name: str) -> tuple[float, int]:
+    """Returns the cumulative import time of the package in seconds and the number of imported modules of the package."""
+
+    result = _run_python(client_path, ["-X", "importtime", "-c", f"import {package_name}"])
+    import_time: Optional[float] = None
+    module_count = 0
+
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+
+        if name == package_name:
+            import_time = int(cumulative) / 1e6
+
+        if name == package_name or name.startswith(f"{package_name}."):
+            module_count += 1
+
+    if import_time is None:
+        raise Exception(f"The import time of {package_name} has not been reported.")
+
+    return import_time, module_count
+
+def _measure_first_call_time(client_path: Path, package_name: str) -> float:
+
+    result = _run_python(client_path, ["-c", FIRST_CALL_SCRIPT.format(package_name=package_name)])
+
+    return float(result.stdout)
+
+def main(repeat: int, client_path: Path):
+
+    _ensure_clients(client_path)
+
+    print(f"{'layout':<8}{'import [ms]':>14}{'modules':>10}{'first call [ms]':>18}")
+
+    for layout, package_name in PACKAGE_NAMES.items():
+
+        # compile the bytecode caches
+        _run_python(client_path, ["-c", FIRST_CALL_SCRIPT.format(package_name=package_name)])
+
+        import_times, module_counts = zip(*(_measure_import_time(client_path, package_name) for _ in range(repeat)))
+        first_call_times = [_measure_first_call_time(client_path, package_name) for _ in range(repeat)]
+
+        print(f"{layout:<8}{min(import_times) * 1000:14.1f}{max(module_counts):10}{min(first_call_times) * 1000:18.1f}")
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10, help="the number of interpreters per measurement (the minimum is reported)")
+    parser.add_argument("--client-path", type=Path, default=CLIENT_PATH, help="the folder which contains the generated import_api and import_api_lazy packages")
+    args = parser.parse_args()
+
+    main(args.repeat, args.client_path)
@@ -0,0 +1,114 @@
+"""
+Compares eager decoding with lazy decoding (JsonEncoderOptions.lazy_decode) when only a few top-level fields are read.
+
+Usage: python benchmarks/python/lazy-decode-benchmarks.py [item_count]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import JsonEncoder, JsonEncoderOptions, to_snake_case
+
+@dataclass(frozen=True)
+class Representation:
+    id: UUID
+    sample_period: str
+    created: datetime
+
+@dataclass(frozen=True)
+class Resource:
+    id: str
+    representations: list[Representation]
+    properties: Optional[dict[str, Any]]
+
+@dataclass(frozen=True)
+class Catalog:
+    id: str
+    title: str
+    resources: list[Resource]
+
+def _create_payload(item_count: int) -> Any:
+
+    catalog = {
+        "id": "/A/B/C",
+        "title": "Catalog",
+        "resources": [
+            {
+                "id": f"resource_{i}",
+                "representations": [
+                    {
+                        "id": str(uuid4()),
+                        "samplePeriod": "00:00:01",
+                        "created": "2020-01-01T00:00:00Z"
+                    } for _ in range(5)
+                ],
+                "properties": { "unit": "m/s", "description": "Speed." }
+            } for i in range(item_count)
+        ]
+    }
+
+    return json.loads(json.dumps(catalog))
+
+def _measure_peak_memory(action: Callable[[], Any]) -> int:
+
+    tracemalloc.start()
+
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+def main(item_count: int):
+
+    eager_options = JsonEncoderOptions(property_name_decoder=to_snake_case)
+    lazy_options = JsonEncoderOptions(property_name_decoder=to_snake_case, lazy_decode=True)
+    payload = _create_payload(item_count)
+
+    assert JsonEncoder.decode(Catalog, payload, eager_options) == JsonEncoder.decode(Catalog, payload, lazy_options)
+
+    # read the title and the id of the first resource only
+    def sparse_access(options: JsonEncoderOptions) -> Callable[[], Any]:
+
+        def action() -> Any:
+            catalog = JsonEncoder.decode(Catalog, payload, options)
+            return (catalog.title, catalog.resources[0].id)
+
+        return action
+
+    # read all fields
+    def full_access(options: JsonEncoderOptions) -> Callable[[], Any]:
+
+        def action() -> Any:
+            catalog = JsonEncoder.decode(Catalog, payload, options)
+            return [representation.created for resource in catalog.resources for representation in resource.representations]
+
+        return action
+
+    print(f"decode a catalog with {item_count} resources")
+
+    for title, access in [("sparse access", sparse_access), ("full access", full_access)]:
+
+        eager_time = min(timeit.repeat(access(eager_options), number=1, repeat=5))
+        lazy_time = min(timeit.repeat(access(lazy_options), number=1, repeat=5))
+        eager_memory = _measure_peak_memory(access(eager_options))
+        lazy_memory = _measure_peak_memory(access(lazy_options))
+
+        print(f"  {title}:")
+        print(f"    eager: {eager_time * 1000:8.1f} ms, peak memory {eager_memory / 1e6:7.1f} MB")
+        print(f"    lazy:  {lazy_time * 1000:8.1f} ms, peak memory {lazy_memory / 1e6:7.1f} MB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
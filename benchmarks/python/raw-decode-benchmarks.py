@@ -0,0 +1,63 @@
+"""
+Compares decoding into dataclasses (and converting them back to dicts) with the raw mode (JsonEncoderOptions.raw_decode).
+
+Usage: python benchmarks/python/raw-decode-benchmarks.py [item_count]
+"""
+
+import dataclasses
+import json
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import JsonEncoder, JsonEncoderOptions, to_snake_case
+
+@dataclass(frozen=True)
+class Row:
+    id: UUID
+    sample_period: str
+    created: datetime
+    values: list[float]
+    properties: Optional[dict[str, Any]]
+
+def _create_payload(item_count: int) -> Any:
+
+    rows = [
+        {
+            "id": str(uuid4()),
+            "samplePeriod": "00:00:01",
+            "created": "2020-01-01T00:00:00Z",
+            "values": [1.0, 2.0, 3.0],
+            "properties": { "unit": "m/s" }
+        } for _ in range(item_count)
+    ]
+
+    return json.loads(json.dumps(rows))
+
+def main(item_count: int):
+
+    options = JsonEncoderOptions(property_name_decoder=to_snake_case)
+    raw_options = JsonEncoderOptions(property_name_decoder=to_snake_case, raw_decode=True)
+    payload = _create_payload(item_count)
+
+    # typical ETL usage: decode and convert back to dicts
+    models = lambda: [dataclasses.asdict(row) for row in JsonEncoder.decode(list[Row], payload, options)]
+    raw = lambda: JsonEncoder.decode(list[Row], payload, raw_options)
+
+    assert [row["sample_period"] for row in models()] == [row["sample_period"] for row in raw()]
+
+    models_time = min(timeit.repeat(models, number=1, repeat=5))
+    raw_time = min(timeit.repeat(raw, number=1, repeat=5))
+
+    print(f"decode {item_count} rows")
+    print(f"  models + asdict: {models_time * 1000:8.1f} ms ({item_count / models_time:10.0f} rows/s)")
+    print(f"  raw:             {raw_time * 1000:8.1f} ms ({item_count / raw_time:10.0f} rows/s)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,98 @@
+"""
+Compares the generated @dataclass(frozen=True) models with @dataclass(frozen=True, slots=True) models (Python_SlottedModels).
+
+Usage: python benchmarks/python/slots-benchmarks.py [item_count]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Type
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import JsonEncoder, JsonEncoderOptions, to_snake_case
+
+@dataclass(frozen=True)
+class Sample:
+    id: UUID
+    name: str
+    value: float
+    count: int
+    timestamp: datetime
+    unit: Optional[str]
+
+@dataclass(frozen=True, slots=True)
+class SlottedSample:
+    id: UUID
+    name: str
+    value: float
+    count: int
+    timestamp: datetime
+    unit: Optional[str]
+
+def _create_payload(item_count: int) -> Any:
+
+    samples = [
+        {
+            "id": str(uuid4()),
+            "name": f"sample_{i}",
+            "value": i * 1.5,
+            "count": i,
+            "timestamp": "2020-01-01T00:00:00Z",
+            "unit": "m/s"
+        } for i in range(item_count)
+    ]
+
+    return json.loads(json.dumps(samples))
+
+def _measure_memory(action: Callable[[], Any]) -> int:
+
+    tracemalloc.start()
+
+    try:
+        result = action()
+        current, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return current
+
+def _construct(typeCls: Type, arguments: list[tuple]) -> list[Any]:
+    return [typeCls(*args) for args in arguments]
+
+def main(item_count: int):
+
+    options = JsonEncoderOptions(property_name_decoder=to_snake_case)
+    payload = _create_payload(item_count)
+    timestamp = datetime(2020, 1, 1)
+    uuid = uuid4()
+
+    # all field values are shared between the instances so only the instances themselves are measured
+    arguments = [(uuid, "sample", 1.5, 1, timestamp, "m/s")] * item_count
+
+    print(f"{item_count} instances with {len(arguments[0])} fields")
+
+    for typeCls in [Sample, SlottedSample]:
+
+        # the list of instances is included in both measurements and is subtracted
+        list_memory = _measure_memory(lambda: [None] * item_count)
+        memory = _measure_memory(lambda: _construct(typeCls, arguments)) - list_memory
+        construct_time = min(timeit.repeat(lambda: _construct(typeCls, arguments), number=1, repeat=5))
+        decode_time = min(timeit.repeat(lambda: JsonEncoder.decode(list[typeCls], payload, options), number=1, repeat=5))
+
+        print(f"  {typeCls.__name__}:")
+        print(f"    memory:    {memory / item_count:8.1f} bytes per instance")
+        print(f"    construct: {item_count / construct_time:10.0f} instances/s")
+        print(f"    decode:    {item_count / decode_time:10.0f} instances/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
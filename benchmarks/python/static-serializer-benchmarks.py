@@ -0,0 +1,179 @@
+"""
+Compares the generated static serializers (Python_StaticSerializers) with the JsonEncoder based path.
+
+The models below mirror the code emitted by PythonGenerator.AppendModelSourceText.
+
+Usage: python benchmarks/python/static-serializer-benchmarks.py [item_count]
+"""
+
+import json
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Type, cast
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import (JsonEncoder, JsonEncoderOptions, _decode_datetime,
+                           _decode_timedelta, _encode_datetime,
+                           _encode_timedelta, to_camel_case, to_snake_case)
+
+# same as _shared._json_encoder_options
+options = JsonEncoderOptions(
+    property_name_encoder=lambda value: to_camel_case(value) if value != "class_" else "class",
+    property_name_decoder=lambda value: to_snake_case(value) if value != "class" else "class_"
+)
+
+options.encoders[Enum] = lambda value: to_camel_case(value.name)
+options.decoders[Enum] = lambda typeCls, value: cast(Type[Enum], typeCls)[to_snake_case(value).upper()]
+
+class Kind(Enum):
+    FIRST_KIND = "FIRST_KIND"
+    SECOND_KIND = "SECOND_KIND"
+
+class _EnumDecoder(dict):
+
+    def __init__(self, enum_type: Type[Enum]):
+        super().__init__()
+        self._enum_type = enum_type
+
+    def __missing__(self, value: str) -> Enum:
+        member = self._enum_type[to_snake_case(value).upper()]
+        self[value] = member
+
+        return member
+
+_Kind_from_json = _EnumDecoder(Kind)
+_Kind_to_json = {member: to_camel_case(member.name) for member in Kind}
+
+@dataclass(frozen=True)
+class Leaf:
+    id: UUID
+    kind: Kind
+    value: float
+    timestamp: datetime
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    count: int
+    period: timedelta
+    leaves: list[Leaf]
+    properties: Optional[dict[str, object]]
+
+@dataclass(frozen=True)
+class StaticLeaf:
+    id: UUID
+    kind: Kind
+    value: float
+    timestamp: datetime
+
+    @staticmethod
+    def _from_json(data: dict[str, Any]) -> "StaticLeaf":
+        return StaticLeaf(
+            None if (value := data.get("id")) is None else UUID(value),
+            None if (value := data.get("kind")) is None else _Kind_from_json[value],
+            data.get("value", 0.0),
+            None if (value := data.get("timestamp")) is None else _decode_datetime(value),
+        )
+
+    def _to_json(self) -> dict[str, Any]:
+        return {
+            "id": None if self.id is None else str(self.id),
+            "kind": None if self.kind is None else _Kind_to_json[self.kind],
+            "value": self.value,
+            "timestamp": None if self.timestamp is None else _encode_datetime(self.timestamp),
+        }
+
+@dataclass(frozen=True)
+class StaticNode:
+    name: str
+    count: int
+    period: timedelta
+    leaves: list[StaticLeaf]
+    properties: Optional[dict[str, object]]
+
+    @staticmethod
+    def _from_json(data: dict[str, Any]) -> "StaticNode":
+        return StaticNode(
+            data.get("name"),
+            data.get("count", 0),
+            None if (value := data.get("period")) is None else _decode_timedelta(value),
+            None if (value := data.get("leaves")) is None else [None if item0 is None else StaticLeaf._from_json(item0) for item0 in value],
+            data.get("properties"),
+        )
+
+    def _to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "period": None if self.period is None else _encode_timedelta(self.period),
+            "leaves": None if self.leaves is None else [None if item0 is None else item0._to_json() for item0 in self.leaves],
+            "properties": None if self.properties is None else {key0: None if item0 is None else JsonEncoder.encode(item0, options) for key0, item0 in self.properties.items()},
+        }
+
+def _create_payload(item_count: int) -> Any:
+
+    nodes = [
+        {
+            "name": f"node_{i}",
+            "count": i,
+            "period": "00:00:01",
+            "leaves": [
+                {
+                    "id": str(uuid4()),
+                    "kind": "firstKind" if j % 2 == 0 else "secondKind",
+                    "value": j * 1.5,
+                    "timestamp": "2020-01-01T00:00:00Z"
+                } for j in range(10)
+            ],
+            "properties": { "unit": "m/s", "description": "Speed." }
+        } for i in range(item_count)
+    ]
+
+    return json.loads(json.dumps(nodes))
+
+def _print(title: str, count: int, reflective: float, static: float):
+    print(title)
+    print(f"  JsonEncoder: {reflective * 1000:8.1f} ms ({count / reflective:10.0f} models/s)")
+    print(f"  static:      {static * 1000:8.1f} ms ({count / static:10.0f} models/s)")
+    print(f"  speedup:     {reflective / static:8.1f}x")
+
+def main(item_count: int):
+
+    payload = _create_payload(item_count)
+    model_count = item_count * 11
+
+    # decode
+    reflective_decode = lambda: JsonEncoder.decode(list[Node], payload, options)
+    static_decode = lambda: [StaticNode._from_json(item) for item in payload]
+
+    reflective_result = reflective_decode()
+    static_result = static_decode()
+
+    assert [node.leaves[1].kind for node in reflective_result] == [node.leaves[1].kind for node in static_result]
+
+    _print(
+        f"decode {model_count} models",
+        model_count,
+        min(timeit.repeat(reflective_decode, number=1, repeat=5)),
+        min(timeit.repeat(static_decode, number=1, repeat=5)))
+
+    # encode
+    reflective_encode = lambda: JsonEncoder.encode_to_bytes(reflective_result, options)
+    static_encode = lambda: json.dumps([item._to_json() for item in static_result]).encode("utf-8")
+
+    assert reflective_encode() == static_encode()
+
+    _print(
+        f"encode {model_count} models",
+        model_count,
+        min(timeit.repeat(reflective_encode, number=1, repeat=5)),
+        min(timeit.repeat(static_encode, number=1, repeat=5)))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
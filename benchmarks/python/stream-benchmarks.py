@@ -0,0 +1,112 @@
+"""
+Compares the buffered decoding of a JSON array response with the streaming decoding used by the generated *_iter methods.
+
+Usage: python benchmarks/python/stream-benchmarks.py [item_count]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src/Apollo3zehn.OpenApiClientGenerator/Templates"))
+
+from PythonEncoder import (JsonArrayReader, JsonEncoder, JsonEncoderOptions,
+                           to_snake_case)
+
+CHUNK_SIZE = 65536
+
+@dataclass(frozen=True)
+class Leaf:
+    id: UUID
+    value: float
+    timestamp: datetime
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    count: int
+    leaves: list[Leaf]
+
+def _create_payload(item_count: int) -> bytes:
+
+    nodes = [
+        {
+            "name": f"node_{i}",
+            "count": i,
+            "leaves": [
+                {
+                    "id": str(uuid4()),
+                    "value": j * 1.5,
+                    "timestamp": "2020-01-01T00:00:00Z"
+                } for j in range(10)
+            ]
+        } for i in range(item_count)
+    ]
+
+    return json.dumps(nodes).encode("utf-8")
+
+# simulates httpx.Response.iter_bytes()
+def _iter_bytes(payload: bytes) -> Iterator[bytes]:
+    for i in range(0, len(payload), CHUNK_SIZE):
+        yield payload[i:i + CHUNK_SIZE]
+
+def _measure_peak_memory(action: Callable[[], Any]) -> int:
+
+    tracemalloc.start()
+
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+def main(item_count: int):
+
+    options = JsonEncoderOptions(property_name_decoder=to_snake_case)
+    payload = _create_payload(item_count)
+
+    # the caller processes one node after the other
+    def buffered() -> int:
+        count = 0
+
+        for node in JsonEncoder.decode(list[Node], json.loads(b"".join(_iter_bytes(payload))), options):
+            count += node.count
+
+        return count
+
+    def streamed() -> int:
+        count = 0
+        decode = JsonEncoder.get_decoder(Node, options)
+        reader = JsonArrayReader()
+
+        for chunk in _iter_bytes(payload):
+            for item in reader.feed(chunk):
+                count += decode(item).count
+
+        for item in reader.close():
+            count += decode(item).count
+
+        return count
+
+    assert buffered() == streamed()
+
+    buffered_time = min(timeit.repeat(buffered, number=1, repeat=5))
+    streamed_time = min(timeit.repeat(streamed, number=1, repeat=5))
+    buffered_memory = _measure_peak_memory(buffered)
+    streamed_memory = _measure_peak_memory(streamed)
+
+    print(f"decode {item_count} nodes from {len(payload) / 1e6:.1f} MB of JSON")
+    print(f"  buffered: {buffered_time * 1000:8.1f} ms, peak memory {buffered_memory / 1e6:7.1f} MB")
+    print(f"  streamed: {streamed_time * 1000:8.1f} ms, peak memory {streamed_memory / 1e6:7.1f} MB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,132 @@
+"""
+Measures the throughput of concurrent requests against a local stub server for different connection pool settings
+(TransportOptions) and compares separate connection pools per client with a SharedConnectionPool.
+
+The transports below mirror the ones created by the generated create() method.
+
+Usage: python benchmarks/python/transport-benchmarks.py [request_count]
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import httpx
+
+CONCURRENCY = 64
+LATENCY = 0.002
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def setup(self):
+        super().setup()
+
+        # avoid delayed acknowledgements between the header and the body
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+
+        _Handler.connections.add(self.client_address)
+        time.sleep(LATENCY)
+
+        body = b'{ "value": 1 }'
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+def _create_client(url: str, max_connections: Optional[int], transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    transport = transport or httpx.AsyncHTTPTransport(limits=limits)
+
+    return httpx.AsyncClient(base_url=url, transport=transport)
+
+async def _run(clients: list[httpx.AsyncClient], request_count: int) -> float:
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request(i: int):
+        async with semaphore:
+            response = await clients[i % len(clients)].get("/")
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(request_count)))
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.aclose()
+
+    return elapsed
+
+async def _run_without_pool(url: str, request_count: int) -> float:
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request():
+        async with semaphore:
+            async with httpx.AsyncClient(base_url=url) as client:
+                response = await client.get("/")
+                response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(request_count)))
+
+    return time.perf_counter() - start
+
+def _print(title: str, request_count: int, elapsed: float):
+    print(f"  {title:<40} {request_count / elapsed:8.0f} requests/s, {len(_Handler.connections):5} connections")
+    _Handler.connections.clear()
+
+async def main(request_count: int):
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{request_count} requests, {CONCURRENCY} concurrent, {LATENCY * 1000:.0f} ms server latency")
+
+    _print("new client per request", request_count, await _run_without_pool(url, request_count))
+
+    for max_connections in [1, 10, 100]:
+        elapsed = await _run([_create_client(url, max_connections)], request_count)
+        _print(f"max_connections={max_connections}", request_count, elapsed)
+
+    # 8 clients for different APIs of the same server
+    elapsed = await _run([_create_client(url, 10) for _ in range(8)], request_count)
+    _print("8 clients, separate pools (10 each)", request_count, elapsed)
+
+    shared_transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+    elapsed = await _run([_create_client(url, None, _SharedAsyncTransport(shared_transport)) for _ in range(8)], request_count)
+    _print("8 clients, shared pool (10)", request_count, elapsed)
+    await shared_transport.aclose()
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -11,5 +11,9 @@ namespace Apollo3zehn.OpenApiClientGenerator
         string Special_ConfigurationHeaderKey,
         bool Special_WebAssemblySupport,
         bool Special_AccessTokenSupport,
-        bool Special_NexusFeatures);
+        bool Special_NexusFeatures,
+        bool Python_StaticSerializers = false,
+        bool Python_SlottedModels = false,
+        bool Python_TypedDicts = false,
+        bool Python_LazyModules = false);
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 ﻿using System.Reflection;
 using System.Text;
+using System.Text.RegularExpressions;
 using Microsoft.OpenApi.Any;
 using Microsoft.OpenApi.Models;
 using Stubble.Core.Builders;
@@ -12,12 +13,14 @@ record SubClientProperties(
     string FieldAssignments,
     string Properties,
     string Source,
+    IReadOnlyDictionary<string, string> Sources,
     string InterfaceProperties);
 
 public class PythonGenerator
 {
     private readonly GeneratorSettings _settings;
     private Dictionary<string, string> _additionalModels = default!;
+    private Dictionary<string, (string ClassName, string Entry)> _operations = default!;
 
     private readonly Dictionary<string, string> _methodNameSuffixes = new()
     {
@@ -34,6 +37,7 @@ public class PythonGenerator
         string targetFolderPath,
         params OpenApiDocument[] documents)
     {
+        var versions = new List<string>();
         var modules = new Dictionary<string, string>();
 
         _additionalModels = new();
@@ -74,15 +78,17 @@ public class PythonGenerator
             if (!char.IsUpper(version[0]))
                 version = Shared.FirstCharToUpper(version);
 
+            _operations = new();
+
             // Versioning
             versioningImportsBuilder.AppendLine($"from .{version} import {version}, {version}Async");
 
             if (_settings.Special_NexusFeatures)
-                versioningImportsBuilder.AppendLine($"from .{version} import CatalogItem, ExportParameters, TaskStatus");
+                versioningImportsBuilder.AppendLine($"from .{version} import CatalogItem, ExportParameters, Job, JobStatus, TaskStatus");
 
             versioningFieldsBuilder.AppendLine($"    _{Shared.FirstCharToLower(version)}: {version}{{{{AsyncPlaceholder}}}}");
 
-            versioningFieldAssignmentsBuilder.AppendLine($"        self._{Shared.FirstCharToLower(version)} = {version}{{{{AsyncPlaceholder}}}}(self._invoke)");
+            versioningFieldAssignmentsBuilder.AppendLine($"        self._{Shared.FirstCharToLower(version)} = {version}{{{{AsyncPlaceholder}}}}(self._invoke, self._invoke_iter)");
 
             versioningPropertiesBuilder.AppendLine($"    @property");
             versioningPropertiesBuilder.AppendLine($"    def {Shared.FirstCharToLower(version)}(self) -> {version}{{{{AsyncPlaceholder}}}}:");
@@ -103,7 +109,8 @@ public class PythonGenerator
                 Version = version,
                 SubClientFields = syncClientProperties.Fields,
                 SubClientFieldAssignments = syncClientProperties.FieldAssignments,
-                SubClientProperties = syncClientProperties.Properties
+                SubClientProperties = syncClientProperties.Properties,
+                Python_LazyModules = _settings.Python_LazyModules
             };
 
             var syncClient = stubble.Render(subClientTemplate, syncClientData);
@@ -121,45 +128,66 @@ public class PythonGenerator
                 Version = version,
                 SubClientFields = asyncClientProperties.Fields,
                 SubClientFieldAssignments = asyncClientProperties.FieldAssignments,
-                SubClientProperties = asyncClientProperties.Properties
+                SubClientProperties = asyncClientProperties.Properties,
+                Python_LazyModules = _settings.Python_LazyModules
             };
 
             var asyncClient = stubble.Render(subClientTemplate, asyncClientData);
 
             // Models
-            sourceTextBuilder.Clear();
+            var modelTexts = new List<string>();
 
             foreach (var schema in document.Components.Schemas)
             {
+                sourceTextBuilder.Clear();
+
                 AppendModelSourceText(
                     schema.Key,
                     schema.Value,
                     sourceTextBuilder);
 
-                sourceTextBuilder.AppendLine();
+                modelTexts.Add(sourceTextBuilder.ToString());
             }
 
-            foreach (var (_, modelText) in _additionalModels)
+            modelTexts.AddRange(_additionalModels.Values);
+            versions.Add(version);
+
+            if (_settings.Python_LazyModules)
             {
-                sourceTextBuilder.Append(modelText);
-                sourceTextBuilder.AppendLine();
+                AddLazyModules(
+                    version,
+                    syncClient,
+                    asyncClient,
+                    syncClientProperties,
+                    asyncClientProperties,
+                    modelTexts,
+                    moduleTemplate,
+                    modules);
             }
 
-            var models = sourceTextBuilder.ToString();
-
-            var moduleData = new
+            else
             {
-                SyncClient = syncClient,
-                SyncSubClients = syncClientProperties.Source,
-                AsyncClient = asyncClient,
-                AsyncSubClients = asyncClientProperties.Source,
-                Models = models
-            };
-
-            var settings = new RenderSettings() { SkipHtmlEncoding = true };
-            var module = stubble.Render(moduleTemplate, moduleData, settings);
+                var models = string.Concat(modelTexts.Select(modelText => modelText + Environment.NewLine));
 
-            modules[version] = module;
+                var moduleData = new
+                {
+                    SyncClient = syncClient,
+                    SyncSubClients = syncClientProperties.Source,
+                    AsyncClient = asyncClient,
+                    AsyncSubClients = asyncClientProperties.Source,
+                    Models = models,
+                    Operations = GetOperationsSourceText(_operations.Values.Select(current => current.Entry)),
+                    ParentPackage = ".",
+                    ModuleImports = default(string),
+                    Python_StaticSerializers = _settings.Python_StaticSerializers,
+                    Python_TypedDicts = _settings.Python_TypedDicts
+                };
+
+                var settings = new RenderSettings() { SkipHtmlEncoding = true };
+                var module = stubble.Render(moduleTemplate, moduleData, settings);
+
+                modules[$"{version}.py"] = module;
+            }
         }
 
         // Main clients
@@ -177,10 +205,12 @@ public class PythonGenerator
             VersioningFieldAssignments = versioningFieldAssignmentsBuilder.ToString().Replace("{{AsyncPlaceholder}}", string.Empty),
             VersioningProperties = versioningPropertiesBuilder.ToString().Replace("{{AsyncPlaceholder}}", string.Empty),
             Async = "",
+            IsAsync = false,
             Def = "def",
             Await = "",
             Aclose = "close",
             Aiter_bytes = "iter_bytes",
+            Aiter_raw = "iter_raw",
             AsyncioSleep = "time.sleep",
             Enter = "enter",
             Exit = "exit",
@@ -203,10 +233,12 @@ public class PythonGenerator
             VersioningFieldAssignments = versioningFieldAssignmentsBuilder.ToString().Replace("{{AsyncPlaceholder}}", "Async"),
             VersioningProperties = versioningPropertiesBuilder.ToString().Replace("{{AsyncPlaceholder}}", "Async"),
             Async = "Async",
+            IsAsync = true,
             Def = "async def",
             Await = "await ",
             Aclose = "aclose",
             Aiter_bytes = "aiter_bytes",
+            Aiter_raw = "aiter_raw",
             AsyncioSleep = "asyncio.sleep",
             Enter = "aenter",
             Exit = "aexit",
@@ -233,6 +265,7 @@ public class PythonGenerator
             SyncMainClient = syncMainClient,
             AsyncMainClient = asyncMainClient,
             ExceptionType = _settings.ExceptionType,
+            Special_ConfigurationHeaderKey = _settings.Special_ConfigurationHeaderKey,
             Special_NexusFeatures = _settings.Special_NexusFeatures
         };
 
@@ -245,6 +278,41 @@ public class PythonGenerator
 
         var encoder = encoderStreamReader.ReadToEnd();
 
+        // HTTP cache
+        using var httpCacheStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonHttpCache.py")!);
+
+        var httpCache = httpCacheStreamReader.ReadToEnd();
+
+        // Concurrency limiter
+        using var limiterStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonConcurrencyLimiter.py")!);
+
+        var limiter = limiterStreamReader.ReadToEnd();
+
+        // Instrumentation
+        using var instrumentationStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonInstrumentation.py")!);
+
+        var instrumentation = instrumentationStreamReader.ReadToEnd();
+
+        // Operation
+        using var operationStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonOperation.py")!);
+
+        var operation = operationStreamReader.ReadToEnd();
+
+        // Data cache
+        using var dataCacheStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonDataCache.py")!);
+
+        var dataCache = dataCacheStreamReader.ReadToEnd();
+
         // Shared
         using var sharedTemplateStreamReader = new StreamReader(Assembly
             .GetExecutingAssembly()
@@ -272,14 +340,183 @@ public class PythonGenerator
         File.WriteAllText(Path.Combine(targetFolderPath, "__init__.py"), init);
         File.WriteAllText(Path.Combine(targetFolderPath, "_client.py"), client);
         File.WriteAllText(Path.Combine(targetFolderPath, "_encoder.py"), encoder);
+        File.WriteAllText(Path.Combine(targetFolderPath, "_http_cache.py"), httpCache);
+        File.WriteAllText(Path.Combine(targetFolderPath, "_limiter.py"), limiter);
+        File.WriteAllText(Path.Combine(targetFolderPath, "_instrumentation.py"), instrumentation);
+        File.WriteAllText(Path.Combine(targetFolderPath, "_operation.py"), operation);
+
+        if (_settings.Special_NexusFeatures)
+            File.WriteAllText(Path.Combine(targetFolderPath, "_cache.py"), dataCache);
+
         File.WriteAllText(Path.Combine(targetFolderPath, "_shared.py"), shared);
 
-        foreach (var (version, module) in modules)
+        // remove the version modules of the other layout and stale lazy modules
+        foreach (var version in versions)
+        {
+            var versionFolderPath = Path.Combine(targetFolderPath, version);
+            var versionFilePath = Path.Combine(targetFolderPath, $"{version}.py");
+
+            if (Directory.Exists(versionFolderPath))
+                Directory.Delete(versionFolderPath, recursive: true);
+
+            if (File.Exists(versionFilePath))
+                File.Delete(versionFilePath);
+        }
+
+        foreach (var (relativeFilePath, module) in modules)
         {
-            File.WriteAllText(Path.Combine(targetFolderPath, $"{version}.py"), module);
+            var filePath = Path.Combine(targetFolderPath, relativeFilePath);
+
+            Directory.CreateDirectory(Path.GetDirectoryName(filePath)!);
+            File.WriteAllText(filePath, module);
         }
     }
 
+    private void AddLazyModules(
+        string version,
+        string syncClient,
+        string asyncClient,
+        SubClientProperties syncClientProperties,
+        SubClientProperties asyncClientProperties,
+        List<string> modelTexts,
+        string moduleTemplate,
+        Dictionary<string, string> modules)
+    {
+        var stubble = new StubbleBuilder().Build();
+        var settings = new RenderSettings() { SkipHtmlEncoding = true };
+        var wordRegex = new Regex(@"\w+");
+        var classNameRegex = new Regex(@"^class (\w+)", RegexOptions.Multiline);
+        var definitionRegex = new Regex(@"^(?:class (\w+)|(\w+) =)", RegexOptions.Multiline);
+
+        // Models which reference each other (directly or indirectly) share a module, i.e. the
+        // modules contain the connected components of the reference graph. This way, there
+        // are no import cycles between the model modules.
+        var definitions = new Dictionary<string, int>();
+
+        for (int i = 0; i < modelTexts.Count; i++)
+        {
+            foreach (Match match in definitionRegex.Matches(modelTexts[i]))
+            {
+                var name = match.Groups[1].Success
+                    ? match.Groups[1].Value
+                    : match.Groups[2].Value;
+
+                definitions[name] = i;
+            }
+        }
+
+        var parents = Enumerable.Range(0, modelTexts.Count).ToArray();
+
+        int FindRoot(int i) => parents[i] == i
+            ? i
+            : parents[i] = FindRoot(parents[i]);
+
+        for (int i = 0; i < modelTexts.Count; i++)
+        {
+            foreach (Match match in wordRegex.Matches(modelTexts[i]))
+            {
+                if (definitions.TryGetValue(match.Value, out var j))
+                    parents[FindRoot(i)] = FindRoot(j);
+            }
+        }
+
+        // public name -> module name
+        var lazyAttributes = new Dictionary<string, string>();
+        var modelModuleNames = new Dictionary<string, string>();
+
+        foreach (var modelGroup in Enumerable.Range(0, modelTexts.Count).GroupBy(FindRoot))
+        {
+            var groupModelTexts = modelGroup
+                .Select(i => modelTexts[i])
+                .ToList();
+
+            var modelNames = groupModelTexts
+                .SelectMany(modelText => classNameRegex.Matches(modelText).Select(match => match.Groups[1].Value))
+                .ToList();
+
+            var moduleName = $"_models_{Shared.ToSnakeCase(modelNames.First())}";
+
+            foreach (var modelName in modelNames)
+            {
+                modelModuleNames[modelName] = moduleName;
+                lazyAttributes[modelName] = moduleName;
+            }
+
+            var moduleData = new
+            {
+                SyncClient = "",
+                SyncSubClients = "",
+                AsyncClient = "",
+                AsyncSubClients = "",
+                Models = string.Concat(groupModelTexts.Select(modelText => modelText + Environment.NewLine)),
+                Operations = default(string),
+                ParentPackage = "..",
+                ModuleImports = default(string),
+                Python_StaticSerializers = _settings.Python_StaticSerializers,
+                Python_TypedDicts = _settings.Python_TypedDicts
+            };
+
+            modules[Path.Combine(version, $"{moduleName}.py")] = stubble.Render(moduleTemplate, moduleData, settings);
+        }
+
+        // one module per sub-client which imports the models it uses
+        foreach (var (subClient, syncSource) in syncClientProperties.Sources)
+        {
+            var asyncSource = asyncClientProperties.Sources[subClient];
+            var moduleName = $"_{Shared.ToSnakeCase(subClient)}";
+
+            lazyAttributes[$"{subClient}Client"] = moduleName;
+            lazyAttributes[$"{subClient}AsyncClient"] = moduleName;
+
+            var moduleImports = wordRegex.Matches(syncSource + asyncSource)
+                .Select(match => match.Value)
+                .Where(modelModuleNames.ContainsKey)
+                .Distinct()
+                .GroupBy(modelName => modelModuleNames[modelName])
+                .Select(group => $"from .{group.Key} import {string.Join(", ", group.OrderBy(modelName => modelName, StringComparer.Ordinal))}");
+
+            var moduleData = new
+            {
+                SyncClient = "",
+                SyncSubClients = syncSource,
+                AsyncClient = "",
+                AsyncSubClients = asyncSource,
+                Models = "",
+                Operations = GetOperationsSourceText(_operations.Values
+                    .Where(operation => operation.ClassName == subClient)
+                    .Select(operation => operation.Entry)),
+                ParentPackage = "..",
+                ModuleImports = string.Join(Environment.NewLine, moduleImports),
+                Python_StaticSerializers = _settings.Python_StaticSerializers,
+                Python_TypedDicts = _settings.Python_TypedDicts
+            };
+
+            modules[Path.Combine(version, $"{moduleName}.py")] = stubble.Render(moduleTemplate, moduleData, settings);
+        }
+
+        // the package contains the version clients and imports everything else on first access
+        using var lazyInitTemplateStreamReader = new StreamReader(Assembly
+            .GetExecutingAssembly()
+            .GetManifestResourceStream("Apollo3zehn.OpenApiClientGenerator.Templates.PythonClientTemplate_LazyInit.py")!);
+
+        var lazyInitTemplate = lazyInitTemplateStreamReader.ReadToEnd();
+
+        var typeCheckingImports = lazyAttributes
+            .GroupBy(entry => entry.Value)
+            .Select(group => $"    from .{group.Key} import {string.Join(", ", group.Select(entry => entry.Key))}")
+            .DefaultIfEmpty("    pass");
+
+        var lazyInitData = new
+        {
+            TypeCheckingImports = string.Join(Environment.NewLine, typeCheckingImports),
+            LazyAttributes = string.Join(Environment.NewLine, lazyAttributes.Select(entry => $"    \"{entry.Key}\": \".{entry.Value}\",")),
+            SyncClient = syncClient,
+            AsyncClient = asyncClient
+        };
+
+        modules[Path.Combine(version, "__init__.py")] = stubble.Render(lazyInitTemplate, lazyInitData, settings);
+    }
+
     private SubClientProperties GenerateClientProperties(
         OpenApiDocument document, 
         StringBuilder sourceTextBuilder, 
@@ -300,7 +537,11 @@ public class PythonGenerator
 
         foreach (var subClient in subClientNames)
         {
-            sourceTextBuilder.AppendLine($"    _{Shared.FirstCharToLower(subClient)}: {subClient}{prefix}Client");
+            var fieldType = _settings.Python_LazyModules
+                ? $"Optional[{subClient}{prefix}Client]"
+                : $"{subClient}{prefix}Client";
+
+            sourceTextBuilder.AppendLine($"    _{Shared.FirstCharToLower(subClient)}: {fieldType}");
         }
 
         var fields = sourceTextBuilder.ToString();
@@ -310,7 +551,12 @@ public class PythonGenerator
 
         foreach (var subClient in subClientNames)
         {
-            sourceTextBuilder.AppendLine($"        self._{Shared.FirstCharToLower(subClient)} = {subClient}{prefix}Client(invoke)");
+            // lazy sub-clients are created on first access
+            var fieldValue = _settings.Python_LazyModules
+                ? "None"
+                : $"{subClient}{prefix}Client(invoke, invoke_iter)";
+
+            sourceTextBuilder.AppendLine($"        self._{Shared.FirstCharToLower(subClient)} = {fieldValue}");
         }
 
         var fieldAssignments = sourceTextBuilder.ToString();
@@ -320,12 +566,29 @@ public class PythonGenerator
 
         foreach (var subClient in subClientNames)
         {
-            sourceTextBuilder.AppendLine(
+            if (_settings.Python_LazyModules)
+            {
+                sourceTextBuilder.AppendLine(
 $@"    @property
     def {Shared.ToSnakeCase(subClient)}(self) -> {subClient}{prefix}Client:
         """"""Gets the {subClient}{prefix}Client.""""""
+        if self._{Shared.FirstCharToLower(subClient)} is None:
+            from ._{Shared.ToSnakeCase(subClient)} import {subClient}{prefix}Client
+            self._{Shared.FirstCharToLower(subClient)} = {subClient}{prefix}Client(self.___invoke, self.___invoke_iter)
+
         return self._{Shared.FirstCharToLower(subClient)}
 ");
+            }
+
+            else
+            {
+                sourceTextBuilder.AppendLine(
+$@"    @property
+    def {Shared.ToSnakeCase(subClient)}(self) -> {subClient}{prefix}Client:
+        """"""Gets the {subClient}{prefix}Client.""""""
+        return self._{Shared.FirstCharToLower(subClient)}
+");
+            }
         }
 
         var properties = sourceTextBuilder.ToString();
@@ -336,8 +599,12 @@ $@"    @property
         // Source
         sourceTextBuilder.Clear();
 
+        var sources = new Dictionary<string, string>();
+
         foreach (var clientGroup in groupedClients)
         {
+            var start = sourceTextBuilder.Length;
+
             AppendSubClientSourceText(
                 clientGroup.Key,
                 clientGroup.ToDictionary(entry => entry.path.Key, entry => entry.path.Value),
@@ -345,6 +612,7 @@ $@"    @property
                 async);
 
             sourceTextBuilder.AppendLine();
+            sources[clientGroup.Key] = sourceTextBuilder.ToString(start, sourceTextBuilder.Length - start);
         }
 
         var source = sourceTextBuilder.ToString();
@@ -355,6 +623,7 @@ $@"    @property
             FieldAssignments: fieldAssignments,
             Properties: properties,
             Source: source,
+            Sources: sources,
             InterfaceProperties: interfaceProperties
         );
     }
@@ -377,9 +646,11 @@ $@"class {augmentedClassName}:
     """"""Provides methods to interact with {Shared.SplitCamelCase(className).ToLower()}.""""""
 
     ___invoke: HttpRequestHandler{prefix}
+    ___invoke_iter: HttpRequestIterHandler{prefix}
     
-    def __init__(self, invoke: HttpRequestHandler{prefix}):
+    def __init__(self, invoke: HttpRequestHandler{prefix}, invoke_iter: HttpRequestIterHandler{prefix}):
         self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
 ");
 
         foreach (var entry in methodMap)
@@ -397,6 +668,7 @@ $@"class {augmentedClassName}:
                 if (response.Value.Content.Count == 0)
                 {
                     AppendImplementationMethodSourceText(
+                        className,
                         path: entry.Key,
                         methodSuffix: "",
                         operation.Key,
@@ -404,7 +676,8 @@ $@"class {augmentedClassName}:
                         response,
                         responseType: default,
                         sourceTextBuilder,
-                        async);
+                        async,
+                        iter: false);
 
                     sourceTextBuilder.AppendLine();
                 }
@@ -418,6 +691,7 @@ $@"class {augmentedClassName}:
                             : _methodNameSuffixes[responseType.Key];
 
                         AppendImplementationMethodSourceText(
+                            className,
                             path: entry.Key,
                             methodSuffix,
                             operation.Key,
@@ -425,7 +699,8 @@ $@"class {augmentedClassName}:
                             response,
                             responseType,
                             sourceTextBuilder,
-                            async);
+                            async,
+                            iter: false);
 
                         sourceTextBuilder.AppendLine();
                     }
@@ -435,6 +710,7 @@ $@"class {augmentedClassName}:
     }
 
     private void AppendImplementationMethodSourceText(
+        string className,
         string path,
         string methodSuffix,
         OperationType operationType,
@@ -442,7 +718,8 @@ $@"class {augmentedClassName}:
         KeyValuePair<string, OpenApiResponse> response,
         KeyValuePair<string, OpenApiMediaType>? responseType,
         StringBuilder sourceTextBuilder,
-        bool async)
+        bool async,
+        bool iter)
     {
         var signature = GetMethodSignature(
             path,
@@ -458,11 +735,32 @@ $@"class {augmentedClassName}:
         var isVoidReturnType = string.IsNullOrWhiteSpace(returnType);
         var actualReturnType = isVoidReturnType ? "None" : returnType;
         var actualActualReturnType = async ? $"Awaitable[{actualReturnType}]" : actualReturnType;
+        var summary = GetFirstLine(operation.Summary);
+
+        if (isVoidReturnType)
+            returnType = "type(None)";
+
+        // remove Optional to make type checker happy (https://github.com/microsoft/pyright/issues/684)
+        var invokeType = returnType.StartsWith("Optional[")
+            ? returnType.Substring(9, returnType.Length - 10)
+            : returnType;
+
+        var itemType = invokeType.StartsWith("list[")
+            ? invokeType.Substring(5, invokeType.Length - 6)
+            : null;
+
+        // the streaming variant yields the array items one by one
+        if (iter)
+        {
+            signature = signature.Insert(signature.IndexOf('('), "_iter");
+            actualActualReturnType = async ? $"AsyncIterator[{itemType}]" : $"Iterator[{itemType}]";
+            summary += " The items are decoded one by one while the response is being received.";
+        }
 
         sourceTextBuilder.AppendLine(
 @$"    def {signature} -> {actualActualReturnType}:
         """"""
-        {GetFirstLine(operation.Summary)}
+        {summary}
 
         Args:");
 
@@ -475,58 +773,27 @@ $@"class {augmentedClassName}:
         sourceTextBuilder.AppendLine(@"        """"""
 ");
 
-        sourceTextBuilder
-            .AppendLine($"        __url = \"{path}\"");
-
         // path parameters
         var pathParameters = parameters
             .Where(parameter => parameter.Item2.In == ParameterLocation.Path)
             .ToList();
 
-        foreach (var parameter in pathParameters)
-        {
-            var originalParameterName = parameter.Item2.Name;
-            var parameterName = parameter.Item1.Split(":")[0];
-            sourceTextBuilder.AppendLine($"        __url = __url.replace(\"{{{originalParameterName}}}\", quote(str({parameterName}), safe=\"\"))");
-        }
-
-        // query parameters
+        // query parameters (optional parameters are omitted if their value is None)
         var queryParameters = parameters
             .Where(parameter => parameter.Item2.In == ParameterLocation.Query)
             .ToList();
 
-        if (queryParameters.Any())
-        {
-            sourceTextBuilder.AppendLine();
-            sourceTextBuilder.AppendLine("        __query_values: dict[str, str] = {}");
-            sourceTextBuilder.AppendLine();
-
-            foreach (var parameter in queryParameters)
-            {
-                var originalParameterName = parameter.Item2.Name;
-                var parameterName = parameter.Item1.Split(":")[0];
-                var parameterValue = $"quote(_to_string({parameterName}), safe=\"\")";
+        var pathParameterNames = ToTuple(pathParameters
+            .Select(parameter => $"\"{parameter.Item2.Name}\""));
 
-                if (!parameter.Item2.Required || parameter.Item2.Schema.Nullable)
-                {
-                    sourceTextBuilder.AppendLine($"        if {parameterName} is not None:");
-                    sourceTextBuilder.AppendLine($"            __query_values[\"{originalParameterName}\"] = {parameterValue}");
-                }
+        var queryParameterNames = ToTuple(queryParameters
+            .Select(parameter => $"(\"{parameter.Item2.Name}\", {(!parameter.Item2.Required || parameter.Item2.Schema.Nullable ? "True" : "False")})"));
 
-                else
-                {
-                    sourceTextBuilder.AppendLine($"        __query_values[\"{originalParameterName}\"] = {parameterValue}");
-                }
+        var pathValues = ToTuple(pathParameters
+            .Select(parameter => parameter.Item1.Split(":")[0]));
 
-                sourceTextBuilder.AppendLine();
-            }
-
-            sourceTextBuilder.AppendLine("        __query: str = \"?\" + \"&\".join(f\"{key}={value}\" for (key, value) in __query_values.items())");
-            sourceTextBuilder.AppendLine("        __url += __query");
-        }
-
-        if (isVoidReturnType)
-            returnType = "type(None)";
+        var queryValues = ToTuple(queryParameters
+            .Select(parameter => parameter.Item1.Split(":")[0]));
 
         var acceptHeaderValue = responseType.HasValue
             ? $"\"{responseType.Value.Key}\""
@@ -540,18 +807,49 @@ $@"class {augmentedClassName}:
             ? "None"
             : operation.RequestBody?.Content.Keys.First() switch
             {
-                "application/json" => $"json.dumps(JsonEncoder.encode({bodyParameter.Split(":")[0]}, _json_encoder_options))",
+                // JSON content is serialized by the request handler
+                "application/json" => bodyParameter.Split(":")[0],
                 "application/octet-stream" => bodyParameter.Split(":")[0],
                 _ => throw new Exception($"The media type {operation.RequestBody!.Content.Keys.First()} is not supported.")
             };
 
-        // remove Optional to make type checker happy (https://github.com/microsoft/pyright/issues/684)
-        var invokeType = returnType.StartsWith("Optional[")
-            ? returnType.Substring(9, returnType.Length - 10)
-            : returnType;
+        // the operation name and the URL template identify the operation in the request metrics
+        var operationName = $"{Shared.ToSnakeCase(className)}.{signature.Substring(0, signature.IndexOf('('))}";
 
-        sourceTextBuilder.AppendLine();
-        sourceTextBuilder.AppendLine($"        return self.___invoke({invokeType}, \"{operationType.ToString().ToUpper()}\", __url, {acceptHeaderValue}, {contentTypeValue}, {content})");
+        // the table entry is shared by the sync and async clients
+        var operationReturnType = iter
+            ? itemType
+            : invokeType;
+
+        _operations[operationName] = (className, $"    \"{operationName}\": _Operation(\"{operationName}\", \"{operationType.ToString().ToUpper()}\", \"{path}\", {pathParameterNames}, {queryParameterNames}, {acceptHeaderValue}, {contentTypeValue}, {operationReturnType}),");
+
+        if (iter)
+        {
+            sourceTextBuilder.AppendLine($"        return self.___invoke_iter(_operations[\"{operationName}\"], {pathValues}, {queryValues}, {content})");
+        }
+
+        else
+        {
+            sourceTextBuilder.AppendLine($"        return self.___invoke(_operations[\"{operationName}\"], {pathValues}, {queryValues}, {content})");
+
+            // streaming variant for JSON arrays
+            if (itemType is not null && responseType?.Key == "application/json")
+            {
+                sourceTextBuilder.AppendLine();
+
+                AppendImplementationMethodSourceText(
+                    className,
+                    path,
+                    methodSuffix,
+                    operationType,
+                    operation,
+                    response,
+                    responseType,
+                    sourceTextBuilder,
+                    async,
+                    iter: true);
+            }
+        }
     }
 
     private void AppendModelSourceText(
@@ -580,13 +878,25 @@ $@"    {Shared.ToSnakeCase(current.Value).ToUpper()} = ""{Shared.ToSnakeCase(cur
 {enumValues}");
 
             sourceTextBuilder.AppendLine();
+
+            if (_settings.Python_StaticSerializers)
+            {
+                sourceTextBuilder.AppendLine($"_{modelName}_from_json = _EnumDecoder({modelName})");
+                sourceTextBuilder.AppendLine($"_{modelName}_to_json = _get_enum_encoder({modelName})");
+                sourceTextBuilder.AppendLine();
+            }
         }
 
         else
         {
+            // slotted dataclasses have no __dict__ (requires Python 3.10)
+            var dataclassArguments = _settings.Python_SlottedModels
+                ? "frozen=True, slots=True"
+                : "frozen=True";
+
             sourceTextBuilder
                 .AppendLine(
-$@"@dataclass(frozen=True)
+$@"@dataclass({dataclassArguments})
 class {modelName}:");
 
             sourceTextBuilder.AppendLine(
@@ -607,6 +917,8 @@ class {modelName}:");
 @"    """"""
 ");
 
+            var fields = new List<(string Key, string Name, string Type, OpenApiSchema Schema, string AnonymousTypeName)>();
+
             if (schema.Properties is not null)
             {
                 foreach (var property in schema.Properties)
@@ -624,9 +936,240 @@ class {modelName}:");
 $@"    {propertyName}: {type}
     """"""{property.Value.Description}""""""
 ");
+
+                    fields.Add((property.Key, propertyName, type, property.Value, anonymousTypeName));
                 }
             }
+
+            if (_settings.Python_StaticSerializers)
+                AppendStaticSerializersSourceText(modelName, fields, sourceTextBuilder);
+
+            if (_settings.Python_TypedDicts)
+                AppendTypedDictSourceText(modelName, schema, fields, sourceTextBuilder);
+        }
+    }
+
+    private void AppendTypedDictSourceText(
+        string modelName,
+        OpenApiSchema schema,
+        List<(string Key, string Name, string Type, OpenApiSchema Schema, string AnonymousTypeName)> fields,
+        StringBuilder sourceTextBuilder)
+    {
+        // the JSON may omit properties which are not required, i.e. their keys are optional (NotRequired requires
+        // Python 3.11, so the required keys are declared in a base class with total=True instead)
+        var requiredFields = fields
+            .Where(field => schema.Required.Contains(field.Key))
+            .ToList();
+
+        var optionalFields = fields
+            .Where(field => !schema.Required.Contains(field.Key))
+            .ToList();
+
+        var baseClassName = "TypedDict";
+
+        sourceTextBuilder.AppendLine();
+
+        if (requiredFields.Any() && optionalFields.Any())
+        {
+            baseClassName = $"_{modelName}DictRequired";
+
+            sourceTextBuilder.AppendLine(
+$@"class {baseClassName}(TypedDict):
+    """"""The required keys of {modelName}Dict.""""""
+");
+
+            foreach (var field in requiredFields)
+            {
+                sourceTextBuilder.AppendLine($"    {field.Name}: {GetTypedDictType(field.Schema, field.AnonymousTypeName)}");
+            }
+
+            sourceTextBuilder.AppendLine();
         }
+
+        var classArguments = optionalFields.Any()
+            ? $"{baseClassName}, total=False"
+            : baseClassName;
+
+        var declaredFields = requiredFields.Any() && optionalFields.Any()
+            ? optionalFields
+            : fields;
+
+        sourceTextBuilder.AppendLine(
+$@"class {modelName}Dict({classArguments}):
+    """"""{modelName} as returned by the client in raw mode with snake_case property names.""""""
+");
+
+        foreach (var field in declaredFields)
+        {
+            sourceTextBuilder.AppendLine($"    {field.Name}: {GetTypedDictType(field.Schema, field.AnonymousTypeName)}");
+        }
+
+        if (!declaredFields.Any())
+            sourceTextBuilder.AppendLine("    pass");
+
+        sourceTextBuilder.AppendLine();
+    }
+
+    // Returns the Python type of the parsed JSON value, i.e. without conversion to
+    // UUID, datetime, timedelta, enums or dataclasses.
+    private string GetTypedDictType(OpenApiSchema schema, string anonymousTypeName)
+    {
+        string type;
+
+        if (schema.Reference is not null)
+        {
+            type = schema.Enum.Any()
+                ? "str"
+                : $"{schema.Reference.Id}Dict";
+        }
+
+        else
+        {
+            type = (schema.Type, schema.Format, schema.AdditionalProperties) switch
+            {
+                (null, _, _) => schema.OneOf.Count == 1
+                    ? GetTypedDictType(schema.OneOf.First(), anonymousTypeName)
+                    : "object",
+                ("boolean", _, _) => "bool",
+                ("number", _, _) => "float",
+                ("integer", _, _) => "int",
+                ("string", _, _) => "str",
+                ("array", _, _) => $"list[{GetTypedDictType(schema.Items, anonymousTypeName)}]",
+                ("object", _, null) => $"{anonymousTypeName}Dict",
+                ("object", _, _) => $"dict[str, {GetTypedDictType(schema.AdditionalProperties, anonymousTypeName)}]",
+                (_, _, _) => throw new Exception($"The schema type {schema.Type} (or one of its formats) is not supported.")
+            };
+        }
+
+        return schema.Nullable
+            ? $"Optional[{type}]"
+            : type;
+    }
+
+    private void AppendStaticSerializersSourceText(
+        string modelName,
+        List<(string Key, string Name, string Type, OpenApiSchema Schema, string AnonymousTypeName)> fields,
+        StringBuilder sourceTextBuilder)
+    {
+        // deserializer
+        sourceTextBuilder.AppendLine(
+$@"    @staticmethod
+    def _from_json(data: dict[str, Any]) -> {modelName}:
+        return {modelName}(");
+
+        foreach (var field in fields)
+        {
+            var expression = GetFromJsonExpression(field.Schema, field.AnonymousTypeName, "value", depth: 0);
+
+            // same default values as JsonEncoder if JSON does not serialize default fields
+            var argument = expression is null
+
+                ? field.Type switch
+                {
+                    "int" => $"data.get(\"{field.Key}\", 0)",
+                    "float" => $"data.get(\"{field.Key}\", 0.0)",
+                    _ => $"data.get(\"{field.Key}\")"
+                }
+
+                : $"None if (value := data.get(\"{field.Key}\")) is None else {expression}";
+
+            sourceTextBuilder.AppendLine($"            {argument},");
+        }
+
+        sourceTextBuilder.AppendLine("        )");
+        sourceTextBuilder.AppendLine();
+
+        // serializer
+        sourceTextBuilder.AppendLine(
+$@"    def _to_json(self) -> dict[str, Any]:
+        return {{");
+
+        foreach (var field in fields)
+        {
+            var value = $"self.{field.Name}";
+            var expression = GetToJsonExpression(field.Schema, field.AnonymousTypeName, value, depth: 0);
+
+            var item = expression is null
+                ? value
+                : $"None if {value} is None else {expression}";
+
+            sourceTextBuilder.AppendLine($"            \"{field.Key}\": {item},");
+        }
+
+        sourceTextBuilder.AppendLine("        }");
+        sourceTextBuilder.AppendLine();
+    }
+
+    // Returns the Python expression which converts the (non-null) JSON value into the
+    // Python type of the schema or null if the JSON value can be used as is.
+    private string? GetFromJsonExpression(OpenApiSchema schema, string anonymousTypeName, string value, int depth)
+    {
+        if (schema.Reference is not null)
+        {
+            return schema.Enum.Any()
+                ? $"_{schema.Reference.Id}_from_json[{value}]"
+                : $"{schema.Reference.Id}._from_json({value})";
+        }
+
+        return (schema.Type, schema.Format, schema.AdditionalProperties) switch
+        {
+            (null, _, _) => schema.OneOf.Count == 1
+                ? GetFromJsonExpression(schema.OneOf.First(), anonymousTypeName, value, depth)
+                : default,
+            ("string", "guid", _) => $"UUID({value})",
+            ("string", "duration", _) => $"_decode_timedelta({value})",
+            ("string", "date-time", _) => $"_decode_datetime({value})",
+            ("array", _, _) => GetListExpression(
+                GetFromJsonExpression(schema.Items, anonymousTypeName, $"item{depth}", depth + 1), value, depth),
+            ("object", _, null) => $"{anonymousTypeName}._from_json({value})",
+            ("object", _, _) => GetDictExpression(
+                GetFromJsonExpression(schema.AdditionalProperties, anonymousTypeName, $"item{depth}", depth + 1), value, depth),
+            (_, _, _) => default
+        };
+    }
+
+    // Returns the Python expression which converts the (non-null) Python value into a JSON
+    // value or null if the Python value can be used as is.
+    private string? GetToJsonExpression(OpenApiSchema schema, string anonymousTypeName, string value, int depth)
+    {
+        if (schema.Reference is not null)
+        {
+            return schema.Enum.Any()
+                ? $"_{schema.Reference.Id}_to_json[{value}]"
+                : $"{value}._to_json()";
+        }
+
+        return (schema.Type, schema.Format, schema.AdditionalProperties) switch
+        {
+            (null, _, _) => schema.OneOf.Count == 1
+                ? GetToJsonExpression(schema.OneOf.First(), anonymousTypeName, value, depth)
+                : $"JsonEncoder.encode({value}, _json_encoder_options)",
+            ("string", "guid", _) => $"str({value})",
+            ("string", "duration", _) => $"_encode_timedelta({value})",
+            ("string", "date-time", _) => $"_encode_datetime({value})",
+            ("array", _, _) => GetListExpression(
+                GetToJsonExpression(schema.Items, anonymousTypeName, $"item{depth}", depth + 1), value, depth),
+            ("object", _, null) => $"{value}._to_json()",
+            ("object", _, _) => GetDictExpression(
+                GetToJsonExpression(schema.AdditionalProperties, anonymousTypeName, $"item{depth}", depth + 1), value, depth),
+            (_, _, _) => default
+        };
+    }
+
+    private static string? GetListExpression(string? itemExpression, string value, int depth)
+    {
+        if (itemExpression is null)
+            return default;
+
+        return $"[None if item{depth} is None else {itemExpression} for item{depth} in {value}]";
+    }
+
+    private static string? GetDictExpression(string? itemExpression, string value, int depth)
+    {
+        if (itemExpression is null)
+            return default;
+
+        return $"{{key{depth}: None if item{depth} is None else {itemExpression} for key{depth}, item{depth} in {value}.items()}}";
     }
 
     private string ApplyRequired(string type, bool isRequired)
@@ -801,6 +1344,25 @@ $@"    {propertyName}: {type}
         }
     }
 
+    private static string GetOperationsSourceText(IEnumerable<string> entries)
+    {
+        return
+$@"# the operation table of the generated methods
+_operations: dict[str, _Operation[Any]] = {{
+{string.Join(Environment.NewLine, entries)}
+}}
+";
+    }
+
+    private static string ToTuple(IEnumerable<string> items)
+    {
+        var itemList = items.ToList();
+
+        return itemList.Count == 1
+            ? $"({itemList[0]},)"
+            : $"({string.Join(", ", itemList)})";
+    }
+
     private static string? GetFirstLine(string? value)
     {
         if (value is null)
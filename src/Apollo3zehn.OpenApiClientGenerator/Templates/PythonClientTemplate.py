@@ -1,37 +1,571 @@
 ﻿from __future__ import annotations
 
-{{#Special_NexusFeatures}}
 import asyncio
+{{#Special_NexusFeatures}}
 import base64
 {{/Special_NexusFeatures}}
+import hashlib
+import importlib
 import json
-{{#Special_NexusFeatures}}
+import random
+import threading
 import time
+{{#Special_NexusFeatures}}
 from array import array
 {{/Special_NexusFeatures}}
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                as_completed, wait)
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 {{#Special_NexusFeatures}}
-from datetime import datetime, timedelta
-from tempfile import NamedTemporaryFile
-from typing import Callable
+from datetime import timedelta
+from io import BytesIO
+from tempfile import TemporaryFile
+from typing import IO, Callable
 {{/Special_NexusFeatures}}
-from typing import (Any, AsyncIterable, Callable, Iterable, Optional, Type,
-                    TypeVar, Union, cast)
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Generic, Iterable, Iterator, Optional, Type, TypeVar,
+                    Union, cast)
 {{#Special_NexusFeatures}}
-from zipfile import ZipFile
+from uuid import UUID
+from zipfile import ZipFile, ZipInfo
 {{/Special_NexusFeatures}}
 
-from httpx import AsyncClient, Client, Request, Response
+from httpx import (AsyncBaseTransport, AsyncClient, AsyncHTTPTransport,
+                   BaseTransport, ByteStream, Client, HTTPTransport, Limits,
+                   Request, Response, Timeout, TransportError)
+from httpx._utils import get_environment_proxies
 
-from ._encoder import JsonEncoder
+{{#Special_NexusFeatures}}
+from ._cache import DataCache
+{{/Special_NexusFeatures}}
+from ._encoder import JsonArrayReader, JsonEncoder, JsonEncoderOptions
+from ._http_cache import (DiskHttpCache, HttpCache, HttpCacheEntry,
+                          MemoryHttpCache)
+from ._instrumentation import (HistogramCollector, RequestMetrics,
+                               RequestObserver, _Measurement)
+from ._limiter import ConcurrencyLimiter
+from ._operation import _Operation
 from ._shared import {{{ExceptionType}}}, _json_encoder_options
 {{{VersioningImports}}}
 
 T = TypeVar("T")
 
+def _validate_raw_mode(raw_mode: Optional[str]) -> None:
+    if raw_mode is not None and raw_mode != "snake_case" and raw_mode != "untouched":
+        raise Exception(f"The raw mode {raw_mode} is not supported.")
+
+# the request headers which select the response, i.e. responses are not shared between users or configurations
+_CACHE_KEY_HEADER_NAMES = ("accept", "accept-language", "authorization", "cookie"{{#Special_NexusFeatures}}, "{{{Special_ConfigurationHeaderKey}}}"{{/Special_NexusFeatures}})
+
+def _get_cache_key(request: Request) -> str:
+    """Returns the cache key of a request, a digest of the method, the URL and the request headers which select the response. Credentials never appear in the key."""
+
+    key = hashlib.sha256(f"{request.method} {request.url}".encode("utf-8"))
+
+    for name in _CACHE_KEY_HEADER_NAMES:
+
+        value = request.headers.get(name)
+
+        if value is not None:
+            key.update(f"\n{name}: {value}".encode("utf-8"))
+
+    return key.hexdigest()
+
+def _get_retry_after(response: Response) -> Optional[float]:
+    """Returns the number of seconds of the Retry-After header, which contains either seconds or an HTTP date."""
+
+    value = response.headers.get("Retry-After")
+
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+
+    except (TypeError, ValueError):
+        return None
+
 {{{SyncMainClient}}}
 {{{AsyncMainClient}}}
 
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """
+    The result of an operation of a batch.
+
+    Args:
+        index: The index of the operation in the order of submission.
+        value: The return value of the operation or None if it has failed.
+        exception: The exception of the operation or None if it has succeeded.
+    """
+
+    index: int
+    """The index of the operation in the order of submission."""
+
+    value: Optional[T]
+    """The return value of the operation or None if it has failed."""
+
+    exception: Optional[BaseException]
+    """The exception of the operation or None if it has succeeded."""
+
+class Batch:
+    """Executes many operations concurrently on a thread pool and returns their results as they complete."""
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initializes a new instance of the Batch.
+
+            Args:
+                max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        self._max_concurrency = max_concurrency
+        self._operations: deque[Callable[[], Any]] = deque()
+        self._count = 0
+
+    def submit(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> int:
+        """Adds an operation, e.g. a method of a sub-client, and returns its index. The operation is executed within results().
+
+            Args:
+                operation: The operation.
+                args: The positional arguments of the operation.
+                kwargs: The keyword arguments of the operation.
+        """
+
+        # settings like lazy_decode() apply as they were at submission time
+        context = copy_context()
+
+        self._operations.append(lambda: context.run(operation, *args, **kwargs))
+        self._count += 1
+
+        return self._count - 1
+
+    def results(self) -> Iterator[BatchResult[Any]]:
+        """Executes the operations and yields their results in order of completion. Failed operations do not stop the batch."""
+
+        pending: dict[Future, int] = {}
+        index = self._count - len(self._operations)
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+
+            try:
+
+                while self._operations or pending:
+
+                    # only max_concurrency operations are in flight
+                    while self._operations and len(pending) < self._max_concurrency:
+                        pending[executor.submit(self._operations.popleft())] = index
+                        index += 1
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield _create_batch_result(pending.pop(future), future)
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
+class AsyncBatch:
+    """Executes many operations concurrently on the event loop and returns their results as they complete."""
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initializes a new instance of the AsyncBatch.
+
+            Args:
+                max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        self._max_concurrency = max_concurrency
+        self._operations: deque[Callable[[], asyncio.Future]] = deque()
+        self._count = 0
+
+    def submit(self, operation: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> int:
+        """Adds an operation, e.g. a method of a sub-client, and returns its index. The operation is executed within results().
+
+            Args:
+                operation: The operation.
+                args: The positional arguments of the operation.
+                kwargs: The keyword arguments of the operation.
+        """
+
+        # settings like lazy_decode() apply as they were at submission time
+        context = copy_context()
+
+        self._operations.append(lambda: context.run(asyncio.ensure_future, operation(*args, **kwargs)))
+        self._count += 1
+
+        return self._count - 1
+
+    async def results(self) -> AsyncIterator[BatchResult[Any]]:
+        """Executes the operations and yields their results in order of completion. Failed operations do not stop the batch."""
+
+        pending: dict[asyncio.Future, int] = {}
+        index = self._count - len(self._operations)
+
+        try:
+
+            while self._operations or pending:
+
+                # only max_concurrency operations are in flight
+                while self._operations and len(pending) < self._max_concurrency:
+                    pending[self._operations.popleft()()] = index
+                    index += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    yield _create_batch_result(pending.pop(future), future)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+def _create_batch_result(index: int, future: Any) -> BatchResult[Any]:
+
+    exception = future.exception()
+
+    return BatchResult(index, None, exception) \
+        if exception is not None \
+        else BatchResult(index, future.result(), None)
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retries and hedging of idempotent requests.
+
+    Args:
+        max_retries: The maximum number of retries per request.
+        initial_delay: The delay in seconds before the first retry. The delay doubles with every retry.
+        max_delay: The maximum delay in seconds between two retries.
+        retry_status_codes: The status codes which cause a retry. A Retry-After header takes precedence over the computed delay.
+        methods: The HTTP methods which are retried and hedged. Requests with streamed content are sent only once.
+        budget_ratio: The number of retries and hedged requests per request, averaged over time.
+        budget_burst: The number of retries and hedged requests which are available at once.
+        hedge_percentile: The latency percentile (e.g. 0.95) after which a duplicate request is sent and the first response wins. None disables hedging. Sync clients send the first request on the calling thread and use the duplicate if it has completed earlier or the first request has failed.
+        hedge_min_samples: The number of measured latencies before hedged requests are sent.
+    """
+
+    max_retries: int = 3
+    """The maximum number of retries per request."""
+
+    initial_delay: float = 0.1
+    """The delay in seconds before the first retry. The delay doubles with every retry."""
+
+    max_delay: float = 10.0
+    """The maximum delay in seconds between two retries."""
+
+    retry_status_codes: frozenset[int] = frozenset({ 429, 500, 502, 503, 504 })
+    """The status codes which cause a retry. A Retry-After header takes precedence over the computed delay."""
+
+    methods: frozenset[str] = frozenset({ "GET", "PUT", "DELETE" })
+    """The HTTP methods which are retried and hedged. Requests with streamed content are sent only once."""
+
+    budget_ratio: float = 0.1
+    """The number of retries and hedged requests per request, averaged over time."""
+
+    budget_burst: float = 10
+    """The number of retries and hedged requests which are available at once."""
+
+    hedge_percentile: Optional[float] = None
+    """The latency percentile (e.g. 0.95) after which a duplicate request is sent and the first response wins. None disables hedging. Sync clients send the first request on the calling thread and use the duplicate if it has completed earlier or the first request has failed."""
+
+    hedge_min_samples: int = 20
+    """The number of measured latencies before hedged requests are sent."""
+
+class _Backoff:
+    """Returns exponentially increasing delays with jitter, limited to a maximum delay."""
+
+    def __init__(self, initial_delay: float, max_delay: float):
+        self._delay = initial_delay
+        self._max_delay = max_delay
+
+    def next(self, retry_after: Optional[float] = None) -> float:
+
+        # the jitter spreads the requests of clients which have started at the same time
+        delay = random.uniform(self._delay / 2, self._delay)
+        self._delay = min(self._delay * 2, self._max_delay)
+
+        return delay if retry_after is None else retry_after
+
+class _RetryBudget:
+    """A token bucket which limits retries and hedged requests to a fraction of all requests to avoid retry storms."""
+
+    def __init__(self, ratio: float, burst: float):
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._burst)
+
+    def withdraw(self) -> bool:
+
+        with self._lock:
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+
+            return True
+
+class _LatencyTracker:
+    """Keeps the most recent latencies to estimate latency percentiles."""
+
+    def __init__(self, capacity: int = 256):
+        self._latencies: deque[float] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def get_percentile(self, percentile: float, min_samples: int) -> Optional[float]:
+
+        with self._lock:
+
+            if len(self._latencies) < max(1, min_samples):
+                return None
+
+            latencies = sorted(self._latencies)
+
+        return latencies[min(len(latencies) - 1, int(percentile * len(latencies)))]
+
+# bodies of iterators or files can only be sent once
+def _is_replayable(request: Request) -> bool:
+    return isinstance(request.stream, ByteStream)
+
+def _copy_request(request: Request) -> Request:
+    return Request(request.method, request.url, headers=request.headers, content=request.content, extensions=request.extensions)
+
+def _get_response(future: Future[Optional[Response]]) -> Optional[Response]:
+    return future.result() \
+        if future.done() and not future.cancelled() and future.exception() is None \
+        else None
+
+def _close_response(future: Future[Optional[Response]]) -> None:
+
+    response = _get_response(future)
+
+    if response is not None:
+        response.close()
+
+@dataclass(frozen=True)
+class TransportOptions:
+    """
+    Options of the HTTP transport and the connection pool.
+
+    Args:
+        http2: Enable HTTP/2. Requires the h2 package (pip install httpx[http2]).
+        max_connections: The maximum number of connections.
+        max_keepalive_connections: The maximum number of idle connections which are kept alive.
+        keepalive_expiry: The time in seconds after which idle connections are closed.
+        connect_timeout: The timeout in seconds for establishing a connection.
+        read_timeout: The timeout in seconds for receiving a chunk of data.
+        write_timeout: The timeout in seconds for sending a chunk of data.
+        pool_timeout: The timeout in seconds for acquiring a connection from the pool.
+    """
+
+    http2: bool = False
+    """Enable HTTP/2. Requires the h2 package (pip install httpx[http2])."""
+
+    max_connections: Optional[int] = 100
+    """The maximum number of connections."""
+
+    max_keepalive_connections: Optional[int] = 20
+    """The maximum number of idle connections which are kept alive."""
+
+    keepalive_expiry: Optional[float] = 5.0
+    """The time in seconds after which idle connections are closed."""
+
+    connect_timeout: Optional[float] = 60.0
+    """The timeout in seconds for establishing a connection."""
+
+    read_timeout: Optional[float] = 60.0
+    """The timeout in seconds for receiving a chunk of data."""
+
+    write_timeout: Optional[float] = 60.0
+    """The timeout in seconds for sending a chunk of data."""
+
+    pool_timeout: Optional[float] = 60.0
+    """The timeout in seconds for acquiring a connection from the pool."""
+
+    def _get_timeout(self) -> Timeout:
+        return Timeout(connect=self.connect_timeout, read=self.read_timeout, write=self.write_timeout, pool=self.pool_timeout)
+
+    def _get_limits(self) -> Limits:
+        return Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_keepalive_connections, keepalive_expiry=self.keepalive_expiry)
+
+    def _create_transport(self, proxy: Optional[str] = None) -> HTTPTransport:
+        self._validate()
+        return HTTPTransport(http2=self.http2, limits=self._get_limits(), proxy=proxy)
+
+    def _create_async_transport(self, proxy: Optional[str] = None) -> AsyncHTTPTransport:
+        self._validate()
+        return AsyncHTTPTransport(http2=self.http2, limits=self._get_limits(), proxy=proxy)
+
+    # httpx ignores the proxies of the environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY, NO_PROXY) if a transport is
+    # passed, so they are mounted explicitly
+    def _create_mounts(self) -> dict[str, Optional[BaseTransport]]:
+        return {
+            pattern: None if proxy is None else self._create_transport(proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def _create_async_mounts(self) -> dict[str, Optional[AsyncBaseTransport]]:
+        return {
+            pattern: None if proxy is None else self._create_async_transport(proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def _validate(self) -> None:
+
+        # h2 is an optional dependency
+        if self.http2:
+
+            try:
+                importlib.import_module("h2")
+
+            except ImportError:
+                raise Exception("HTTP/2 requires the h2 package (pip install httpx[http2]).")
+
+class SharedConnectionPool:
+    """A connection pool which is shared between multiple clients, e.g. for different APIs on the same server. Closing a client does not close the pool."""
+
+    def __init__(self, options: Optional[TransportOptions] = None):
+        """
+        Initializes a new instance of the SharedConnectionPool.
+
+            Args:
+                options: The transport options. The timeouts are configured per client.
+        """
+
+        self._options = options or TransportOptions()
+        self._transport: Optional[HTTPTransport] = None
+        self._async_transport: Optional[AsyncHTTPTransport] = None
+
+        # proxy URL -> transport
+        self._proxy_transports: dict[str, HTTPTransport] = {}
+        self._async_proxy_transports: dict[str, AsyncHTTPTransport] = {}
+
+    def close(self) -> None:
+        """Closes the connections of the sync clients."""
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        for transport in self._proxy_transports.values():
+            transport.close()
+
+        self._proxy_transports.clear()
+
+    async def aclose(self) -> None:
+        """Closes the connections of the async clients."""
+
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+            self._async_transport = None
+
+        for transport in self._async_proxy_transports.values():
+            await transport.aclose()
+
+        self._async_proxy_transports.clear()
+
+    def _get_transport(self) -> BaseTransport:
+
+        if self._transport is None:
+            self._transport = self._options._create_transport()
+
+        return _SharedTransport(self._transport)
+
+    def _get_async_transport(self) -> AsyncBaseTransport:
+
+        if self._async_transport is None:
+            self._async_transport = self._options._create_async_transport()
+
+        return _SharedAsyncTransport(self._async_transport)
+
+    # see TransportOptions._create_mounts
+    def _get_mounts(self) -> dict[str, Optional[BaseTransport]]:
+
+        mounts: dict[str, Optional[BaseTransport]] = {}
+
+        for pattern, proxy in get_environment_proxies().items():
+
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+
+            if proxy not in self._proxy_transports:
+                self._proxy_transports[proxy] = self._options._create_transport(proxy)
+
+            mounts[pattern] = _SharedTransport(self._proxy_transports[proxy])
+
+        return mounts
+
+    def _get_async_mounts(self) -> dict[str, Optional[AsyncBaseTransport]]:
+
+        mounts: dict[str, Optional[AsyncBaseTransport]] = {}
+
+        for pattern, proxy in get_environment_proxies().items():
+
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+
+            if proxy not in self._async_proxy_transports:
+                self._async_proxy_transports[proxy] = self._options._create_async_transport(proxy)
+
+            mounts[pattern] = _SharedAsyncTransport(self._async_proxy_transports[proxy])
+
+        return mounts
+
+class _SharedTransport(BaseTransport):
+
+    def __init__(self, transport: BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self._transport.handle_request(request)
+
+    # the connections are closed by the pool
+    def close(self) -> None:
+        pass
+
+class _SharedAsyncTransport(AsyncBaseTransport):
+
+    def __init__(self, transport: AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
+
+    # the connections are closed by the pool
+    async def aclose(self) -> None:
+        pass
+
 {{#Special_NexusFeatures}}
 @dataclass(frozen=True)
 class DataResponse:
@@ -62,6 +596,188 @@ class DataResponse:
     sample_period: timedelta
     """The sample period."""
 
-    values: array[float]
-    """The data."""
+    values: Union[array[float], memoryview, Any]
+    """The data. The type depends on the values_type argument of load(): array.array (default), memoryview or numpy.ndarray."""
+
+def _create_data_response(catalog_item: CatalogItem, values: Any) -> DataResponse:
+
+    resource = catalog_item.resource
+
+    unit = cast(str, resource.properties["unit"]) \
+        if resource.properties is not None and "unit" in resource.properties and type(resource.properties["unit"]) == str \
+        else None
+
+    description = cast(str, resource.properties["description"]) \
+        if resource.properties is not None and "description" in resource.properties and type(resource.properties["description"]) == str \
+        else None
+
+    sample_period = catalog_item.representation.sample_period
+
+    return DataResponse(
+        catalog_item=catalog_item,
+        name=resource.id,
+        unit=unit,
+        description=description,
+        sample_period=sample_period,
+        values=values
+    )
+
+_values_types = ("array", "memoryview", "numpy")
+
+def _allocate_values(sample_count: int, values_type: str) -> tuple[Any, memoryview]:
+    """Returns the values and a writable byte view of them."""
+
+    if values_type == "memoryview":
+        buffer = bytearray(sample_count * 8)
+        return (memoryview(buffer).cast("d"), memoryview(buffer))
+
+    elif values_type == "numpy":
+
+        # numpy is an optional dependency
+        try:
+            numpy = importlib.import_module("numpy")
+
+        except ImportError:
+            raise Exception("The values type numpy requires the numpy package.")
+
+        # all bytes are overwritten by the data
+        values = numpy.empty(sample_count, dtype=numpy.float64)
+        return (values, memoryview(values).cast("B"))
+
+    else:
+        values = array("d", [0.0]) * sample_count
+        return (values, memoryview(values).cast("B"))
+
+def _split_time_range(begin: datetime, end: datetime, sample_period: timedelta, max_chunk_size: int) -> tuple[int, list[tuple[datetime, datetime, int, int]]]:
+    """Returns the number of samples and the chunks (begin, end, byte offset, byte length) of the time range."""
+
+    if (end - begin) % sample_period != timedelta(0):
+        raise Exception("The time range must be a multiple of the sample period.")
+
+    sample_count = (end - begin) // sample_period
+    chunk_sample_count = max(1, max_chunk_size // 8)
+    chunks: list[tuple[datetime, datetime, int, int]] = []
+
+    for chunk_offset in range(0, sample_count, chunk_sample_count):
+        chunk_length = min(chunk_sample_count, sample_count - chunk_offset)
+
+        chunks.append((
+            begin + chunk_offset * sample_period,
+            begin + (chunk_offset + chunk_length) * sample_period,
+            chunk_offset * 8,
+            chunk_length * 8))
+
+    # an empty time range is still requested
+    if not chunks:
+        chunks.append((begin, end, 0, 0))
+
+    return (sample_count, chunks)
+
+def _split_export_time_range(begin: datetime, end: datetime, file_period: timedelta, max_jobs: int) -> list[tuple[datetime, datetime]]:
+    """Splits the time range at file boundaries into up to max_jobs time ranges. Like in Nexus, the file boundaries are multiples of the file period since 0001-01-01 (UTC)."""
+
+    if max_jobs == 1 or file_period <= timedelta(0) or end <= begin:
+        return [(begin, end)]
+
+    epoch = datetime(1, 1, 1) \
+        if begin.tzinfo is None \
+        else datetime(1, 1, 1, tzinfo=timezone.utc)
+
+    # the files which overlap the time range
+    first_file = (begin - epoch) // file_period
+    last_file = -((epoch - end) // file_period)
+
+    files_per_job = -(-(last_file - first_file) // max_jobs)
+    time_ranges: list[tuple[datetime, datetime]] = []
+    job_begin = begin
+    job_last_file = first_file
+
+    while job_begin < end:
+        job_last_file += files_per_job
+        job_end = min(epoch + job_last_file * file_period, end)
+        time_ranges.append((job_begin, job_end))
+        job_begin = job_end
+
+    return time_ranges
+
+class _ExportProgress:
+    """Aggregates the progress of multiple export jobs per progress message."""
+
+    def __init__(self, job_count: int, on_progress: Optional[Callable[[float, str], None]]):
+        self._job_count = job_count
+        self._on_progress = on_progress
+        self._progress: dict[str, list[float]] = {}
+
+        # downloads and extractions report their progress from different threads
+        self._lock = threading.Lock()
+
+    def report(self, index: int, progress: float, message: str) -> None:
+
+        if self._on_progress is None:
+            return
+
+        with self._lock:
+
+            job_progress = self._progress.setdefault(message, [0.0] * self._job_count)
+            job_progress[index] = progress
+            total_progress = sum(job_progress) / self._job_count
+
+            if total_progress < 1:
+                self._on_progress(total_progress, message)
+
+    def complete(self, message: str) -> None:
+
+        if self._on_progress is None:
+            return
+
+        with self._lock:
+            self._on_progress(1, message)
+
+# artifacts up to this size are downloaded into memory instead of into a temporary file
+_MAX_IN_MEMORY_ARTIFACT_SIZE = 64 * 1024 * 1024
+
+def _create_artifact_stream(length: Optional[int]) -> IO[bytes]:
+    """Returns an in-memory stream for small artifacts and a temporary file for large artifacts or artifacts of unknown size."""
+
+    if length is not None and length <= _MAX_IN_MEMORY_ARTIFACT_SIZE:
+        return BytesIO()
+
+    return TemporaryFile()
+
+def _is_partial_content(response: Response, offset: int) -> bool:
+    """Checks if the response contains the requested range starting at the offset."""
+
+    return response.status_code == 206 and \
+        response.headers.get("Content-Range", "").startswith(f"bytes {offset}-")
+
+def _extract_zip_file(file: IO[bytes], target_folder: str, max_concurrency: int, on_progress: Optional[Callable[[float], None]]) -> None:
+    """Extracts the zip file into the target folder. The members are decompressed concurrently."""
+
+    with ZipFile(file, "r") as zip_file:
+
+        members = zip_file.infolist()
+        total_size = sum(member.file_size for member in members)
+        extracted_size = 0
+
+        # the zip file synchronizes the reads from the underlying file
+        def extract(member: ZipInfo) -> int:
+
+            try:
+                zip_file.extract(member, target_folder)
+
+            # another thread has created the parent folder in the meantime
+            except FileExistsError:
+                zip_file.extract(member, target_folder)
+
+            return member.file_size
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+
+            # progress is reported on the calling thread
+            for size in executor.map(extract, members):
+
+                extracted_size += size
+
+                if on_progress is not None and total_size > 0 and extracted_size < total_size:
+                    on_progress(extracted_size / total_size)
 {{/Special_NexusFeatures}}
\ No newline at end of file
@@ -0,0 +1,33 @@
+﻿from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Optional
+
+from .._shared import (HttpRequestHandler, HttpRequestHandlerAsync,
+                       HttpRequestIterHandler, HttpRequestIterHandlerAsync)
+
+if TYPE_CHECKING:
+{{{TypeCheckingImports}}}
+
+# the sub-clients and models are imported on first access (PEP 562)
+_lazy_attributes: dict[str, str] = {
+{{{LazyAttributes}}}
+}
+
+def __getattr__(name: str) -> Any:
+
+    module_name = _lazy_attributes.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
+
+{{{SyncClient}}}
+{{{AsyncClient}}}
@@ -25,31 +25,135 @@ class {{{ClientName}}}{{{Async}}}Client:
     ___token: Optional[str]
 {{/Special_AccessTokenSupport}}
     ___http_client: {{{Async}}}Client
+    ___json_encoder_options: JsonEncoderOptions
+    ___lazy_json_encoder_options: JsonEncoderOptions
+    ___raw_json_encoder_options: JsonEncoderOptions
+    ___lazy_decode: ContextVar[bool]
+    ___raw_mode: ContextVar[Optional[str]]
+    ___stream_responses: ContextVar[bool]
+    ___request_headers: ContextVar[Optional[dict[str, str]]]
+    ___observed_responses: ContextVar[Optional[list[Response]]]
+    ___bypass_http_cache: ContextVar[bool]
+    ___http_cache: Optional[HttpCache]
+    ___coalesce_requests: bool
+    ___retry_policy: Optional[RetryPolicy]
+    ___concurrency_limiter: Optional[ConcurrencyLimiter]
+    ___request_observers: list[RequestObserver]
+    ___retry_budget: _RetryBudget
+    ___latency_tracker: _LatencyTracker
+{{#IsAsync}}
+    ___in_flight_requests: dict[Any, asyncio.Future]
+{{/IsAsync}}
+{{^IsAsync}}
+    ___in_flight_requests: dict[Any, Future]
+    ___in_flight_requests_lock: threading.Lock
+    ___hedging_executor: Optional[ThreadPoolExecutor]
+{{/IsAsync}}
 
 {{{VersioningFields}}}
 
     @classmethod
-    def create(cls, base_url: str) -> {{{ClientName}}}{{{Async}}}Client:
+    def create(
+        cls,
+        base_url: str,
+        json_backend: str = "stdlib",
+        lazy_decode: bool = False,
+        raw_mode: Optional[str] = None,
+        http_cache: Optional[HttpCache] = None,
+        coalesce_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        request_observers: Optional[list[RequestObserver]] = None,
+        transport_options: Optional[TransportOptions] = None,
+        connection_pool: Optional[SharedConnectionPool] = None) -> {{{ClientName}}}{{{Async}}}Client:
         """
         Initializes a new instance of the {{{ClientName}}}{{{Async}}}Client
         
             Args:
                 base_url: The base URL to use.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
+                transport_options: The HTTP/2, connection pool and timeout options.
+                connection_pool: An optional connection pool which is shared with other clients. The transport options of the pool apply, except for the timeouts.
         """
-        return {{{ClientName}}}{{{Async}}}Client({{{Async}}}Client(base_url=base_url, timeout=60.0))
 
-    def __init__(self, http_client: {{{Async}}}Client):
+        # the default transport of httpx uses the proxies of the environment
+        if transport_options is None and connection_pool is None:
+            http_client = {{{Async}}}Client(base_url=base_url, timeout=60.0)
+
+        else:
+
+            transport_options = transport_options or TransportOptions()
+
+            if connection_pool is None:
+                transport = transport_options._create{{#IsAsync}}_async{{/IsAsync}}_transport()
+                mounts = transport_options._create{{#IsAsync}}_async{{/IsAsync}}_mounts()
+
+            else:
+                transport = connection_pool._get{{#IsAsync}}_async{{/IsAsync}}_transport()
+                mounts = connection_pool._get{{#IsAsync}}_async{{/IsAsync}}_mounts()
+
+            http_client = {{{Async}}}Client(base_url=base_url, timeout=transport_options._get_timeout(), transport=transport, mounts=mounts)
+
+        return {{{ClientName}}}{{{Async}}}Client(http_client, json_backend, lazy_decode, raw_mode, http_cache, coalesce_requests, retry_policy, concurrency_limiter, request_observers)
+
+    def __init__(self, http_client: {{{Async}}}Client, json_backend: str = "stdlib", lazy_decode: bool = False, raw_mode: Optional[str] = None, http_cache: Optional[HttpCache] = None, coalesce_requests: bool = False, retry_policy: Optional[RetryPolicy] = None, concurrency_limiter: Optional[ConcurrencyLimiter] = None, request_observers: Optional[list[RequestObserver]] = None):
         """
         Initializes a new instance of the {{{ClientName}}}{{{Async}}}Client
         
             Args:
-                http_client: The HTTP client to use.
+                http_client: The HTTP client to use. Use the create() method to configure the transport and the connection pool.
+                json_backend: The JSON backend ("stdlib", "orjson", "msgspec" or "auto"). Falls back to "stdlib" if the package is not installed.
+                lazy_decode: Return models which decode their fields on first access.
+                raw_mode: Return the parsed JSON instead of models, either with the property names converted to snake_case ("snake_case") or "untouched".
+                http_cache: An optional cache (MemoryHttpCache or DiskHttpCache) for the responses of GET requests. Cached decoded objects are shared between calls and must not be modified.
+                coalesce_requests: Let identical concurrent GET requests share a single request and its decoded result, which must not be modified.
+                retry_policy: An optional policy for retries and hedged requests of idempotent operations.
+                concurrency_limiter: An optional limiter for the number and the rate of concurrent requests which may be shared with other clients.
+                request_observers: Functions (e.g. a HistogramCollector) which receive the metrics of each operation call. Requests are only measured if there are observers.
         """
 
         if http_client.base_url is None:
             raise Exception("The base url of the HTTP client must be set.")
 
+        _validate_raw_mode(raw_mode)
+
         self.___http_client = http_client
+
+        self.___json_encoder_options = _json_encoder_options \
+            if json_backend == _json_encoder_options.json_backend \
+            else replace(_json_encoder_options, json_backend=json_backend)
+
+        self.___lazy_json_encoder_options = replace(self.___json_encoder_options, lazy_decode=True)
+        self.___raw_json_encoder_options = replace(self.___json_encoder_options, raw_decode=True)
+        self.___lazy_decode = ContextVar("lazy_decode", default=lazy_decode)
+        self.___raw_mode = ContextVar("raw_mode", default=raw_mode)
+        self.___stream_responses = ContextVar("stream_responses", default=False)
+        self.___request_headers = ContextVar("request_headers", default=None)
+        self.___observed_responses = ContextVar("observed_responses", default=None)
+        self.___bypass_http_cache = ContextVar("bypass_http_cache", default=False)
+        self.___http_cache = http_cache
+        self.___coalesce_requests = coalesce_requests
+        self.___in_flight_requests = {}
+{{^IsAsync}}
+        self.___in_flight_requests_lock = threading.Lock()
+        self.___hedging_executor = None
+{{/IsAsync}}
+        self.___retry_policy = retry_policy
+
+        self.___retry_budget = _RetryBudget(1, 1) \
+            if retry_policy is None \
+            else _RetryBudget(retry_policy.budget_ratio, retry_policy.budget_burst)
+
+        self.___latency_tracker = _LatencyTracker()
+        self.___concurrency_limiter = concurrency_limiter
+        self.___request_observers = list(request_observers or [])
 {{#Special_AccessTokenSupport}}
         self.___token = None
 {{/Special_AccessTokenSupport}}
@@ -82,6 +186,47 @@ class {{{ClientName}}}{{{Async}}}Client:
         self.___token = access_token
 {{/Special_AccessTokenSupport}}
 
+    def batch(self, max_concurrency: int = 16) -> {{{Async}}}Batch:
+        """Creates a batch which executes many operations concurrently, e.g. batch.submit(client.v1.items.get_item, id), and returns their results as they complete.
+
+        Args:
+            max_concurrency: The maximum number of operations which are executed concurrently.
+        """
+        return {{{Async}}}Batch(max_concurrency)
+
+    @contextmanager
+    def lazy_decode(self, enabled: bool = True) -> Iterator[None]:
+        """Enables or disables lazy decoding for requests within the with block. Lazily decoded models keep the JSON data and decode each field on first access.
+
+        Args:
+            enabled: Enable or disable lazy decoding.
+        """
+
+        token = self.___lazy_decode.set(enabled)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(token)
+
+    @contextmanager
+    def raw(self, mode: Optional[str] = "snake_case") -> Iterator[None]:
+        """Returns the parsed JSON instead of models for requests within the with block. This skips the construction of the models. Use typing.cast with the generated TypedDicts for static typing.
+
+        Args:
+            mode: "snake_case" to convert the property names (like the model fields), "untouched" to return the JSON as is or None to disable the raw mode.
+        """
+
+        _validate_raw_mode(mode)
+        token = self.___raw_mode.set(mode)
+
+        try:
+            yield
+
+        finally:
+            self.___raw_mode.reset(token)
+
 {{#Special_NexusFeatures}}
     def attach_configuration(self, configuration: Any) -> Any:
         """Attaches configuration data to subsequent API requests.
@@ -106,25 +251,151 @@ class {{{ClientName}}}{{{Async}}}Client:
             del self.___http_client.headers[self.___configuration_header_key]
 {{/Special_NexusFeatures}}
 
-    {{{Def}}} _invoke(self, typeOfT: Optional[Type[T]], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> T:
+    {{{Def}}} _invoke(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> T:
+
+        typeOfT = operation.return_type
+        method = operation.method
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request{{#IsAsync}}, is_async=True{{/IsAsync}})
+
+            # identical concurrent GET requests share one response
+            if self.___coalesce_requests and method == "GET" and typeOfT is not Response and typeOfT is not type(None):
+                return_value = {{{Await}}}self._invoke_coalesced(cast(Type[T], typeOfT), request, operation.url_template, measurement)
+
+            else:
+                return_value = {{{Await}}}self._process_request(typeOfT, request, operation.url_template, measurement)
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
 
-        # prepare request
-        request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value)
+        return return_value
+
+    {{{Def}}} _invoke_coalesced(self, typeOfT: Type[T], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        key = (_get_cache_key(request), self._get_decoding_mode(typeOfT))
+{{#IsAsync}}
+        task = self.___in_flight_requests.get(key)
+
+        if task is None:
+
+            # the request is not cancelled when a single caller is cancelled
+            task = asyncio.ensure_future(self._process_request(typeOfT, request, url_template, measurement))
+            task.add_done_callback(lambda _: self.___in_flight_requests.pop(key, None))
+            self.___in_flight_requests[key] = task
+
+        return await asyncio.shield(task)
+{{/IsAsync}}
+{{^IsAsync}}
+        with self.___in_flight_requests_lock:
+
+            future = self.___in_flight_requests.get(key)
+            is_leader = future is None
+
+            if future is None:
+                future = Future()
+                self.___in_flight_requests[key] = future
+
+        # wait for the thread which sends the request
+        if not is_leader:
+            return future.result()
+
+        try:
+            return_value = self._process_request(typeOfT, request, url_template, measurement)
+
+        except BaseException as exception:
+
+            with self.___in_flight_requests_lock:
+                del self.___in_flight_requests[key]
+
+            future.set_exception(exception)
+            raise
+
+        with self.___in_flight_requests_lock:
+            del self.___in_flight_requests[key]
+
+        future.set_result(return_value)
+
+        return return_value
+{{/IsAsync}}
+
+    {{{Def}}} _process_request(self, typeOfT: Optional[Type[T]], request: Request, url_template: str, measurement: Optional[_Measurement]) -> T:
+
+        method = request.method
+
+        # use the cached response if available
+        http_cache = self.___http_cache
+        cache_key: Optional[str] = None
+        cache_entry: Optional[HttpCacheEntry] = None
+
+        if http_cache is not None and method == "GET" and typeOfT is not Response and typeOfT is not type(None) and not self.___bypass_http_cache.get():
+
+            cache_key = _get_cache_key(request)
+            cache_entry = http_cache._lookup(cache_key)
+
+            if cache_entry is not None:
+
+                if cache_entry.is_fresh():
+                    return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
+
+                if cache_entry.etag is not None:
+                    request.headers["If-None-Match"] = cache_entry.etag
+
+                if cache_entry.last_modified is not None:
+                    request.headers["If-Modified-Since"] = cache_entry.last_modified
 
         # send request
-        response = {{{Await}}}self.___http_client.send(request)
+        stream = typeOfT is Response and self.___stream_responses.get()
+
+        if measurement is not None:
+            measurement.sending()
+
+        response = {{{Await}}}self._send(request, url_template, stream)
+
+        if measurement is not None:
+
+            measurement.received(response)
+
+            if not stream:
+                measurement.add_response_size(len(response.content))
+
+        observed_responses = self.___observed_responses.get()
+
+        if observed_responses is not None:
+            observed_responses.append(response)
+
+        # the cached response is still valid
+        if http_cache is not None and cache_key is not None and cache_entry is not None and response.status_code == 304:
+            {{{Await}}}response.{{{Aclose}}}()
+            http_cache._revalidate(cache_key, cache_entry, response.headers)
+
+            return self._decode_cache_entry(cast(Type[T], typeOfT), cache_entry, measurement)
 
         # process response
         if not response.is_success:
-            
-            message = response.text
-            status_code = f"{{{ExceptionCodePrefix}}}00.{response.status_code}"
 
-            if not message:
-                raise {{{ExceptionType}}}(status_code, f"The HTTP request failed with status code {response.status_code}.")
+            if stream:
+                {{{Await}}}response.{{{Read}}}()
 
-            else:
-                raise {{{ExceptionType}}}(status_code, f"The HTTP request failed with status code {response.status_code}. The response message is: {message}")
+            raise self._create_exception(response)
 
         try:
 
@@ -136,19 +407,438 @@ class {{{ClientName}}}{{{Async}}}Client:
 
             else:
 
-                jsonObject = json.loads(response.text)
-                return_value = JsonEncoder.decode(cast(Type[T], typeOfT), jsonObject, _json_encoder_options)
+                return_value = self._decode(cast(Type[T], typeOfT), response.content, measurement)
+
+                if http_cache is not None and cache_key is not None:
 
-                if return_value is None:
-                    raise {{{ExceptionType}}}("{{{ExceptionCodePrefix}}}01", "Response data could not be deserialized.")
+                    cache_entry = http_cache._store(cache_key, response.headers, response.content)
+
+                    if cache_entry is not None:
+                        cache_entry.decoded[self._get_decoding_mode(typeOfT)] = return_value
 
                 return return_value
 
         finally:
             if typeOfT is not Response:
                 {{{Await}}}response.{{{Aclose}}}()
+
+    def _decode(self, typeOfT: Type[T], content: bytes, measurement: Optional[_Measurement]) -> T:
+
+        if measurement is not None:
+            measurement.mark()
+
+        jsonObject = JsonEncoder.parse(content, self.___json_encoder_options)
+
+        if measurement is not None:
+            measurement.parsed()
+
+        options = self._get_decoder_options()
+
+        # raw mode with untouched property names
+        if options is None:
+            return_value = jsonObject
+
+        # use the generated deserializer if available
+        elif options is self.___json_encoder_options and hasattr(typeOfT, "_from_json"):
+            return_value = getattr(typeOfT, "_from_json")(jsonObject)
+
+        else:
+            return_value = JsonEncoder.decode(typeOfT, jsonObject, options)
+
+        if measurement is not None:
+            measurement.decoded()
+
+        if return_value is None:
+            raise {{{ExceptionType}}}("{{{ExceptionCodePrefix}}}01", "Response data could not be deserialized.")
+
+        return return_value
+
+    # the decoded objects are reused as long as the response is cached
+    def _decode_cache_entry(self, typeOfT: Type[T], cache_entry: HttpCacheEntry, measurement: Optional[_Measurement]) -> T:
+
+        decoding_mode = self._get_decoding_mode(typeOfT)
+        return_value = cache_entry.decoded.get(decoding_mode)
+
+        if return_value is None:
+            return_value = self._decode(typeOfT, cache_entry.content, measurement)
+            cache_entry.decoded[decoding_mode] = return_value
+
+        return return_value
+
+    def _get_decoding_mode(self, typeOfT: Any) -> tuple[Any, Optional[str], bool]:
+        return (typeOfT, self.___raw_mode.get(), self.___lazy_decode.get())
     
+    {{{Def}}} _invoke_iter(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> {{{Async}}}Iterator[T]:
+
+        typeOfT = operation.return_type
+
+        # requests are only measured if there are observers
+        measurement = _Measurement(operation.name, operation.method, operation.url_template) \
+            if self.___request_observers \
+            else None
+
+        try:
+
+            # prepare request
+            relative_url = operation.build_url(path_values, query_values)
+            request = self._build_request_message(operation.method, relative_url, content, operation.content_type_value, operation.accept_header_value)
+
+            if measurement is not None:
+                measurement.built(request{{#IsAsync}}, is_async=True{{/IsAsync}})
+                measurement.sending()
+
+            # send request
+            response = {{{Await}}}self._send(request, operation.url_template, True)
+
+            if measurement is not None:
+                measurement.received(response)
+
+            try:
+
+                # process response
+                if not response.is_success:
+                    {{{Await}}}response.{{{Read}}}()
+                    raise self._create_exception(response)
+
+                # decode the array items while the response body is being received
+                options = self._get_decoder_options()
+
+                decode = JsonEncoder.get_decoder(typeOfT, options) \
+                    if options is not None \
+                    else lambda item: item
+
+                if measurement is not None:
+                    decode = measurement.measure_decode(decode)
+
+                reader = JsonArrayReader()
+
+                {{{For}}} chunk in response.{{{Aiter_bytes}}}():
+
+                    if measurement is not None:
+                        measurement.add_response_size(len(chunk))
+                        measurement.mark()
+
+                    items = reader.feed(chunk)
+
+                    if measurement is not None:
+                        measurement.parsed()
+
+                    for item in items:
+                        yield decode(item)
+
+                for item in reader.close():
+                    yield decode(item)
+
+            finally:
+                {{{Await}}}response.{{{Aclose}}}()
+
+        # the consumer has stopped the iteration early
+        except GeneratorExit:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(None))
+
+            raise
+
+        except BaseException as exception:
+
+            if measurement is not None:
+                self._notify_observers(measurement.complete(exception))
+
+            raise
+
+        if measurement is not None:
+            self._notify_observers(measurement.complete(None))
+
+    def _notify_observers(self, metrics: RequestMetrics) -> None:
+        for observer in self.___request_observers:
+            observer(metrics)
+
+    # retries and hedges idempotent requests according to the retry policy
+    {{{Def}}} _send(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        retry_policy = self.___retry_policy
+
+        if retry_policy is None or request.method not in retry_policy.methods or not _is_replayable(request):
+            return {{{Await}}}self._send_timed(request, url_template, stream)
+
+        self.___retry_budget.deposit()
+        backoff = _Backoff(retry_policy.initial_delay, retry_policy.max_delay)
+        retries = 0
+
+        while True:
+
+            # a sent request is not sent again
+            attempt = request \
+                if retries == 0 \
+                else _copy_request(request)
+
+            try:
+                response = {{{Await}}}self._send_hedged(attempt, url_template, stream, retry_policy)
+
+            except TransportError:
+
+                if retries >= retry_policy.max_retries or not self.___retry_budget.withdraw():
+                    raise
+
+                retry_after = None
+
+            else:
+
+                if response.status_code not in retry_policy.retry_status_codes or \
+                   retries >= retry_policy.max_retries or \
+                   not self.___retry_budget.withdraw():
+
+                    return response
+
+                retry_after = _get_retry_after(response)
+                {{{Await}}}response.{{{Aclose}}}()
+
+            retries += 1
+            {{{Await}}}{{{AsyncioSleep}}}(backoff.next(retry_after))
+
+    {{{Def}}} _send_hedged(self, request: Request, url_template: str, stream: bool, retry_policy: RetryPolicy) -> Response:
+
+        threshold = None \
+            if retry_policy.hedge_percentile is None \
+            else self.___latency_tracker.get_percentile(retry_policy.hedge_percentile, retry_policy.hedge_min_samples)
+
+        if threshold is None:
+            return {{{Await}}}self._send_timed(request, url_template, stream)
+
+{{#IsAsync}}
+        first = asyncio.ensure_future(self._send_timed(request, url_template, stream))
+        pending: set[asyncio.Future[Response]] = { first }
+        done: set[asyncio.Future[Response]] = set()
+
+        # the requests are also cancelled if the caller is cancelled
+        try:
+
+            done, pending = await asyncio.wait(pending, timeout=threshold)
+
+            # the first response wins, the other request is cancelled
+            if not done and self.___retry_budget.withdraw():
+                pending.add(asyncio.ensure_future(self._send_timed(_copy_request(request), url_template, stream)))
+
+            while True:
+
+                winner = next((task for task in done if task.exception() is None), None)
+
+                if winner is not None:
+                    done.remove(winner)
+                    return winner.result()
+
+                # all requests have failed
+                if not pending:
+                    return done.pop().result()
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        finally:
+
+            for task in pending:
+                task.cancel()
+
+            # wait for the cancelled requests to give back their connections and limiter slots and close the responses
+            # of the requests which have completed anyway
+            for result in await asyncio.gather(*pending, *done, return_exceptions=True):
+                if isinstance(result, Response):
+                    await result.aclose()
+{{/IsAsync}}
+{{^IsAsync}}
+        # the first request is sent on the calling thread and only the hedged request on the pool, so that waiting
+        # for a pool thread neither delays the first request nor adds to the threshold
+        first_completed = threading.Event()
+        deadline = time.perf_counter() + threshold
+        second = self._get_hedging_executor().submit(self._send_hedge, _copy_request(request), url_template, stream, deadline, first_completed)
+
+        try:
+            response = self._send_timed(request, url_template, stream)
+
+        except BaseException as exception:
+
+            first_completed.set()
+            second.cancel()
+
+            # the hedged request may still succeed
+            if isinstance(exception, TransportError) and not second.cancelled() and second.exception() is None:
+
+                hedged_response = second.result()
+
+                if hedged_response is not None:
+                    return hedged_response
+
+            raise
+
+        first_completed.set()
+        second.cancel()
+        hedged_response = _get_response(second)
+
+        # the hedged request has completed first
+        if hedged_response is not None:
+            response.close()
+            return hedged_response
+
+        second.add_done_callback(_close_response)
+
+        return response
+
+    def _send_hedge(self, request: Request, url_template: str, stream: bool, deadline: float, first_completed: threading.Event) -> Optional[Response]:
+
+        # the hedged request is only sent if the first request is still running at the deadline
+        if first_completed.wait(max(0.0, deadline - time.perf_counter())) or not self.___retry_budget.withdraw():
+            return None
+
+        return self._send_timed(request, url_template, stream)
+{{/IsAsync}}
+
+    {{{Def}}} _send_timed(self, request: Request, url_template: str, stream: bool) -> Response:
+
+        limiter = self.___concurrency_limiter
+
+        if limiter is not None:
+            {{{Await}}}limiter._acquire{{#IsAsync}}_async{{/IsAsync}}()
+
+        # the limiter compares the time to first byte of each operation and server with its own baseline, because the
+        # time to download the body depends on its size and not only on the load of the server
+        limiter_key = (request.url.host, request.method, url_template)
+        start = time.perf_counter()
+
+        try:
+
+            response = {{{Await}}}self.___http_client.send(request, stream=True)
+            time_to_first_byte = time.perf_counter() - start
+
+            if not stream:
+
+                try:
+                    {{{Await}}}response.{{{Read}}}()
+
+                except BaseException:
+                    {{{Await}}}response.{{{Aclose}}}()
+                    raise
+
+        except BaseException as exception:
+
+            # cancelled requests (e.g. hedged requests) say nothing about the load of the server
+            if limiter is not None:
+                limiter._release(time.perf_counter() - start if isinstance(exception, TransportError) else None, None, limiter_key)
+
+            raise
+
+        self.___latency_tracker.add(time.perf_counter() - start)
+
+        if limiter is not None:
+            limiter._release(time_to_first_byte, response.status_code, limiter_key)
+
+        return response
+
+{{^IsAsync}}
+    def _get_hedging_executor(self) -> ThreadPoolExecutor:
+
+        with self.___in_flight_requests_lock:
+
+            if self.___hedging_executor is None:
+                self.___hedging_executor = ThreadPoolExecutor(thread_name_prefix="hedging")
+
+            return self.___hedging_executor
+
+{{/IsAsync}}
+    # the body of responses of type Response is not read in advance within the with block
+    @contextmanager
+    def _stream_responses(self) -> Iterator[None]:
+
+        token = self.___stream_responses.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___stream_responses.reset(token)
+
+    # the requests within the with block neither use nor fill the HTTP cache
+    @contextmanager
+    def _bypass_http_cache(self) -> Iterator[None]:
+
+        token = self.___bypass_http_cache.set(True)
+
+        try:
+            yield
+
+        finally:
+            self.___bypass_http_cache.reset(token)
+
+    # the requests within the with block return models, independent of the raw mode and lazy decoding
+    @contextmanager
+    def _decode_models(self) -> Iterator[None]:
+
+        raw_mode_token = self.___raw_mode.set(None)
+        lazy_decode_token = self.___lazy_decode.set(False)
+
+        try:
+            yield
+
+        finally:
+            self.___lazy_decode.reset(lazy_decode_token)
+            self.___raw_mode.reset(raw_mode_token)
+
+    # the headers are added to the requests within the with block
+    @contextmanager
+    def _request_headers(self, headers: Optional[dict[str, str]]) -> Iterator[None]:
+
+        token = self.___request_headers.set(headers)
+
+        try:
+            yield
+
+        finally:
+            self.___request_headers.reset(token)
+
+    # the responses of the requests within the with block are collected
+    @contextmanager
+    def _observe_responses(self) -> Iterator[list[Response]]:
+
+        responses: list[Response] = []
+        token = self.___observed_responses.set(responses)
+
+        try:
+            yield responses
+
+        finally:
+            self.___observed_responses.reset(token)
+
+    # returns None in raw mode with untouched property names
+    def _get_decoder_options(self) -> Optional[JsonEncoderOptions]:
+
+        raw_mode = self.___raw_mode.get()
+
+        if raw_mode == "untouched":
+            return None
+
+        elif raw_mode == "snake_case":
+            return self.___raw_json_encoder_options
+
+        elif self.___lazy_decode.get():
+            return self.___lazy_json_encoder_options
+
+        else:
+            return self.___json_encoder_options
+
+    def _create_exception(self, response: Response) -> {{{ExceptionType}}}:
+
+        message = response.text
+        status_code = f"{{{ExceptionCodePrefix}}}00.{response.status_code}"
+
+        if not message:
+            return {{{ExceptionType}}}(status_code, f"The HTTP request failed with status code {response.status_code}.")
+
+        else:
+            return {{{ExceptionType}}}(status_code, f"The HTTP request failed with status code {response.status_code}. The response message is: {message}")
+
     def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+
+        if content_type_value == "application/json":
+            content = JsonEncoder.encode_to_bytes(content, self.___json_encoder_options)
        
         request_message = self.___http_client.build_request(method, relative_url, content = content)
 
@@ -158,6 +848,11 @@ class {{{ClientName}}}{{{Async}}}Client:
         if accept_header_value is not None:
             request_message.headers["Accept"] = accept_header_value
 
+        request_headers = self.___request_headers.get()
+
+        if request_headers is not None:
+            request_message.headers.update(request_headers)
+
         return request_message
 
     # "disposable" methods
@@ -167,6 +862,11 @@ class {{{ClientName}}}{{{Async}}}Client:
     {{{Def}}} __{{{Exit}}}__(self, exc_type, exc_value, exc_traceback):
         if (self.___http_client is not None):
             {{{Await}}}self.___http_client.{{{Aclose}}}()
+{{^IsAsync}}
+
+        if self.___hedging_executor is not None:
+            self.___hedging_executor.shutdown(wait=False)
+{{/IsAsync}}
 
 {{#Special_NexusFeatures}}
     {{{Def}}} load(
@@ -174,7 +874,11 @@ class {{{ClientName}}}{{{Async}}}Client:
         begin: datetime, 
         end: datetime, 
         resource_paths: Iterable[str],
-        on_progress: Optional[Callable[[float], None]]) -> dict[str, DataResponse]:
+        on_progress: Optional[Callable[[float], None]],
+        max_concurrency: int = 4,
+        max_chunk_size: int = 16 * 1024 * 1024,
+        values_type: str = "array",
+        cache: Optional[DataCache] = None) -> dict[str, DataResponse]:
         """This high-level methods simplifies loading multiple resources at once.
 
         Args:
@@ -182,60 +886,142 @@ class {{{ClientName}}}{{{Async}}}Client:
             end: End date/time.
             resource_paths: The resource paths.
             onProgress: A callback which accepts the current progress.
+            max_concurrency: The maximum number of data requests which are executed concurrently.
+            max_chunk_size: The maximum number of bytes per data request. Longer time ranges are split into multiple requests.
+            values_type: The type of the returned values: "array" (array.array), "memoryview" or "numpy" (numpy.ndarray, requires the numpy package). The data is written directly into the values without intermediate copies.
+            cache: An optional data cache. Only the time intervals which are not cached yet are loaded and then added to the cache. The data is cached per base URL, so the cache can be shared by clients of different servers.
         """
 
-        catalog_item_map = {{{Await}}}self.v1.catalogs.search_catalog_items(list(resource_paths))
-        result: dict[str, DataResponse] = {}
-        progress: float = 0
+        if max_concurrency < 1:
+            raise Exception("The maximum concurrency must be at least 1.")
+
+        if values_type not in _values_types:
+            raise Exception(f"The values type {values_type} is not supported.")
+
+        with self._decode_models():
+            catalog_item_map = {{{Await}}}self.v1.catalogs.search_catalog_items(list(resource_paths))
+        base_url = str(self.___http_client.base_url)
+
+        # preallocate the buffers and split the time range into chunks which are written directly into the buffers
+        buffers: dict[str, Any] = {}
+        chunks: list[tuple[str, datetime, datetime, memoryview]] = []
+        missing: list[tuple[str, timedelta, datetime, memoryview]] = []
 
         for (resource_path, catalog_item) in catalog_item_map.items():
 
-            response = {{{Await}}}self.v1.data.get_stream(resource_path, begin, end)
+            sample_period = catalog_item.representation.sample_period
+            sample_count, _ = _split_time_range(begin, end, sample_period, max_chunk_size)
+            buffer, byte_buffer = _allocate_values(sample_count, values_type)
 
-            try:
-                double_data = {{{Await}}}self._read_as_double(response)
+            # only the gaps in the cache are loaded
+            if cache is None:
+                intervals = [(begin, end)]
 
-            finally:
-                {{{Await}}}response.{{{Aclose}}}()
+            else:
+                intervals = cache.read(resource_path, sample_period, begin, byte_buffer, base_url)
 
-            resource = catalog_item.resource
+            for (interval_begin, interval_end) in intervals:
 
-            unit = cast(str, resource.properties["unit"]) \
-                if resource.properties is not None and "unit" in resource.properties and type(resource.properties["unit"]) == str \
-                else None
+                interval_offset = (interval_begin - begin) // sample_period * 8
+                _, time_range_chunks = _split_time_range(interval_begin, interval_end, sample_period, max_chunk_size)
 
-            description = cast(str, resource.properties["description"]) \
-                if resource.properties is not None and "description" in resource.properties and type(resource.properties["description"]) == str \
-                else None
+                for (chunk_begin, chunk_end, offset, length) in time_range_chunks:
+                    offset += interval_offset
+                    chunks.append((resource_path, chunk_begin, chunk_end, byte_buffer[offset:offset + length]))
 
-            sample_period = catalog_item.representation.sample_period
+                interval_length = (interval_end - interval_begin) // sample_period * 8
+                missing.append((resource_path, sample_period, interval_begin, byte_buffer[interval_offset:interval_offset + interval_length]))
+
+            buffers[resource_path] = buffer
+
+        total_length = sum(len(chunk[3]) for chunk in chunks)
+        progress: float = 0
 
-            result[resource_path] = DataResponse(
-                catalog_item=catalog_item,
-                name=resource.id,
-                unit=unit,
-                description=description,
-                sample_period=sample_period,
-                values=double_data
-            )
+        def report_progress(length: int):
 
-            progress = progress + 1.0 / len(catalog_item_map)
+            nonlocal progress
+
+            progress = progress + (length / total_length if total_length > 0 else 1.0 / len(chunks))
 
             if on_progress is not None:
                 on_progress(progress)
-                
-        return result
 
-    {{{Def}}} _read_as_double(self, response: Response):
-        
-        byteBuffer = {{{Await}}}response.{{{Read}}}()
+{{#IsAsync}}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load_chunk(resource_path: str, chunk_begin: datetime, chunk_end: datetime, chunk_buffer: memoryview) -> None:
+
+            async with semaphore:
+                await self._load_chunk(resource_path, chunk_begin, chunk_end, chunk_buffer)
 
-        if len(byteBuffer) % 8 != 0:
-            raise Exception("The data length is invalid.")
+            report_progress(len(chunk_buffer))
 
-        doubleBuffer = array("d", byteBuffer)
+        tasks = [asyncio.ensure_future(load_chunk(*chunk)) for chunk in chunks]
 
-        return doubleBuffer 
+        try:
+            await asyncio.gather(*tasks)
+
+        except BaseException:
+
+            for task in tasks:
+                task.cancel()
+
+            raise
+{{/IsAsync}}
+{{^IsAsync}}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+            futures = {executor.submit(self._load_chunk, *chunk): len(chunk[3]) for chunk in chunks}
+
+            try:
+
+                # progress is reported on the calling thread
+                for future in as_completed(futures):
+                    future.result()
+                    report_progress(futures[future])
+
+            except BaseException:
+
+                for future in futures:
+                    future.cancel()
+
+                raise
+{{/IsAsync}}
+
+        # the progress is complete even if nothing has been loaded, e.g. because all data is cached
+        if not chunks and on_progress is not None:
+            on_progress(1)
+
+        if cache is not None:
+            for (resource_path, sample_period, interval_begin, interval_buffer) in missing:
+                cache.write(resource_path, sample_period, interval_begin, interval_buffer, base_url)
+
+        return {resource_path: _create_data_response(catalog_item, buffers[resource_path]) for (resource_path, catalog_item) in catalog_item_map.items()}
+
+    {{{Def}}} _load_chunk(self, resource_path: str, begin: datetime, end: datetime, buffer: memoryview) -> None:
+
+        with self._stream_responses():
+            response = {{{Await}}}self.v1.data.get_stream(resource_path, begin, end)
+
+        try:
+
+            offset = 0
+
+            {{{For}}} data in response.{{{Aiter_bytes}}}():
+
+                next_offset = offset + len(data)
+
+                if next_offset > len(buffer):
+                    raise Exception("The data length is invalid.")
+
+                buffer[offset:next_offset] = data
+                offset = next_offset
+
+            if offset != len(buffer):
+                raise Exception("The data length is invalid.")
+
+        finally:
+            {{{Await}}}response.{{{Aclose}}}()
 
     {{{Def}}} export(
         self,
@@ -246,7 +1032,10 @@ class {{{ClientName}}}{{{Async}}}Client:
         resource_paths: Iterable[str],
         configuration: dict[str, object],
         target_folder: str,
-        on_progress: Optional[Callable[[float, str], None]]) -> None:
+        on_progress: Optional[Callable[[float, str], None]],
+        max_retries: int = 3,
+        max_concurrency: int = 4,
+        max_jobs: int = 1) -> None:
         """This high-level methods simplifies exporting multiple resources at once.
 
         Args:
@@ -258,90 +1047,255 @@ class {{{ClientName}}}{{{Async}}}Client:
             configuration: The configuration.
             targetFolder: The target folder for the files to extract.
             onProgress: A callback which accepts the current progress and the progress message.
+            max_retries: The maximum number of attempts to resume an interrupted download without receiving new data.
+            max_concurrency: The maximum number of files which are extracted concurrently.
+            max_jobs: The maximum number of export jobs. With a non-zero file period, the time range is split at file boundaries (multiples of the file period since 0001-01-01 UTC) into up to max_jobs jobs. These are created and processed concurrently.
         """
 
-        export_parameters = ExportParameters(
-            begin,
-            end,
-            file_period,
-            file_format,
-            list(resource_paths),
-            configuration
-        )
+        if max_jobs < 1:
+            raise Exception("The maximum number of jobs must be at least 1.")
+
+        resource_paths = list(resource_paths)
+        time_ranges = _split_export_time_range(begin, end, file_period, max_jobs)
+        progress = _ExportProgress(len(time_ranges), on_progress)
+
+        # Start jobs
+        export_parameters = [
+            ExportParameters(
+                job_begin,
+                job_end,
+                file_period,
+                file_format,
+                resource_paths,
+                configuration
+            ) for (job_begin, job_end) in time_ranges
+        ]
+
+{{#IsAsync}}
+        jobs = await asyncio.gather(*(self._create_export_job(parameters) for parameters in export_parameters))
+{{/IsAsync}}
+{{^IsAsync}}
+        with ThreadPoolExecutor(max_workers=len(export_parameters)) as executor:
+            jobs = list(executor.map(self._create_export_job, export_parameters))
+{{/IsAsync}}
+
+        # Wait for jobs to finish
+        job_statuses = {{{Await}}}self.wait_for_jobs(
+            [job.id for job in jobs],
+            lambda index, value: progress.report(index, value, "export"))
+
+        progress.complete("export")
+
+        artifact_ids: list[str] = []
+
+        for job_status in job_statuses:
+
+            if (job_status.result is None or \
+                type(job_status.result) != str):
+
+                raise Exception("The job result is invalid.")
+
+            artifact_ids.append(cast(str, job_status.result))
+
+        if file_format is None:
+            return
+
+        # Download and extract zip files
+{{#IsAsync}}
+        await asyncio.gather(*(
+            self._download_and_extract(artifact_id, target_folder, max_retries, max_concurrency, progress, index)
+            for (index, artifact_id) in enumerate(artifact_ids)))
+{{/IsAsync}}
+{{^IsAsync}}
+        with ThreadPoolExecutor(max_workers=len(artifact_ids)) as executor:
+
+            futures = [
+                executor.submit(self._download_and_extract, artifact_id, target_folder, max_retries, max_concurrency, progress, index)
+                for (index, artifact_id) in enumerate(artifact_ids)]
+
+            for future in futures:
+                future.result()
+{{/IsAsync}}
+
+        progress.complete("download")
+        progress.complete("extract")
 
-        # Start job
-        job = {{{Await}}}self.v1.jobs.export(export_parameters)
+    {{{Def}}} _create_export_job(self, parameters: ExportParameters) -> Job:
 
-        # Wait for job to finish
-        artifact_id: Optional[str] = None
+        with self._decode_models():
+            return {{{Await}}}self.v1.jobs.export(parameters)
+
+    {{{Def}}} wait_for_jobs(
+        self,
+        job_ids: Iterable[UUID],
+        on_progress: Optional[Callable[[int, float], None]] = None,
+        initial_delay: float = 0.1,
+        max_delay: float = 10.0) -> list[JobStatus]:
+        """Waits until all jobs have run to completion. The job status is polled with exponentially increasing delays. A Retry-After header of the server takes precedence.
+
+        Args:
+            job_ids: The job identifiers.
+            on_progress: A callback which accepts the index of the job and its current progress.
+            initial_delay: The delay in seconds before the first status request.
+            max_delay: The maximum delay in seconds between two status requests.
+        """
+
+        job_ids = list(job_ids)
+        job_statuses: list[Optional[JobStatus]] = [None] * len(job_ids)
+        polling_delay = _Backoff(initial_delay, max_delay)
+        retry_after: Optional[float] = None
 
         while True:
-            {{{Await}}}{{{AsyncioSleep}}}(1)
-            
-            job_status = {{{Await}}}self.v1.jobs.get_job_status(job.id)
+            {{{Await}}}{{{AsyncioSleep}}}(polling_delay.next(retry_after))
 
-            if (job_status.status == TaskStatus.CANCELED):
-                raise Exception("The job has been cancelled.")
+            pending = [index for (index, job_status) in enumerate(job_statuses) if job_status is None]
 
-            elif (job_status.status == TaskStatus.FAULTED):
-                raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
+            # the status of all pending jobs is requested together
+{{#IsAsync}}
+            results = await asyncio.gather(*(self._get_job_status(job_ids[index]) for index in pending))
+{{/IsAsync}}
+{{^IsAsync}}
+            results = [self._get_job_status(job_ids[index]) for index in pending]
+{{/IsAsync}}
 
-            elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+            retry_after = max((result[1] for result in results if result[1] is not None), default=None)
 
-                if (job_status.result is not None and \
-                    type(job_status.result) == str):
+            for (index, (job_status, _)) in zip(pending, results):
 
-                    artifact_id = cast(Optional[str], job_status.result)
+                if (job_status.status == TaskStatus.CANCELED):
+                    raise Exception("The job has been cancelled.")
 
-                    break
+                elif (job_status.status == TaskStatus.FAULTED):
+                    raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
 
-            if job_status.progress < 1 and on_progress is not None:
-                on_progress(job_status.progress, "export")
+                elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+                    job_statuses[index] = job_status
 
-        if on_progress is not None:
-            on_progress(1, "export")
+                if on_progress is not None:
+                    on_progress(index, 1 if job_status.status == TaskStatus.RAN_TO_COMPLETION else job_status.progress)
 
-        if artifact_id is None:
-            raise Exception("The job result is invalid.")
+            if all(job_status is not None for job_status in job_statuses):
+                return cast(list[JobStatus], job_statuses)
 
-        if file_format is None:
-            return
+    # returns the job status and the value of the Retry-After header
+    {{{Def}}} _get_job_status(self, job_id: UUID) -> tuple[JobStatus, Optional[float]]:
+
+        # the job status changes while polling, so a cached status (e.g. due to the ttl of the cache) must not be used
+        with self._decode_models(), self._bypass_http_cache(), self._observe_responses() as responses:
+            job_status = {{{Await}}}self.v1.jobs.get_job_status(job_id)
+
+        return (job_status, _get_retry_after(responses[-1]) if responses else None)
+
+    {{{Def}}} _download_and_extract(self, artifact_id: str, target_folder: str, max_retries: int, max_concurrency: int, progress: _ExportProgress, index: int) -> None:
 
         # Download zip file
-        with NamedTemporaryFile() as target_stream:
+        target_stream = {{{Await}}}self._download_artifact(artifact_id, lambda value: progress.report(index, value, "download"), max_retries)
 
-            response = {{{Await}}}self.v1.artifacts.download(artifact_id)
-            
-            try:
+        try:
+
+            progress.report(index, 1, "download")
+
+            # Extract file
+{{#IsAsync}}
+            await asyncio.get_running_loop().run_in_executor(
+                None, _extract_zip_file, target_stream, target_folder, max_concurrency, lambda value: progress.report(index, value, "extract"))
+{{/IsAsync}}
+{{^IsAsync}}
+            _extract_zip_file(target_stream, target_folder, max_concurrency, lambda value: progress.report(index, value, "extract"))
+{{/IsAsync}}
+
+            progress.report(index, 1, "extract")
+
+        finally:
+            target_stream.close()
+
+    # downloads the artifact into memory or into a temporary file (see _create_artifact_stream)
+    {{{Def}}} _download_artifact(self, artifact_id: str, on_progress: Callable[[float], None], max_retries: int) -> IO[bytes]:
+
+        target_stream: Optional[IO[bytes]] = None
+        length: Optional[int] = None
+        consumed = 0
+        retries = 0
+
+        try:
+
+            while True:
+
+                # the raw bytes are counted because the Range and Content-Length headers refer to them, content
+                # encodings are refused so that the raw bytes are the bytes of the zip file
+                headers = { "Accept-Encoding": "identity" }
 
-                length: Optional[int] = None
+                # continue where the previous attempt has stopped
+                if consumed > 0:
+                    headers["Range"] = f"bytes={consumed}-"
 
                 try:
-                    length = int(response.headers["Content-Length"])
-                except:
-                    pass
 
-                consumed = 0.0
+                    with self._stream_responses(), self._request_headers(headers):
+                        response = {{{Await}}}self.v1.artifacts.download(artifact_id)
 
-                {{{For}}} data in response.{{{Aiter_bytes}}}():
+                    try:
 
-                    target_stream.write(data)
-                    consumed += len(data)
+                        # the server does not support range requests, start over
+                        if consumed > 0 and not _is_partial_content(response, consumed):
+                            consumed = 0
 
-                    if length is not None and on_progress is not None:
-                        if consumed < length:
-                            on_progress(consumed / length, "download")
+                        if consumed == 0:
 
-            finally:
-                {{{Await}}}response.{{{Aclose}}}()
+                            try:
+                                length = int(response.headers["Content-Length"])
+                            except:
+                                length = None
 
-            if on_progress is not None:
-                on_progress(1, "download")
+                            if target_stream is not None:
+                                target_stream.close()
 
-            # Extract file
-            with ZipFile(target_stream, "r") as zipFile:
-                zipFile.extractall(target_folder)
+                            target_stream = _create_artifact_stream(length)
+
+                        {{{For}}} data in response.{{{Aiter_raw}}}():
+
+{{#IsAsync}}
+                            # file writes would block the event loop
+                            if isinstance(target_stream, BytesIO):
+                                target_stream.write(data)
+
+                            else:
+                                await asyncio.to_thread(target_stream.write, data)
+{{/IsAsync}}
+{{^IsAsync}}
+                            target_stream.write(data)
+{{/IsAsync}}
+                            consumed += len(data)
+                            retries = 0
+
+                            if length is not None and consumed < length:
+                                on_progress(consumed / length)
 
-        if on_progress is not None:
-            on_progress(1, "extract")
+                    finally:
+                        {{{Await}}}response.{{{Aclose}}}()
+
+                    if length is None or consumed >= length:
+                        break
+
+                    raise TransportError("The download has ended prematurely.")
+
+                except TransportError:
+
+                    retries += 1
+
+                    if retries > max_retries:
+                        raise
+
+        except BaseException:
+
+            if target_stream is not None:
+                target_stream.close()
+
+            raise
+
+        # the stream has been created for the first response
+        result = cast(IO[bytes], target_stream)
+        result.seek(0)
+
+        return result
 {{/Special_NexusFeatures}}
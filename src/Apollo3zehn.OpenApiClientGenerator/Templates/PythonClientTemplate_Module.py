@@ -1,18 +1,32 @@
 ﻿from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import AsyncIterable, Awaitable, Iterable, Optional, TypeVar, Union
-from urllib.parse import quote
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Iterable,
+                    Iterator, Optional, TypeVar, Union)
+{{#Python_TypedDicts}}
+from typing import TypedDict
+{{/Python_TypedDicts}}
 from uuid import UUID
 
 from httpx import Response
 
-from ._encoder import JsonEncoder
-from ._shared import (HttpRequestHandler, HttpRequestHandlerAsync,
-                      _json_encoder_options, _to_string)
+from {{{ParentPackage}}}_encoder import JsonEncoder
+{{#Python_StaticSerializers}}
+from {{{ParentPackage}}}_encoder import (_decode_datetime, _decode_timedelta, _encode_datetime,
+                       _encode_timedelta)
+{{/Python_StaticSerializers}}
+from {{{ParentPackage}}}_operation import _Operation
+from {{{ParentPackage}}}_shared import (HttpRequestHandler, HttpRequestHandlerAsync,
+                      HttpRequestIterHandler, HttpRequestIterHandlerAsync,
+                      _json_encoder_options)
+{{#Python_StaticSerializers}}
+from {{{ParentPackage}}}_shared import _EnumDecoder, _get_enum_encoder
+{{/Python_StaticSerializers}}
+{{#ModuleImports}}
+{{{ModuleImports}}}
+{{/ModuleImports}}
 
 T = TypeVar("T")
 
@@ -21,3 +35,6 @@ T = TypeVar("T")
 {{AsyncClient}}
 {{AsyncSubClients}}
 {{Models}}
+{{#Operations}}
+{{{Operations}}}
+{{/Operations}}
@@ -2,15 +2,25 @@
     """A client for version {{{Version}}}."""
     
 {{{SubClientFields}}}
+{{#Python_LazyModules}}
+    ___invoke: HttpRequestHandler{{{Async}}}
+    ___invoke_iter: HttpRequestIterHandler{{{Async}}}
+{{/Python_LazyModules}}
 
-    def __init__(self, invoke: HttpRequestHandler{{{Async}}}):
+    def __init__(self, invoke: HttpRequestHandler{{{Async}}}, invoke_iter: HttpRequestIterHandler{{{Async}}}):
         """
         Initializes a new instance of {{{Version}}}{{{Async}}}
         
             Args:
-                client: The client to use.
+                invoke: The handler to execute HTTP requests.
+                invoke_iter: The handler to execute HTTP requests which return a JSON array.
         """
 
+{{#Python_LazyModules}}
+        self.___invoke = invoke
+        self.___invoke_iter = invoke_iter
+
+{{/Python_LazyModules}}
 {{{SubClientFieldAssignments}}}
 
 {{{SubClientProperties}}}
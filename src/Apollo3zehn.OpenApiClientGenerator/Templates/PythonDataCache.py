@@ -0,0 +1,373 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+
+_EPOCH = datetime(1, 1, 1)
+
+# the version of the index file format
+_INDEX_VERSION = 1
+_MICROSECOND = timedelta(microseconds=1)
+
+# (first sample index, last sample index + 1)
+_Interval = tuple[int, int]
+
+class DataCache:
+    """
+    Caches float64 data on disk, keyed by server, resource path and sample period. The data is stored in memory-mapped
+    block files, the time intervals which are already present are tracked per block. The least recently used blocks
+    are evicted when the cache grows beyond its maximum size.
+    """
+
+    def __init__(self, folder: str, max_size: int = 1024 * 1024 * 1024, block_size: int = 8 * 1024 * 1024):
+        """
+        Initializes a new instance of the DataCache.
+
+        Args:
+            folder: The folder where the cache files are stored. Existing cache files in this folder are reused if they have been written with the same block size, otherwise they are removed.
+            max_size: The maximum number of bytes of cached data.
+            block_size: The number of bytes per block file.
+        """
+
+        if block_size < 8:
+            raise Exception("The block size must be at least 8 bytes.")
+
+        self._folder = folder
+        self._max_size = max_size
+        self._block_sample_count = block_size // 8
+        self._lock = threading.Lock()
+
+        # file name -> intervals, ordered from least to most recently used
+        self._blocks: OrderedDict[str, list[_Interval]] = OrderedDict()
+
+        os.makedirs(folder, exist_ok=True)
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of cached data."""
+
+        with self._lock:
+            return sum(_get_length(intervals) for intervals in self._blocks.values()) * 8
+
+    def get_missing_intervals(self, resource_path: str, sample_period: timedelta, begin: datetime, end: datetime, base_url: str = "") -> list[tuple[datetime, datetime]]:
+        """
+        Returns the time intervals between begin and end which are not cached yet. Adjacent intervals are merged.
+
+        Args:
+            resource_path: The resource path.
+            sample_period: The sample period.
+            begin: Start date/time.
+            end: End date/time.
+            base_url: The base URL of the server. The data of different servers is cached separately.
+        """
+
+        first = _get_sample_index(begin, sample_period)
+        last = _get_sample_index(end, sample_period)
+
+        # time ranges which are not aligned to the sample period are not cached
+        if first is None or last is None:
+            return [(begin, end)] if begin < end else []
+
+        with self._lock:
+            missing = self._get_missing_intervals(base_url, resource_path, sample_period, first, last)
+
+        return _to_time_intervals(missing, begin, first, sample_period)
+
+    def read(self, resource_path: str, sample_period: timedelta, begin: datetime, buffer: memoryview, base_url: str = "") -> list[tuple[datetime, datetime]]:
+        """
+        Copies the cached data into the buffer and returns the time intervals of the buffer which are not cached. The
+        parts of the buffer which are not cached remain untouched. Both are determined under the same lock, i.e. the
+        returned intervals match the copied data even if other threads write to the cache concurrently.
+
+        Args:
+            resource_path: The resource path.
+            sample_period: The sample period.
+            begin: The date/time of the first sample in the buffer.
+            buffer: A byte view of the buffer.
+            base_url: The base URL of the server. The data of different servers is cached separately.
+        """
+
+        first = _get_sample_index(begin, sample_period)
+        sample_count = len(buffer) // 8
+
+        # time ranges which are not aligned to the sample period are not cached
+        if first is None:
+            return [(begin, begin + sample_count * sample_period)] if sample_count > 0 else []
+
+        last = first + sample_count
+
+        with self._lock:
+            for (block, block_first, block_last) in self._get_blocks(first, last):
+                file_name = self._get_file_name(base_url, resource_path, sample_period, block)
+                intervals = self._blocks.get(file_name)
+
+                if intervals is None:
+                    continue
+
+                self._blocks.move_to_end(file_name)
+                block_offset = block * self._block_sample_count
+
+                with self._map(file_name) as mapped_file:
+                    for (interval_first, interval_last) in _intersect(intervals, block_first, block_last):
+
+                        source = slice((interval_first - block_offset) * 8, (interval_last - block_offset) * 8)
+                        target = slice((interval_first - first) * 8, (interval_last - first) * 8)
+                        buffer[target] = mapped_file[source]
+
+            missing = self._get_missing_intervals(base_url, resource_path, sample_period, first, last)
+
+        return _to_time_intervals(missing, begin, first, sample_period)
+
+    def write(self, resource_path: str, sample_period: timedelta, begin: datetime, buffer: memoryview, base_url: str = "") -> None:
+        """
+        Stores the data of the buffer in the cache and evicts the least recently used blocks if the cache grows beyond its maximum size.
+
+        Args:
+            resource_path: The resource path.
+            sample_period: The sample period.
+            begin: The date/time of the first sample in the buffer.
+            buffer: A byte view of the buffer.
+            base_url: The base URL of the server. The data of different servers is cached separately.
+        """
+
+        first = _get_sample_index(begin, sample_period)
+
+        if first is None or len(buffer) < 8:
+            return
+
+        last = first + len(buffer) // 8
+
+        with self._lock:
+            for (block, block_first, block_last) in self._get_blocks(first, last):
+                file_name = self._get_file_name(base_url, resource_path, sample_period, block)
+                block_offset = block * self._block_sample_count
+
+                with self._map(file_name) as mapped_file:
+                    target = slice((block_first - block_offset) * 8, (block_last - block_offset) * 8)
+                    source = slice((block_first - first) * 8, (block_last - first) * 8)
+                    mapped_file[target] = buffer[source]
+
+                self._blocks[file_name] = _merge(self._blocks.get(file_name, []), block_first, block_last)
+                self._blocks.move_to_end(file_name)
+
+            self._evict()
+            self._save_index()
+
+    def clear(self) -> None:
+        """Removes all cached data."""
+
+        with self._lock:
+            for file_name in self._blocks:
+                _remove_file(os.path.join(self._folder, file_name))
+
+            self._blocks.clear()
+            self._save_index()
+
+    def _get_blocks(self, first: int, last: int) -> list[tuple[int, int, int]]:
+        """Returns the blocks (block, first sample index, last sample index + 1) which overlap the sample range."""
+
+        blocks: list[tuple[int, int, int]] = []
+
+        for block in range(first // self._block_sample_count, (last - 1) // self._block_sample_count + 1 if last > first else 0):
+            block_offset = block * self._block_sample_count
+            blocks.append((block, max(first, block_offset), min(last, block_offset + self._block_sample_count)))
+
+        return blocks
+
+    def _get_missing_intervals(self, base_url: str, resource_path: str, sample_period: timedelta, first: int, last: int) -> list[_Interval]:
+        """Returns the sample ranges between first and last which are not cached yet. The lock must be held."""
+
+        missing: list[_Interval] = []
+
+        for (block, block_first, block_last) in self._get_blocks(first, last):
+            intervals = self._blocks.get(self._get_file_name(base_url, resource_path, sample_period, block), [])
+
+            for (missing_first, missing_last) in _subtract(intervals, block_first, block_last):
+
+                if missing and missing[-1][1] == missing_first:
+                    missing[-1] = (missing[-1][0], missing_last)
+
+                else:
+                    missing.append((missing_first, missing_last))
+
+        return missing
+
+    def _get_file_name(self, base_url: str, resource_path: str, sample_period: timedelta, block: int) -> str:
+        key = f"{base_url}|{resource_path}|{sample_period // _MICROSECOND}|{block}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".bin"
+
+    def _map(self, file_name: str) -> "_MappedFile":
+        return _MappedFile(os.path.join(self._folder, file_name), self._block_sample_count * 8)
+
+    def _evict(self) -> None:
+
+        size = sum(_get_length(intervals) for intervals in self._blocks.values()) * 8
+
+        while size > self._max_size and self._blocks:
+            file_name, intervals = self._blocks.popitem(last=False)
+            _remove_file(os.path.join(self._folder, file_name))
+            size -= _get_length(intervals) * 8
+
+    def _load_index(self) -> None:
+
+        index_file_path = os.path.join(self._folder, "index.json")
+
+        if not os.path.exists(index_file_path):
+            return
+
+        try:
+            with open(index_file_path, "r") as index_file:
+                index = json.load(index_file)
+
+            # the sample offsets within the block files depend on the block size, so block files of another block size
+            # or index format are removed
+            if not isinstance(index, dict) or \
+               index.get("version") != _INDEX_VERSION or \
+               index.get("block_size") != self._block_sample_count * 8:
+
+                for (file_name, _) in (index["blocks"] if isinstance(index, dict) else index):
+                    _remove_file(os.path.join(self._folder, os.path.basename(file_name)))
+
+                _remove_file(index_file_path)
+                return
+
+            for (file_name, intervals) in index["blocks"]:
+                if os.path.exists(os.path.join(self._folder, file_name)):
+                    self._blocks[file_name] = [(interval[0], interval[1]) for interval in intervals]
+
+        # a corrupt index invalidates the cache
+        except (ValueError, TypeError, IndexError, KeyError):
+            self._blocks.clear()
+
+    def _save_index(self) -> None:
+
+        index_file_path = os.path.join(self._folder, "index.json")
+        temp_file_path = index_file_path + ".tmp"
+
+        with open(temp_file_path, "w") as index_file:
+            json.dump({
+                "version": _INDEX_VERSION,
+                "block_size": self._block_sample_count * 8,
+                "blocks": [[file_name, intervals] for (file_name, intervals) in self._blocks.items()]
+            }, index_file)
+
+        os.replace(temp_file_path, index_file_path)
+
+class _MappedFile:
+    """Maps a block file into memory and creates it if it does not exist."""
+
+    def __init__(self, file_path: str, size: int):
+        self._file_path = file_path
+        self._size = size
+
+    def __enter__(self) -> memoryview:
+
+        mode = "r+b" if os.path.exists(self._file_path) else "w+b"
+        self._file = open(self._file_path, mode)
+
+        try:
+            # the file is sparse until data is written
+            if os.fstat(self._file.fileno()).st_size < self._size:
+                self._file.truncate(self._size)
+
+            self._mmap = mmap.mmap(self._file.fileno(), self._size)
+
+        except:
+            self._file.close()
+            raise
+
+        self._view = memoryview(self._mmap)
+
+        return self._view
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+
+        # the view must be released before the map can be closed
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+def _get_sample_index(value: datetime, sample_period: timedelta) -> Optional[int]:
+    """Returns the index of the sample at the given date/time, counted from 0001-01-01 UTC, or None if the date/time is not aligned to the sample period."""
+
+    if sample_period < _MICROSECOND:
+        return None
+
+    offset = value.utcoffset()
+
+    if offset is not None:
+        value = value.replace(tzinfo=None) - offset
+
+    index, remainder = divmod(value - _EPOCH, sample_period)
+
+    return index if remainder == timedelta(0) else None
+
+def _to_time_intervals(intervals: list[_Interval], begin: datetime, first: int, sample_period: timedelta) -> list[tuple[datetime, datetime]]:
+    """Converts the sample ranges into time intervals relative to begin, which is the date/time of the sample first."""
+
+    return [
+        (begin + (interval_first - first) * sample_period, begin + (interval_last - first) * sample_period)
+        for (interval_first, interval_last) in intervals
+    ]
+
+def _get_length(intervals: list[_Interval]) -> int:
+    return sum(last - first for (first, last) in intervals)
+
+def _merge(intervals: list[_Interval], first: int, last: int) -> list[_Interval]:
+    """Adds the interval to the sorted intervals and merges overlapping and adjacent intervals."""
+
+    result: list[_Interval] = []
+
+    for (interval_first, interval_last) in intervals:
+
+        if interval_last < first:
+            result.append((interval_first, interval_last))
+
+        elif last < interval_first:
+            result.append((first, last))
+            first, last = interval_first, interval_last
+
+        else:
+            first, last = min(first, interval_first), max(last, interval_last)
+
+    result.append((first, last))
+
+    return result
+
+def _intersect(intervals: list[_Interval], first: int, last: int) -> list[_Interval]:
+    """Returns the parts of the sorted intervals which lie between first and last."""
+
+    return [
+        (max(first, interval_first), min(last, interval_last))
+        for (interval_first, interval_last) in intervals
+        if interval_first < last and first < interval_last
+    ]
+
+def _subtract(intervals: list[_Interval], first: int, last: int) -> list[_Interval]:
+    """Returns the parts between first and last which are not covered by the sorted intervals."""
+
+    result: list[_Interval] = []
+
+    for (interval_first, interval_last) in _intersect(intervals, first, last):
+
+        if first < interval_first:
+            result.append((first, interval_first))
+
+        first = interval_last
+
+    if first < last:
+        result.append((first, last))
+
+    return result
+
+def _remove_file(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+
+    except FileNotFoundError:
+        pass
@@ -1,15 +1,104 @@
+import codecs
 import dataclasses
+import importlib
+import io
+import json
 import re
+import threading
 import typing
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import (Any, Callable, ClassVar, Optional, Type, TypeVar, Union,
-                    cast)
+from typing import (Any, Callable, ClassVar, Optional, Protocol, Type, TypeVar,
+                    Union, cast)
 from uuid import UUID
 
 T = TypeVar("T")
 
+# writes the JSON representation of a value using the provided write function
+_JsonWriter = Callable[[Any, Callable[[str], Any]], None]
+
+class JsonBackend(Protocol):
+    """Parses and serializes JSON."""
+
+    name: str
+    """The name of the backend."""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parses the JSON data."""
+        ...
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a tree of JSON primitives, lists and dicts into UTF-8 encoded JSON."""
+        ...
+
+class _StdlibJsonBackend:
+
+    name = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+class _OrjsonJsonBackend:
+
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = importlib.import_module("orjson")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, option=self._orjson.OPT_NON_STR_KEYS)
+
+class _MsgspecJsonBackend:
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._msgspec_json = importlib.import_module("msgspec.json")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._msgspec_json.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgspec_json.encode(value)
+
+_json_backend_types: dict[str, Callable[[], JsonBackend]] = {
+    "stdlib": _StdlibJsonBackend,
+    "orjson": _OrjsonJsonBackend,
+    "msgspec": _MsgspecJsonBackend
+}
+
+def get_json_backend(name: str = "auto") -> JsonBackend:
+    """
+    Returns the JSON backend with the specified name ("stdlib", "orjson", "msgspec" or "auto" for the fastest
+    installed backend). Falls back to the stdlib backend if the required package is not installed.
+    """
+
+    if name == "auto":
+        candidates = ["orjson", "msgspec"]
+
+    elif name in _json_backend_types:
+        candidates = [name]
+
+    else:
+        raise Exception(f"The JSON backend {name} is not supported.")
+
+    for candidate in candidates:
+
+        try:
+            return _json_backend_types[candidate]()
+
+        except ImportError:
+            pass
+
+    return _StdlibJsonBackend()
+
 @dataclass(frozen=True)
 class JsonEncoderOptions:
 
@@ -17,72 +106,256 @@ class JsonEncoderOptions:
     property_name_decoder: Callable[[str], str] = lambda value: value
 
     encoders: dict[Type, Callable[[Any], Any]] = field(default_factory=lambda: {
-        datetime:   lambda value: value.isoformat().replace("+00:00", "Z"),
+        datetime:   lambda value: _encode_datetime(value),
         timedelta:  lambda value: _encode_timedelta(value),
         Enum:       lambda value: value.name,
         UUID:       lambda value: str(value)
     })
 
     decoders: dict[Type, Callable[[Type, Any], Any]] = field(default_factory=lambda: {
-        datetime:   lambda       _, value: datetime.fromisoformat((value[0:26] + value[26 + 1:]).replace("Z", "+00:00")),
+        datetime:   lambda       _, value: _decode_datetime(value),
         timedelta:  lambda       _, value: _decode_timedelta(value),
         Enum:       lambda typeCls, value: cast(Type[Enum], typeCls)[value],
         UUID:       lambda       _, value: UUID(value)
     })
 
+    json_backend: str = "stdlib"
+    """
+    The JSON backend to parse and serialize JSON: "stdlib", "orjson", "msgspec" or "auto" (fastest installed
+    backend). Falls back to "stdlib" if the requested package is not installed.
+    """
+
+    lazy_decode: bool = False
+    """
+    Decode dataclasses into lazy views. A view is an instance of a subclass of the dataclass which keeps the
+    parsed JSON and decodes each field on first access.
+    """
+
+    raw_decode: bool = False
+    """
+    Decode dataclasses into plain dicts with the property names converted by property_name_decoder. All other
+    values (e.g. datetime, UUID or enum values) are returned as parsed from JSON.
+    """
+
+    single_pass_writer: bool = False
+    """
+    Let encode_to_bytes write the JSON in a single pass, i.e. without building the intermediate tree returned by
+    encode, when the stdlib backend is used. This lowers the peak memory of large payloads to about the size of the
+    output but is usually slower than the tree and the C implementation of json.dumps.
+    """
+
+    _json_backend: JsonBackend = field(init=False, repr=False, compare=False)
+    _decoder_cache: dict[Any, Callable[[Any], Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _decoder_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+    _pending_decoders: dict[Any, Callable[[Any], Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _encoder_cache: dict[Type, Callable[[Any], Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _writer_cache: dict[Type, _JsonWriter] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_json_backend", get_json_backend(self.json_backend))
+
 class JsonEncoder:
 
     @staticmethod
     def encode(value: Any, options: Optional[JsonEncoderOptions] = None) -> Any:
-        options = options if options is not None else JsonEncoderOptions()
+        options = options if options is not None else _default_options
         value = JsonEncoder._try_encode(value, options)         
 
         return value
 
     @staticmethod
-    def _try_encode(value: Any, options: JsonEncoderOptions) -> Any:
+    def encode_to_bytes(value: Any, options: Optional[JsonEncoderOptions] = None) -> bytes:
+        """
+        Encodes the value and serializes it into UTF-8 encoded JSON using the configured JSON backend. If
+        single_pass_writer is enabled, the stdlib backend writes the JSON without building the intermediate tree
+        returned by encode and the output is identical to json.dumps(encode(value)).
+        """
+        options = options if options is not None else _default_options
+        backend = options._json_backend
+
+        if not options.single_pass_writer or backend.name != "stdlib":
+            return backend.dumps(JsonEncoder._try_encode(value, options))
+
+        # the output is ASCII only, so it is encoded in small chunks and the bytes buffer is the only full copy
+        buffer = io.BytesIO()
+        text_buffer = io.TextIOWrapper(buffer, encoding="ascii")
+
+        JsonEncoder.get_writer(value.__class__, options)(value, text_buffer.write)
+
+        text_buffer.flush()
+        result = buffer.getvalue()
+        text_buffer.detach()
+
+        return result
+
+    @staticmethod
+    def parse(data: Union[bytes, str], options: Optional[JsonEncoderOptions] = None) -> Any:
+        """Parses JSON data using the configured JSON backend."""
+        options = options if options is not None else _default_options
+        return options._json_backend.loads(data)
+
+    @staticmethod
+    def get_encoder(typeCls: Type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
+        """
+        Returns the encoder for instances of the specified class. The encoder is compiled when the
+        class is seen for the first time and is then cached in the options. Custom encoders must therefore
+        be registered before the first call.
+        """
+
+        encoder = options._encoder_cache.get(typeCls)
+
+        if encoder is None:
+            encoder = JsonEncoder._compile_encoder(typeCls, options)
+            options._encoder_cache[typeCls] = encoder
+
+        return encoder
+
+    @staticmethod
+    def _compile_encoder(typeCls: Type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
 
         # None
-        if value is None:
-            return None
+        if typeCls is type(None):
+            return _encode_identity
 
         # list/tuple
-        elif isinstance(value, list) or isinstance(value, tuple):
-            value = [JsonEncoder._try_encode(current, options) for current in value]
-        
+        elif issubclass(typeCls, list) or issubclass(typeCls, tuple):
+            return _compile_list_encoder(options)
+
         # dict
-        elif isinstance(value, dict):
-            # also encode key, it could be a UUID
-            value = {JsonEncoder._try_encode(key, options):JsonEncoder._try_encode(current_value, options) for key, current_value in value.items()}
+        elif issubclass(typeCls, dict):
+            return _compile_dict_encoder(options)
+
+        # dataclass with generated serializer
+        elif hasattr(typeCls, "_to_json"):
+            return _encode_to_json
 
-        elif dataclasses.is_dataclass(value):
-            # dataclasses.asdict(value) would be good choice here, but it also converts nested dataclasses into
-            # dicts, which prevents us to distinct between dict and dataclasses (important for property_name_encoder)
-            value = {options.property_name_encoder(key):JsonEncoder._try_encode(value, options) for key, value in value.__dict__.items()}
+        elif dataclasses.is_dataclass(typeCls):
+            return _compile_dataclass_encoder(typeCls, options)
 
         # registered encoders
-        else:
-            for base in value.__class__.__mro__[:-1]:
-                encoder = options.encoders.get(base)
+        for base in typeCls.__mro__[:-1]:
+            encoder = options.encoders.get(base)
 
-                if encoder is not None:
-                    return encoder(value)
+            if encoder is not None:
+                return encoder
 
-        return value
+        return _encode_identity
+
+    @staticmethod
+    def get_writer(typeCls: Type, options: JsonEncoderOptions) -> _JsonWriter:
+        """
+        Returns the JSON writer for instances of the specified class. The writer is compiled when the
+        class is seen for the first time and is then cached in the options. Custom encoders must therefore
+        be registered before the first call.
+        """
+
+        writer = options._writer_cache.get(typeCls)
+
+        if writer is None:
+            writer = JsonEncoder._compile_writer(typeCls, options)
+            options._writer_cache[typeCls] = writer
+
+        return writer
+
+    @staticmethod
+    def _compile_writer(typeCls: Type, options: JsonEncoderOptions) -> _JsonWriter:
+
+        # None
+        if typeCls is type(None):
+            return _write_none
+
+        # list/tuple
+        elif issubclass(typeCls, list) or issubclass(typeCls, tuple):
+            return _compile_list_writer(options)
+
+        # dict
+        elif issubclass(typeCls, dict):
+            return _compile_dict_writer(options)
+
+        # dataclass with generated serializer
+        elif hasattr(typeCls, "_to_json"):
+            return _write_to_json
+
+        elif dataclasses.is_dataclass(typeCls):
+            return _compile_dataclass_writer(typeCls, options)
+
+        # registered encoders
+        for base in typeCls.__mro__[:-1]:
+            encoder = options.encoders.get(base)
+
+            if encoder is not None:
+                return _compile_registered_writer(encoder, options)
+
+        # JSON primitives
+        if issubclass(typeCls, str):
+            return _write_str
+
+        elif issubclass(typeCls, bool):
+            return _write_bool
+
+        elif issubclass(typeCls, int):
+            return _write_int
+
+        elif issubclass(typeCls, float):
+            return _write_float
+
+        raise TypeError(f"Object of type {typeCls.__name__} is not JSON serializable")
+
+    @staticmethod
+    def _try_encode(value: Any, options: JsonEncoderOptions) -> Any:
+        return JsonEncoder.get_encoder(value.__class__, options)(value)
 
     @staticmethod
     def decode(type: Type[T], data: Any, options: Optional[JsonEncoderOptions] = None) -> T:
-        options = options if options is not None else JsonEncoderOptions()
-        return JsonEncoder._decode(type, data, options)
+        options = options if options is not None else _default_options
+        return JsonEncoder.get_decoder(type, options)(data)
 
     @staticmethod
-    def _decode(typeCls: Type[T], data: Any, options: JsonEncoderOptions) -> T:
-       
-        if data is None:
-            return cast(T, None)
+    def get_decoder(typeCls: Type[T], options: JsonEncoderOptions) -> Callable[[Any], T]:
+        """
+        Returns the decoder for the specified type. The decoder is compiled when the type is seen
+        for the first time and is then cached in the options. Custom decoders must therefore be
+        registered before the first call.
+        """
+
+        decoder = options._decoder_cache.get(typeCls)
+
+        if decoder is not None:
+            return decoder
+
+        # decoders of dataclasses are registered as pending before their fields are compiled to support recursive
+        # types, so they are published to other threads only after the outermost compilation is complete
+        with options._decoder_lock:
+
+            pending_decoders = options._pending_decoders
+            decoder = options._decoder_cache.get(typeCls) or pending_decoders.get(typeCls)
+
+            if decoder is not None:
+                return decoder
+
+            is_outermost = len(pending_decoders) == 0
+
+            try:
+                decoder = JsonEncoder._compile_decoder(typeCls, options)
+                pending_decoders[typeCls] = decoder
+
+                if is_outermost:
+                    options._decoder_cache.update(pending_decoders)
+
+            finally:
+                if is_outermost:
+                    pending_decoders.clear()
+
+        return decoder
+
+    @staticmethod
+    def _compile_decoder(typeCls: Type[T], options: JsonEncoderOptions) -> Callable[[Any], T]:
 
         if typeCls == Any:
-            return data
+            return _decode_identity
+
+        if options.raw_decode:
+            return JsonEncoder._compile_raw_decoder(typeCls, options)
 
         origin = typing.get_origin(typeCls)
         args = typing.get_args(typeCls)
@@ -91,82 +364,770 @@ class JsonEncoder:
 
             # Optional
             if origin is Union and type(None) in args:
-
-                baseType = args[0]
-                instance3 = JsonEncoder._decode(baseType, data, options)
-
-                return cast(T, instance3)
+                # all decoders pass None through
+                return JsonEncoder.get_decoder(args[0], options)
 
             # list
             elif issubclass(cast(type, origin), list):
+                return _compile_list_decoder(JsonEncoder.get_decoder(args[0], options))
 
-                listType = args[0]
-                instance1: list = list()
-
-                for value in data:
-                    instance1.append(JsonEncoder._decode(listType, value, options))
-
-                return cast(T, instance1)
-            
             # dict
             elif issubclass(cast(type, origin), dict):
+                # also decode key, it could be a UUID
+                return _compile_dict_decoder(
+                    JsonEncoder.get_decoder(args[0], options),
+                    JsonEncoder.get_decoder(args[1], options))
+
+            # default
+            else:
+                raise Exception(f"Type {str(origin)} cannot be decoded.")
+
+        # lazy dataclass view
+        elif options.lazy_decode and dataclasses.is_dataclass(typeCls):
+            return _compile_lazy_dataclass_decoder(cast(type, typeCls), options)
 
-                keyType = args[0]
-                valueType = args[1]
+        # dataclass with generated deserializer
+        elif hasattr(typeCls, "_from_json"):
+            return _compile_from_json_decoder(getattr(typeCls, "_from_json"))
+
+        # dataclass
+        elif dataclasses.is_dataclass(typeCls):
+            return _compile_dataclass_decoder(typeCls, options)
 
-                instance2: dict = dict()
+        # registered decoders
+        for base in typeCls.__mro__[:-1]:
+            decoder = options.decoders.get(base)
 
-                for key, value in data.items():
-                    # also decode key, it could be a UUID
-                    instance2[JsonEncoder._decode(keyType, key, options)] = JsonEncoder._decode(valueType, value, options)
+            if decoder is not None:
+                return _compile_registered_decoder(typeCls, decoder)
 
-                return cast(T, instance2)
+        # default
+        return _decode_identity
+
+    @staticmethod
+    def _compile_raw_decoder(typeCls: Type[T], options: JsonEncoderOptions) -> Callable[[Any], T]:
+
+        origin = typing.get_origin(typeCls)
+        args = typing.get_args(typeCls)
+
+        if origin is not None:
+
+            # Optional
+            if origin is Union and type(None) in args:
+                return JsonEncoder.get_decoder(args[0], options)
+
+            # list
+            elif issubclass(cast(type, origin), list):
+                item_decoder = JsonEncoder.get_decoder(args[0], options)
+
+                return _decode_identity \
+                    if item_decoder is _decode_identity \
+                    else _compile_list_decoder(item_decoder)
+
+            # dict (the keys are data, not property names)
+            elif issubclass(cast(type, origin), dict):
+                value_decoder = JsonEncoder.get_decoder(args[1], options)
+
+                return _decode_identity \
+                    if value_decoder is _decode_identity \
+                    else _compile_dict_decoder(_decode_identity, value_decoder)
 
             # default
             else:
                 raise Exception(f"Type {str(origin)} cannot be decoded.")
-        
+
         # dataclass
         elif dataclasses.is_dataclass(typeCls):
+            return _compile_raw_dataclass_decoder(cast(type, typeCls), options)
 
-            parameters = {}
-            type_hints = typing.get_type_hints(typeCls)
+        # default
+        return _decode_identity
 
-            for key, value in data.items():
+class JsonArrayReader:
+    """
+    Incrementally parses a JSON array from chunks of UTF-8 encoded bytes and returns the array items as soon as
+    they are complete. Items which span several chunks are scanned incrementally (only the nesting depth and the strings
+    are tracked) and parsed once when they are complete, so only the current item is buffered.
+    """
+
+    _BEFORE_ARRAY = 0
+    _BEFORE_FIRST_ITEM = 1
+    _BEFORE_ITEM = 2
+    _IN_ITEM = 3
+    _AFTER_ITEM = 4
+    _AFTER_ARRAY = 5
+
+    def __init__(self):
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._state = JsonArrayReader._BEFORE_ARRAY
+
+        # the state of the current item
+        self._item_parts: list[str] = []
+        self._is_literal = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Parses the next chunk and returns the items that have been completed by it.
 
-                key = options.property_name_decoder(key)
-                parameter_type = cast(Type, type_hints.get(key))
-                
-                if (parameter_type is not None):
-                    value = JsonEncoder._decode(parameter_type, value, options)
-                    parameters[key] = value
+        Args:
+            chunk: The next chunk of the JSON array.
+        """
+        return self._parse(self._text_decoder.decode(chunk))
 
-            # ensure default values if JSON does not serialize default fields
-            for key, value in type_hints.items():
-                if not key in parameters and not typing.get_origin(value) == ClassVar:
-                    
-                    if (value == int):
-                        parameters[key] = 0
+    def close(self) -> list[Any]:
+        """
+        Parses the remaining input and returns the last items. Raises an exception if the JSON array is incomplete.
+        """
+        items = self._parse(self._text_decoder.decode(b"", final=True))
 
-                    elif (value == float):
-                        parameters[key] = 0.0
+        if self._state != JsonArrayReader._AFTER_ARRAY:
+            raise ValueError("The JSON array is incomplete.")
+
+        return items
+
+    def _parse(self, text: str) -> list[Any]:
+
+        items: list[Any] = []
+        length = len(text)
+        position = 0
+
+        while position < length:
+
+            state = self._state
+
+            if state == JsonArrayReader._IN_ITEM:
+
+                end = self._find_item_end(text, position)
+
+                if end < 0:
+                    self._item_parts.append(text[position:])
+                    break
+
+                self._item_parts.append(text[position:end])
+                item_text = "".join(self._item_parts)
+                self._item_parts.clear()
+
+                # a syntax error within the item is raised as soon as the item is complete
+                items.append(json.loads(item_text))
+                self._state = JsonArrayReader._AFTER_ITEM
+                position = end
+                continue
+
+            match = _non_whitespace_pattern.search(text, position)
+
+            if match is None:
+                break
+
+            position = match.start()
+            character = text[position]
+
+            if state == JsonArrayReader._BEFORE_ITEM or state == JsonArrayReader._BEFORE_FIRST_ITEM:
+
+                if state == JsonArrayReader._BEFORE_FIRST_ITEM and character == "]":
+                    self._state = JsonArrayReader._AFTER_ARRAY
+                    position += 1
+
+                elif character in '[{"-0123456789tfn':
+
+                    # fast path: the item is complete within this chunk
+                    try:
+                        item, end = self._raw_decode(text, position)
+
+                    except json.JSONDecodeError:
+                        item, end = None, length
+
+                    # accept the item only once a delimiter follows it because a number might continue in the next chunk
+                    if end < length and (character in '[{"' or text[end] in " \t\n\r,]"):
+                        items.append(item)
+                        self._state = JsonArrayReader._AFTER_ITEM
+                        position = end
 
                     else:
-                        parameters[key] = None
-              
-            instance = cast(T, typeCls(**parameters))
+                        self._start_item(is_literal=character not in '[{"')
 
-            return instance
+                else:
+                    raise ValueError(f"Unexpected character '{character}' in the JSON array.")
 
-        # registered decoders
-        for base in typeCls.__mro__[:-1]:
-            decoder = options.decoders.get(base)
+            elif state == JsonArrayReader._AFTER_ITEM and character == ",":
+                self._state = JsonArrayReader._BEFORE_ITEM
+                position += 1
 
-            if decoder is not None:
-                return decoder(typeCls, data)
+            elif state == JsonArrayReader._AFTER_ITEM and character == "]":
+                self._state = JsonArrayReader._AFTER_ARRAY
+                position += 1
 
-        # default
-        return data
+            elif state == JsonArrayReader._BEFORE_ARRAY and character == "[":
+                self._state = JsonArrayReader._BEFORE_FIRST_ITEM
+                position += 1
+
+            else:
+                raise ValueError(f"Unexpected character '{character}' in the JSON array.")
+
+        return items
+
+    def _start_item(self, is_literal: bool) -> None:
+        self._state = JsonArrayReader._IN_ITEM
+        self._is_literal = is_literal
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _find_item_end(self, text: str, position: int) -> int:
+        """Returns the end of the current item in the text or -1 if the item continues in the next chunk."""
+
+        # a number, true, false or null ends with the next delimiter
+        if self._is_literal:
+            match = _literal_end_pattern.search(text, position)
+            return -1 if match is None else match.start()
+
+        # a string, array or object ends with its closing quote or bracket
+        length = len(text)
+
+        while position < length:
+
+            if self._escape:
+                self._escape = False
+                position += 1
+
+            elif self._in_string:
+
+                # skip to the closing quote or to the end of the chunk
+                position = cast(re.Match[str], _string_content_pattern.match(text, position)).end()
+
+                if position == length:
+                    return -1
+
+                # the escaped character is in the next chunk
+                if text[position] == "\\":
+                    self._escape = True
+                    return -1
+
+                self._in_string = False
+                position += 1
+
+                if self._depth == 0:
+                    return position
+
+            elif self._depth == 0:
+
+                # the opening quote or bracket of the item
+                if text[position] == '"':
+                    self._in_string = True
+
+                else:
+                    self._depth = 1
+
+                position += 1
+
+            else:
+
+                # skip the content of the array or object up to the next bracket or incomplete string
+                position = cast(re.Match[str], _container_content_pattern.match(text, position)).end()
+
+                if position == length:
+                    return -1
+
+                character = text[position]
+                position += 1
+
+                # a string which continues in the next chunk
+                if character == '"':
+                    self._in_string = True
+
+                elif character == "[" or character == "{":
+                    self._depth += 1
+
+                else:
+                    self._depth -= 1
+
+                    if self._depth == 0:
+                        return position
+
+        return -1
+
+def _decode_identity(data: Any) -> Any:
+    return data
+
+def _compile_list_decoder(item_decoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+
+    if item_decoder is _decode_identity:
+
+        def decode_list(data: Any) -> Any:
+            return None if data is None else list(data)
+
+    else:
+
+        def decode_list(data: Any) -> Any:
+            return None if data is None else [item_decoder(value) for value in data]
+
+    return decode_list
+
+def _compile_dict_decoder(key_decoder: Callable[[Any], Any], value_decoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+
+    def decode_dict(data: Any) -> Any:
+
+        if data is None:
+            return None
+
+        return {key_decoder(key): value_decoder(value) for key, value in data.items()}
+
+    return decode_dict
+
+def _compile_registered_decoder(typeCls: Type, decoder: Callable[[Type, Any], Any]) -> Callable[[Any], Any]:
+
+    def decode_registered(data: Any) -> Any:
+        return None if data is None else decoder(typeCls, data)
+
+    return decode_registered
+
+def _compile_from_json_decoder(from_json: Callable[[Any], Any]) -> Callable[[Any], Any]:
+
+    def decode_from_json(data: Any) -> Any:
+        return None if data is None else from_json(data)
+
+    return decode_from_json
+
+def _compile_dataclass_decoder(typeCls: Type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    field_decoders: dict[str, Callable[[Any], Any]] = {}
+    defaults: dict[str, Any] = {}
+
+    # JSON property name -> (field name, field decoder) or None if there is no such field (the decoder is published
+    # only after field_decoders is complete, so a miss is final)
+    property_map: dict[str, Optional[tuple[str, Callable[[Any], Any]]]] = {}
+
+    def decode_dataclass(data: Any) -> Any:
+
+        if data is None:
+            return None
+
+        parameters = defaults.copy()
+
+        for key, value in data.items():
+
+            try:
+                entry = property_map[key]
+
+            except KeyError:
+                name = options.property_name_decoder(key)
+                field_decoder = field_decoders.get(name)
+                entry = None if field_decoder is None else (name, field_decoder)
+                property_map[key] = entry
+
+            if entry is not None:
+                parameters[entry[0]] = entry[1](value)
+
+        return typeCls(**parameters)
+
+    # register before compiling the fields to support recursive types
+    options._pending_decoders[typeCls] = decode_dataclass
+
+    for name, hint in typing.get_type_hints(typeCls).items():
+
+        if typing.get_origin(hint) == ClassVar:
+            continue
+
+        field_decoders[name] = JsonEncoder.get_decoder(hint, options)
+
+        # ensure default values if JSON does not serialize default fields
+        if (hint == int):
+            defaults[name] = 0
+
+        elif (hint == float):
+            defaults[name] = 0.0
+
+        else:
+            defaults[name] = None
+
+    return decode_dataclass
+
+def _compile_raw_dataclass_decoder(typeCls: type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    field_decoders: dict[str, Callable[[Any], Any]] = {}
+
+    # JSON property name -> (converted property name, field decoder)
+    property_map: dict[str, tuple[str, Callable[[Any], Any]]] = {}
+
+    def decode_raw_dataclass(data: Any) -> Any:
+
+        if data is None:
+            return None
+
+        result = {}
+
+        for key, value in data.items():
+
+            try:
+                name, field_decoder = property_map[key]
+
+            except KeyError:
+                name = options.property_name_decoder(key)
+                field_decoder = field_decoders.get(name, _decode_identity)
+                property_map[key] = (name, field_decoder)
+
+            result[name] = field_decoder(value)
+
+        return result
+
+    # register before compiling the fields to support recursive types
+    options._pending_decoders[typeCls] = decode_raw_dataclass
+
+    for name, hint in typing.get_type_hints(typeCls).items():
+
+        if typing.get_origin(hint) == ClassVar:
+            continue
+
+        field_decoders[name] = JsonEncoder.get_decoder(hint, options)
+
+    return decode_raw_dataclass
+
+# marks JSON values which are missing or have already been decoded
+_MISSING = object()
+
+class _LazyField:
+    """Decodes a field of a lazy dataclass view on first access and stores the result in the view. Concurrent first accesses may decode the field twice but return the same value."""
+
+    def __init__(self, name: str, default: Any, get_values: Callable[[Any], dict[str, Any]]):
+        self.name = name
+        self.default = default
+        self.get_values = get_values
+        self.decoder: Callable[[Any], Any] = _decode_identity
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+
+        if instance is None:
+            return self
+
+        name = self.name
+        state = instance.__dict__
+        values = self.get_values(instance)
+        json_value = values.get(name, _MISSING)
+
+        # another thread has stored the value in the meantime or the JSON value is missing
+        if json_value is _MISSING:
+            return state.setdefault(name, self.default)
+
+        # the instance value takes precedence over this non-data descriptor from now on
+        value = state.setdefault(name, self.decoder(json_value))
+
+        # release the JSON value after storing the decoded value
+        values.pop(name, None)
+
+        return value
+
+def _compile_lazy_dataclass_decoder(typeCls: type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    lazy_fields: dict[str, _LazyField] = {}
+
+    # JSON property name -> field name or None if there is no such field
+    property_map: dict[str, Optional[str]] = {}
+
+    def get_values(view: Any) -> dict[str, Any]:
+
+        state = view.__dict__
+        values = state.get("_lazy_values")
+
+        # map the JSON properties to fields on first access
+        if values is None:
+
+            data = state.get("_lazy_data")
+
+            # another thread has mapped the JSON properties in the meantime
+            if data is None:
+                return state["_lazy_values"]
+
+            values = {}
+
+            for key, value in data.items():
+
+                try:
+                    name = property_map[key]
+
+                except KeyError:
+                    name = options.property_name_decoder(key)
+                    name = name if name in lazy_fields else None
+                    property_map[key] = name
+
+                if name is not None:
+                    values[name] = value
+
+            # the values of the first thread win, the JSON data is released only afterwards
+            values = state.setdefault("_lazy_values", values)
+            state.pop("_lazy_data", None)
+
+        return values
+
+    compare_names = [field.name for field in dataclasses.fields(typeCls) if field.compare]
+    init_names = [field.name for field in dataclasses.fields(typeCls) if field.init]
+
+    # views are equal to instances of the dataclass
+    def __eq__(self: Any, other: Any) -> Any:
+
+        if other.__class__ is not view_type and other.__class__ is not typeCls:
+            return NotImplemented
+
+        return tuple(getattr(self, name) for name in compare_names) == tuple(getattr(other, name) for name in compare_names)
+
+    # views are pickled as instances of the dataclass
+    def __reduce__(self: Any) -> Any:
+        return (typeCls, tuple(getattr(self, name) for name in init_names))
+
+    hints = {name: hint for name, hint in typing.get_type_hints(typeCls).items() if typing.get_origin(hint) != ClassVar}
+
+    for name, hint in hints.items():
+
+        # ensure default values if JSON does not serialize default fields
+        if (hint == int):
+            default = 0
+
+        elif (hint == float):
+            default = 0.0
+
+        else:
+            default = None
+
+        lazy_fields[name] = _LazyField(name, default, get_values)
+
+    # a subclass of a slotted dataclass has a __dict__ as well
+    view_type = type(typeCls.__name__, (typeCls,), {
+        "__qualname__": typeCls.__qualname__,
+        "__module__": typeCls.__module__,
+        "__eq__": __eq__,
+        "__hash__": typeCls.__hash__,
+        "__reduce__": __reduce__,
+        **lazy_fields
+    })
+
+    def decode_lazy_dataclass(data: Any) -> Any:
+
+        if data is None:
+            return None
+
+        view = object.__new__(view_type)
+        view.__dict__["_lazy_data"] = data
+
+        return view
+
+    # register before compiling the fields to support recursive types
+    options._pending_decoders[typeCls] = decode_lazy_dataclass
+
+    for name, hint in hints.items():
+        lazy_fields[name].decoder = JsonEncoder.get_decoder(hint, options)
+
+    return decode_lazy_dataclass
+
+def _encode_identity(value: Any) -> Any:
+    return value
+
+def _encode_to_json(value: Any) -> Any:
+    return value._to_json()
+
+def _compile_list_encoder(options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    encoders = options._encoder_cache
+
+    def encode_list(value: Any) -> Any:
+        return [(encoders.get(item.__class__) or JsonEncoder.get_encoder(item.__class__, options))(item) for item in value]
+
+    return encode_list
+
+def _compile_dict_encoder(options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    encoders = options._encoder_cache
+
+    def encode_dict(value: Any) -> Any:
+        # also encode key, it could be a UUID
+        return {
+            (encoders.get(key.__class__) or JsonEncoder.get_encoder(key.__class__, options))(key):
+            (encoders.get(item.__class__) or JsonEncoder.get_encoder(item.__class__, options))(item)
+            for key, item in value.items()
+        }
+
+    return encode_dict
+
+def _compile_dataclass_encoder(typeCls: Type, options: JsonEncoderOptions) -> Callable[[Any], Any]:
+
+    encoders = options._encoder_cache
+
+    # dataclasses.asdict(value) would be good choice here, but it also converts nested dataclasses into
+    # dicts, which prevents us to distinct between dict and dataclasses (important for property_name_encoder)
+    entries = [(options.property_name_encoder(current.name), current.name) for current in dataclasses.fields(typeCls)]
+
+    def encode_dataclass(value: Any) -> Any:
+
+        result = {}
+
+        for key, name in entries:
+            item = getattr(value, name)
+            result[key] = (encoders.get(item.__class__) or JsonEncoder.get_encoder(item.__class__, options))(item)
+
+        return result
+
+    return encode_dataclass
+
+def _write_none(_: Any, write: Callable[[str], Any]) -> None:
+    write("null")
+
+def _write_str(value: Any, write: Callable[[str], Any]) -> None:
+    write(_encode_json_string(value))
+
+def _write_bool(value: Any, write: Callable[[str], Any]) -> None:
+    write("true" if value else "false")
+
+def _write_int(value: Any, write: Callable[[str], Any]) -> None:
+    write(int.__repr__(value))
+
+def _write_float(value: Any, write: Callable[[str], Any]) -> None:
+    write(_encode_json_float(value))
+
+def _encode_json_float(value: float) -> str:
+
+    # same as json.dumps
+    if value != value:
+        return "NaN"
+
+    elif value == _infinity:
+        return "Infinity"
+
+    elif value == -_infinity:
+        return "-Infinity"
+
+    return float.__repr__(value)
+
+def _write_to_json(value: Any, write: Callable[[str], Any]) -> None:
+    # the generated serializer only returns JSON primitives, lists and dicts
+    write(json.dumps(value._to_json()))
+
+def _compile_list_writer(options: JsonEncoderOptions) -> _JsonWriter:
+
+    writers = options._writer_cache
+
+    def write_list(value: Any, write: Callable[[str], Any]) -> None:
+
+        separator = "["
+
+        for item in value:
+            write(separator)
+            (writers.get(item.__class__) or JsonEncoder.get_writer(item.__class__, options))(item, write)
+            separator = ", "
+
+        write("]" if separator == ", " else "[]")
+
+    return write_list
+
+def _compile_dict_writer(options: JsonEncoderOptions) -> _JsonWriter:
+
+    writers = options._writer_cache
+
+    def write_dict(value: Any, write: Callable[[str], Any]) -> None:
+
+        separator = "{"
+
+        for key, item in value.items():
+            write(separator)
+            write(_encode_json_key(key, options))
+            write(": ")
+            (writers.get(item.__class__) or JsonEncoder.get_writer(item.__class__, options))(item, write)
+            separator = ", "
+
+        write("}" if separator == ", " else "{}")
+
+    return write_dict
+
+def _encode_json_key(key: Any, options: JsonEncoderOptions) -> str:
+
+    # also encode key, it could be a UUID
+    if key.__class__ is not str:
+        key = JsonEncoder._try_encode(key, options)
+
+    # same key conversion rules as json.dumps
+    if isinstance(key, str):
+        return _encode_json_string(key)
+
+    elif key is True:
+        return '"true"'
+
+    elif key is False:
+        return '"false"'
+
+    elif key is None:
+        return '"null"'
+
+    elif isinstance(key, int):
+        return f'"{int.__repr__(key)}"'
+
+    elif isinstance(key, float):
+        return f'"{_encode_json_float(key)}"'
+
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+def _compile_dataclass_writer(typeCls: Type, options: JsonEncoderOptions) -> _JsonWriter:
+
+    writers = options._writer_cache
+    entries: list[tuple[str, str]] = []
+
+    for current in dataclasses.fields(typeCls):
+        separator = "{" if len(entries) == 0 else ", "
+        prefix = f"{separator}{_encode_json_string(options.property_name_encoder(current.name))}: "
+        entries.append((prefix, current.name))
+
+    if len(entries) == 0:
+
+        def write_empty_dataclass(_: Any, write: Callable[[str], Any]) -> None:
+            write("{}")
+
+        return write_empty_dataclass
+
+    def write_dataclass(value: Any, write: Callable[[str], Any]) -> None:
+
+        for prefix, name in entries:
+            write(prefix)
+            item = getattr(value, name)
+            (writers.get(item.__class__) or JsonEncoder.get_writer(item.__class__, options))(item, write)
+
+        write("}")
+
+    return write_dataclass
+
+def _compile_registered_writer(encoder: Callable[[Any], Any], options: JsonEncoderOptions) -> _JsonWriter:
+
+    writers = options._writer_cache
+
+    def write_registered(value: Any, write: Callable[[str], Any]) -> None:
+        encoded = encoder(value)
+        (writers.get(encoded.__class__) or JsonEncoder.get_writer(encoded.__class__, options))(encoded, write)
+
+    return write_registered
+
+_encode_json_string = json.encoder.encode_basestring_ascii
+_infinity = float("inf")
+_non_whitespace_pattern = re.compile(r"[^ \t\n\r]")
+_literal_end_pattern = re.compile(r"[ \t\n\r,\]]")
+_string_content_pattern = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# text and complete strings as well as complete arrays and objects which contain no further arrays or objects
+_container_content_pattern = re.compile(r"""
+    [^"\[\]{}]*
+    (?:
+        (?:
+            "[^"\\]*(?:\\.[^"\\]*)*"
+            |
+            [\[{] [^"\[\]{}]* (?:"[^"\\]*(?:\\.[^"\\]*)*" [^"\[\]{}]*)* [\]}]
+        )
+        [^"\[\]{}]*
+    )*
+""", re.DOTALL | re.VERBOSE)
+_default_options = JsonEncoderOptions()
+
+def _encode_datetime(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+def _decode_datetime(value: str) -> datetime:
+    return datetime.fromisoformat((value[0:26] + value[26 + 1:]).replace("Z", "+00:00"))
 
 # timespan is always serialized with 7 subsecond digits (https://github.com/dotnet/runtime/blob/a6cb7705bd5317ab5e9f718b55a82444156fc0c8/src/libraries/System.Text.Json/tests/System.Text.Json.Tests/Serialization/Value.WriteTests.cs#L178-L189)
 def _encode_timedelta(value: timedelta):
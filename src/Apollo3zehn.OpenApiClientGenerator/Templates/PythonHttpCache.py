@@ -0,0 +1,359 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+@dataclass
+class HttpCacheEntry:
+    """A cached response."""
+
+    content: bytes
+    """The response body."""
+
+    expires: float
+    """The time (seconds since the epoch) until which the response is fresh."""
+
+    etag: Optional[str]
+    """The value of the ETag header."""
+
+    last_modified: Optional[str]
+    """The value of the Last-Modified header."""
+
+    decoded: dict[Any, Any] = field(default_factory=dict)
+    """The decoded objects of the response body, keyed by the type and the decoding mode. These are not persisted."""
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires
+
+class HttpCache(ABC):
+    """Caches the responses of GET requests. Fresh responses are returned without a request, stale responses are revalidated with the ETag and Last-Modified validators."""
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initializes a new instance of the HttpCache.
+
+        Args:
+            max_size: The maximum number of bytes of cached response bodies.
+            ttl: The lifetime in seconds of responses without Cache-Control max-age or Expires header. Only suitable if the GET resources of the server do not change within this lifetime, i.e. not for polled resources like a job status.
+        """
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of requests which have been answered by fresh responses."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of requests which have not been found in the cache."""
+        return self._misses
+
+    @property
+    def revalidations(self) -> int:
+        """The number of stale responses which have been confirmed by the server (304 Not Modified)."""
+        return self._revalidations
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[HttpCacheEntry]:
+        """Returns the cached response or None."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: HttpCacheEntry) -> None:
+        """Stores the response and evicts the least recently used responses if the cache grows beyond its maximum size."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        ...
+
+    def _lookup(self, key: str) -> Optional[HttpCacheEntry]:
+        """Returns the cached response and counts a hit if it is fresh."""
+
+        entry = self.get(key)
+
+        if entry is not None and entry.is_fresh():
+
+            with self._lock:
+                self._hits += 1
+
+        return entry
+
+    def _store(self, key: str, headers: Any, content: bytes) -> Optional[HttpCacheEntry]:
+        """Counts a miss and stores the response unless it must not be stored."""
+
+        with self._lock:
+            self._misses += 1
+
+        directives = _parse_cache_control(headers.get("Cache-Control"))
+
+        if "no-store" in directives:
+            return None
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        lifetime = self._get_lifetime(headers, directives)
+
+        # responses which are neither fresh nor can be revalidated are useless
+        if lifetime <= 0 and etag is None and last_modified is None:
+            return None
+
+        entry = HttpCacheEntry(content, time.time() + lifetime, etag, last_modified)
+        self.set(key, entry)
+
+        return entry
+
+    def _revalidate(self, key: str, entry: HttpCacheEntry, headers: Any) -> None:
+        """Counts a revalidation and updates the lifetime of the response after a 304 Not Modified response."""
+
+        with self._lock:
+            self._revalidations += 1
+
+        directives = _parse_cache_control(headers.get("Cache-Control"))
+        entry.expires = time.time() + self._get_lifetime(headers, directives)
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+
+        self.set(key, entry)
+
+    def _get_lifetime(self, headers: Any, directives: dict[str, Optional[str]]) -> float:
+
+        if "no-cache" in directives:
+            return 0
+
+        max_age = directives.get("max-age")
+
+        if max_age is not None:
+
+            try:
+                return float(max_age)
+
+            except ValueError:
+                return 0
+
+        expires = headers.get("Expires")
+
+        if expires is not None:
+
+            try:
+                return parsedate_to_datetime(expires).timestamp() - time.time()
+
+            # an invalid date means "already expired"
+            except (TypeError, ValueError):
+                return 0
+
+        return self._ttl
+
+class MemoryHttpCache(HttpCache):
+    """Caches the responses and their decoded objects in memory."""
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024, ttl: float = 0):
+        """
+        Initializes a new instance of the MemoryHttpCache.
+
+        Args:
+            max_size: The maximum number of bytes of cached response bodies.
+            ttl: The lifetime in seconds of responses without Cache-Control max-age or Expires header. Only suitable if the GET resources of the server do not change within this lifetime, i.e. not for polled resources like a job status.
+        """
+
+        super().__init__(max_size, ttl)
+
+        self._entries: OrderedDict[str, HttpCacheEntry] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[HttpCacheEntry]:
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: HttpCacheEntry) -> None:
+
+        with self._lock:
+
+            previous_entry = self._entries.pop(key, None)
+
+            if previous_entry is not None:
+                self._size -= previous_entry.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while self._size > self._max_size and self._entries:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._size -= evicted_entry.size
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+class DiskHttpCache(HttpCache):
+    """
+    Caches the responses on disk so that they survive the process. The files are named after a digest of the key, the
+    key itself is not stored. Decoded objects are not persisted, but those of the most recently used responses are
+    kept in memory.
+    """
+
+    def __init__(self, folder: str, max_size: int = 1024 * 1024 * 1024, ttl: float = 0, max_decoded_count: int = 256):
+        """
+        Initializes a new instance of the DiskHttpCache.
+
+        Args:
+            folder: The folder where the responses are stored. Existing responses in this folder are reused.
+            max_size: The maximum number of bytes of the cache files.
+            ttl: The lifetime in seconds of responses without Cache-Control max-age or Expires header. Only suitable if the GET resources of the server do not change within this lifetime, i.e. not for polled resources like a job status.
+            max_decoded_count: The maximum number of responses whose decoded objects are kept in memory.
+        """
+
+        super().__init__(max_size, ttl)
+
+        self._folder = folder
+        self._max_decoded_count = max_decoded_count
+
+        # file name -> size, ordered from least to most recently used
+        self._files: OrderedDict[str, int] = OrderedDict()
+
+        # file name -> decoded objects, ordered from least to most recently used
+        self._decoded: OrderedDict[str, dict[Any, Any]] = OrderedDict()
+
+        os.makedirs(folder, exist_ok=True)
+
+        file_names = [file_name for file_name in os.listdir(folder) if file_name.endswith(".cache")]
+        file_names.sort(key=lambda file_name: os.path.getmtime(os.path.join(folder, file_name)))
+
+        for file_name in file_names:
+            self._files[file_name] = os.path.getsize(os.path.join(folder, file_name))
+
+    def get(self, key: str) -> Optional[HttpCacheEntry]:
+
+        file_name = self._get_file_name(key)
+
+        with self._lock:
+
+            if file_name not in self._files:
+                return None
+
+            file_path = os.path.join(self._folder, file_name)
+
+            try:
+                with open(file_path, "rb") as file:
+                    metadata = json.loads(file.readline())
+                    content = file.read()
+
+            # the file is corrupt or has been removed
+            except (OSError, ValueError):
+                self._remove(file_name)
+                return None
+
+            self._files.move_to_end(file_name)
+            os.utime(file_path)
+
+            # the decoded objects are shared with the previously returned entries
+            decoded = self._decoded.pop(file_name, None)
+
+            if decoded is None:
+                decoded = {}
+
+            self._set_decoded(file_name, decoded)
+
+            return HttpCacheEntry(content, metadata["expires"], metadata["etag"], metadata["last_modified"], decoded)
+
+    def set(self, key: str, entry: HttpCacheEntry) -> None:
+
+        file_name = self._get_file_name(key)
+        file_path = os.path.join(self._folder, file_name)
+        temp_file_path = file_path + ".tmp"
+
+        metadata = {
+            "expires": entry.expires,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified
+        }
+
+        with self._lock:
+
+            with open(temp_file_path, "wb") as file:
+                file.write(json.dumps(metadata).encode("utf-8") + b"\n")
+                file.write(entry.content)
+
+            os.replace(temp_file_path, file_path)
+
+            self._files[file_name] = os.path.getsize(file_path)
+            self._files.move_to_end(file_name)
+            self._decoded.pop(file_name, None)
+            self._set_decoded(file_name, entry.decoded)
+
+            size = sum(self._files.values())
+
+            while size > self._max_size and self._files:
+                evicted_file_name = next(iter(self._files))
+                size -= self._files[evicted_file_name]
+                self._remove(evicted_file_name)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            for file_name in list(self._files):
+                self._remove(file_name)
+
+    def _get_file_name(self, key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + ".cache"
+
+    def _set_decoded(self, file_name: str, decoded: dict[Any, Any]) -> None:
+
+        self._decoded[file_name] = decoded
+
+        while len(self._decoded) > self._max_decoded_count:
+            self._decoded.popitem(last=False)
+
+    def _remove(self, file_name: str) -> None:
+
+        self._files.pop(file_name, None)
+        self._decoded.pop(file_name, None)
+
+        try:
+            os.remove(os.path.join(self._folder, file_name))
+
+        except FileNotFoundError:
+            pass
+
+def _parse_cache_control(value: Optional[str]) -> dict[str, Optional[str]]:
+    """Returns the directives of a Cache-Control header."""
+
+    directives: dict[str, Optional[str]] = {}
+
+    if value is None:
+        return directives
+
+    for directive in value.split(","):
+
+        name, _, argument = directive.strip().partition("=")
+
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+
+    return directives
@@ -0,0 +1,302 @@
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """The metrics of a single operation call."""
+
+    operation_name: str
+    """The name of the operation (e.g. "items.get_item")."""
+
+    method: str
+    """The HTTP method."""
+
+    url_template: str
+    """The URL template of the operation (e.g. "/api/v1/items/{id}")."""
+
+    status_code: Optional[int]
+    """The status code of the response or None if no response has been received (e.g. fresh cached responses or transport errors)."""
+
+    request_size: int
+    """The number of bytes of the request body."""
+
+    response_size: int
+    """The number of bytes of the response body."""
+
+    build_time: float
+    """The time in seconds to build the request, including the encoding of the request body."""
+
+    send_time: float
+    """The time in seconds from sending the request until the response has been received, including retries. Streamed responses are received when their headers have arrived."""
+
+    time_to_first_byte: float
+    """The time in seconds from sending the request until the response headers have been received. Equal to send_time if the transport does not report it."""
+
+    parse_time: float
+    """The time in seconds to parse the JSON response body."""
+
+    decode_time: float
+    """The time in seconds to decode the parsed JSON into the return type."""
+
+    exception: Optional[BaseException]
+    """The exception which has been raised by the operation or None."""
+
+    @property
+    def total_time(self) -> float:
+        """The sum of all timings except the time to first byte."""
+        return self.build_time + self.send_time + self.parse_time + self.decode_time
+
+RequestObserver = Callable[[RequestMetrics], None]
+"""A function which receives the metrics of each operation call."""
+
+class HistogramCollector:
+    """
+    Collects the request metrics of all operations in histograms with logarithmic buckets and reports percentiles.
+    Pass an instance as request observer to the client.
+    """
+
+    _PHASES = ["total", "build", "send", "ttfb", "parse", "decode"]
+
+    def __init__(self, precision: int = 8):
+        """
+        Initializes a new instance of the HistogramCollector.
+
+        Args:
+            precision: The number of buckets per power of two. The relative error of the percentiles is about 2 ** (1 / precision) - 1 (9 % for 8 buckets).
+        """
+
+        self._precision = precision
+        self._lock = threading.Lock()
+        self._operations: dict[tuple[str, str, str], _OperationStatistics] = {}
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+
+        key = (metrics.operation_name, metrics.method, metrics.url_template)
+
+        values = (
+            metrics.total_time,
+            metrics.build_time,
+            metrics.send_time,
+            metrics.time_to_first_byte,
+            metrics.parse_time,
+            metrics.decode_time
+        )
+
+        with self._lock:
+
+            statistics = self._operations.get(key)
+
+            if statistics is None:
+                statistics = _OperationStatistics([_Histogram(self._precision) for _ in self._PHASES])
+                self._operations[key] = statistics
+
+            statistics.count += 1
+            statistics.request_bytes += metrics.request_size
+            statistics.response_bytes += metrics.response_size
+
+            if metrics.exception is not None:
+                statistics.errors += 1
+
+            for histogram, value in zip(statistics.histograms, values):
+                histogram.add(value)
+
+    def get_percentile(self, operation_name: str, phase: str, percentile: float) -> Optional[float]:
+        """
+        Returns the percentile (e.g. 0.99) of the timings in seconds of a phase ("total", "build", "send", "ttfb", "parse" or "decode") of all calls of an operation or None if there are no calls.
+        """
+
+        index = self._PHASES.index(phase)
+
+        with self._lock:
+
+            histograms = [
+                statistics.histograms[index]
+                for key, statistics in self._operations.items()
+                if key[0] == operation_name
+            ]
+
+            if not histograms:
+                return None
+
+            merged = _Histogram(self._precision)
+
+            for histogram in histograms:
+                merged.merge(histogram)
+
+            return merged.get_percentile(percentile)
+
+    def report(self) -> str:
+        """Returns a table of the call counts, errors, payload sizes and timing percentiles (in milliseconds) per operation."""
+
+        lines: list[str] = []
+
+        with self._lock:
+
+            for (operation_name, method, url_template), statistics in sorted(self._operations.items()):
+
+                lines.append(
+                    f"{operation_name} ({method} {url_template}): {statistics.count} calls, {statistics.errors} errors, "
+                    f"{statistics.request_bytes / statistics.count:.0f} B sent, {statistics.response_bytes / statistics.count:.0f} B received (mean)")
+
+                lines.append(f"  {'phase':<8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+
+                for phase, histogram in zip(self._PHASES, statistics.histograms):
+
+                    percentiles = [histogram.get_percentile(percentile) for percentile in (0.5, 0.9, 0.99)]
+                    lines.append(f"  {phase:<8}" + "".join(f"{value * 1000:10.3f}" for value in percentiles + [histogram.max]))
+
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Removes all collected metrics."""
+
+        with self._lock:
+            self._operations.clear()
+
+@dataclass
+class _OperationStatistics:
+    histograms: list["_Histogram"]
+    count: int = 0
+    errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+class _Histogram:
+    """A histogram with logarithmic buckets which has a constant relative error and a constant size per decade of values."""
+
+    # values below 1 µs share the first bucket
+    _MIN_VALUE = 1e-6
+
+    def __init__(self, precision: int):
+        self._precision = precision
+        self._buckets: dict[int, int] = {}
+        self._count = 0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+
+        index = 0 \
+            if value <= self._MIN_VALUE \
+            else math.ceil(math.log2(value / self._MIN_VALUE) * self._precision)
+
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self._count += 1
+        self.max = max(self.max, value)
+
+    def merge(self, other: "_Histogram") -> None:
+
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+
+        self._count += other._count
+        self.max = max(self.max, other.max)
+
+    def get_percentile(self, percentile: float) -> float:
+
+        if self._count == 0:
+            return 0.0
+
+        rank = percentile * self._count
+        count = 0
+
+        for index in sorted(self._buckets):
+
+            count += self._buckets[index]
+
+            # the upper bound of the bucket
+            if count >= rank:
+                return min(self._MIN_VALUE * 2 ** (index / self._precision), self.max)
+
+        return self.max
+
+class _Measurement:
+    """Collects the timings of a single operation call. The timestamps are only taken when request observers are registered."""
+
+    def __init__(self, operation_name: str, method: str, url_template: str):
+        self.operation_name = operation_name
+        self.method = method
+        self.url_template = url_template
+        self.status_code: Optional[int] = None
+        self.request_size = 0
+        self.response_size = 0
+        self.build_time = 0.0
+        self.send_time = 0.0
+        self.time_to_first_byte: Optional[float] = None
+        self.parse_time = 0.0
+        self.decode_time = 0.0
+        self._start = time.perf_counter()
+        self._send_start = self._start
+        self._mark = self._start
+
+    def built(self, request: Any, is_async: bool = False) -> None:
+
+        self.build_time = time.perf_counter() - self._start
+        self.request_size = int(request.headers.get("Content-Length", 0))
+
+        # the transport reports when the response headers have arrived
+        request.extensions = { **request.extensions, "trace": self._trace_async if is_async else self._trace }
+
+    def sending(self) -> None:
+        self._send_start = time.perf_counter()
+
+    def received(self, response: Any) -> None:
+
+        self.send_time = time.perf_counter() - self._send_start
+        self.status_code = response.status_code
+
+        if self.time_to_first_byte is None:
+            self.time_to_first_byte = self.send_time
+
+    def add_response_size(self, size: int) -> None:
+        self.response_size += size
+
+    def mark(self) -> None:
+        self._mark = time.perf_counter()
+
+    def parsed(self) -> None:
+        now = time.perf_counter()
+        self.parse_time += now - self._mark
+        self._mark = now
+
+    def decoded(self) -> None:
+        now = time.perf_counter()
+        self.decode_time += now - self._mark
+        self._mark = now
+
+    def measure_decode(self, decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+
+        def measured_decode(item: Any) -> Any:
+            self.mark()
+            return_value = decode(item)
+            self.decoded()
+
+            return return_value
+
+        return measured_decode
+
+    def complete(self, exception: Optional[BaseException]) -> RequestMetrics:
+
+        return RequestMetrics(
+            operation_name=self.operation_name,
+            method=self.method,
+            url_template=self.url_template,
+            status_code=self.status_code,
+            request_size=self.request_size,
+            response_size=self.response_size,
+            build_time=self.build_time,
+            send_time=self.send_time,
+            time_to_first_byte=self.send_time if self.time_to_first_byte is None else self.time_to_first_byte,
+            parse_time=self.parse_time,
+            decode_time=self.decode_time,
+            exception=exception
+        )
+
+    def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name.endswith("receive_response_headers.complete"):
+            self.time_to_first_byte = time.perf_counter() - self._send_start
+
+    async def _trace_async(self, event_name: str, info: dict[str, Any]) -> None:
+        self._trace(event_name, info)
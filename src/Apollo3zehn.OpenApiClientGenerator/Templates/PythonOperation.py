@@ -0,0 +1,94 @@
+import re
+import string
+from datetime import datetime
+from typing import Any, Generic, Optional, Type, TypeVar
+from urllib.parse import quote
+
+T = TypeVar("T")
+
+# the characters which are never quoted
+_SAFE_CHARACTERS = string.ascii_letters + string.digits + "_.-~"
+
+def _to_string(value: Any) -> str:
+
+    if type(value) is datetime:
+        return value.isoformat()
+
+    elif type(value) is str:
+        return value
+
+    else:
+        return str(value)
+
+def _quote(value: str) -> str:
+
+    # most values (e.g. numbers, UUIDs and names) contain no characters to quote
+    if not value.strip(_SAFE_CHARACTERS):
+        return value
+
+    return quote(value, safe="")
+
+class _Operation(Generic[T]):
+    """
+    An entry of the operation table of the generated clients. The URL template is compiled into a formatter once so
+    that each call only quotes and inserts the parameter values.
+    """
+
+    __slots__ = ("name", "method", "url_template", "accept_header_value", "content_type_value", "return_type", "_format_path", "_query_parameters")
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        url_template: str,
+        path_parameters: tuple[str, ...],
+        query_parameters: tuple[tuple[str, bool], ...],
+        accept_header_value: Optional[str],
+        content_type_value: Optional[str],
+        return_type: Type[T]
+    ):
+        """
+        Initializes a new instance of the _Operation.
+
+        Args:
+            name: The name of the operation (e.g. "items.get_item").
+            method: The HTTP method.
+            url_template: The URL template (e.g. "/api/v1/items/{id}").
+            path_parameters: The names of the path parameters in the order of their values.
+            query_parameters: The names of the query parameters in the order of their values and whether they are omitted if their value is None.
+            accept_header_value: The value of the accept header.
+            content_type_value: The value of the content type.
+            return_type: The return type or the type of the array items of streamed operations.
+        """
+
+        self.name = name
+        self.method = method
+        self.url_template = url_template
+        self.accept_header_value = accept_header_value
+        self.content_type_value = content_type_value
+        self.return_type = return_type
+
+        # "/api/v1/items/{id}" -> "/api/v1/items/{0}".format
+        self._format_path = re.sub(
+            r"\{([^}]+)\}",
+            lambda match: f"{{{path_parameters.index(match.group(1))}}}",
+            url_template
+        ).format
+
+        self._query_parameters = tuple((f"{name}=", is_optional) for name, is_optional in query_parameters)
+
+    def build_url(self, path_values: tuple[Any, ...], query_values: tuple[Any, ...]) -> str:
+        """Returns the relative URL for the given path and query parameter values."""
+
+        url = self._format_path(*[_quote(str(value)) for value in path_values]) \
+            if path_values \
+            else self.url_template
+
+        if self._query_parameters:
+            url += "?" + "&".join([
+                prefix + _quote(_to_string(value))
+                for (prefix, is_optional), value in zip(self._query_parameters, query_values)
+                if value is not None or not is_optional
+            ])
+
+        return url
@@ -1,21 +1,9 @@
-﻿from datetime import datetime
-from enum import Enum
-from typing import (Any, AsyncIterable, Awaitable, Iterable, Optional,
-                    Protocol, Type, TypeVar, Union, cast)
+﻿from enum import Enum
+from typing import (Any, AsyncIterator, Awaitable, Iterator, Protocol, Type,
+                    TypeVar, cast)
 
 from ._encoder import JsonEncoderOptions, to_camel_case, to_snake_case
-
-
-def _to_string(value: Any) -> str:
-
-    if type(value) is datetime:
-        return value.isoformat()
-
-    elif type(value) is str:
-        return value
-
-    else:
-        return str(value)
+from ._operation import _Operation
 
 _json_encoder_options: JsonEncoderOptions = JsonEncoderOptions(
     property_name_encoder=lambda value: to_camel_case(value) if value != "class_" else "class",
@@ -25,6 +13,25 @@ _json_encoder_options: JsonEncoderOptions = JsonEncoderOptions(
 _json_encoder_options.encoders[Enum] = lambda value: to_camel_case(value.name)
 _json_encoder_options.decoders[Enum] = lambda typeCls, value: cast(Type[Enum], typeCls)[to_snake_case(value).upper()]
 
+TEnum = TypeVar("TEnum", bound=Enum)
+
+class _EnumDecoder(dict[str, TEnum]):
+    """Maps JSON values to the members of an enum (used by generated deserializers)."""
+
+    def __init__(self, enum_type: Type[TEnum]):
+        super().__init__()
+        self._enum_type = enum_type
+
+    def __missing__(self, value: str) -> TEnum:
+        member = self._enum_type[to_snake_case(value).upper()]
+        self[value] = member
+
+        return member
+
+def _get_enum_encoder(enum_type: Type[TEnum]) -> dict[TEnum, str]:
+    """Maps the members of an enum to JSON values (used by generated serializers)."""
+    return {member: to_camel_case(member.name) for member in enum_type}
+
 T = TypeVar("T")
 
 class HttpRequestHandler(Protocol):
@@ -32,17 +39,15 @@ class HttpRequestHandler(Protocol):
     A handler to execute HTTP requests.
     """
 
-    def __call__(self, typeOfT: Optional[Type[T]], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> T:
+    def __call__(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> T:
         """
         Execute the HTTP request.
 
         Args:
-            typeOfT: The return type.
-            method: The HTTP method.
-            relative_url: The relative URL.
-            accept_header_value: The value of the accept header.
-            content_type_value: The value of the content type.
-            content: The content.
+            operation: The operation, i.e. the HTTP method, the URL template, the header values and the return type.
+            path_values: The values of the path parameters.
+            query_values: The values of the query parameters.
+            content: The content. JSON content is serialized by the handler.
         """
         ...
 
@@ -51,17 +56,49 @@ class HttpRequestHandlerAsync(Protocol):
     A handler to execute HTTP requests.
     """
 
-    def __call__(self, typeOfT: Optional[Type[T]], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> Awaitable[T]:
+    def __call__(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> Awaitable[T]:
+        """
+        Execute the HTTP request.
+
+        Args:
+            operation: The operation, i.e. the HTTP method, the URL template, the header values and the return type.
+            path_values: The values of the path parameters.
+            query_values: The values of the query parameters.
+            content: The content. JSON content is serialized by the handler.
+        """
+        ...
+
+class HttpRequestIterHandler(Protocol):
+    """
+    A handler to execute HTTP requests which return a JSON array. The array items are decoded while the response is being received.
+    """
+
+    def __call__(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> Iterator[T]:
+        """
+        Execute the HTTP request.
+
+        Args:
+            operation: The operation, i.e. the HTTP method, the URL template, the header values and the type of the array items.
+            path_values: The values of the path parameters.
+            query_values: The values of the query parameters.
+            content: The content. JSON content is serialized by the handler.
+        """
+        ...
+
+class HttpRequestIterHandlerAsync(Protocol):
+    """
+    A handler to execute HTTP requests which return a JSON array. The array items are decoded while the response is being received.
+    """
+
+    def __call__(self, operation: _Operation[T], path_values: tuple[Any, ...], query_values: tuple[Any, ...], content: Any) -> AsyncIterator[T]:
         """
         Execute the HTTP request.
 
         Args:
-            typeOfT: The return type.
-            method: The HTTP method.
-            relative_url: The relative URL.
-            accept_header_value: The value of the accept header.
-            content_type_value: The value of the content type.
-            content: The content.
+            operation: The operation, i.e. the HTTP method, the URL template, the header values and the type of the array items.
+            path_values: The values of the path parameters.
+            query_values: The values of the query parameters.
+            content: The content. JSON content is serialized by the handler.
         """
         ...
 
@@ -0,0 +1,155 @@
+﻿using Apollo3zehn.OpenApiClientGenerator;
+using Microsoft.OpenApi.Models;
+using Microsoft.OpenApi.Readers;
+
+// Generates the Python clients which are imported by the tests in tests/templates/python and by the benchmarks in
+// benchmarks/python:
+//
+//   dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- test-client
+//   dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- benchmark-client
+//   dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- import-benchmark-clients
+
+var repositoryFolderPath = AppContext.BaseDirectory;
+
+while (!File.Exists(Path.Combine(repositoryFolderPath, "Apollo3zehn.OpenApiClientGenerator.sln")))
+{
+    repositoryFolderPath = Path.GetDirectoryName(repositoryFolderPath)
+        ?? throw new Exception("The repository folder could not be found.");
+}
+
+switch (args.FirstOrDefault())
+{
+    case "test-client":
+        GenerateTestClient(repositoryFolderPath);
+        break;
+
+    case "benchmark-client":
+        GenerateBenchmarkClient(repositoryFolderPath);
+        break;
+
+    case "import-benchmark-clients":
+        GenerateImportBenchmarkClients(repositoryFolderPath);
+        break;
+
+    default:
+        Console.Error.WriteLine("Usage: dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- test-client | benchmark-client | import-benchmark-clients");
+        return 1;
+}
+
+return 0;
+
+static OpenApiDocument ReadDocument(string filePath)
+{
+    var document = new OpenApiStringReader()
+        .Read(File.ReadAllText(filePath), out var diagnostic);
+
+    if (diagnostic.Errors.Any())
+        throw new Exception($"The open API document {filePath} is invalid: {diagnostic.Errors.First().Message}");
+
+    return document;
+}
+
+static void GenerateTestClient(string repositoryFolderPath)
+{
+    // a Nexus-enabled client to test the runtime of the generated client (load(), export(), batches, retries, ...)
+    var document = ReadDocument(
+        Path.Combine(repositoryFolderPath, "tests", "templates", "python", "specs", "test-api.json"));
+
+    var settings = new GeneratorSettings(
+        Namespace: "Test.Api",
+        ClientName: "Test",
+        ExceptionType: "TestException",
+        ExceptionCodePrefix: "T",
+        GetOperationName: (path, type, operation) => operation.OperationId,
+        Special_ConfigurationHeaderKey: "Nexus-Configuration",
+        Special_WebAssemblySupport: false,
+        Special_AccessTokenSupport: true,
+        Special_NexusFeatures: true
+    );
+
+    var targetFolderPath = Path.Combine(repositoryFolderPath, "artifacts", "tests", "python", "test_api");
+
+    var pythonGenerator = new PythonGenerator(settings);
+    pythonGenerator.Generate(targetFolderPath, document);
+}
+
+static void GenerateBenchmarkClient(string repositoryFolderPath)
+{
+    // used by benchmarks/python/client-benchmarks.py
+    var document = ReadDocument(
+        Path.Combine(repositoryFolderPath, "benchmarks", "python", "specs", "benchmark-api.json"));
+
+    var settings = new GeneratorSettings(
+        Namespace: "Benchmark.Api",
+        ClientName: "Benchmark",
+        ExceptionType: "BenchmarkException",
+        ExceptionCodePrefix: "B",
+        GetOperationName: (path, type, operation) => operation.OperationId,
+        Special_ConfigurationHeaderKey: default!,
+        Special_WebAssemblySupport: false,
+        Special_AccessTokenSupport: false,
+        Special_NexusFeatures: false,
+        Python_StaticSerializers: true
+    );
+
+    var targetFolderPath = Path.Combine(repositoryFolderPath, "artifacts", "benchmarks", "python", "benchmark_api");
+
+    var pythonGenerator = new PythonGenerator(settings);
+    pythonGenerator.Generate(targetFolderPath, document);
+}
+
+static void GenerateImportBenchmarkClients(string repositoryFolderPath)
+{
+    // enlarge the benchmark API (used by benchmarks/python/import-benchmarks.py)
+    var specFilePath = Path.Combine(repositoryFolderPath, "benchmarks", "python", "specs", "benchmark-api.json");
+    var openApiJsonString = File.ReadAllText(specFilePath);
+    var document = ReadDocument(specFilePath);
+
+    document.Paths.Clear();
+    document.Components.Schemas.Clear();
+
+    // 100 sub-clients with 4 operations and 3 models each
+    for (int i = 0; i < 100; i++)
+    {
+        var groupJsonString = openApiJsonString
+            .Replace("Item", $"Group{i}Item")
+            .Replace("/items", $"/group{i}/items");
+
+        var groupDocument = new OpenApiStringReader()
+            .Read(groupJsonString, out _);
+
+        foreach (var (path, pathItem) in groupDocument.Paths)
+        {
+            document.Paths.Add(path, pathItem);
+        }
+
+        foreach (var (name, schema) in groupDocument.Components.Schemas)
+        {
+            document.Components.Schemas.Add(name, schema);
+        }
+    }
+
+    // generate python clients
+    foreach (var lazyModules in new[] { false, true })
+    {
+        var settings = new GeneratorSettings(
+            Namespace: "Benchmark.Api",
+            ClientName: "Benchmark",
+            ExceptionType: "BenchmarkException",
+            ExceptionCodePrefix: "B",
+            GetOperationName: (path, type, operation) => operation.OperationId,
+            Special_ConfigurationHeaderKey: default!,
+            Special_WebAssemblySupport: false,
+            Special_AccessTokenSupport: false,
+            Special_NexusFeatures: false,
+            Python_StaticSerializers: true,
+            Python_LazyModules: lazyModules
+        );
+
+        var packageName = lazyModules ? "import_api_lazy" : "import_api";
+        var targetFolderPath = Path.Combine(repositoryFolderPath, "artifacts", "benchmarks", "python", packageName);
+
+        var pythonGenerator = new PythonGenerator(settings);
+        pythonGenerator.Generate(targetFolderPath, document);
+    }
+}
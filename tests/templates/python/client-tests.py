@@ -0,0 +1,975 @@
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import (AsyncIterator, Generator, Iterator, Optional, Sequence,
+                    cast)
+
+import httpx
+import pytest
+
+pytest.importorskip("test_api", reason="Generate the test client with: dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- test-client")
+
+from test_api import (AsyncBatch, Batch, BatchResult, ConcurrencyLimiter,
+                      DiskHttpCache, MemoryHttpCache, RetryPolicy,
+                      SharedConnectionPool, TestAsyncClient, TestClient,
+                      TestException, TransportOptions)
+from test_api._client import _Backoff, _is_replayable, _RetryBudget
+
+class _ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A response stream which sends the data in small chunks and records whether it has been closed."""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.sent_size = 0
+        self.is_closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+
+        for offset in range(0, len(self.data), self.chunk_size):
+            self.sent_size = offset + self.chunk_size
+            yield self.data[offset:offset + self.chunk_size]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+
+        for chunk in self:
+            yield chunk
+
+    def close(self) -> None:
+        self.is_closed = True
+
+    async def aclose(self) -> None:
+        self.is_closed = True
+
+class _ItemsServer:
+    """A fake server for the items operations which records the requests."""
+
+    def __init__(self, delay: float = 0, chunk_size: Optional[int] = None, failures: Sequence[Optional[int]] = (), retry_after: Optional[str] = None, slow_requests: Optional[dict[int, float]] = None):
+        self.delay = delay
+        self.chunk_size = chunk_size
+        self.failures = list(failures)
+        self.retry_after = retry_after
+        self.slow_requests = slow_requests or {}
+        self.streams: list[_ChunkedStream] = []
+        self.requests: list[httpx.Request] = []
+        self.threads: list[int] = []
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self._lock = threading.Lock()
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+
+        with self._lock:
+            index = len(self.requests)
+            self.requests.append(request)
+            self.threads.append(threading.get_ident())
+            self.active_requests += 1
+            self.max_active_requests = max(self.max_active_requests, self.active_requests)
+
+        try:
+            delay = self.slow_requests.get(index, self.delay)
+
+            if delay:
+                time.sleep(delay)
+
+            return self._handle(request)
+
+        finally:
+            with self._lock:
+                self.active_requests -= 1
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+
+        index = len(self.requests)
+        self.requests.append(request)
+        self.active_requests += 1
+        self.max_active_requests = max(self.max_active_requests, self.active_requests)
+
+        try:
+            delay = self.slow_requests.get(index, self.delay)
+
+            if delay:
+                await asyncio.sleep(delay)
+
+            return self._handle(request)
+
+        finally:
+            self.active_requests -= 1
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+
+        # None stands for a connection error
+        if self.failures:
+
+            status_code = self.failures.pop(0)
+
+            if status_code is None:
+                raise httpx.ConnectError("The connection has failed.")
+
+            headers = {} if self.retry_after is None else { "Retry-After": self.retry_after }
+
+            return httpx.Response(status_code, headers=headers, text="The server is not available.")
+
+        if request.url.path == "/api/v1/items":
+            limit = request.url.params.get("limit")
+            count = 3 if limit is None else int(limit)
+            items = [self._get_item(str(i)) for i in range(count)]
+
+            if self.chunk_size is not None:
+                stream = _ChunkedStream(json.dumps(items).encode("utf-8"), self.chunk_size)
+                self.streams.append(stream)
+
+                return httpx.Response(200, stream=stream, headers={ "Content-Type": "application/json" })
+
+            return httpx.Response(200, json=items, headers={ "Cache-Control": "max-age=60" })
+
+        item_id = request.url.path.split("/")[-1]
+
+        if item_id == "missing":
+            return httpx.Response(404, text="The item does not exist.")
+
+        return httpx.Response(200, json=self._get_item(item_id), headers={ "Cache-Control": "max-age=60" })
+
+    def _get_item(self, item_id: str) -> dict[str, object]:
+        return { "id": item_id, "name": f"item{item_id}", "value": float(len(self.requests)) }
+
+def _create_client(server: _ItemsServer, **kwargs) -> TestClient:
+    return TestClient(httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(server.handle_sync)), **kwargs)
+
+def _create_async_client(server: _ItemsServer, **kwargs) -> TestAsyncClient:
+    return TestAsyncClient(httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(server.handle_async)), **kwargs)
+
+def http_cache_separates_users_test(tmp_path: Path):
+
+    # arrange
+    server = _ItemsServer()
+    client = _create_client(server, http_cache=DiskHttpCache(str(tmp_path)))
+
+    # act
+    client.sign_in("secret1")
+    client.v1.items.get_item("1")
+    client.v1.items.get_item("1")
+
+    client.sign_in("secret2")
+    client.v1.items.get_item("1")
+
+    # assert
+    assert 2 == len(server.requests)
+
+    for file_path in tmp_path.glob("*.cache"):
+        content = file_path.read_bytes()
+        assert b"secret" not in content
+        assert b"/api/v1/items" not in content
+
+def http_cache_ignores_other_headers_test():
+
+    # arrange
+    server = _ItemsServer()
+    http_cache = MemoryHttpCache()
+    http_client = httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(server.handle_sync))
+    client = TestClient(http_client, http_cache=http_cache)
+
+    # act
+    client.v1.items.get_item("1")
+
+    http_client.headers["User-Agent"] = "other"
+    client.v1.items.get_item("1")
+
+    # assert
+    assert 1 == len(server.requests)
+    assert 1 == http_cache.hits
+
+def disk_http_cache_reuses_decoded_objects_test(tmp_path: Path):
+
+    # arrange
+    server = _ItemsServer()
+    client = _create_client(server, http_cache=DiskHttpCache(str(tmp_path)))
+
+    # act
+    item1 = client.v1.items.get_item("1")
+    item2 = client.v1.items.get_item("1")
+
+    # assert
+    assert 1 == len(server.requests)
+    assert item1 is item2
+
+class _LocalServer(ThreadingHTTPServer):
+    """A local HTTP/1.1 server for the transport tests which records the client ports, i.e. the connections."""
+
+    def __init__(self, delay: float):
+        super().__init__(("127.0.0.1", 0), _LocalRequestHandler)
+        self.delay = delay
+        self.client_ports: list[int] = []
+        self.connect_targets: list[str] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    # clients which time out close the connection
+    def handle_error(self, request, client_address):
+        pass
+
+class _LocalRequestHandler(BaseHTTPRequestHandler):
+
+    # keep the connections alive
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+
+        server = cast(_LocalServer, self.server)
+        server.client_ports.append(self.client_address[1])
+
+        if server.delay:
+            time.sleep(server.delay)
+
+        content = json.dumps({ "id": self.path.split("/")[-1], "name": "item", "value": 1.0 }).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    # acts as a proxy which refuses all tunnels
+    def do_CONNECT(self):
+
+        server = cast(_LocalServer, self.server)
+        server.connect_targets.append(self.path)
+
+        self.send_response(502)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+@contextmanager
+def _run_local_server(delay: float = 0) -> Iterator[_LocalServer]:
+
+    server = _LocalServer(delay)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    try:
+        yield server
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.mark.parametrize("transport", ["default", "transport_options", "connection_pool"])
+def client_uses_proxy_of_environment_test(monkeypatch: pytest.MonkeyPatch, transport: str):
+
+    with _run_local_server() as server:
+
+        # arrange
+        monkeypatch.setenv("HTTPS_PROXY", server.base_url)
+
+        client = TestClient.create(
+            "https://example.invalid",
+            transport_options=TransportOptions() if transport == "transport_options" else None,
+            connection_pool=SharedConnectionPool() if transport == "connection_pool" else None)
+
+        # act
+        with client:
+            with pytest.raises(httpx.ProxyError):
+                client.v1.items.get_item("1")
+
+        # assert
+        assert ["example.invalid:443"] == server.connect_targets
+
+def async_client_uses_proxy_of_environment_test(monkeypatch: pytest.MonkeyPatch):
+
+    with _run_local_server() as server:
+
+        # arrange
+        monkeypatch.setenv("HTTPS_PROXY", server.base_url)
+        pool = SharedConnectionPool()
+        client = TestAsyncClient.create("https://example.invalid", connection_pool=pool)
+
+        async def run():
+
+            async with client:
+                with pytest.raises(httpx.ProxyError):
+                    await client.v1.items.get_item("1")
+
+            await pool.aclose()
+
+        # act
+        asyncio.run(run())
+
+        # assert
+        assert ["example.invalid:443"] == server.connect_targets
+
+def clients_share_connection_pool_test():
+
+    with _run_local_server() as server:
+
+        # arrange
+        pool = SharedConnectionPool(TransportOptions(max_connections=1))
+        client1 = TestClient.create(server.base_url, connection_pool=pool)
+        client2 = TestClient.create(server.base_url, connection_pool=pool)
+
+        # act
+        with client1:
+            client1.v1.items.get_item("1")
+
+        item = client2.v1.items.get_item("2")
+        pool.close()
+
+        # assert
+        assert "2" == item.id
+        assert 2 == len(server.client_ports)
+        assert 1 == len(set(server.client_ports))
+
+def async_clients_share_connection_pool_test():
+
+    with _run_local_server() as server:
+
+        # arrange
+        pool = SharedConnectionPool(TransportOptions(max_connections=1))
+        client1 = TestAsyncClient.create(server.base_url, connection_pool=pool)
+        client2 = TestAsyncClient.create(server.base_url, connection_pool=pool)
+
+        async def run():
+
+            async with client1:
+                await client1.v1.items.get_item("1")
+
+            item = await client2.v1.items.get_item("2")
+            await pool.aclose()
+
+            return item
+
+        # act
+        item = asyncio.run(run())
+
+        # assert
+        assert "2" == item.id
+        assert 1 == len(set(server.client_ports))
+
+def clients_without_pool_use_own_connections_test():
+
+    with _run_local_server() as server:
+
+        # arrange
+        client1 = TestClient.create(server.base_url)
+        client2 = TestClient.create(server.base_url)
+
+        # act
+        with client1, client2:
+            client1.v1.items.get_item("1")
+            client2.v1.items.get_item("2")
+
+        # assert
+        assert 2 == len(set(server.client_ports))
+
+def can_apply_timeouts_test():
+
+    with _run_local_server(delay=0.2) as server:
+
+        # arrange
+        client = TestClient.create(server.base_url, transport_options=TransportOptions(read_timeout=0.05))
+
+        # act / assert
+        with client:
+            with pytest.raises(httpx.ReadTimeout):
+                client.v1.items.get_item("1")
+
+def http2_requires_h2_test():
+
+    # arrange
+    try:
+        import h2 # type: ignore
+        pytest.skip("The h2 package is installed.")
+
+    except ImportError:
+        pass
+
+    # act / assert
+    with pytest.raises(Exception, match="h2"):
+        TestClient.create("http://localhost", transport_options=TransportOptions(http2=True))
+
+def can_execute_batch_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02)
+    client = _create_client(server)
+    batch = client.batch(max_concurrency=3)
+
+    for i in range(10):
+        batch.submit(client.v1.items.get_item, str(i))
+
+    # act
+    results = list(batch.results())
+
+    # assert
+    assert list(range(10)) == sorted(result.index for result in results)
+    assert all(result.value is not None and result.value.id == str(result.index) for result in results)
+    assert 3 == server.max_active_requests
+
+def can_execute_async_batch_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02)
+    client = _create_async_client(server)
+    batch = client.batch(max_concurrency=3)
+
+    for i in range(10):
+        batch.submit(client.v1.items.get_item, str(i))
+
+    async def run() -> list[BatchResult]:
+        return [result async for result in batch.results()]
+
+    # act
+    results = asyncio.run(run())
+
+    # assert
+    assert list(range(10)) == sorted(result.index for result in results)
+    assert all(result.value is not None and result.value.id == str(result.index) for result in results)
+    assert 3 == server.max_active_requests
+
+def failed_operations_do_not_stop_batch_test():
+
+    # arrange
+    server = _ItemsServer()
+    client = _create_client(server)
+    batch = client.batch()
+
+    batch.submit(client.v1.items.get_item, "1")
+    batch.submit(client.v1.items.get_item, "missing")
+    batch.submit(client.v1.items.get_item, "3")
+
+    # act
+    results = sorted(batch.results(), key=lambda result: result.index)
+
+    # assert
+    assert results[0].value is not None and results[0].exception is None
+    exception = results[1].exception
+
+    assert results[1].value is None and isinstance(exception, TestException)
+    assert "T00.404" == exception.status_code
+    assert results[2].value is not None and results[2].exception is None
+
+def batch_applies_settings_of_submission_test():
+
+    # arrange
+    server = _ItemsServer()
+    client = _create_client(server)
+    batch = client.batch()
+
+    with client.raw():
+        batch.submit(client.v1.items.get_item, "1")
+
+    batch.submit(client.v1.items.get_item, "2")
+
+    # act
+    results = sorted(batch.results(), key=lambda result: result.index)
+
+    # assert
+    assert isinstance(results[0].value, dict)
+    assert not isinstance(results[1].value, dict)
+
+def stopping_batch_cancels_pending_operations_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02)
+    client = _create_client(server)
+    batch = client.batch(max_concurrency=2)
+
+    for i in range(10):
+        batch.submit(client.v1.items.get_item, str(i))
+
+    # act
+    for _ in batch.results():
+        break
+
+    # assert
+    assert 3 >= len(server.requests)
+
+@pytest.mark.parametrize("batch_type", [Batch, AsyncBatch])
+def batch_requires_positive_concurrency_test(batch_type: type):
+
+    # act / assert
+    with pytest.raises(Exception, match="at least 1"):
+        batch_type(0)
+
+def _get_items_concurrently(client: TestClient, item_id: str, count: int) -> list[object]:
+
+    barrier = threading.Barrier(count)
+    results: list[object] = [None] * count
+
+    def get_item(index: int):
+
+        barrier.wait()
+
+        try:
+            results[index] = client.v1.items.get_item(item_id)
+
+        except Exception as exception:
+            results[index] = exception
+
+    threads = [threading.Thread(target=get_item, args=(i,)) for i in range(count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return results
+
+@pytest.mark.parametrize("coalesce_requests, expected_request_count", [(True, 1), (False, 8)])
+def can_coalesce_requests_test(coalesce_requests: bool, expected_request_count: int):
+
+    # arrange
+    server = _ItemsServer(delay=0.05)
+    client = _create_client(server, coalesce_requests=coalesce_requests)
+
+    # act
+    results = _get_items_concurrently(client, "1", 8)
+
+    # assert
+    assert expected_request_count == len(server.requests)
+    assert all(getattr(result, "id") == "1" for result in results)
+
+    if coalesce_requests:
+        assert all(result is results[0] for result in results)
+
+def coalesced_requests_share_exception_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.05)
+    client = _create_client(server, coalesce_requests=True)
+
+    # act
+    results = _get_items_concurrently(client, "missing", 8)
+
+    # assert
+    assert 1 == len(server.requests)
+    assert all(isinstance(result, TestException) for result in results)
+
+def does_not_coalesce_completed_requests_test():
+
+    # arrange
+    server = _ItemsServer()
+    client = _create_client(server, coalesce_requests=True)
+
+    # act
+    item1 = client.v1.items.get_item("1")
+    item2 = client.v1.items.get_item("1")
+
+    # assert
+    assert 2 == len(server.requests)
+    assert item1 is not item2
+
+def does_not_coalesce_different_decoding_modes_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.05)
+    client = _create_async_client(server, coalesce_requests=True)
+
+    async def get_raw_item():
+        with client.raw():
+            return await client.v1.items.get_item("1")
+
+    async def run():
+        return await asyncio.gather(client.v1.items.get_item("1"), get_raw_item())
+
+    # act
+    item, raw_item = asyncio.run(run())
+
+    # assert
+    assert 2 == len(server.requests)
+    assert not isinstance(item, dict)
+    assert isinstance(raw_item, dict)
+
+def can_coalesce_async_requests_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.05)
+    client = _create_async_client(server, coalesce_requests=True)
+
+    async def run():
+        return await asyncio.gather(*[client.v1.items.get_item("1") for _ in range(8)])
+
+    # act
+    results = asyncio.run(run())
+
+    # assert
+    assert 1 == len(server.requests)
+    assert all(result is results[0] for result in results)
+
+def cancelling_leader_does_not_cancel_followers_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.05)
+    client = _create_async_client(server, coalesce_requests=True)
+
+    async def run():
+
+        leader = asyncio.ensure_future(client.v1.items.get_item("1"))
+        await asyncio.sleep(0.01)
+
+        followers = [asyncio.ensure_future(client.v1.items.get_item("1")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await asyncio.gather(*followers)
+
+    # act
+    results = asyncio.run(run())
+
+    # assert
+    assert 1 == len(server.requests)
+    assert all(result.id == "1" for result in results)
+
+def can_iterate_items_test():
+
+    # arrange
+    server = _ItemsServer(chunk_size=7)
+    client = _create_client(server)
+
+    # act
+    items = list(client.v1.items.get_items_iter(limit=100))
+
+    # assert
+    assert [str(i) for i in range(100)] == [item.id for item in items]
+    assert [f"item{i}" for i in range(100)] == [item.name for item in items]
+    assert server.streams[0].is_closed
+
+def can_iterate_items_async_test():
+
+    # arrange
+    server = _ItemsServer(chunk_size=7)
+    client = _create_async_client(server)
+
+    async def run():
+        return [item async for item in client.v1.items.get_items_iter(limit=100)]
+
+    # act
+    items = asyncio.run(run())
+
+    # assert
+    assert [str(i) for i in range(100)] == [item.id for item in items]
+    assert server.streams[0].is_closed
+
+def iterates_items_while_receiving_test():
+
+    # arrange
+    server = _ItemsServer(chunk_size=16)
+    client = _create_client(server)
+    items = cast(Generator, client.v1.items.get_items_iter(limit=1000))
+
+    # act
+    next(items)
+    sent_size = server.streams[0].sent_size
+    items.close()
+
+    # assert
+    assert sent_size < len(server.streams[0].data) / 10
+    assert server.streams[0].is_closed
+
+def can_iterate_raw_items_test():
+
+    # arrange
+    server = _ItemsServer(chunk_size=7)
+    client = _create_client(server)
+
+    # act
+    with client.raw():
+        items = list(client.v1.items.get_items_iter(limit=3))
+
+    # assert
+    assert [{ "id": "0", "name": "item0", "value": 1.0 }] == items[:1]
+
+def iterating_failed_request_raises_test():
+
+    # arrange
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, text="The server has failed.")
+
+    client = TestClient(httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(handle)))
+
+    # act / assert
+    with pytest.raises(TestException, match="The server has failed."):
+        list(client.v1.items.get_items_iter())
+
+@pytest.mark.parametrize("failures", [[503, 503], [None, 500], [429]])
+def can_retry_failed_requests_test(failures: list[Optional[int]]):
+
+    # arrange
+    server = _ItemsServer(failures=failures)
+    client = _create_client(server, retry_policy=RetryPolicy(initial_delay=0.001))
+
+    # act
+    item = client.v1.items.get_item("1")
+
+    # assert
+    assert "1" == item.id
+    assert len(failures) + 1 == len(server.requests)
+
+def gives_up_after_max_retries_test():
+
+    # arrange
+    server = _ItemsServer(failures=[503] * 5)
+    client = _create_client(server, retry_policy=RetryPolicy(max_retries=2, initial_delay=0.001))
+
+    # act / assert
+    with pytest.raises(TestException) as exception_info:
+        client.v1.items.get_item("1")
+
+    assert "T00.503" == exception_info.value.status_code
+    assert 3 == len(server.requests)
+
+def gives_up_after_max_connection_errors_test():
+
+    # arrange
+    server = _ItemsServer(failures=[None] * 5)
+    client = _create_client(server, retry_policy=RetryPolicy(max_retries=2, initial_delay=0.001))
+
+    # act / assert
+    with pytest.raises(httpx.ConnectError):
+        client.v1.items.get_item("1")
+
+    assert 3 == len(server.requests)
+
+@pytest.mark.parametrize("retry_policy", [None, RetryPolicy(initial_delay=0.001)])
+def does_not_retry_non_idempotent_requests_test(retry_policy: Optional[RetryPolicy]):
+
+    # arrange
+    server = _ItemsServer(failures=[503])
+    client = _create_client(server, retry_policy=retry_policy)
+
+    # act / assert
+    with pytest.raises(TestException):
+        client.v1.catalogs.search_catalog_items(["/A/B/C"])
+
+    assert 1 == len(server.requests)
+
+def retry_budget_limits_retries_test():
+
+    # arrange
+    server = _ItemsServer(failures=[503] * 10)
+    client = _create_client(server, retry_policy=RetryPolicy(initial_delay=0.001, budget_ratio=0, budget_burst=1))
+
+    # act
+    for _ in range(2):
+        with pytest.raises(TestException):
+            client.v1.items.get_item("1")
+
+    # assert
+    assert 3 == len(server.requests)
+
+def retries_honor_retry_after_test(monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    server = _ItemsServer(failures=[503, 503], retry_after="2")
+    client = _create_async_client(server, retry_policy=RetryPolicy())
+
+    async def run():
+        return await client.v1.items.get_item("1")
+
+    # act
+    item = asyncio.run(run())
+
+    # assert
+    assert "1" == item.id
+    assert [2.0, 2.0] == delays
+
+def can_back_off_exponentially_test():
+
+    # arrange
+    backoff = _Backoff(0.1, 0.3)
+
+    # act
+    delays = [backoff.next() for _ in range(4)]
+
+    # assert
+    assert 0.05 <= delays[0] <= 0.1
+    assert 0.1 <= delays[1] <= 0.2
+    assert 0.15 <= delays[2] <= 0.3
+    assert 0.15 <= delays[3] <= 0.3
+    assert 5.0 == backoff.next(retry_after=5.0)
+
+def retry_budget_refills_with_requests_test():
+
+    # arrange
+    budget = _RetryBudget(ratio=0.5, burst=1)
+
+    # act / assert
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert budget.withdraw()
+
+@pytest.mark.parametrize("content, expected", [
+    (b"{}", True),
+    (None, True),
+    (iter([b"{}"]), False)
+])
+def only_replays_byte_content_test(content, expected: bool):
+
+    # arrange
+    request = httpx.Request("PUT", "http://localhost/api/v1/items", content=content)
+
+    # act
+    actual = _is_replayable(request)
+
+    # assert
+    assert expected == actual
+
+def can_hedge_requests_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02, slow_requests={ 5: 0.2 })
+    client = _create_client(server, retry_policy=RetryPolicy(hedge_percentile=0.5, hedge_min_samples=5))
+
+    for _ in range(5):
+        client.v1.items.get_item("1")
+
+    # act
+    item = client.v1.items.get_item("2")
+
+    # assert
+    assert "2" == item.id
+    assert 7 == len(server.requests)
+    assert "/api/v1/items/2" == server.requests[6].url.path
+
+    # the first request runs on the calling thread, only the hedged request runs on the pool
+    assert threading.get_ident() == server.threads[5]
+    assert threading.get_ident() != server.threads[6]
+
+def can_hedge_async_requests_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02, slow_requests={ 5: 1.0 })
+    client = _create_async_client(server, retry_policy=RetryPolicy(hedge_percentile=0.5, hedge_min_samples=5))
+
+    async def run():
+
+        for _ in range(5):
+            await client.v1.items.get_item("1")
+
+        start = time.perf_counter()
+        item = await client.v1.items.get_item("2")
+
+        return item, time.perf_counter() - start
+
+    # act
+    item, elapsed = asyncio.run(run())
+
+    # assert
+    assert "2" == item.id
+    assert 7 == len(server.requests)
+    assert elapsed < 0.5
+
+def cancelling_hedged_async_request_cancels_requests_test():
+
+    # arrange
+    server = _ItemsServer(delay=0.02, slow_requests={ 5: 1.0 })
+    limiter = ConcurrencyLimiter(initial_limit=16)
+    client = _create_async_client(server, retry_policy=RetryPolicy(hedge_percentile=0.5, hedge_min_samples=5), concurrency_limiter=limiter)
+
+    async def run():
+
+        for _ in range(5):
+            await client.v1.items.get_item("1")
+
+        # cancel the caller before the hedge threshold is reached
+        task = asyncio.ensure_future(client.v1.items.get_item("2"))
+        await asyncio.sleep(0.005)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        return server.active_requests, limiter.in_flight
+
+    # act
+    active_requests, in_flight = asyncio.run(run())
+
+    # assert
+    assert 6 == len(server.requests)
+    assert 0 == active_requests
+    assert 0 == in_flight
+
+def hedging_requires_latency_samples_test():
+
+    # arrange
+    server = _ItemsServer(slow_requests={ 0: 0.05 })
+    client = _create_client(server, retry_policy=RetryPolicy(hedge_percentile=0.5, hedge_min_samples=5))
+
+    # act
+    client.v1.items.get_item("1")
+
+    # assert
+    assert 1 == len(server.requests)
+
+class _SlowBodyStream(httpx.SyncByteStream):
+    """A response stream whose body takes some time to arrive."""
+
+    def __init__(self, data: bytes, delay: float):
+        self._data = data
+        self._delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        time.sleep(self._delay)
+        yield self._data
+
+def limiter_measures_time_to_first_byte_test():
+
+    # arrange
+    body_delays = [0, 0.05]
+
+    # the headers of both responses arrive at once, but the body of the second response is slow
+    def handle(request: httpx.Request) -> httpx.Response:
+        items = [{ "id": str(i), "name": f"item{i}", "value": 1.0 } for i in range(3)]
+        return httpx.Response(200, stream=_SlowBodyStream(json.dumps(items).encode("utf-8"), body_delays.pop(0)))
+
+    limiter = ConcurrencyLimiter(initial_limit=16)
+    client = TestClient(httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(handle)), concurrency_limiter=limiter)
+
+    # act
+    client.v1.items.get_items()
+    items = client.v1.items.get_items()
+
+    # assert
+    assert 3 == len(items)
+    assert 16 == limiter.limit
+    assert 0 == limiter.in_flight
+
+def limiter_separates_operations_test():
+
+    # arrange
+    server = _ItemsServer(slow_requests={ 1: 0.05 })
+    limiter = ConcurrencyLimiter(initial_limit=16)
+    client = _create_client(server, concurrency_limiter=limiter)
+
+    # act
+    client.v1.items.get_item("1")
+    client.v1.items.get_items()
+    client.v1.items.get_item("2")
+
+    # assert
+    assert 16 == limiter.limit
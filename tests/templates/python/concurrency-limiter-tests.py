@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from PythonConcurrencyLimiter import ConcurrencyLimiter
+
+@pytest.mark.parametrize("status_code, latency, expected", [
+    (429, 0.01, 8),
+    (503, 0.01, 8),
+    (None, 0.01, 8),
+    (200, 0.1, 8),
+    (200, 0.01, 16)
+])
+def can_adapt_limit_test(status_code, latency: float, expected: int):
+
+    # arrange
+    limiter = ConcurrencyLimiter(initial_limit=16)
+
+    limiter._acquire()
+    limiter._release(0.01, 200)
+
+    # act
+    limiter._acquire()
+    limiter._release(latency, status_code)
+
+    # assert
+    assert expected == limiter.limit
+    assert 0 == limiter.in_flight
+
+def increases_limit_by_one_per_round_trip_test():
+
+    # arrange
+    limiter = ConcurrencyLimiter(initial_limit=4)
+
+    # act
+    for _ in range(4):
+        limiter._acquire()
+
+    for _ in range(4):
+        limiter._release(0.01, 200)
+
+    # assert
+    assert 4 < limiter._limit <= 5
+    assert 4 == limiter.requests
+    assert 0 == limiter.overloads
+
+def blocks_beyond_limit_test():
+
+    # arrange
+    limiter = ConcurrencyLimiter(initial_limit=1)
+    limiter._acquire()
+
+    acquired = threading.Event()
+
+    def acquire():
+        limiter._acquire()
+        acquired.set()
+
+    # act
+    thread = threading.Thread(target=acquire)
+    thread.start()
+
+    is_blocked = not acquired.wait(0.05)
+    limiter._release(None, None)
+    thread.join()
+
+    # assert
+    assert is_blocked
+    assert 1 == limiter.in_flight
+    assert 0.05 / 2 <= limiter.mean_queueing_time
+
+def can_limit_rate_test():
+
+    # arrange
+    limiter = ConcurrencyLimiter(rate=100, burst=1)
+
+    # act
+    start = time.monotonic()
+
+    for _ in range(6):
+        limiter._acquire()
+        limiter._release(None, None)
+
+    elapsed = time.monotonic() - start
+
+    # assert
+    assert 0.04 <= elapsed
+
+def passes_slot_of_cancelled_waiter_on_test():
+
+    async def run():
+
+        # arrange
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        await limiter._acquire_async()
+
+        cancelled_waiter = asyncio.ensure_future(limiter._acquire_async())
+        waiter = asyncio.ensure_future(limiter._acquire_async())
+        await asyncio.sleep(0)
+
+        # act
+        cancelled_waiter.cancel()
+        limiter._release(None, None)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        # assert
+        assert 1 == limiter.in_flight
+
+    asyncio.run(run())
+
+def separates_baselines_of_operations_test():
+
+    # arrange
+    limiter = ConcurrencyLimiter(initial_limit=16)
+
+    limiter._acquire()
+    limiter._release(0.01, 200, "GET /api/v1/items/{id}")
+
+    # act
+    limiter._acquire()
+    limiter._release(0.1, 200, "GET /api/v1/items")
+
+    # assert
+    assert 16 == limiter.limit
+
+@pytest.mark.parametrize("baseline_decay, expected", [
+    (0, 8),
+    (0.5, 16)
+])
+def baseline_follows_lasting_latency_changes_test(baseline_decay: float, expected: int):
+
+    # arrange
+    limiter = ConcurrencyLimiter(initial_limit=16, baseline_decay=baseline_decay)
+
+    for latency in [0.01, 0.015, 0.015, 0.015, 0.015]:
+        limiter._acquire()
+        limiter._release(latency, 200)
+
+    # act
+    limiter._acquire()
+    limiter._release(0.025, 200)
+
+    # assert
+    assert expected == limiter.limit
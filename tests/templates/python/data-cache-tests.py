@@ -0,0 +1,143 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from PythonDataCache import DataCache
+
+begin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+sample_period = timedelta(seconds=1)
+
+def _get_values(first: int, last: int) -> array:
+    return array("d", [float(i) for i in range(first, last)])
+
+def can_track_missing_intervals_test(tmp_path: Path):
+
+    # arrange
+    cache = DataCache(str(tmp_path), block_size=8 * 10)
+
+    # act
+    cache.write("/A/B/C", sample_period, begin + 5 * sample_period, memoryview(_get_values(5, 15)).cast("B"))
+    cache.write("/A/B/C", sample_period, begin + 15 * sample_period, memoryview(_get_values(15, 20)).cast("B"))
+    cache.write("/A/B/C", sample_period, begin + 30 * sample_period, memoryview(_get_values(30, 35)).cast("B"))
+
+    actual = cache.get_missing_intervals("/A/B/C", sample_period, begin, begin + 40 * sample_period)
+
+    # assert
+    expected = [
+        (begin, begin + 5 * sample_period),
+        (begin + 20 * sample_period, begin + 30 * sample_period),
+        (begin + 35 * sample_period, begin + 40 * sample_period)
+    ]
+
+    assert expected == actual
+    assert [] == cache.get_missing_intervals("/A/B/C", sample_period, begin + 5 * sample_period, begin + 20 * sample_period)
+    assert [(begin, begin + 40 * sample_period)] == cache.get_missing_intervals("/A/B/D", sample_period, begin, begin + 40 * sample_period)
+    assert 20 * 8 == cache.size
+
+def can_read_cached_data_test(tmp_path: Path):
+
+    # arrange
+    cache = DataCache(str(tmp_path), block_size=8 * 10)
+    cache.write("/A/B/C", sample_period, begin + 5 * sample_period, memoryview(_get_values(5, 25)).cast("B"))
+
+    # act
+    actual = array("d", [-1.0]) * 30
+    missing_intervals = cache.read("/A/B/C", sample_period, begin, memoryview(actual).cast("B"))
+
+    # assert
+    expected_missing_intervals = [
+        (begin, begin + 5 * sample_period),
+        (begin + 25 * sample_period, begin + 30 * sample_period)
+    ]
+
+    assert [-1.0] * 5 + list(_get_values(5, 25)) + [-1.0] * 5 == list(actual)
+    assert expected_missing_intervals == missing_intervals
+
+def can_reuse_cache_folder_test(tmp_path: Path):
+
+    # arrange
+    cache1 = DataCache(str(tmp_path))
+    cache1.write("/A/B/C", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"))
+
+    # act
+    cache2 = DataCache(str(tmp_path))
+
+    actual = array("d", [0.0]) * 10
+    cache2.read("/A/B/C", sample_period, begin, memoryview(actual).cast("B"))
+
+    # assert
+    assert [] == cache2.get_missing_intervals("/A/B/C", sample_period, begin, begin + 10 * sample_period)
+    assert list(_get_values(0, 10)) == list(actual)
+
+def clears_cache_folder_of_other_block_size_test(tmp_path: Path):
+
+    # arrange
+    cache1 = DataCache(str(tmp_path), block_size=8 * 10)
+    cache1.write("/A/B/C", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"))
+
+    # act
+    cache2 = DataCache(str(tmp_path), block_size=8 * 20)
+
+    actual = array("d", [-1.0]) * 10
+    missing_intervals = cache2.read("/A/B/C", sample_period, begin, memoryview(actual).cast("B"))
+
+    # assert
+    assert [(begin, begin + 10 * sample_period)] == missing_intervals
+    assert [-1.0] * 10 == list(actual)
+    assert 0 == cache2.size
+    assert [] == list(tmp_path.iterdir())
+
+def separates_servers_test(tmp_path: Path):
+
+    # arrange
+    cache = DataCache(str(tmp_path))
+    end = begin + 10 * sample_period
+
+    # act
+    cache.write("/A/B/C", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"), "http://server1/")
+
+    actual = array("d", [-1.0]) * 10
+    missing_intervals = cache.read("/A/B/C", sample_period, begin, memoryview(actual).cast("B"), "http://server2/")
+
+    # assert
+    assert [(begin, end)] == missing_intervals
+    assert [-1.0] * 10 == list(actual)
+    assert [] == cache.get_missing_intervals("/A/B/C", sample_period, begin, end, "http://server1/")
+    assert [(begin, end)] == cache.get_missing_intervals("/A/B/C", sample_period, begin, end)
+
+def evicts_least_recently_used_blocks_test(tmp_path: Path):
+
+    # arrange
+    cache = DataCache(str(tmp_path), max_size=8 * 20, block_size=8 * 10)
+
+    cache.write("/A/B/C", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"))
+    cache.write("/A/B/D", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"))
+
+    # mark /A/B/C as recently used
+    cache.read("/A/B/C", sample_period, begin, memoryview(array("d", [0.0]) * 10).cast("B"))
+
+    # act
+    cache.write("/A/B/E", sample_period, begin, memoryview(_get_values(0, 10)).cast("B"))
+
+    # assert
+    end = begin + 10 * sample_period
+
+    assert [] == cache.get_missing_intervals("/A/B/C", sample_period, begin, end)
+    assert [(begin, end)] == cache.get_missing_intervals("/A/B/D", sample_period, begin, end)
+    assert [] == cache.get_missing_intervals("/A/B/E", sample_period, begin, end)
+    assert 20 * 8 == cache.size
+    assert 2 == len(list(tmp_path.glob("*.bin")))
+
+@pytest.mark.parametrize("value", [begin + timedelta(milliseconds=500), begin.replace(tzinfo=None) + timedelta(milliseconds=1)])
+def does_not_cache_unaligned_time_ranges_test(tmp_path: Path, value: datetime):
+
+    # arrange
+    cache = DataCache(str(tmp_path))
+
+    # act
+    cache.write("/A/B/C", sample_period, value, memoryview(_get_values(0, 10)).cast("B"))
+
+    # assert
+    assert 0 == cache.size
+    assert [(value, value + 10 * sample_period)] == cache.get_missing_intervals("/A/B/C", sample_period, value, value + 10 * sample_period)
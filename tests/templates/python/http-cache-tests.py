@@ -0,0 +1,126 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from PythonHttpCache import DiskHttpCache, HttpCache, MemoryHttpCache
+
+@pytest.mark.parametrize("headers, is_stored, is_fresh", [
+    ({ "Cache-Control": "max-age=60" }, True, True),
+    ({ "Cache-Control": "public, max-age=0", "ETag": '"1"' }, True, False),
+    ({ "Cache-Control": "no-cache", "ETag": '"1"' }, True, False),
+    ({ "Cache-Control": "no-store", "ETag": '"1"' }, False, False),
+    ({ "Expires": "Wed, 21 Oct 2015 07:28:00 GMT", "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT" }, True, False),
+    ({ "Expires": "invalid" }, False, False),
+    ({}, False, False)
+])
+def can_evaluate_cache_headers_test(headers: dict[str, str], is_stored: bool, is_fresh: bool):
+
+    # arrange
+    cache = MemoryHttpCache()
+
+    # act
+    entry = cache._store("key", headers, b"{}")
+
+    # assert
+    assert is_stored == (cache.get("key") is not None)
+    assert is_fresh == (entry is not None and entry.is_fresh())
+    assert 1 == cache.misses
+
+def can_revalidate_test():
+
+    # arrange
+    cache = MemoryHttpCache()
+    entry = cache._store("key", { "Cache-Control": "no-cache", "ETag": '"1"' }, b"{}")
+    assert entry is not None
+
+    # act
+    cache._revalidate("key", entry, { "Cache-Control": "max-age=60", "ETag": '"2"' })
+    actual = cache._lookup("key")
+
+    # assert
+    assert actual is not None and actual.is_fresh()
+    assert '"2"' == actual.etag
+    assert 1 == cache.hits
+    assert 1 == cache.revalidations
+
+@pytest.mark.parametrize("create_cache", [
+    lambda folder, max_size: MemoryHttpCache(max_size=max_size),
+    lambda folder, max_size: DiskHttpCache(str(folder), max_size=max_size)
+])
+def evicts_least_recently_used_responses_test(tmp_path: Path, create_cache):
+
+    # arrange
+    headers = { "Cache-Control": "max-age=60" }
+    cache: HttpCache = create_cache(tmp_path, 2500)
+
+    cache._store("a", headers, b"a" * 1000)
+    cache._store("b", headers, b"b" * 1000)
+
+    # mark a as recently used
+    cache.get("a")
+
+    # act
+    cache._store("c", headers, b"c" * 1000)
+
+    # assert
+    def get_content(key: str) -> Optional[bytes]:
+        entry = cache.get(key)
+        return None if entry is None else entry.content
+
+    assert b"a" * 1000 == get_content("a")
+    assert get_content("b") is None
+    assert b"c" * 1000 == get_content("c")
+
+def can_reuse_cache_folder_test(tmp_path: Path):
+
+    # arrange
+    cache1 = DiskHttpCache(str(tmp_path))
+    cache1._store("key", { "Cache-Control": "max-age=60", "ETag": '"1"' }, b'{ "value": 1 }')
+
+    # act
+    cache2 = DiskHttpCache(str(tmp_path))
+    actual = cache2.get("key")
+
+    # assert
+    assert actual is not None and actual.is_fresh()
+    assert b'{ "value": 1 }' == actual.content
+    assert '"1"' == actual.etag
+
+def cannot_create_abstract_cache_test():
+
+    # act / assert
+    with pytest.raises(TypeError):
+        HttpCache(1000, 0) # type: ignore
+
+def disk_cache_reuses_decoded_objects_test(tmp_path: Path):
+
+    # arrange
+    cache = DiskHttpCache(str(tmp_path))
+    cache._store("key", { "Cache-Control": "max-age=60" }, b'{ "value": 1 }')
+
+    entry1 = cache.get("key")
+    assert entry1 is not None
+
+    decoded = { "value": 1 }
+    entry1.decoded["default"] = decoded
+
+    # act
+    entry2 = cache.get("key")
+
+    # assert
+    assert entry2 is not None
+    assert decoded is entry2.decoded["default"]
+
+def disk_cache_does_not_store_keys_test(tmp_path: Path):
+
+    # arrange
+    cache = DiskHttpCache(str(tmp_path))
+
+    # act
+    cache._store("GET http://localhost/api\nauthorization: Bearer secret", { "Cache-Control": "max-age=60" }, b"{}")
+
+    # assert
+    file_paths = list(tmp_path.glob("*.cache"))
+
+    assert 1 == len(file_paths)
+    assert b"secret" not in file_paths[0].read_bytes()
@@ -0,0 +1,72 @@
+from typing import Optional
+
+import pytest
+from PythonInstrumentation import HistogramCollector, RequestMetrics
+
+def _create_metrics(operation_name: str, send_time: float, exception: Optional[BaseException] = None) -> RequestMetrics:
+
+    return RequestMetrics(
+        operation_name=operation_name,
+        method="GET",
+        url_template="/api/v1/items/{id}",
+        status_code=200,
+        request_size=0,
+        response_size=100,
+        build_time=0.0,
+        send_time=send_time,
+        time_to_first_byte=send_time / 2,
+        parse_time=0.0,
+        decode_time=0.0,
+        exception=exception
+    )
+
+@pytest.mark.parametrize("percentile, expected", [
+    (0.5, 0.050),
+    (0.9, 0.090),
+    (0.99, 0.099),
+    (1.0, 0.100)
+])
+def can_estimate_percentiles_test(percentile: float, expected: float):
+
+    # arrange
+    collector = HistogramCollector()
+
+    # act
+    for i in range(1, 101):
+        collector(_create_metrics("items.get_item", i / 1000))
+
+    actual = collector.get_percentile("items.get_item", "send", percentile)
+
+    # assert
+    assert actual is not None
+    assert expected <= actual <= expected * 2 ** (1 / 8)
+
+def can_report_test():
+
+    # arrange
+    collector = HistogramCollector()
+
+    # act
+    collector(_create_metrics("items.get_item", 0.010))
+    collector(_create_metrics("items.get_item", 0.020, exception=Exception()))
+    collector(_create_metrics("items.get_items", 0.030))
+
+    actual = collector.report()
+
+    # assert
+    assert "items.get_item (GET /api/v1/items/{id}): 2 calls, 1 errors, 0 B sent, 100 B received (mean)" in actual
+    assert "items.get_items (GET /api/v1/items/{id}): 1 calls, 0 errors" in actual
+    assert 2 * 8 == len(actual.splitlines())
+
+def can_clear_test():
+
+    # arrange
+    collector = HistogramCollector()
+    collector(_create_metrics("items.get_item", 0.010))
+
+    # act
+    collector.clear()
+
+    # assert
+    assert collector.get_percentile("items.get_item", "total", 0.5) is None
+    assert "" == collector.report()
@@ -0,0 +1,734 @@
+import asyncio
+import io
+import json
+import random
+import struct
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional
+from uuid import UUID
+from zipfile import ZipFile, ZipInfo
+
+import httpx
+import pytest
+
+pytest.importorskip("test_api", reason="Generate the test client with: dotnet run --project tests/Apollo3zehn.OpenApiClientGenerator.PythonClients -- test-client")
+
+from test_api import (DataCache, MemoryHttpCache, TestAsyncClient, TestClient,
+                      TestException)
+
+begin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+end = begin + timedelta(hours=1)
+resource_paths = [f"/A/B/C/resource{i}/1_s" for i in range(8)]
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+def _get_values(resource_path: str, value_begin: datetime, value_end: datetime) -> list[float]:
+
+    # the values encode the resource index and the sample index
+    index = resource_paths.index(resource_path)
+    first = int((value_begin - begin).total_seconds())
+    last = int((value_end - begin).total_seconds())
+
+    return [index * 10000.0 + i for i in range(first, last)]
+
+def _get_artifact_file_data(job_number: int) -> bytes:
+    return random.Random(job_number).randbytes(100 * 1000)
+
+def _create_artifact(job_number: int) -> bytes:
+
+    stream = io.BytesIO()
+
+    # a fixed date/time keeps the bytes of the artifact identical across requests
+    with ZipFile(stream, "w") as zip_file:
+        zip_file.writestr(ZipInfo(f"data/file{job_number}.bin", date_time=(2020, 1, 1, 0, 0, 0)), _get_artifact_file_data(job_number))
+
+    return stream.getvalue()
+
+class _DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A response stream which drops the connection after the given number of bytes."""
+
+    def __init__(self, data: bytes, drop_offset: Optional[int]):
+        self._data = data
+        self._drop_offset = drop_offset
+
+    def __iter__(self) -> Iterator[bytes]:
+
+        for offset in range(0, len(self._data), 10 * 1000):
+
+            if self._drop_offset is not None and offset >= self._drop_offset:
+                raise httpx.ReadError("The connection has been closed.")
+
+            yield self._data[offset:offset + 10 * 1000]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+
+        for chunk in self:
+            yield chunk
+
+class _NexusServer:
+    """A fake Nexus server which records the data requests and their concurrency."""
+
+    def __init__(self, delay: float = 0, truncate: bool = False, drops: int = 0, drop_offset: float = 0.5, supports_range: bool = True, export_barrier: Optional[threading.Barrier] = None, slow_jobs: bool = False, retry_after: Optional[str] = None, faulted_job: Optional[int] = None):
+        self.delay = delay
+        self.slow_jobs = slow_jobs
+        self.retry_after = retry_after
+        self.faulted_job = faulted_job
+        self.export_barrier = export_barrier
+        self.truncate = truncate
+        self.drops = drops
+        self.drop_offset = drop_offset
+        self.supports_range = supports_range
+        self.data_requests: list[tuple[str, datetime, datetime]] = []
+        self.export_requests: list[tuple[datetime, datetime]] = []
+        self.download_requests: list[httpx.Headers] = []
+        self.status_requests: dict[int, int] = {}
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self._lock = threading.Lock()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+
+        path = request.url.path
+
+        if path == "/api/v1/catalogs/search-items":
+
+            catalog_items = {
+                resource_path: {
+                    "catalog": None,
+                    "resource": { "id": resource_path.split("/")[4], "properties": { "unit": "m/s" } },
+                    "representation": { "samplePeriod": "00:00:01" }
+                }
+                for resource_path in json.loads(request.content)
+            }
+
+            return httpx.Response(200, json=catalog_items)
+
+        elif path == "/api/v1/data":
+
+            resource_path = request.url.params["resourcePath"]
+            data_begin = _parse_datetime(request.url.params["begin"])
+            data_end = _parse_datetime(request.url.params["end"])
+
+            with self._lock:
+                self.data_requests.append((resource_path, data_begin, data_end))
+
+            if resource_path not in resource_paths:
+                return httpx.Response(500, text="The resource does not exist.")
+
+            values = _get_values(resource_path, data_begin, data_end)
+
+            if self.truncate:
+                values = values[:-1]
+
+            return httpx.Response(200, content=struct.pack(f"<{len(values)}d", *values))
+
+        elif path == "/api/v1/jobs/export":
+
+            # all jobs must be created concurrently to pass the barrier
+            if self.export_barrier is not None:
+                self.export_barrier.wait()
+
+            parameters = json.loads(request.content)
+
+            with self._lock:
+                self.export_requests.append((_parse_datetime(parameters["begin"]), _parse_datetime(parameters["end"])))
+                job_number = len(self.export_requests)
+
+            return httpx.Response(200, json={ "id": str(UUID(int=job_number)) })
+
+        elif path.startswith("/api/v1/jobs/") and path.endswith("/status"):
+
+            job_number = UUID(path.split("/")[-2]).int
+
+            with self._lock:
+                self.status_requests[job_number] = self.status_requests.get(job_number, 0) + 1
+                status_request_count = self.status_requests[job_number]
+
+            if job_number == self.faulted_job:
+                job_status = { "start": "2020-01-01T00:00:00Z", "status": "Faulted", "progress": 0.5, "exceptionMessage": "The job has been aborted.", "result": None }
+                return httpx.Response(200, json=job_status)
+
+            # slow jobs run to completion on the status request with their job number
+            if self.slow_jobs and status_request_count < job_number:
+                job_status = { "start": "2020-01-01T00:00:00Z", "status": "Running", "progress": status_request_count / job_number, "exceptionMessage": None, "result": None }
+                headers = { "Retry-After": self.retry_after } if self.retry_after is not None else {}
+                return httpx.Response(200, headers=headers, json=job_status)
+
+            job_status = { "start": "2020-01-01T00:00:00Z", "status": "RanToCompletion", "progress": 1.0, "exceptionMessage": None, "result": f"artifact{job_number}" }
+
+            return httpx.Response(200, json=job_status)
+
+        elif path.startswith("/api/v1/artifacts/"):
+            return self._download(request, int(path.split("/")[-1].removeprefix("artifact")))
+
+        return httpx.Response(404)
+
+    def _download(self, request: httpx.Request, job_number: int) -> httpx.Response:
+
+        artifact = _create_artifact(job_number)
+        range_header = request.headers.get("Range")
+
+        with self._lock:
+            self.download_requests.append(request.headers)
+            drop = self.drops > 0
+            self.drops -= 1
+
+        offset = int(range_header.removeprefix("bytes=").removesuffix("-")) \
+            if range_header is not None and self.supports_range \
+            else 0
+
+        data = artifact[offset:]
+        stream = _DroppingStream(data, int(len(data) * self.drop_offset) if drop else None)
+
+        if offset > 0:
+            headers = { "Content-Length": str(len(artifact) - offset), "Content-Range": f"bytes {offset}-{len(artifact) - 1}/{len(artifact)}" }
+            return httpx.Response(206, headers=headers, stream=stream)
+
+        return httpx.Response(200, headers={ "Content-Length": str(len(artifact)) }, stream=stream)
+
+    def _enter(self):
+
+        with self._lock:
+            self.active_requests += 1
+            self.max_active_requests = max(self.max_active_requests, self.active_requests)
+
+    def _leave(self):
+
+        with self._lock:
+            self.active_requests -= 1
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+
+        if request.url.path == "/api/v1/data":
+            self._enter()
+            time.sleep(self.delay)
+            self._leave()
+
+        return self.handle(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+
+        if request.url.path == "/api/v1/data":
+
+            self._enter()
+
+            try:
+                await asyncio.sleep(self.delay)
+
+            finally:
+                self._leave()
+
+        return self.handle(request)
+
+def _create_client(server: _NexusServer, base_url: str = "http://localhost", **kwargs) -> TestClient:
+    return TestClient(httpx.Client(base_url=base_url, transport=httpx.MockTransport(server.handle_sync)), **kwargs)
+
+def _create_async_client(server: _NexusServer, **kwargs) -> TestAsyncClient:
+    return TestAsyncClient(httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(server.handle_async)), **kwargs)
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def can_load_concurrently_test(max_concurrency: int):
+
+    # arrange
+    server = _NexusServer(delay=0.02)
+    client = _create_client(server)
+    progress: list[float] = []
+
+    # act
+    actual = client.load(begin, end, resource_paths, progress.append, max_concurrency=max_concurrency)
+
+    # assert
+    assert resource_paths == list(actual.keys())
+
+    for resource_path, data_response in actual.items():
+        assert _get_values(resource_path, begin, end) == list(data_response.values)
+        assert "m/s" == data_response.unit
+        assert timedelta(seconds=1) == data_response.sample_period
+
+    assert max_concurrency == server.max_active_requests
+    assert sorted(progress) == progress
+    assert 1 == pytest.approx(progress[-1])
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def can_load_concurrently_async_test(max_concurrency: int):
+
+    # arrange
+    server = _NexusServer(delay=0.02)
+    client = _create_async_client(server)
+    progress: list[float] = []
+
+    # act
+    actual = asyncio.run(client.load(begin, end, resource_paths, progress.append, max_concurrency=max_concurrency))
+
+    # assert
+    assert resource_paths == list(actual.keys())
+
+    for resource_path, data_response in actual.items():
+        assert _get_values(resource_path, begin, end) == list(data_response.values)
+
+    assert max_concurrency == server.max_active_requests
+    assert sorted(progress) == progress
+    assert 1 == pytest.approx(progress[-1])
+
+def load_raises_first_error_test():
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+
+    # act
+    with pytest.raises(TestException) as exception_info:
+        client.load(begin, end, resource_paths + ["/A/B/C/missing/1_s"], None)
+
+    # assert
+    assert "The resource does not exist." in exception_info.value.message
+
+def load_raises_first_error_and_cancels_requests_async_test():
+
+    async def run() -> Optional[set[asyncio.Task]]:
+
+        client = _create_async_client(server)
+
+        with pytest.raises(TestException):
+            await client.load(begin, end, resource_paths + ["/A/B/C/missing/1_s"], None, max_concurrency=2)
+
+        await asyncio.sleep(server.delay * 2)
+
+        return asyncio.all_tasks() - { asyncio.current_task() }
+
+    # arrange
+    server = _NexusServer(delay=0.02)
+
+    # act
+    pending_tasks = asyncio.run(run())
+
+    # assert
+    assert not pending_tasks
+    assert 0 == server.active_requests
+
+def can_load_in_chunks_test():
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+    progress: list[float] = []
+
+    # act
+    actual = client.load(begin, end, resource_paths[:2], progress.append, max_chunk_size=8 * 1000)
+
+    # assert
+    expected_time_ranges = [
+        (begin, begin + timedelta(seconds=1000)),
+        (begin + timedelta(seconds=1000), begin + timedelta(seconds=2000)),
+        (begin + timedelta(seconds=2000), begin + timedelta(seconds=3000)),
+        (begin + timedelta(seconds=3000), end)
+    ]
+
+    for resource_path, data_response in actual.items():
+
+        actual_time_ranges = sorted(
+            (request_begin, request_end)
+            for request_resource_path, request_begin, request_end in server.data_requests
+            if request_resource_path == resource_path)
+
+        assert expected_time_ranges == actual_time_ranges
+        assert _get_values(resource_path, begin, end) == list(data_response.values)
+
+    assert 2 * 4 == len(progress)
+    assert 1 == pytest.approx(progress[-1])
+
+def can_load_empty_time_range_test():
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+
+    # act
+    actual = client.load(begin, begin, resource_paths[:1], None)
+
+    # assert
+    assert [] == list(actual[resource_paths[0]].values)
+
+@pytest.mark.parametrize("max_chunk_size", [8 * 1000, 16 * 1024 * 1024])
+def load_rejects_invalid_data_length_test(max_chunk_size: int):
+
+    # arrange
+    server = _NexusServer(truncate=True)
+    client = _create_client(server)
+
+    # act / assert
+    with pytest.raises(Exception, match="The data length is invalid."):
+        client.load(begin, end, resource_paths[:1], None, max_chunk_size=max_chunk_size)
+
+@pytest.mark.parametrize("values_type, expected_type", [
+    ("array", array),
+    ("memoryview", memoryview)
+])
+def can_load_values_type_test(values_type: str, expected_type: type):
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+
+    # act
+    actual = client.load(begin, end, resource_paths[:2], None, max_chunk_size=8 * 1000, values_type=values_type)
+
+    # assert
+    for resource_path, data_response in actual.items():
+        assert expected_type is type(data_response.values)
+        assert _get_values(resource_path, begin, end) == list(data_response.values)
+
+def can_load_numpy_values_test():
+
+    # arrange
+    numpy = pytest.importorskip("numpy")
+    server = _NexusServer()
+    client = _create_async_client(server)
+
+    # act
+    actual = asyncio.run(client.load(begin, end, resource_paths[:2], None, max_chunk_size=8 * 1000, values_type="numpy"))
+
+    # assert
+    for resource_path, data_response in actual.items():
+
+        values: Any = data_response.values
+
+        assert numpy.ndarray is type(values)
+        assert numpy.float64 == values.dtype
+        assert _get_values(resource_path, begin, end) == values.tolist()
+
+def load_rejects_unsupported_values_type_test():
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+
+    # act / assert
+    with pytest.raises(Exception, match="The values type list is not supported."):
+        client.load(begin, end, resource_paths[:1], None, values_type="list")
+
+    assert [] == server.data_requests
+
+def load_ignores_raw_mode_test():
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server, raw_mode="snake_case")
+
+    # act
+    actual = client.load(begin, end, resource_paths[:1], None)
+
+    # assert
+    assert _get_values(resource_paths[0], begin, end) == list(actual[resource_paths[0]].values)
+    assert timedelta(seconds=1) == actual[resource_paths[0]].sample_period
+
+def can_load_from_cache_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+    cache = DataCache(str(tmp_path), block_size=8 * 1000)
+    half = begin + (end - begin) / 2
+
+    client.load(begin, half, resource_paths[:2], None, cache=cache)
+    server.data_requests.clear()
+
+    # act
+    actual = client.load(begin, end, resource_paths[:2], None, cache=cache)
+
+    # assert
+    for resource_path, data_response in actual.items():
+        assert _get_values(resource_path, begin, end) == list(data_response.values)
+
+    assert sorted([(resource_path, half, end) for resource_path in resource_paths[:2]]) == sorted(server.data_requests)
+
+def reports_progress_of_cached_load_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+    cache = DataCache(str(tmp_path))
+    progress: list[float] = []
+
+    client.load(begin, end, resource_paths[:2], None, cache=cache)
+    server.data_requests.clear()
+
+    # act
+    client.load(begin, end, resource_paths[:2], progress.append, cache=cache)
+
+    # assert
+    assert [] == server.data_requests
+    assert [1] == progress
+
+def separates_cached_data_of_servers_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer()
+    cache = DataCache(str(tmp_path))
+
+    _create_client(server, "http://server1").load(begin, end, resource_paths[:1], None, cache=cache)
+    server.data_requests.clear()
+
+    # act
+    _create_client(server, "http://server2").load(begin, end, resource_paths[:1], None, cache=cache)
+    _create_client(server, "http://server1").load(begin, end, resource_paths[:1], None, cache=cache)
+
+    # assert
+    assert [(resource_paths[0], begin, end)] == server.data_requests
+
+@pytest.mark.parametrize("drops, supports_range", [(0, True), (2, True), (2, False)])
+@pytest.mark.parametrize("in_memory", [True, False])
+def can_export_and_resume_download_test(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, drops: int, supports_range: bool, in_memory: bool):
+
+    # arrange
+    server = _NexusServer(drops=drops, supports_range=supports_range)
+    client = _create_client(server)
+    progress: list[tuple[float, str]] = []
+
+    if not in_memory:
+        monkeypatch.setattr("test_api._client._MAX_IN_MEMORY_ARTIFACT_SIZE", 0)
+
+    # act
+    client.export(begin, end, timedelta(0), "csv", resource_paths[:1], {}, str(tmp_path), lambda value, message: progress.append((value, message)))
+
+    # assert
+    assert _get_artifact_file_data(1) == (tmp_path / "data" / "file1.bin").read_bytes()
+    assert drops + 1 == len(server.download_requests)
+    assert all("identity" == headers["Accept-Encoding"] for headers in server.download_requests)
+    assert (1, "extract") == progress[-1]
+
+    if drops > 0:
+
+        # the download continues at the number of received bytes
+        range_header = server.download_requests[1]["Range"]
+
+        assert range_header.startswith("bytes=")
+        assert 0 < int(range_header.removeprefix("bytes=").removesuffix("-")) < len(_create_artifact(1))
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def can_export_and_resume_download_async_test(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, in_memory: bool):
+
+    # arrange
+    server = _NexusServer(drops=2)
+    client = _create_async_client(server)
+
+    if not in_memory:
+        monkeypatch.setattr("test_api._client._MAX_IN_MEMORY_ARTIFACT_SIZE", 0)
+
+    # act
+    asyncio.run(client.export(begin, end, timedelta(0), "csv", resource_paths[:1], {}, str(tmp_path), None))
+
+    # assert
+    assert _get_artifact_file_data(1) == (tmp_path / "data" / "file1.bin").read_bytes()
+    assert 3 == len(server.download_requests)
+
+def export_ignores_raw_mode_test(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True)
+    client = _create_client(server, raw_mode="snake_case", lazy_decode=True)
+    _record_sleeps(monkeypatch)
+
+    # act
+    client.export(begin, end, timedelta(0), "csv", resource_paths[:1], {}, str(tmp_path), None)
+
+    # assert
+    assert _get_artifact_file_data(1) == (tmp_path / "data" / "file1.bin").read_bytes()
+
+def export_ignores_raw_mode_async_test(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True)
+    client = _create_async_client(server)
+    _record_sleeps(monkeypatch)
+
+    async def run():
+
+        with client.raw("untouched"):
+            await client.export(begin, end, timedelta(0), "csv", resource_paths[:1], {}, str(tmp_path), None)
+
+    # act
+    asyncio.run(run())
+
+    # assert
+    assert _get_artifact_file_data(1) == (tmp_path / "data" / "file1.bin").read_bytes()
+
+def export_raises_if_download_makes_no_progress_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer(drops=10, drop_offset=0)
+    client = _create_client(server)
+
+    # act / assert
+    with pytest.raises(httpx.ReadError):
+        client.export(begin, end, timedelta(0), "csv", resource_paths[:1], {}, str(tmp_path), None, max_retries=3)
+
+    assert 4 == len(server.download_requests)
+
+def _get_time(hours: int, minutes: int) -> datetime:
+    return begin + timedelta(hours=hours, minutes=minutes)
+
+@pytest.mark.parametrize("export_begin, export_end, max_jobs, expected", [
+    (_get_time(0, 0), _get_time(1, 0), 1, [(_get_time(0, 0), _get_time(1, 0))]),
+    (_get_time(0, 0), _get_time(1, 0), 3, [(_get_time(0, 0), _get_time(0, 20)), (_get_time(0, 20), _get_time(0, 40)), (_get_time(0, 40), _get_time(1, 0))]),
+    (_get_time(0, 0), _get_time(1, 0), 4, [(_get_time(0, 0), _get_time(0, 20)), (_get_time(0, 20), _get_time(0, 40)), (_get_time(0, 40), _get_time(1, 0))]),
+    (_get_time(0, 0), _get_time(0, 30), 10, [(_get_time(0, 0), _get_time(0, 10)), (_get_time(0, 10), _get_time(0, 20)), (_get_time(0, 20), _get_time(0, 30))]),
+    # the jobs are split at multiples of the file period, not relative to the begin
+    (_get_time(0, 5), _get_time(1, 5), 3, [(_get_time(0, 5), _get_time(0, 30)), (_get_time(0, 30), _get_time(1, 0)), (_get_time(1, 0), _get_time(1, 5))])
+])
+def can_split_export_into_jobs_test(tmp_path: Path, export_begin: datetime, export_end: datetime, max_jobs: int, expected: list[tuple[datetime, datetime]]):
+
+    # arrange
+    server = _NexusServer()
+    client = _create_client(server)
+
+    # act
+    client.export(export_begin, export_end, timedelta(minutes=10), "csv", resource_paths[:1], {}, str(tmp_path), None, max_jobs=max_jobs)
+
+    # assert
+    assert expected == sorted(server.export_requests)
+
+    for job_number in range(1, len(expected) + 1):
+        assert _get_artifact_file_data(job_number) == (tmp_path / "data" / f"file{job_number}.bin").read_bytes()
+
+def creates_export_jobs_concurrently_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer(export_barrier=threading.Barrier(3, timeout=5))
+    client = _create_client(server)
+
+    # act
+    client.export(begin, end, timedelta(minutes=10), "csv", resource_paths[:1], {}, str(tmp_path), None, max_jobs=3)
+
+    # assert
+    assert 3 == len(server.export_requests)
+
+def can_export_with_multiple_jobs_async_test(tmp_path: Path):
+
+    # arrange
+    server = _NexusServer()
+    client = _create_async_client(server)
+    progress: list[tuple[float, str]] = []
+
+    # act
+    asyncio.run(client.export(begin, end, timedelta(minutes=10), "csv", resource_paths[:1], {}, str(tmp_path), lambda value, message: progress.append((value, message)), max_jobs=3))
+
+    # assert
+    assert 3 == len(server.export_requests)
+
+    for message in ["export", "download", "extract"]:
+
+        message_progress = [value for value, progress_message in progress if progress_message == message]
+
+        assert sorted(message_progress) == message_progress
+        assert 1 == message_progress[-1]
+
+def _record_sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+
+    delays: list[float] = []
+
+    async def sleep_async(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setattr(asyncio, "sleep", sleep_async)
+
+    return delays
+
+def wait_for_jobs_backs_off_exponentially_test(monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True)
+    client = _create_client(server)
+    delays = _record_sleeps(monkeypatch)
+    progress: list[tuple[int, float]] = []
+
+    # act
+    actual = client.wait_for_jobs([UUID(int=8), UUID(int=2)], lambda index, value: progress.append((index, value)), initial_delay=0.1, max_delay=1.0)
+
+    # assert
+    assert ["artifact8", "artifact2"] == [job_status.result for job_status in actual]
+
+    # all pending jobs are polled in each round
+    assert { 8: 8, 2: 2 } == server.status_requests
+    assert 8 == len(delays)
+
+    for i, delay in enumerate(delays):
+        max_delay = min(0.1 * 2 ** i, 1.0)
+        assert max_delay / 2 <= delay <= max_delay
+
+    assert (0, 1) == progress[-1]
+    assert (1, 1) in progress
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("3", 3.0),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)
+])
+def wait_for_jobs_respects_retry_after_test(monkeypatch: pytest.MonkeyPatch, retry_after: str, expected: float):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True, retry_after=retry_after)
+    client = _create_client(server)
+    delays = _record_sleeps(monkeypatch)
+
+    # act
+    client.wait_for_jobs([UUID(int=4)], initial_delay=0.1)
+
+    # assert
+    assert 4 == len(delays)
+    assert [expected] * 3 == delays[1:]
+
+def wait_for_jobs_respects_retry_after_async_test(monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True, retry_after="3")
+    client = _create_async_client(server)
+    delays = _record_sleeps(monkeypatch)
+
+    # act
+    actual = asyncio.run(client.wait_for_jobs([UUID(int=4), UUID(int=2)], initial_delay=0.1))
+
+    # assert
+    assert ["artifact4", "artifact2"] == [job_status.result for job_status in actual]
+    assert { 4: 4, 2: 2 } == server.status_requests
+    assert [3.0] * 3 == delays[1:]
+
+def wait_for_jobs_bypasses_http_cache_test(monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True)
+    client = _create_client(server, http_cache=MemoryHttpCache(ttl=60))
+    delays: list[float] = []
+
+    # a cached job status would be polled forever
+    def sleep(delay: float) -> None:
+
+        if len(delays) == 10:
+            raise Exception("The job status has been polled too often.")
+
+        delays.append(delay)
+
+    monkeypatch.setattr(time, "sleep", sleep)
+
+    # act
+    actual = client.wait_for_jobs([UUID(int=4)])
+
+    # assert
+    assert ["artifact4"] == [job_status.result for job_status in actual]
+    assert { 4: 4 } == server.status_requests
+
+def wait_for_jobs_raises_if_job_has_failed_test(monkeypatch: pytest.MonkeyPatch):
+
+    # arrange
+    server = _NexusServer(slow_jobs=True, faulted_job=2)
+    client = _create_client(server)
+    _record_sleeps(monkeypatch)
+
+    # act / assert
+    with pytest.raises(Exception, match="The job has failed. Reason: The job has been aborted."):
+        client.wait_for_jobs([UUID(int=4), UUID(int=2)])
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import pytest
+from PythonOperation import _Operation
+
+@pytest.mark.parametrize("path_values, query_values, expected", [
+    (("a/b", "1 2"), (None, None), "/api/v1/items/1%202/values/a%2Fb?end=None"),
+    (("a", 1), (datetime(2020, 1, 1, tzinfo=timezone.utc), "x&y"), "/api/v1/items/1/values/a?begin=2020-01-01T00%3A00%3A00%2B00%3A00&end=x%26y")
+])
+def can_build_url_test(path_values: tuple[Any, ...], query_values: tuple[Optional[Any], ...], expected: str):
+
+    # arrange
+    operation = _Operation(
+        "items.get_value",
+        "GET",
+        "/api/v1/items/{id}/values/{name}",
+        ("name", "id"),
+        (("begin", True), ("end", False)),
+        "application/json",
+        None,
+        float
+    )
+
+    # act
+    actual = operation.build_url(path_values, query_values)
+
+    # assert
+    assert expected == actual
+
+def can_build_url_without_parameters_test():
+
+    # arrange
+    operation = _Operation("items.get_items", "GET", "/api/v1/items", (), (), "application/json", None, list[int])
+
+    # act
+    actual = operation.build_url((), ())
+
+    # assert
+    assert "/api/v1/items" == actual
@@ -1,4 +1,8 @@
 import json
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import IntEnum
@@ -6,8 +10,11 @@ from typing import Any, Optional, Type
 from uuid import UUID
 
 import pytest
-from PythonEncoder import (JsonEncoder, JsonEncoderOptions, to_camel_case,
-                           to_snake_case)
+from PythonEncoder import (JsonArrayReader, JsonEncoder, JsonEncoderOptions,
+                           get_json_backend, to_camel_case, to_snake_case)
+
+# all installed JSON backends
+json_backends = [name for name in ["stdlib", "orjson", "msgspec"] if get_json_backend(name).name == name]
 
 
 class TestEnum(IntEnum):
@@ -139,4 +146,397 @@ def can_decode_primitive_test(json_string: str, cls: Type, expected: Any):
     actual = JsonEncoder.decode(cls, decoded)
 
     # assert
-    assert expected == actual
\ No newline at end of file
+    assert expected == actual
+
+@dataclass(frozen=True)
+class TestClassRecursive:
+    name: str
+    count: int
+    children: Optional[list["TestClassRecursive"]]
+    lookup: Optional[dict[UUID, TestClassNested]]
+
+def can_decode_recursive_dataclass_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_decoder = to_snake_case)
+
+    json_string = \
+"""
+{
+    "name": "root",
+    "children": [
+        {
+            "name": "child",
+            "count": 2,
+            "children": null,
+            "lookup": {
+                "9842d4b6-0b89-4b56-ad0f-acb5b8be8112": {
+                    "uuidValue": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112"
+                }
+            },
+            "unknownValue": 3
+        }
+    ]
+}
+"""
+    uuid = UUID("9842d4b6-0b89-4b56-ad0f-acb5b8be8112")
+
+    expected = TestClassRecursive(
+        name="root",
+        count=0,
+        children=[
+            TestClassRecursive(
+                name="child",
+                count=2,
+                children=None,
+                lookup={ uuid: TestClassNested(uuid_value=uuid) })
+        ],
+        lookup=None)
+
+    # act
+    decoded = json.loads(json_string)
+    actual1 = JsonEncoder.decode(TestClassRecursive, decoded, options)
+    actual2 = JsonEncoder.decode(TestClassRecursive, decoded, options)
+
+    # assert
+    assert expected == actual1
+    assert expected == actual2
+    assert JsonEncoder.get_decoder(TestClassRecursive, options) is JsonEncoder.get_decoder(TestClassRecursive, options)
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        1,
+        1.1,
+        float("nan"),
+        "1 \"ä\" \n",
+        True,
+        TestEnum.A,
+        [],
+        {},
+        [1, None, [2.5, "3"]],
+        (1, 2),
+        { UUID("9842d4b6-0b89-4b56-ad0f-acb5b8be8112"): 1, 2: TestEnum.B, None: [], True: {} },
+        TestClass(
+            int_value=1,
+            float_value=1.1,
+            str_value="1",
+            datetime_value=datetime(2020, 1, 2, 3, 4, 5, microsecond=678901, tzinfo = timezone.utc),
+            timedelta_value=timedelta(days=1,hours=2,minutes=3,seconds=4,milliseconds=5,microseconds=6),
+            enum_value=TestEnum.A,
+            nested_value=TestClassNested(uuid_value=UUID("9842d4b6-0b89-4b56-ad0f-acb5b8be8112")))
+    ])
+@pytest.mark.parametrize("single_pass_writer", [False, True])
+def can_encode_to_bytes_test(value: Any, single_pass_writer: bool):
+
+    # arrange
+    options = JsonEncoderOptions(property_name_encoder = to_camel_case, single_pass_writer = single_pass_writer)
+    expected = json.dumps(JsonEncoder.encode(value, options)).encode("utf-8")
+
+    # act
+    actual = JsonEncoder.encode_to_bytes(value, options)
+
+    # assert
+    assert expected == actual
+
+@dataclass(frozen=True, slots=True)
+class TestClassSlotted:
+    name: str
+    value: float
+    kind: TestEnum
+    nested: Optional[TestClassNested]
+    children: Optional[list["TestClassSlotted"]]
+
+def can_roundtrip_slotted_dataclass_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_encoder = to_camel_case, property_name_decoder = to_snake_case)
+    uuid = UUID("9842d4b6-0b89-4b56-ad0f-acb5b8be8112")
+
+    value = TestClassSlotted(
+        name="root",
+        value=1.5,
+        kind=TestEnum.B,
+        nested=TestClassNested(uuid_value=uuid),
+        children=[TestClassSlotted(name="child", value=2.0, kind=TestEnum.A, nested=None, children=None)])
+
+    # act
+    encoded = JsonEncoder.encode(value, options)
+    encoded_bytes = JsonEncoder.encode_to_bytes(value, options)
+    decoded = JsonEncoder.decode(TestClassSlotted, encoded, options)
+
+    # assert
+    assert not hasattr(value, "__dict__")
+    assert encoded["nested"] == { "uuidValue": str(uuid) }
+    assert json.loads(encoded_bytes) == encoded
+    assert value == decoded
+
+def can_decode_lazily_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_decoder = to_snake_case)
+    lazy_options = JsonEncoderOptions(property_name_decoder = to_snake_case, lazy_decode = True)
+
+    data = {
+        "name": "root",
+        "value": 1.5,
+        "kind": "B",
+        "nested": { "uuidValue": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112" },
+        "children": [{ "name": "child", "kind": "A", "nested": None, "children": None }],
+        "unknownValue": 3
+    }
+
+    expected = JsonEncoder.decode(TestClassSlotted, data, options)
+
+    # act
+    actual = JsonEncoder.decode(TestClassSlotted, data, lazy_options)
+    name = actual.name
+    pending = set(actual.__dict__["_lazy_values"])
+
+    # assert
+    assert "root" == name
+    assert isinstance(actual, TestClassSlotted)
+    assert { "value", "kind", "nested", "children" } == pending
+    assert actual.children is not None
+    assert TestEnum.A == actual.children[0].kind
+    assert 0.0 == actual.children[0].value
+    assert expected == actual
+    assert actual == expected
+    assert hash(expected.nested) == hash(actual.nested)
+    assert JsonEncoder.encode(expected, options) == JsonEncoder.encode(actual, options)
+    assert expected == pickle.loads(pickle.dumps(actual))
+
+def can_decode_raw_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_decoder = to_snake_case, raw_decode = True)
+
+    data = {
+        "name": "root",
+        "value": 1.5,
+        "kind": "B",
+        "nested": { "uuidValue": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112" },
+        "children": [{ "name": "child", "kind": "A", "nested": None, "children": None }],
+        "unknownValue": 3
+    }
+
+    expected = {
+        "name": "root",
+        "value": 1.5,
+        "kind": "B",
+        "nested": { "uuid_value": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112" },
+        "children": [{ "name": "child", "kind": "A", "nested": None, "children": None }],
+        "unknown_value": 3
+    }
+
+    # act
+    actual = JsonEncoder.decode(TestClassSlotted, data, options)
+    actual_dict = JsonEncoder.decode(dict[str, list[int]], { "keyValue": [1, 2] }, options)
+
+    # assert
+    assert expected == actual
+    assert { "keyValue": [1, 2] } == actual_dict
+
+@dataclass(frozen=True)
+class TestClassStatic:
+    str_value: str
+
+    @staticmethod
+    def _from_json(data: dict[str, Any]) -> "TestClassStatic":
+        return TestClassStatic(data["value"].upper())
+
+    def _to_json(self) -> dict[str, Any]:
+        return { "value": self.str_value.lower() }
+
+def uses_generated_serializers_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_encoder = to_camel_case, property_name_decoder = to_snake_case)
+    value = [TestClassStatic(str_value="A"), None]
+
+    # act
+    encoded = JsonEncoder.encode(value, options)
+    encoded_bytes = JsonEncoder.encode_to_bytes(value, options)
+    decoded = JsonEncoder.decode(list[Optional[TestClassStatic]], encoded, options)
+
+    # assert
+    assert [{ "value": "a" }, None] == encoded
+    assert b'[{"value": "a"}, null]' == encoded_bytes
+    assert value == decoded
+
+@pytest.mark.parametrize("json_backend", json_backends)
+def can_roundtrip_with_json_backend_test(json_backend: str):
+
+    # arrange
+    options = JsonEncoderOptions(
+        property_name_encoder = to_camel_case,
+        property_name_decoder = to_snake_case,
+        json_backend = json_backend)
+
+    uuid = UUID("9842d4b6-0b89-4b56-ad0f-acb5b8be8112")
+
+    value = TestClassRecursive(
+        name="root ä",
+        count=1,
+        children=[TestClassRecursive(name="child", count=2, children=None, lookup=None)],
+        lookup={ uuid: TestClassNested(uuid_value=uuid) })
+
+    # act
+    encoded = JsonEncoder.encode_to_bytes(value, options)
+    actual1 = JsonEncoder.decode(TestClassRecursive, JsonEncoder.parse(encoded, options), options)
+    actual2 = JsonEncoder.decode(TestClassRecursive, JsonEncoder.parse(encoded.decode("utf-8"), options), options)
+
+    # assert
+    assert json.loads(encoded) == JsonEncoder.encode(value, options)
+    assert value == actual1
+    assert value == actual2
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+def can_read_json_array_incrementally_test(chunk_size: int):
+
+    # arrange
+    expected = [{ "value": "ä€😀", "items": [1, 2.5e-3, None] }, -12345, "]", '\\"]}[{', 1.5e3, [], {}, True, None, False]
+    data = json.dumps(expected, ensure_ascii=False).encode("utf-8")
+    reader = JsonArrayReader()
+
+    # act
+    actual = []
+
+    for i in range(0, len(data), chunk_size):
+        actual.extend(reader.feed(data[i:i + chunk_size]))
+
+    actual.extend(reader.close())
+
+    # assert
+    assert expected == actual
+
+def can_read_json_array_items_before_end_test():
+
+    # arrange
+    reader = JsonArrayReader()
+
+    # act
+    actual1 = reader.feed(b' [{"value": 1}, 12')
+    actual2 = reader.feed(b'3, 4')
+    actual3 = reader.feed(b"] ")
+    actual4 = reader.close()
+
+    # assert
+    assert [{ "value": 1 }] == actual1
+    assert [123] == actual2
+    assert [4] == actual3
+    assert [] == actual4
+
+@pytest.mark.parametrize("data", [b"", b"[1, 2", b"[1 2]", b'{"value": 1}', b"[1]]", b"[tru]", b'[{"value": 1]]'])
+def cannot_read_invalid_json_array_test(data: bytes):
+
+    # arrange
+    reader = JsonArrayReader()
+
+    # act / assert
+    with pytest.raises(ValueError):
+        reader.feed(data)
+        reader.close()
+
+def can_decode_concurrently_test():
+
+    # arrange
+    data = {
+        "name": "root",
+        "count": 1,
+        "children": [{ "name": "child", "count": 2, "children": None, "lookup": None }],
+        "lookup": { "9842d4b6-0b89-4b56-ad0f-acb5b8be8112": { "uuidValue": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112" } }
+    }
+
+    expected = JsonEncoder.decode(TestClassRecursive, data, JsonEncoderOptions(property_name_decoder = to_snake_case))
+
+    def decode(options: JsonEncoderOptions, barrier: threading.Barrier) -> TestClassRecursive:
+        barrier.wait()
+        return JsonEncoder.decode(TestClassRecursive, data, options)
+
+    # act
+    actual: list[TestClassRecursive] = []
+    switch_interval = sys.getswitchinterval()
+
+    # switch threads as often as possible to interrupt the compilation of the decoders
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+
+            for _ in range(50):
+                options = JsonEncoderOptions(property_name_decoder = to_snake_case)
+                barrier = threading.Barrier(8)
+                futures = [executor.submit(decode, options, barrier) for _ in range(8)]
+                actual.extend(future.result() for future in futures)
+
+                # the property map must not have been poisoned by a decoder which was not yet complete
+                actual.append(JsonEncoder.decode(TestClassRecursive, data, options))
+
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    # assert
+    assert all(expected == current for current in actual)
+
+def can_access_lazy_view_concurrently_test():
+
+    # arrange
+    options = JsonEncoderOptions(property_name_decoder = to_snake_case, lazy_decode = True)
+
+    data = {
+        "name": "root",
+        "value": 1.5,
+        "kind": "B",
+        "nested": { "uuidValue": "9842d4b6-0b89-4b56-ad0f-acb5b8be8112" },
+        "children": [{ "name": "child", "kind": "A", "nested": None, "children": None }]
+    }
+
+    expected = JsonEncoder.decode(TestClassSlotted, data, JsonEncoderOptions(property_name_decoder = to_snake_case))
+
+    def access(view: TestClassSlotted, barrier: threading.Barrier) -> tuple[Any, ...]:
+        barrier.wait()
+        return (view.name, view.value, view.kind, view.nested, view.children)
+
+    # act
+    actual: list[tuple[TestClassSlotted, list[tuple[Any, ...]]]] = []
+    switch_interval = sys.getswitchinterval()
+
+    # switch threads as often as possible to interrupt the materialization of the fields
+    sys.setswitchinterval(1e-6)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+
+            for _ in range(50):
+                view = JsonEncoder.decode(TestClassSlotted, data, options)
+                barrier = threading.Barrier(8)
+                futures = [executor.submit(access, view, barrier) for _ in range(8)]
+                actual.append((view, [future.result() for future in futures]))
+
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    # assert
+    for view, fields in actual:
+
+        assert expected == view
+
+        # all threads see the value which has been stored in the view
+        for current in fields:
+            assert (expected.name, expected.value, expected.kind, expected.nested, expected.children) == current
+            assert view.nested is current[3]
+            assert view.children is current[4]
+
+def cannot_read_invalid_json_array_item_test():
+
+    # arrange
+    reader = JsonArrayReader()
+    reader.feed(b'[{"value": 1}, {"value": 2,')
+
+    # act / assert
+
+    # the syntax error is raised as soon as the item is complete, i.e. without waiting for the end of the stream
+    with pytest.raises(ValueError):
+        reader.feed(b'}, {"value": 3}')